@@ -1,12 +1,12 @@
-from SyntaxAnalyzer.AST import (
-    NodoPrograma, NodoBinario, NodoLiteral, NodoIdentificador,
-    NodoIf, NodoMientras, NodoRepetir, NodoPara, NodoMostrar,
-    NodoDeclaracion, NodoAsignacion, NodoUnario, NodoError
-)
+from SyntaxAnalyzer.AST import Visitante
 from GlobalErrors.ErrorsManager import global_errors
 
-class TACGenerator:
-    def __init__(self):
+class TACGenerator(Visitante):
+    prefijo = "generate_"
+
+    def __init__(self, diagnosticos=None):
+        # Errores de las fases anteriores (por defecto, los de la compilación en curso)
+        self.diagnosticos = diagnosticos if diagnosticos is not None else global_errors
         self.temp_count = 0
         self.code = []
         self.current_temp = None
@@ -21,49 +21,40 @@ class TACGenerator:
         indent = "    " * self.indent_level
         self.code.append(f"{indent}{instruction}")
 
+    @classmethod
+    def nombre_metodo(cls, clase):
+        # NodoBinario -> generate_binario
+        nombre = clase.__name__
+        if nombre.startswith("Nodo"):
+            nombre = nombre[len("Nodo"):]
+        return cls.prefijo + nombre.lower()
+
     def generate(self, ast_node):
-        """Genera código TAC a partir del AST"""
-        if ast_node is None:
-            raise ValueError("El AST es None")
-        if isinstance(ast_node, NodoError):
-            raise ValueError(f"El AST contiene errores: {ast_node.mensaje}")
-        if isinstance(ast_node, NodoPrograma):
-            return self.generate_programa(ast_node)
-        elif isinstance(ast_node, NodoBinario):
-            return self.generate_binario(ast_node)
-        elif isinstance(ast_node, NodoLiteral):
-            return self.generate_literal(ast_node)
-        elif isinstance(ast_node, NodoIdentificador):
-            return self.generate_identificador(ast_node)
-        elif isinstance(ast_node, NodoIf):
-            return self.generate_if(ast_node)
-        elif isinstance(ast_node, NodoMientras):
-            return self.generate_mientras(ast_node)
-        elif isinstance(ast_node, NodoRepetir):
-            return self.generate_repetir(ast_node)
-        elif isinstance(ast_node, NodoPara):
-            return self.generate_para(ast_node)
-        elif isinstance(ast_node, NodoMostrar):
-            return self.generate_mostrar(ast_node)
-        elif isinstance(ast_node, NodoDeclaracion):
-            return self.generate_declaracion(ast_node)
-        elif isinstance(ast_node, NodoAsignacion):
-            return self.generate_asignacion(ast_node)
-        elif isinstance(ast_node, NodoUnario):
-            return self.generate_unario(ast_node)
-        else:
-            raise ValueError(f"Nodo AST no reconocido: {type(ast_node)}")
+        """Genera código TAC a partir del AST, sin recursión (ver `recorrer` en AST.py).
+
+        Los métodos `generate_*` que generan hijos son generadores: `temp = yield hijo`.
+        """
+        return self.visitar(ast_node)
+
+    def generate_nonetype(self, ast_node):
+        raise ValueError("El AST es None")
+
+    def generate_error(self, ast_node):
+        raise ValueError(f"El AST contiene errores: {ast_node.mensaje}")
+
+    def visita_generica(self, ast_node):
+        raise ValueError(f"Nodo AST no reconocido: {type(ast_node)}")
 
     def generate_programa(self, node):
-        if global_errors:
+        if self.diagnosticos:
             raise Exception("🚫 No se puede generar código intermedio: existen errores en el análisis previo")
         for decl in node.declaraciones:
-            self.generate(decl)
+            yield decl
         return self.code
 
     def generate_binario(self, node):
-        left_temp = self.generate(node.izquierda)
-        right_temp = self.generate(node.derecha)
+        left_temp = yield node.izquierda
+        right_temp = yield node.derecha
         self.current_temp = self.new_temp()
 
         # Mapeo de operadores lógicos de PSeInt a Python
@@ -90,30 +81,30 @@ class TACGenerator:
         return node.nombre
 
     def generate_if(self, node):
-        cond_temp = self.generate(node.condicion)
+        cond_temp = yield node.condicion
         self.emit(f"if {cond_temp}:")
         self.indent_level += 1
         for stmt in node.cuerpo_if:
-            self.generate(stmt)
+            yield stmt
         self.indent_level -= 1
         if node.cuerpo_else is not None and len(node.cuerpo_else) > 0:
             self.emit("else:")
             self.indent_level += 1
             for stmt in node.cuerpo_else:
-                self.generate(stmt)
+                yield stmt
             self.indent_level -= 1
 
     def generate_mientras(self, node):
         self.emit("# inicio mientras")
         self.emit("while True:")
         self.indent_level += 1
-        cond_temp = self.generate(node.condicion)
+        cond_temp = yield node.condicion
         self.emit(f"if not {cond_temp}:")
         self.indent_level += 1
         self.emit(f"break")
         self.indent_level -= 1
         for stmt in node.cuerpo:
-            self.generate(stmt)
+            yield stmt
         self.indent_level -= 1
         self.emit("# fin mientras")
 
@@ -121,8 +112,8 @@ class TACGenerator:
         self.emit("while True:")
         self.indent_level += 1
         for stmt in node.cuerpo:
-            self.generate(stmt)
-        cond_temp = self.generate(node.condicion)
+            yield stmt
+        cond_temp = yield node.condicion
         self.emit(f"if {cond_temp}:")
         self.indent_level += 1
         self.emit("break")
@@ -130,9 +121,10 @@ class TACGenerator:
         self.indent_level -= 1
 
     def generate_para(self, node):
-        self.emit(f"{node.variable.nombre} = {self.generate(node.inicio)}")
-        fin_temp = self.generate(node.fin)
-        paso_temp = self.generate(node.paso) if node.paso else "1"
+        inicio_temp = yield node.inicio
+        self.emit(f"{node.variable.nombre} = {inicio_temp}")
+        fin_temp = yield node.fin
+        paso_temp = (yield node.paso) if node.paso else "1"
         self.emit("# inicio para")
         self.emit("while True:")
         self.indent_level += 1
@@ -143,27 +135,29 @@ class TACGenerator:
         self.emit(f"break")
         self.indent_level -= 1
         for stmt in node.cuerpo:
-            self.generate(stmt)
+            yield stmt
         self.emit(f"{node.variable.nombre} += {paso_temp}")
         self.indent_level -= 1
         self.emit("# fin para")
 
 
     def generate_mostrar(self, node):
-        exprs = [self.generate(expr) for expr in node.expresiones]
+        exprs = []
+        for expr in node.expresiones:
+            exprs.append((yield expr))
         self.emit(f'print({", ".join(exprs)})')
 
     def generate_declaracion(self, node):
         if node.expresion:
-            expr_temp = self.generate(node.expresion)
+            expr_temp = yield node.expresion
             self.emit(f"{node.identificador.nombre} = {expr_temp}")
 
     def generate_asignacion(self, node):
-        expr_temp = self.generate(node.expresion)
+        expr_temp = yield node.expresion
         self.emit(f"{node.identificador.nombre} = {expr_temp}")
 
     def generate_unario(self, node):
-        expr_temp = self.generate(node.expresion)
+        expr_temp = yield node.expresion
         self.current_temp = self.new_temp()
         if node.operador == "NOT":
             self.emit(f"{self.current_temp} = not {expr_temp}")
@@ -0,0 +1,178 @@
+# BatchCompiler.py
+"""Compilación por lotes de muchos archivos PSeInt, repartidos entre procesos.
+
+Uso: `python -m Executor.BatchCompiler "entregas/**/*.psc" [--workers N] [--json salida.json]`
+"""
+import argparse
+import contextlib
+import glob
+import io
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from GlobalErrors.ErrorsManager import global_errors, AnalisisDetenido, MAX_DIAGNOSTICOS_POR_FASE, MAX_DIAGNOSTICOS
+from LexicalAnalyzer.Lexer import crear_lexer, MAX_ERRORES_LEXICOS
+from SyntaxAnalyzer.AST import NodoPrograma, NodoError
+from SyntaxAnalyzer.Parser import BACKENDS_PARSER, crear_parser, obtener_parser
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from CodeGenerator.TACGenerator import TACGenerator
+from CodeGenerator.Translator import Translator
+from CodeGenerator.Optimizer import Optimizer
+
+# Archivos más lentos que muestra el resumen
+SLOWEST_FILES = 10
+
+# python_code es None si hubo errores; seconds es el tiempo de compilación del archivo
+FileResult = namedtuple("FileResult", "path python_code errors seconds")
+
+
+def _error(error_type, message, line=0):
+    global_errors.append({"tipo": error_type, "linea": line, "mensaje": message})
+
+
+def compile_source(code, lexer_backend="ply", max_lexical_errors=MAX_ERRORES_LEXICOS, parser_backend="ply",
+                   max_diagnostics_per_phase=MAX_DIAGNOSTICOS_POR_FASE, max_diagnostics=MAX_DIAGNOSTICOS):
+    """Compila `code` con las mismas fases que CompilerController, sin interfaz ni ejecución.
+
+    Devuelve (código Python o None, lista de errores). Los mensajes que las
+    fases imprimen se descartan. Al alcanzar un tope de diagnósticos la
+    compilación se detiene y la lista termina con el aviso del tope.
+    """
+    global_errors.reiniciar(max_diagnostics_per_phase, max_diagnostics, {"léxico": max_lexical_errors})
+    python_code = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            code_lexer = crear_lexer(lexer_backend)
+            ast_node = crear_parser(parser_backend).parse(code, lexer=code_lexer, tracking=True)
+            if isinstance(ast_node, NodoError):
+                _error("sintáctico", ast_node.mensaje, ast_node.linea)
+            elif not isinstance(ast_node, NodoPrograma):
+                _error("sintáctico", "No se generó un programa válido")
+            else:
+                SemanticAnalyzer(global_errors).analyze(ast_node)
+            if not global_errors:
+                tac_code = TACGenerator(global_errors).generate(ast_node)
+                try:
+                    tac_code = Optimizer().optimize(tac_code)
+                except Exception:
+                    pass  # Igual que el editor: se usa el código sin optimizar
+                python_code = Translator(tac_code).translate()
+        except AnalisisDetenido:
+            pass  # El aviso del tope ya está entre los errores
+        except Exception as e:
+            _error("sistema", f"Error inesperado: {str(e)}")
+    errors = list(global_errors)
+    global_errors.clear()
+    return (python_code if not errors else None), errors
+
+
+def compile_file(path, lexer_backend="ply", max_lexical_errors=MAX_ERRORES_LEXICOS, parser_backend="ply",
+                 max_diagnostics_per_phase=MAX_DIAGNOSTICOS_POR_FASE, max_diagnostics=MAX_DIAGNOSTICOS):
+    """Lee y compila un archivo; los errores de lectura quedan como diagnóstico"""
+    start = time.perf_counter()
+    try:
+        with open(path, encoding="utf-8") as source:
+            code = source.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return FileResult(path, None, [{"tipo": "sistema", "linea": 0, "mensaje": str(e)}],
+                          time.perf_counter() - start)
+    python_code, errors = compile_source(code, lexer_backend, max_lexical_errors, parser_backend,
+                                         max_diagnostics_per_phase, max_diagnostics)
+    return FileResult(path, python_code, errors, time.perf_counter() - start)
+
+
+def _preload():
+    """Inicializa cada proceso: tablas del parser y lexer listos antes del primer archivo"""
+    obtener_parser()
+    crear_lexer()
+
+
+def expand_paths(patterns):
+    """Archivos de una lista de rutas y patrones glob (`**` recursivo), sin repetir y ordenados"""
+    paths = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True) if glob.has_magic(pattern) else [pattern]
+        paths.update(path for path in matches if os.path.isfile(path))
+    return sorted(paths)
+
+
+def compile_batch(paths, workers=None, lexer_backend="ply", max_lexical_errors=MAX_ERRORES_LEXICOS,
+                  parser_backend="ply", max_diagnostics_per_phase=MAX_DIAGNOSTICOS_POR_FASE,
+                  max_diagnostics=MAX_DIAGNOSTICOS):
+    """Compila `paths` en un ProcessPoolExecutor y devuelve un FileResult por archivo, en orden.
+
+    Con `workers=1` todo ocurre en este proceso.
+    """
+    paths = list(paths)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        _preload()
+        return [compile_file(path, lexer_backend, max_lexical_errors, parser_backend,
+                             max_diagnostics_per_phase, max_diagnostics) for path in paths]
+    # Lotes medianos: pocos viajes entre procesos sin dejar trabajadores ociosos al final
+    chunksize = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_preload) as executor:
+        return list(executor.map(compile_file, paths, [lexer_backend] * len(paths),
+                                 [max_lexical_errors] * len(paths), [parser_backend] * len(paths),
+                                 [max_diagnostics_per_phase] * len(paths), [max_diagnostics] * len(paths),
+                                 chunksize=chunksize))
+
+
+def summarize(results, elapsed, slowest=SLOWEST_FILES):
+    """Resumen del lote: totales, archivos por segundo y los archivos más lentos"""
+    failed = [result for result in results if result.errors]
+    return {
+        "files": len(results),
+        "ok": len(results) - len(failed),
+        "with_errors": len(failed),
+        "seconds": elapsed,
+        "files_per_second": len(results) / elapsed if elapsed else 0.0,
+        "slowest": [(result.path, result.seconds)
+                    for result in sorted(results, key=lambda r: r.seconds, reverse=True)[:slowest]],
+    }
+
+
+def main(argv=None):
+    arguments = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arguments.add_argument("patterns", nargs="+", help="archivos o patrones glob")
+    arguments.add_argument("--workers", type=int, default=None, help="procesos (por defecto, uno por núcleo)")
+    arguments.add_argument("--backend", choices=("ply", "dfa"), default="ply", help="lexer a usar")
+    arguments.add_argument("--parser", choices=BACKENDS_PARSER, default="ply", help="parser a usar")
+    arguments.add_argument("--max-diagnostics", type=int, default=MAX_DIAGNOSTICOS,
+                           help="errores por archivo antes de detener su compilación (0 = sin tope)")
+    arguments.add_argument("--max-diagnostics-per-phase", type=int, default=MAX_DIAGNOSTICOS_POR_FASE,
+                           help="errores de una misma fase antes de detener la compilación (0 = sin tope)")
+    arguments.add_argument("--json", help="guardar el resultado de cada archivo en este archivo JSON")
+    arguments.add_argument("--slowest", type=int, default=SLOWEST_FILES, help="archivos lentos a listar")
+    options = arguments.parse_args(argv)
+
+    paths = expand_paths(options.patterns)
+    if not paths:
+        print("⚠️ Ningún archivo coincide con los patrones indicados", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    results = compile_batch(paths, options.workers, options.backend, parser_backend=options.parser,
+                            max_diagnostics_per_phase=options.max_diagnostics_per_phase or None,
+                            max_diagnostics=options.max_diagnostics or None)
+    summary = summarize(results, time.perf_counter() - start, options.slowest)
+
+    print(f"📦 {summary['files']} archivos: {summary['ok']} sin errores, {summary['with_errors']} con errores")
+    print(f"⏱️ {summary['seconds']:.2f} s ({summary['files_per_second']:.1f} archivos/s)")
+    if summary["slowest"]:
+        print("🐢 Más lentos:")
+        for path, seconds in summary["slowest"]:
+            print(f"   {seconds * 1000:8.1f} ms  {path}")
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as output:
+            json.dump({"summary": summary, "files": [result._asdict() for result in results]},
+                      output, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,2 +1,204 @@
-global_errors = []
+# ErrorsManager.py
+"""Diagnósticos de una compilación.
 
+`global_errors` es el `Diagnosticos` que usan las fases (el lexer y el
+parser directamente; el analizador semántico y el TAC lo reciben o lo toman
+por defecto). Se usa como la lista de diccionarios `{"tipo", "linea",
+"mensaje"[, "columna", ...]}` de siempre: `append`, `extend`, `len`,
+índices, rebanadas, `del` y `clear`. Por dentro guarda tuplas y arma el
+mensaje recién cuando alguien lo lee.
+"""
+import contextlib
+
+# Topes por defecto del compilador (el editor y el compilador por lotes)
+MAX_DIAGNOSTICOS_POR_FASE = 100
+MAX_DIAGNOSTICOS = 300
+
+
+class AnalisisDetenido(Exception):
+    """Se alcanzó un tope de diagnósticos: la fase que lo alcanzó no debe seguir."""
+
+
+class Diagnosticos:
+    """Diagnósticos sin repetidos, con tope por fase (`tipo`) y total.
+
+    Un diagnóstico igual a uno ya registrado (misma línea, tipo y mensaje)
+    se descarta. `max_por_tipo` fija el tope de fases concretas en lugar de
+    `max_por_fase` (None = esa fase sin tope), como el de errores léxicos
+    del editor. El que alcanza un tope se registra junto con un aviso y
+    lanza AnalisisDetenido; desde entonces todo lo que llegue se descarta
+    (hasta `clear`), así que el análisis termina rápido aunque alguna fase
+    atrape la excepción y siga.
+    """
+
+    def __init__(self, max_por_fase=None, max_total=None, deduplicar=True, max_por_tipo=None):
+        self.max_por_fase = max_por_fase  # None = sin tope
+        self.max_total = max_total
+        self.max_por_tipo = dict(max_por_tipo or {})
+        self.deduplicar = deduplicar
+        # (tipo, linea, mensaje, argumentos, extra): `mensaje.format(*argumentos)`
+        # se calcula al leer; `extra` son las claves adicionales (columna...) o None.
+        # Los avisos de tope tienen `argumentos` None
+        self._registros = []
+        self._claves = set()
+        self._por_fase = {}
+        self.detenido = False
+        self.descartados = 0  # Repetidos y los que llegaron después de detenerse
+
+    def reiniciar(self, max_por_fase=None, max_total=None, max_por_tipo=None):
+        """Vacía los diagnósticos y fija los topes de la próxima compilación."""
+        self.max_por_fase = max_por_fase
+        self.max_total = max_total
+        self.max_por_tipo = dict(max_por_tipo or {})
+        self.clear()
+
+    # ---------------------------------------------------------------
+    # Registro
+    # ---------------------------------------------------------------
+
+    def agregar(self, tipo, linea, mensaje, *argumentos, **extra):
+        """Registra un diagnóstico; el texto es `mensaje.format(*argumentos)` si hay argumentos.
+
+        Devuelve False si se descartó. Lanza AnalisisDetenido si con este se
+        alcanza un tope.
+        """
+        if self.detenido:
+            self.descartados += 1
+            return False
+        if self.deduplicar:
+            clave = self._clave(tipo, linea, mensaje, argumentos)
+            if clave in self._claves:
+                self.descartados += 1
+                return False
+            self._claves.add(clave)
+        self._registros.append((tipo, linea, mensaje, argumentos, extra or None))
+        cuenta = self._por_fase[tipo] = self._por_fase.get(tipo, 0) + 1
+        maximo = self.max_por_tipo.get(tipo, self.max_por_fase)
+        if maximo is not None and cuenta >= maximo:
+            self._detener(tipo, linea, f"⚠️ Se alcanzó el límite de {maximo} errores de tipo "
+                                       f"'{tipo}'; el análisis se detiene")
+        elif self.max_total is not None and len(self._registros) >= self.max_total:
+            self._detener(tipo, linea, f"⚠️ Se alcanzó el límite de {self.max_total} errores; "
+                                       f"el análisis se detiene")
+        return True
+
+    @staticmethod
+    def _clave(tipo, linea, mensaje, argumentos):
+        """Clave de repetidos: el texto ya formateado, así que da igual si llegó con plantilla o armado."""
+        return linea, tipo, mensaje.format(*argumentos) if argumentos else mensaje
+
+    def _detener(self, tipo, linea, aviso):
+        # El aviso (argumentos None) no cuenta para los topes ni se compara con los demás
+        self._registros.append((tipo, linea, aviso, None, None))
+        self.detenido = True
+        raise AnalisisDetenido(aviso)
+
+    def append(self, diagnostico):
+        """Registra un diagnóstico ya armado como diccionario (con el mensaje formateado)."""
+        extra = {clave: valor for clave, valor in diagnostico.items()
+                 if clave not in ("tipo", "linea", "mensaje")}
+        return self.agregar(diagnostico["tipo"], diagnostico.get("linea", 0), diagnostico["mensaje"], **extra)
+
+    def extend(self, diagnosticos):
+        for diagnostico in diagnosticos:
+            self.append(diagnostico)
+
+    @contextlib.contextmanager
+    def aparte(self, con_topes=True):
+        """Registra desde un estado vacío y deja en la lista que entrega lo registrado.
+
+        Al salir (también con excepción) vuelve el estado anterior, sin lo
+        registrado. Sirve para quedarse con los diagnósticos de una parte del
+        análisis sin que se descarten por repetir alguno anterior. Con
+        `con_topes=False` no se aplican los topes: quien recibe la lista los
+        aplica al agregarla (como el lexer paralelo al unir los trozos).
+        """
+        anterior = (self._registros, self._claves, self._por_fase, self.detenido, self.descartados,
+                    self.max_por_fase, self.max_total, self.max_por_tipo)
+        self._registros, self._claves, self._por_fase = [], set(), {}
+        self.detenido = False
+        self.descartados = 0
+        if not con_topes:
+            self.max_por_fase = self.max_total = None
+            self.max_por_tipo = {}
+        registrados = []
+        try:
+            yield registrados
+        finally:
+            registrados.extend(self)
+            (self._registros, self._claves, self._por_fase, self.detenido, self.descartados,
+             self.max_por_fase, self.max_total, self.max_por_tipo) = anterior
+
+    def restaurar(self, diagnosticos):
+        """Vuelve a registrar diagnósticos guardados de una compilación anterior, sin aplicar los topes.
+
+        Si esa compilación se detuvo, la lista ya trae el aviso del tope; con
+        los topes se registraría otro aviso y se lanzaría AnalisisDetenido.
+        """
+        for diagnostico in diagnosticos:
+            extra = {clave: valor for clave, valor in diagnostico.items()
+                     if clave not in ("tipo", "linea", "mensaje")}
+            tipo, linea, mensaje = diagnostico["tipo"], diagnostico.get("linea", 0), diagnostico["mensaje"]
+            clave = self._clave(tipo, linea, mensaje, ())
+            if self.deduplicar and clave in self._claves:
+                continue
+            self._claves.add(clave)
+            self._registros.append((tipo, linea, mensaje, (), extra or None))
+            self._por_fase[tipo] = self._por_fase.get(tipo, 0) + 1
+
+    def clear(self):
+        self._registros.clear()
+        self._claves.clear()
+        self._por_fase.clear()
+        self.detenido = False
+        self.descartados = 0
+
+    # ---------------------------------------------------------------
+    # Lectura (como una lista de diccionarios)
+    # ---------------------------------------------------------------
+
+    @staticmethod
+    def _como_dict(registro):
+        tipo, linea, mensaje, argumentos, extra = registro
+        diagnostico = {"tipo": tipo, "linea": linea, "mensaje": mensaje.format(*argumentos) if argumentos else mensaje}
+        if extra:
+            diagnostico.update(extra)
+        return diagnostico
+
+    def por_fase(self, tipo):
+        """Cuántos diagnósticos de `tipo` se registraron (sin contar avisos de tope)."""
+        return self._por_fase.get(tipo, 0)
+
+    def __len__(self):
+        return len(self._registros)
+
+    def __bool__(self):
+        return bool(self._registros)
+
+    def __iter__(self):
+        return map(self._como_dict, self._registros)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._como_dict(registro) for registro in self._registros[indice]]
+        return self._como_dict(self._registros[indice])
+
+    def __delitem__(self, indice):
+        """Quita diagnósticos (p. ej. los que una fase registró de prueba) y deja de contarlos."""
+        quitados = self._registros[indice] if isinstance(indice, slice) else [self._registros[indice]]
+        del self._registros[indice]
+        for tipo, linea, mensaje, argumentos, _ in quitados:
+            if argumentos is None:
+                self.detenido = False  # Se quitó el aviso de tope
+                continue
+            self._claves.discard(self._clave(tipo, linea, mensaje, argumentos))
+            self._por_fase[tipo] -= 1
+
+    def __eq__(self, otro):
+        return list(self) == list(otro)
+
+    def __repr__(self):
+        return f"Diagnosticos({list(self)!r})"
+
+
+global_errors = Diagnosticos()
@@ -0,0 +1,371 @@
+# DFALexer.py
+import re
+import ply.lex as lex
+from LexicalAnalyzer.Lexer import reserved, registrar_error_lexico, PATRON_INVALIDO
+
+# ------------------------ Clases de Caracteres ------------------------
+
+(C_LETRA, C_DIGITO, C_DIGITO_UNI, C_PUNTO, C_COMILLA, C_BARRA, C_SALTO,
+ C_PUNTO_COMA, C_PAR_IZQ, C_PAR_DER, C_COMA, C_SUMA, C_RESTA, C_MULT, C_MOD,
+ C_IGUAL, C_MAYOR, C_MENOR, C_EXCLAM, C_OTRO) = range(20)
+
+NUM_CLASES = 20
+
+# Caracteres de cada clase (C_DIGITO_UNI son los dígitos Unicode no ASCII que acepta \d)
+_CARACTERES = {
+    C_LETRA: "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_",
+    C_DIGITO: "0123456789",
+    C_PUNTO: ".",
+    C_COMILLA: '"',
+    C_BARRA: "/",
+    C_SALTO: "\n",
+    C_PUNTO_COMA: ";",
+    C_PAR_IZQ: "(",
+    C_PAR_DER: ")",
+    C_COMA: ",",
+    C_SUMA: "+",
+    C_RESTA: "-",
+    C_MULT: "*",
+    C_MOD: "%",
+    C_IGUAL: "=",
+    C_MAYOR: ">",
+    C_MENOR: "<",
+    C_EXCLAM: "!",
+}
+
+_CLASE_ASCII = [C_OTRO] * 128
+for _clase, _chars in _CARACTERES.items():
+    for _c in _chars:
+        _CLASE_ASCII[ord(_c)] = _clase
+
+_TODAS = frozenset(range(NUM_CLASES))
+_DIGITOS = frozenset((C_DIGITO, C_DIGITO_UNI))
+
+# ------------------------ Definición del Autómata ------------------------
+
+# Autómata de los tokens de Lexer.py, escrito estado por estado.
+# Las etiquetas "_SALTO" y "_COMENTARIO" aceptan pero no producen token.
+_ESPECIFICACION = {
+    "inicio": {
+        C_LETRA: "identificador",
+        C_DIGITO: "entero",
+        C_DIGITO_UNI: "entero",
+        C_COMILLA: "cadena_abierta",
+        C_BARRA: "barra",
+        C_SALTO: "salto",
+        C_PUNTO_COMA: "punto_coma",
+        C_PAR_IZQ: "parentesis_izq",
+        C_PAR_DER: "parentesis_der",
+        C_COMA: "coma",
+        C_SUMA: "suma",
+        C_RESTA: "resta",
+        C_MULT: "multiplicacion",
+        C_MOD: "modulo",
+        C_IGUAL: "igual",
+        C_MAYOR: "mayor",
+        C_MENOR: "menor",
+        C_EXCLAM: "exclamacion",
+    },
+    "identificador": {C_LETRA: "identificador", C_DIGITO: "identificador"},
+    "entero": {C_DIGITO: "entero", C_DIGITO_UNI: "entero", C_PUNTO: "entero_punto"},
+    "entero_punto": {c: "decimal" for c in _DIGITOS},
+    "decimal": {c: "decimal" for c in _DIGITOS},
+    "cadena_abierta": {c: ("cadena" if c == C_COMILLA else "cadena_abierta") for c in _TODAS},
+    "cadena": {},
+    "barra": {C_BARRA: "comentario"},
+    "comentario": {c: "comentario" for c in _TODAS - {C_SALTO}},
+    "salto": {C_SALTO: "salto"},
+    "punto_coma": {},
+    "parentesis_izq": {},
+    "parentesis_der": {},
+    "coma": {},
+    "suma": {},
+    "resta": {},
+    "multiplicacion": {},
+    "modulo": {},
+    "igual": {C_IGUAL: "igual_igual"},
+    "igual_igual": {},
+    "mayor": {C_IGUAL: "mayor_igual"},
+    "mayor_igual": {},
+    "menor": {C_IGUAL: "menor_igual"},
+    "menor_igual": {},
+    "exclamacion": {C_IGUAL: "diferente"},
+    "diferente": {},
+}
+
+_ACEPTACION = {
+    "identificador": "IDENTIFICADOR",
+    "entero": "LITERAL_ENTERO",
+    "decimal": "LITERAL_DECIMAL",
+    "cadena": "LITERAL_CADENA",
+    "barra": "DIVISION",
+    "comentario": "_COMENTARIO",
+    "salto": "_SALTO",
+    "punto_coma": "PUNTO_COMA",
+    "parentesis_izq": "PARENTESIS_IZQ",
+    "parentesis_der": "PARENTESIS_DER",
+    "coma": "COMA",
+    "suma": "SUMA",
+    "resta": "RESTA",
+    "multiplicacion": "MULTIPLICACION",
+    "modulo": "MODULO",
+    "igual": "ASIGNACION",
+    "igual_igual": "IGUAL_IGUAL",
+    "mayor": "MAYOR_QUE",
+    "mayor_igual": "MAYOR_IGUAL",
+    "menor": "MENOR_QUE",
+    "menor_igual": "MENOR_IGUAL",
+    "diferente": "DIFERENTE",
+}
+
+
+def minimizar(especificacion, aceptacion, inicial="inicio"):
+    """Minimiza el autómata por refinamiento de particiones (Moore).
+
+    Devuelve (transiciones, etiquetas, nombres): `transiciones[e][clase]` es el
+    estado destino o -1, `etiquetas[e]` el token aceptado (o None) y
+    `nombres[e]` los estados originales agrupados en `e`. El estado 0 es el inicial.
+    """
+    estados = [inicial] + [e for e in especificacion if e != inicial]
+    bloque = {e: aceptacion.get(e) for e in estados}
+    while True:
+        firmas = {
+            e: (bloque[e],) + tuple(
+                bloque[especificacion[e][c]] if c in especificacion[e] else None
+                for c in range(NUM_CLASES)
+            )
+            for e in estados
+        }
+        numeracion = {}
+        nuevo = {e: numeracion.setdefault(firmas[e], len(numeracion)) for e in estados}
+        if len(numeracion) == len(set(bloque.values())):
+            bloque = nuevo
+            break
+        bloque = nuevo
+
+    # Renumerar para que el estado inicial sea el 0
+    orden = {}
+    for e in estados:
+        orden.setdefault(bloque[e], len(orden))
+    nombres = [[] for _ in orden]
+    transiciones = [[-1] * NUM_CLASES for _ in orden]
+    etiquetas = [None] * len(orden)
+    for e in estados:
+        destino = orden[bloque[e]]
+        nombres[destino].append(e)
+        etiquetas[destino] = aceptacion.get(e)
+        for clase, siguiente in especificacion[e].items():
+            transiciones[destino][clase] = orden[bloque[siguiente]]
+    return transiciones, etiquetas, nombres
+
+
+def _acelerador(clases):
+    """Expresión regular que consume de una vez un ciclo sobre `clases`."""
+    if C_OTRO in clases:
+        excluidas = _TODAS - clases
+        assert C_DIGITO_UNI not in excluidas
+        return re.compile("[^%s]*" % re.escape("".join(_CARACTERES[c] for c in sorted(excluidas)))).match
+    if C_DIGITO_UNI in clases:
+        assert C_DIGITO in clases
+        resto = "".join(_CARACTERES[c] for c in sorted(clases - _DIGITOS))
+        return re.compile("[\\d%s]*" % re.escape(resto)).match
+    return re.compile("[%s]*" % re.escape("".join(_CARACTERES[c] for c in sorted(clases)))).match
+
+
+TRANSICIONES, ETIQUETAS, NOMBRES = minimizar(_ESPECIFICACION, _ACEPTACION)
+
+# Para cada estado con ciclo sobre sí mismo, un `match` que salta toda la racha
+ACELERADORES = [
+    _acelerador(frozenset(c for c in range(NUM_CLASES) if fila[c] == estado)) if estado in fila else None
+    for estado, fila in enumerate(TRANSICIONES)
+]
+
+# Palabras que t_TIPO y t_LITERAL_BOOLEANO reconocen antes que t_IDENTIFICADOR
+_TIPOS = frozenset(("entero", "decimal", "cadena", "booleano", "constante"))
+_BOOLEANOS = frozenset(("verdadero", "falso"))
+
+_RE_IGNORAR = re.compile(r"[ \t]*")
+_RE_INVALIDO = re.compile(PATRON_INVALIDO)
+
+
+def _es_palabra(c):
+    """Equivalente a \\w de `re` para un carácter."""
+    return c.isalnum() or c == "_"
+
+
+# ------------------------ Lexer DFA ------------------------
+
+class DFALexer:
+    """Lexer dirigido por tabla, alternativo al lexer de PLY.
+
+    Recorre la tabla de transiciones minimizada con la regla del lexema más
+    largo y produce los mismos tokens (tipo, valor, línea y posición) que
+    `Lexer.lexer`, incluidos los errores léxicos, que registra con
+    `registrar_error_lexico`.
+    Tiene la misma interfaz (`input`, `token`, `lineno`, `lexpos`, `clone`),
+    así que el parser lo acepta con `parser.parse(codigo, lexer=DFALexer())`.
+    """
+
+    def __init__(self):
+        self.lexdata = ""
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self._escaner = None
+        self.agrupar_errores = True
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+        self._escaner = None
+
+    def clone(self):
+        copia = DFALexer()
+        copia.__dict__.update(self.__dict__)
+        copia._escaner = None
+        return copia
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def escanear(self):
+        """Genera (tipo, inicio, fin, linea) de cada token sin crear objetos LexToken.
+
+        `tipo` es None para una racha de caracteres inesperados; el llamador
+        decide cómo reportarla (`reportar_error` la registra y avanza `lexpos`).
+        """
+        data = self.lexdata
+        n = self.lexlen
+        transiciones = TRANSICIONES
+        etiquetas = ETIQUETAS
+        aceleradores = ACELERADORES
+        clase_ascii = _CLASE_ASCII
+        ignorar = _RE_IGNORAR.match
+        invalido = _RE_INVALIDO.match
+        while True:
+            inicio = ignorar(data, self.lexpos).end()
+            if inicio >= n:
+                self.lexpos = inicio
+                return
+            estado = 0
+            pos = inicio
+            fin = -1
+            etiqueta = None
+            while pos < n:
+                c = data[pos]
+                o = ord(c)
+                if o < 128:
+                    clase = clase_ascii[o]
+                else:
+                    clase = C_DIGITO_UNI if c.isdecimal() else C_OTRO
+                estado = transiciones[estado][clase]
+                if estado < 0:
+                    break
+                pos += 1
+                acelerar = aceleradores[estado]
+                if acelerar is not None:
+                    pos = acelerar(data, pos).end()
+                if etiquetas[estado] is not None:
+                    fin = pos
+                    etiqueta = etiquetas[estado]
+
+            self.lexpos = inicio
+            if fin < 0:
+                racha = invalido(data, inicio)
+                yield None, inicio, racha.end() if racha else inicio + 1, self.lineno
+                continue
+            self.lexpos = fin
+            if etiqueta == "_SALTO":
+                self.lineno += fin - inicio
+            elif etiqueta != "_COMENTARIO":
+                if etiqueta == "IDENTIFICADOR":
+                    etiqueta = self._clasificar_palabra(data, inicio, fin)
+                yield etiqueta, inicio, fin, self.lineno
+
+    def _clasificar_palabra(self, data, inicio, fin):
+        """Distingue tipos, booleanos, palabras reservadas e identificadores."""
+        palabra = data[inicio:fin]
+        if palabra in _TIPOS or palabra in _BOOLEANOS:
+            # t_TIPO y t_LITERAL_BOOLEANO exigen límite de palabra (\b) a ambos lados
+            limite = (inicio == 0 or not _es_palabra(data[inicio - 1])) and \
+                     (fin == self.lexlen or not _es_palabra(data[fin]))
+            if limite:
+                return "TIPO" if palabra in _TIPOS else "LITERAL_BOOLEANO"
+        return reserved.get(palabra.lower(), "IDENTIFICADOR")
+
+    def token(self):
+        """Devuelve el siguiente token o None al final de la entrada."""
+        escaner = self._escaner
+        if escaner is None:
+            escaner = self._escaner = self.escanear()
+        for tipo, inicio, fin, linea in escaner:
+            if tipo is None:
+                self.reportar_error(inicio, fin, linea)
+                continue
+            tok = lex.LexToken()
+            tok.type = tipo
+            tok.value = valor_token(tipo, self.lexdata[inicio:fin])
+            tok.lineno = linea
+            tok.lexpos = inicio
+            tok.lexer = self
+            return tok
+        self._escaner = None
+        return None
+
+    def reportar_error(self, inicio, fin, linea):
+        """Registra los caracteres inesperados de `inicio` a `fin` y sigue después de ellos."""
+        registrar_error_lexico(self, self.lexdata[inicio:fin], inicio, linea)
+        self.lexpos = fin
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        tok = self.token()
+        if tok is None:
+            raise StopIteration
+        return tok
+
+    def exportar_dot(self, ruta, nombre="LexerDFA"):
+        """Escribe el autómata minimizado en formato Graphviz, como los de Automatas/."""
+        exportar_dot(ruta, nombre)
+
+
+def valor_token(tipo, texto):
+    """Valor del token tal como lo dejan las reglas de Lexer.py."""
+    if tipo == "LITERAL_ENTERO":
+        return ("ENTERO", int(texto))
+    if tipo == "LITERAL_DECIMAL":
+        return ("DECIMAL", float(texto))
+    if tipo == "LITERAL_CADENA":
+        return ("CADENA", texto.strip('"'))
+    if tipo == "LITERAL_BOOLEANO":
+        return ("BOOLEANO", texto == "verdadero")
+    return texto
+
+
+def exportar_dot(ruta, nombre="LexerDFA"):
+    """Escribe el autómata minimizado en formato Graphviz."""
+    nombres_clase = {C_LETRA: "letra", C_DIGITO: "0-9", C_DIGITO_UNI: "dígito unicode",
+                     C_SALTO: "\\\\n", C_COMILLA: '\\"', C_OTRO: "otro"}
+
+    def etiqueta_clase(clase):
+        return nombres_clase.get(clase) or _CARACTERES[clase]
+
+    lineas = ["digraph %s {" % nombre, "    rankdir=LR;", "    node [shape = circle];", ""]
+    for estado, etiqueta in enumerate(ETIQUETAS):
+        forma = ', shape=doublecircle' if etiqueta else ""
+        texto = "q%d" % estado if not etiqueta else "q%d\\n%s" % (estado, etiqueta.strip("_"))
+        lineas.append('    q%d [label="%s"%s];' % (estado, texto, forma))
+    lineas.append("")
+    for estado, fila in enumerate(TRANSICIONES):
+        por_destino = {}
+        for clase, destino in enumerate(fila):
+            if destino >= 0:
+                por_destino.setdefault(destino, []).append(etiqueta_clase(clase))
+        for destino, clases in por_destino.items():
+            lineas.append('    q%d -> q%d [label="%s"];' % (estado, destino, " ".join(clases)))
+    lineas.append("}")
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        archivo.write("\n".join(lineas) + "\n")
@@ -0,0 +1,286 @@
+# IncrementalLexer.py
+import copy
+from bisect import bisect_left, bisect_right
+from LexicalAnalyzer.Lexer import crear_lexer, mensaje_error_lexico
+from LexicalAnalyzer.LineIndex import IndiceLineas
+
+# Tokens por bloque: al desplazar lo que sigue a una edición solo se tocan los bloques
+TOKENS_POR_BLOQUE = 256
+
+# Caracteres que el lexer puede mirar más allá del final de un token
+# (`12` seguido de `.5`, `/` seguido de `/`, `\b` tras una palabra)
+_ANTICIPACION = 2
+
+# Caracteres que se comparan de una vez al buscar qué cambió en el texto
+_TROZO = 4096
+
+
+class _Bloque:
+    """Tramo de tokens con posición y línea relativas a (`pos`, `linea`)."""
+    __slots__ = ("pos", "linea", "tokens", "fines")
+
+    def __init__(self, pos, linea, tokens, fines):
+        self.pos = pos
+        self.linea = linea
+        self.tokens = tokens
+        self.fines = fines
+
+
+def diferencia(viejo, nuevo):
+    """(inicio, fin, texto) tal que reemplazar `viejo[inicio:fin]` por `texto` da `nuevo`, o None si son iguales."""
+    if viejo == nuevo:
+        return None
+    limite = min(len(viejo), len(nuevo))
+    inicio = 0
+    while inicio + _TROZO <= limite and viejo[inicio:inicio + _TROZO] == nuevo[inicio:inicio + _TROZO]:
+        inicio += _TROZO
+    while inicio < limite and viejo[inicio] == nuevo[inicio]:
+        inicio += 1
+    # Sufijo común, sin volver a contar el prefijo
+    limite -= inicio
+    comun = 0
+    while comun + _TROZO <= limite and \
+            viejo[len(viejo) - comun - _TROZO:len(viejo) - comun] == nuevo[len(nuevo) - comun - _TROZO:len(nuevo) - comun]:
+        comun += _TROZO
+    while comun < limite and viejo[len(viejo) - comun - 1] == nuevo[len(nuevo) - comun - 1]:
+        comun += 1
+    return inicio, len(viejo) - comun, nuevo[inicio:len(nuevo) - comun]
+
+
+def _agrupar(absolutos):
+    """Reparte pares (token, fin) absolutos en bloques con posiciones relativas."""
+    bloques = []
+    for i in range(0, len(absolutos), TOKENS_POR_BLOQUE):
+        tramo = absolutos[i:i + TOKENS_POR_BLOQUE]
+        pos, linea = tramo[0][0].lexpos, tramo[0][0].lineno
+        tokens, fines = [], []
+        for tok, fin in tramo:
+            tok.lexpos -= pos
+            tok.lineno -= linea
+            tokens.append(tok)
+            fines.append(fin - pos)
+        bloques.append(_Bloque(pos, linea, tokens, fines))
+    return bloques
+
+
+class LexerIncremental:
+    """Mantiene el texto y los tokens de un documento y re-tokeniza solo lo editado.
+
+    Ante una edición, el análisis se reanuda en el último token que termina
+    antes del cambio (o antes de la última comilla previa si la edición
+    agrega o quita comillas, porque eso cambia qué cadenas se cierran) y se
+    detiene en cuanto un token nuevo coincide en tipo, valor y posición con
+    uno anterior ya pasado el cambio. Los tokens siguientes se reutilizan
+    desplazando solo la base de sus bloques.
+
+    El resultado es idéntico a tokenizar el texto completo con el mismo backend.
+    `ultimo_tramo` es el rango [inicio, fin) del texto actual que se
+    re-tokenizó en la última edición (fuera de él, los tokens y errores son
+    los de antes, desplazados), y `tokens_en`/`errores_en` dan lo que hay en
+    un rango: es lo que necesita el editor para resaltar solo lo editado.
+    Los errores léxicos no se imprimen ni pasan por `global_errors`: quedan
+    en `errores`, los del texto actual, como al tokenizarlo completo sin tope.
+    """
+
+    def __init__(self, codigo="", backend="ply"):
+        self.backend = backend
+        self.codigo = ""
+        self._bloques = []
+        self._errores = []  # (offset, caracteres inesperados, línea) en orden
+        self.ultimo_cambio = None
+        self.ultimo_tramo = (0, 0)
+        self.cargar(codigo)
+
+    def cargar(self, codigo):
+        """Descarta todo y tokeniza `codigo` desde el principio."""
+        self.codigo = codigo
+        self.lineas = IndiceLineas(codigo)
+        self._errores = []
+        absolutos = list(self._lexear(codigo, 0, 1, self._errores))
+        self._bloques = _agrupar(absolutos)
+        self.ultimo_cambio = (0, None, len(absolutos))
+        self.ultimo_tramo = (0, len(codigo))
+        return self
+
+    def _lexear(self, texto, pos, linea, errores):
+        """Itera (token, fin) desde (`pos`, `linea`), agregando los errores léxicos a `errores`."""
+        lx = crear_lexer(self.backend)
+        lx.errores_aparte = errores
+        lx.input(texto)
+        lx.lexpos = pos
+        lx.lineno = linea
+        for tok in iter(lx.token, None):
+            yield tok, lx.lexpos
+
+    # ---------------------------------------------------------------
+    # Consulta
+    # ---------------------------------------------------------------
+
+    def __len__(self):
+        return sum(len(b.tokens) for b in self._bloques)
+
+    def __iter__(self):
+        """Tokens con posiciones absolutas (copias; los internos son relativos)."""
+        for bloque in self._bloques:
+            for tok in bloque.tokens:
+                absoluto = copy.copy(tok)
+                absoluto.lexpos += bloque.pos
+                absoluto.lineno += bloque.linea
+                yield absoluto
+
+    def tokens(self):
+        return list(self)
+
+    @property
+    def errores(self):
+        """Diagnósticos léxicos del texto actual (diccionarios como los de `global_errors`)."""
+        diagnosticos = []
+        for pos, texto, linea in self._errores:
+            columna = self.lineas.columna(pos)
+            mensaje, argumentos = mensaje_error_lexico(texto, linea, columna)
+            diagnosticos.append({"tipo": "léxico", "linea": linea, "mensaje": mensaje.format(*argumentos),
+                                 "columna": columna, "columna_fin": columna + len(texto) - 1})
+        return diagnosticos
+
+    def tokens_en(self, inicio, fin):
+        """Itera (tipo, inicio, fin) absolutos de los tokens que se superponen con `[inicio, fin)`."""
+        b, t = self._primero_afectado(inicio + 1)
+        for i in range(b, len(self._bloques)):
+            bloque = self._bloques[i]
+            for j in range(t if i == b else 0, len(bloque.tokens)):
+                tok = bloque.tokens[j]
+                pos = tok.lexpos + bloque.pos
+                if pos >= fin:
+                    return
+                yield tok.type, pos, bloque.fines[j] + bloque.pos
+
+    def errores_en(self, inicio, fin):
+        """Itera (inicio, fin) absolutos de los caracteres inesperados que se superponen con `[inicio, fin)`."""
+        errores = self._errores
+        for k in range(max(bisect_left(errores, (inicio,)) - 1, 0), len(errores)):
+            pos, texto, _ = errores[k]
+            if pos >= fin:
+                return
+            if pos + len(texto) > inicio:
+                yield pos, pos + len(texto)
+
+    def _desde(self, b, t):
+        """Itera (pos, linea, bloque, indice, token) a partir del token `t` del bloque `b`."""
+        for i in range(b, len(self._bloques)):
+            bloque = self._bloques[i]
+            for j in range(t if i == b else 0, len(bloque.tokens)):
+                tok = bloque.tokens[j]
+                yield tok.lexpos + bloque.pos, tok.lineno + bloque.linea, i, j, tok
+
+    # ---------------------------------------------------------------
+    # Edición
+    # ---------------------------------------------------------------
+
+    def editar(self, linea_inicio, linea_fin, texto):
+        """Reemplaza las líneas `linea_inicio`..`linea_fin` (inclusive, desde 1) por `texto`.
+
+        `texto` no incluye el salto de línea final de `linea_fin`. Devuelve el
+        flujo de tokens actualizado.
+        """
+        return self.editar_rango(self.lineas.inicio_linea(linea_inicio), self.lineas.fin_linea(linea_fin), texto)
+
+    def editar_rango(self, inicio, fin, texto):
+        """Reemplaza `codigo[inicio:fin]` por `texto` y re-tokeniza lo necesario."""
+        viejo = self.codigo
+        nuevo = self.codigo = viejo[:inicio] + texto + viejo[fin:]
+        self.lineas.reemplazar(inicio, fin, texto, nuevo)
+        delta = len(texto) - (fin - inicio)
+        fin_nuevo = inicio + len(texto)
+
+        limite = inicio
+        if '"' in texto or viejo.find('"', inicio, fin) != -1:
+            comilla = viejo.rfind('"', 0, inicio)
+            if comilla != -1:
+                limite = comilla
+        b, t = self._primero_afectado(limite - _ANTICIPACION)
+
+        # Se reanuda justo después del último token conservado
+        if t > 0:
+            bloque = self._bloques[b]
+            pos, linea = bloque.fines[t - 1] + bloque.pos, bloque.tokens[t - 1].lineno + bloque.linea
+        elif b > 0:
+            bloque = self._bloques[b - 1]
+            pos, linea = bloque.fines[-1] + bloque.pos, bloque.tokens[-1].lineno + bloque.linea
+        else:
+            pos, linea = 0, 1
+
+        anteriores = self._desde(b, t)
+        actual = next(anteriores, None)
+        nuevos = []
+        errores = []
+        sincronia = None
+        for tok, tok_fin in self._lexear(nuevo, pos, linea, errores):
+            # Pasado el cambio (con un carácter de margen por `\b`), un token que
+            # empieza donde empezaba uno anterior deja todo lo que sigue igual
+            if tok.lexpos > fin_nuevo:
+                objetivo = tok.lexpos - delta
+                while actual is not None and actual[0] < objetivo:
+                    actual = next(anteriores, None)
+                if actual is not None and actual[0] == objetivo and \
+                        actual[4].type == tok.type and actual[4].value == tok.value:
+                    sincronia = (actual[2], actual[3], tok.lineno - actual[1])
+                    break
+            nuevos.append((tok, tok_fin))
+
+        # Los errores del tramo re-tokenizado se reemplazan; los siguientes se corren
+        desde = bisect_left(self._errores, (pos,))
+        if sincronia is None:
+            self._errores[desde:] = errores
+        else:
+            hasta = bisect_left(self._errores, (actual[0],))
+            errores.extend((inicio + delta, texto, linea + sincronia[2])
+                           for inicio, texto, linea in self._errores[hasta:])
+            self._errores[desde:] = errores
+        self._empalmar(b, t, nuevos, sincronia, delta)
+        # Hasta el token de la sincronía (el primero que no cambió), o hasta el final
+        self.ultimo_tramo = (pos, tok.lexpos if sincronia is not None else len(nuevo))
+        return iter(self)
+
+    def _primero_afectado(self, limite):
+        """(bloque, indice) del primer token que no termina antes de `limite`."""
+        bloques = self._bloques
+        b = bisect_right([bloque.pos for bloque in bloques], limite) - 1
+        while b >= 0:
+            bloque = bloques[b]
+            t = bisect_left(bloque.fines, limite - bloque.pos)
+            if t > 0:
+                return (b, t) if t < len(bloque.tokens) else (b + 1, 0)
+            b -= 1
+        return 0, 0
+
+    def _empalmar(self, b, t, nuevos, sincronia, delta):
+        """Sustituye los tokens desde (b, t) hasta la sincronía por `nuevos`."""
+        bloques = self._bloques
+        indice = sum(len(x.tokens) for x in bloques[:b]) + t
+        absolutos = []
+        if t > 0:
+            bloque = bloques[b]
+            for tok, fin in zip(bloque.tokens[:t], bloque.fines[:t]):
+                tok.lexpos += bloque.pos
+                tok.lineno += bloque.linea
+                absolutos.append((tok, fin + bloque.pos))
+        absolutos.extend(nuevos)
+
+        if sincronia is None:
+            eliminados = sum(len(x.tokens) for x in bloques[b:]) - t
+            bloques[b:] = _agrupar(absolutos)
+        else:
+            bs, ts, dlinea = sincronia
+            eliminados = sum(len(x.tokens) for x in bloques[b:bs]) + ts - t
+            bloque = bloques[bs]
+            for tok, fin in zip(bloque.tokens[ts:], bloque.fines[ts:]):
+                tok.lexpos += bloque.pos + delta
+                tok.lineno += bloque.linea + dlinea
+                absolutos.append((tok, fin + bloque.pos + delta))
+            # Los bloques posteriores solo mueven su base
+            for siguiente in bloques[bs + 1:]:
+                siguiente.pos += delta
+                siguiente.linea += dlinea
+            bloques[b:bs + 1] = _agrupar(absolutos)
+        self.ultimo_cambio = (indice, eliminados, len(nuevos))
+
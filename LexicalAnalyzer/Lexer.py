@@ -1,6 +1,8 @@
+import re
 import ply.lex as lex
 # Lexer.py
 from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.LineIndex import indice_lineas
 
 # ------------------------ Definición de Tokens ------------------------
 
@@ -153,15 +155,211 @@ t_ignore = " \t"
 
 lex_errors = []  # Lista para almacenar errores léxicos
 
+# Tope por defecto de errores léxicos por compilación (None = sin límite); lo
+# aplica `global_errors` (`max_por_tipo`), no el lexer
+MAX_ERRORES_LEXICOS = 100
+
+MENSAJE_CARACTER_INESPERADO = "❌ Error léxico en línea {}, columna {}: Carácter inesperado '{}'"
+MENSAJE_CARACTERES_INESPERADOS = "❌ Error léxico en línea {}, columnas {}-{}: {} caracteres inesperados '{}'"
+
+# Racha de caracteres donde no puede empezar ningún token: fuera del alfabeto,
+# `!` que no forma `!=` y la comilla que ya no se cierra
+PATRON_INVALIDO = r'(?:[^a-zA-Z_\d"\n \t;(),+\-*/%=<>!]|!(?!=)|"(?![^"]*"))+'
+
+
+def mensaje_error_lexico(texto, linea, columna):
+    """(mensaje, argumentos) del error por los caracteres inesperados `texto` desde (`linea`, `columna`)."""
+    if len(texto) == 1:
+        return MENSAJE_CARACTER_INESPERADO, (linea, columna, texto)
+    muestra = texto if len(texto) <= 20 else texto[:20] + "..."
+    return MENSAJE_CARACTERES_INESPERADOS, (linea, columna, columna + len(texto) - 1, len(texto), muestra)
+
+
+def registrar_error_lexico(lx, texto, lexpos, linea):
+    """Registra los caracteres inesperados `texto` hallados en `lexpos`.
+
+    Con `lx.agrupar_errores` la racha completa es un solo error con columnas
+    inicial y final; si no, se registra un error por carácter, como antes.
+    Los topes los aplica `global_errors`: el error que alcanza el de la fase
+    'léxico' lanza AnalisisDetenido. Si `lx.errores_aparte` es una lista, el
+    error solo se agrega a ella como
+    (lexpos, texto, línea): sin topes, sin imprimirlo y sin `global_errors`.
+    """
+    if not getattr(lx, "agrupar_errores", True) and len(texto) > 1:
+        for i, caracter in enumerate(texto):
+            registrar_error_lexico(lx, caracter, lexpos + i, linea)
+        return
+    aparte = getattr(lx, "errores_aparte", None)
+    if aparte is not None:
+        aparte.append((lexpos, texto, linea))
+        return
+    columna = indice_lineas(lx).columna(lexpos)
+    columna_fin = columna + len(texto) - 1
+    mensaje, argumentos = mensaje_error_lexico(texto, linea, columna)
+    # Después de un tope el diagnóstico se descarta sin armar el texto
+    if global_errors.agregar("léxico", linea, mensaje, *argumentos, columna=columna, columna_fin=columna_fin):
+        print(mensaje.format(*argumentos))
+
+
+# 🔹 Caracteres inválidos: una racha entera se reporta de una vez y se descarta
+@lex.TOKEN(PATRON_INVALIDO)
+def t_ignore_INVALIDO(t):
+    registrar_error_lexico(t.lexer, t.value, t.lexpos, t.lineno)
+
+
 def t_error(t):
-    """Manejo de errores léxicos"""
-    if t.value[0] == "\n":
-        t.lexer.lineno += 1  # Asegurar que los errores que incluyen \n actualicen la línea
-    error_msg = f"❌ Error léxico en línea {t.lineno}: Carácter inesperado '{t.value[0]}'"
-    global_errors.append({"tipo": "léxico", "linea": t.lineno, "mensaje": error_msg})  # Usar errores_globales
-    print(error_msg)
+    """Manejo de errores léxicos (t_ignore_INVALIDO ya cubre los caracteres inválidos)"""
+    registrar_error_lexico(t.lexer, t.value[0], t.lexpos, t.lineno)
     t.lexer.skip(1)
 
 # ------------------------ Construcción del Lexer ------------------------
 
 lexer = lex.lex()
+lexer.agrupar_errores = True  # Racha de caracteres inválidos = un solo error
+
+# Backends disponibles: "ply" (reglas de este módulo) y "dfa" (tabla de DFALexer.py)
+BACKENDS_LEXER = ("ply", "dfa")
+
+
+def crear_lexer(backend="ply", agrupar_errores=True):
+    """Devuelve un lexer nuevo del backend indicado, listo para `input()`.
+
+    `agrupar_errores` controla el reporte de errores léxicos de esta
+    compilación; su tope es el de `global_errors`.
+    """
+    if backend == "ply":
+        nuevo = lexer.clone()
+    elif backend == "dfa":
+        from LexicalAnalyzer.DFALexer import DFALexer
+        nuevo = DFALexer()
+    else:
+        raise ValueError(f"Backend de lexer desconocido: '{backend}' (opciones: {', '.join(BACKENDS_LEXER)})")
+    nuevo.lineno = 1
+    nuevo.agrupar_errores = agrupar_errores
+    return nuevo
+
+
+# ------------------------ Lectura por Bloques ------------------------
+
+# Tamaño de bloque por defecto al leer de archivos (en caracteres)
+TAM_BLOQUE = 1 << 16
+
+# Cadenas (cerradas o no) y comentarios: fuera de ellos un salto de línea es un corte seguro
+_RE_OPACO = re.compile(r'"[^"]*"|"|//[^\n]*')
+
+
+def _tramos_multilinea(texto, final=True):
+    """Localiza las cadenas de `texto` que contienen saltos de línea.
+
+    Devuelve la lista de tramos (inicio, fin) de esas cadenas y la posición
+    hasta la que el análisis es concluyente. Si `final` es falso y aparece una
+    comilla sin cerrar, esa cadena podría terminar en el siguiente bloque, así
+    que nada a partir de ella se considera seguro.
+    """
+    tramos = []
+    for m in _RE_OPACO.finditer(texto):
+        valor = m.group()
+        if valor[0] != '"':
+            continue
+        if len(valor) == 1:
+            if not final:
+                return tramos, m.start()
+            continue  # El lexer la reporta como carácter inesperado
+        if "\n" in valor:
+            tramos.append((m.start(), m.end()))
+    return tramos, len(texto)
+
+
+def _ultimo_corte_seguro(texto, final=True):
+    """Busca el último salto de línea seguro de `texto`.
+
+    Devuelve (corte, limite): `corte` es la posición justo después de ese salto
+    (0 si no hay ninguno) y `limite` la posición de una comilla aún sin cerrar,
+    o `len(texto)` si no la hay.
+    """
+    tramos, limite = _tramos_multilinea(texto, final)
+    corte = texto.rfind("\n", 0, limite)
+    for inicio, fin in reversed(tramos):
+        if corte >= fin:
+            break
+        if corte >= inicio:
+            corte = texto.rfind("\n", 0, inicio)
+    return corte + 1, limite
+
+
+def _bloques(fuente, tam_bloque):
+    """Itera los bloques de texto de un archivo abierto o de un iterable de cadenas."""
+    if hasattr(fuente, "read"):
+        return iter(lambda: fuente.read(tam_bloque), "")
+    return iter(fuente)
+
+
+class LexerFlujo:
+    """Lexer que consume la fuente por bloques en lugar de una sola cadena.
+
+    Acepta un archivo abierto en modo texto o cualquier iterable de cadenas.
+    Cada bloque se corta en el último salto de línea que no cae dentro de una
+    cadena ni de un comentario, de modo que ningún token queda partido y los
+    números de línea coinciden con los del `lexer` sobre el texto completo.
+    `lexpos` de cada token es la posición absoluta en la fuente.
+
+    Expone `token()`, `lineno` y `lexpos`, así que el parser puede usarlo
+    directamente: `parser.parse(lexer=LexerFlujo(archivo), tracking=True)`.
+    """
+
+    def __init__(self, fuente, tam_bloque=TAM_BLOQUE, base=None):
+        self._lexer = (base or lexer).clone()
+        self._lexer.lineno = 1
+        self._desplazamiento = 0
+        self._tokens = self._generar(_bloques(fuente, tam_bloque))
+
+    @property
+    def lineno(self):
+        return self._lexer.lineno
+
+    @lineno.setter
+    def lineno(self, valor):
+        self._lexer.lineno = valor
+
+    @property
+    def lexpos(self):
+        return self._desplazamiento + self._lexer.lexpos
+
+    def _tokens_de(self, texto):
+        self._lexer.input(texto)
+        for tok in iter(self._lexer.token, None):
+            tok.lexpos += self._desplazamiento
+            tok.lexer = self  # El clon solo conoce el bloque; lexpos ya es absoluto
+            yield tok
+        self._desplazamiento += len(texto)
+        self._lexer.input("")  # Sin esto, `lexpos` contaría dos veces el bloque terminado
+
+    def _generar(self, bloques):
+        pendiente = ""
+        revisado = 0  # Con una comilla abierta: hasta aquí no hay comilla que la cierre
+        for bloque in bloques:
+            if not bloque:
+                continue
+            pendiente += bloque
+            if revisado and pendiente.find('"', revisado) == -1:
+                revisado = len(pendiente)
+                continue
+            corte, limite = _ultimo_corte_seguro(pendiente, final=False)
+            if corte:
+                yield from self._tokens_de(pendiente[:corte])
+                pendiente = pendiente[corte:]
+            revisado = len(pendiente) if limite - corte < len(pendiente) else 0
+        if pendiente:
+            yield from self._tokens_de(pendiente)
+
+    def token(self):
+        """Devuelve el siguiente token o None al final de la fuente."""
+        return next(self._tokens, None)
+
+    def __iter__(self):
+        return self._tokens
+
+
+def tokenizar_flujo(fuente, tam_bloque=TAM_BLOQUE):
+    """Genera perezosamente los tokens de `fuente` (archivo o iterable de bloques)."""
+    return iter(LexerFlujo(fuente, tam_bloque))
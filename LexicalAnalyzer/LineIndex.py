@@ -0,0 +1,115 @@
+# LineIndex.py
+from array import array
+from bisect import bisect_right
+
+
+# Líneas por bloque: una edición rearma los bloques que toca y corre los siguientes
+LINEAS_POR_BLOQUE = 1024
+
+
+class IndiceLineas:
+    """Posición de inicio de cada línea de un texto, para pasar de offset a (línea, columna).
+
+    Se construye una vez por fuente recorriendo sus saltos de línea; cada
+    consulta es una búsqueda binaria. Líneas y columnas empiezan en 1 y son
+    físicas (cuentan también los saltos dentro de cadenas).
+
+    Los inicios se guardan en bloques de LINEAS_POR_BLOQUE líneas, cada uno
+    con un desplazamiento que se suma a sus offsets: `reemplazar` rearma
+    solo los bloques que toca la edición y corre el desplazamiento de los
+    siguientes, sin recorrer el resto del texto.
+    """
+
+    def __init__(self, texto):
+        self.texto = texto
+        inicios = array("I", [0])
+        agregar = inicios.append
+        buscar = texto.find
+        pos = buscar("\n")
+        while pos != -1:
+            agregar(pos + 1)
+            pos = buscar("\n", pos + 1)
+        self._bloques = []  # array de inicios (sin el desplazamiento)
+        self._desplazamientos = []
+        self._primeras = []  # Índice (desde 0) de la primera línea de cada bloque
+        self._claves = []  # Offset absoluto de la primera línea de cada bloque
+        self._agrupar(inicios, 0, 0, 0)
+
+    def _agrupar(self, inicios, desde, hasta, primera):
+        """Reemplaza los bloques `desde`..`hasta` (sin incluir) por los de `inicios`, absolutos."""
+        bloques = [inicios[i:i + LINEAS_POR_BLOQUE] for i in range(0, len(inicios), LINEAS_POR_BLOQUE)]
+        self._bloques[desde:hasta] = bloques
+        self._desplazamientos[desde:hasta] = [0] * len(bloques)
+        self._primeras[desde:hasta] = range(primera, primera + len(inicios), LINEAS_POR_BLOQUE)
+        self._claves[desde:hasta] = [bloque[0] for bloque in bloques]
+
+    def _ubicar(self, pos):
+        """(bloque, índice en el bloque) de la última línea que empieza en `pos` o antes."""
+        k = max(bisect_right(self._claves, pos) - 1, 0)
+        return k, bisect_right(self._bloques[k], pos - self._desplazamientos[k]) - 1
+
+    def __len__(self):
+        return self._primeras[-1] + len(self._bloques[-1])
+
+    def linea(self, pos):
+        k, j = self._ubicar(pos)
+        return self._primeras[k] + j + 1
+
+    def columna(self, pos):
+        k, j = self._ubicar(pos)
+        return pos - self._bloques[k][j] - self._desplazamientos[k] + 1
+
+    def linea_columna(self, pos):
+        k, j = self._ubicar(pos)
+        return self._primeras[k] + j + 1, pos - self._bloques[k][j] - self._desplazamientos[k] + 1
+
+    def inicio_linea(self, linea):
+        """Offset donde empieza `linea`; más allá de la última, el largo del texto."""
+        if linea > len(self):
+            return len(self.texto)
+        k = bisect_right(self._primeras, linea - 1) - 1
+        return self._bloques[k][linea - 1 - self._primeras[k]] + self._desplazamientos[k]
+
+    def fin_linea(self, linea):
+        """Offset del salto de línea que cierra `linea` (o el largo del texto)."""
+        if linea >= len(self):
+            return len(self.texto)
+        return self.inicio_linea(linea + 1) - 1
+
+    def reemplazar(self, inicio, fin, texto, nuevo):
+        """Actualiza el índice tras reemplazar `[inicio, fin)` por `texto`; `nuevo` es el texto completo resultante."""
+        delta = len(texto) - (fin - inicio)
+        ka, ja = self._ubicar(inicio)
+        kb, jb = self._ubicar(fin)
+        bloques, desplazamientos = self._bloques, self._desplazamientos
+        # Se conservan las líneas que empiezan hasta `inicio` y las que empiezan después de `fin`
+        agregados = bloques[ka][:ja + 1]
+        if desplazamientos[ka]:
+            agregados = array("I", map(desplazamientos[ka].__add__, agregados))
+        pos = texto.find("\n")
+        while pos != -1:
+            agregados.append(inicio + pos + 1)
+            pos = texto.find("\n", pos + 1)
+        desplazamiento = desplazamientos[kb] + delta
+        if desplazamiento:
+            agregados.extend(map(desplazamiento.__add__, bloques[kb][jb + 1:]))
+        else:
+            agregados.extend(bloques[kb][jb + 1:])
+
+        primera = self._primeras[ka]
+        dlineas = len(agregados) - (self._primeras[kb] + len(bloques[kb]) - primera)
+        if delta or dlineas:
+            for k in range(kb + 1, len(bloques)):
+                desplazamientos[k] += delta
+                self._claves[k] += delta
+                self._primeras[k] += dlineas
+        self._agrupar(agregados, ka, kb + 1, primera)
+        self.texto = nuevo
+
+
+def indice_lineas(lx):
+    """Índice de líneas del texto que analiza `lx`, construido la primera vez que se pide."""
+    indice = getattr(lx, "indice_lineas", None)
+    if indice is None or indice.texto is not lx.lexdata:
+        indice = lx.indice_lineas = IndiceLineas(lx.lexdata)
+    return indice
@@ -0,0 +1,184 @@
+# MmapLexer.py
+import mmap
+import re
+import ply.lex as lex
+from LexicalAnalyzer.Lexer import lexer
+
+# Reglas que no cambian entre bytes y texto: su alcance no depende de \d ni de \b
+_REGLAS_NEUTRAS = frozenset(("LITERAL_CADENA", "newline", "ignore_COMENTARIO"))
+
+# Cada cuántos bytes se devuelven al sistema las páginas ya analizadas
+_LIBERAR_CADA = 16 << 20
+
+_RE_NO_ASCII = re.compile(rb"[\x80-\xff]")
+
+
+def _reglas_bytes(reglas):
+    """Versión en bytes de las expresiones maestras de PLY (mismos grupos y funciones)."""
+    return [(re.compile(regex.pattern.encode("ascii"), regex.flags & ~re.UNICODE), indices)
+            for regex, indices in reglas]
+
+
+_REGLAS = lexer.lexre
+_REGLAS_BYTES = _reglas_bytes(_REGLAS)
+_IGNORAR = frozenset(lexer.lexignore.encode("ascii"))
+
+
+def _decodificar(datos):
+    return datos.decode("utf-8", "surrogateescape")
+
+
+class _ColumnasMmap:
+    """Columna (en caracteres, desde 1) de un offset en bytes del archivo mapeado.
+
+    Ocupa el lugar de IndiceLineas para `indice_lineas(lx)`: solo se consulta
+    al reportar errores, así que no vale la pena indexar todo el archivo.
+    """
+
+    def __init__(self, datos):
+        self.texto = datos
+
+    def columna(self, pos):
+        inicio = self.texto.rfind(b"\n", 0, pos) + 1
+        return len(_decodificar(self.texto[inicio:pos])) + 1
+
+
+class MmapLexer:
+    """Lexer que lee un archivo UTF-8 mapeado en memoria en lugar de una cadena.
+
+    Aplica las mismas reglas de `Lexer.py` con sus expresiones regulares
+    compiladas para bytes, directamente sobre el `mmap`, así que el sistema
+    carga las páginas a medida que se leen y nunca existe una copia `str` de
+    toda la fuente. Donde un carácter no ASCII puede cambiar el resultado
+    (\\d y \\b de Unicode) se decodifica solo esa línea y se da un paso con las
+    expresiones de texto. Los tokens son los de `lexer` sobre el texto
+    decodificado, salvo que `lexpos` es la posición en bytes.
+
+    Se usa como contexto (`with MmapLexer(ruta) as lx:`) o se cierra con `cerrar()`.
+    """
+
+    def __init__(self, ruta, agrupar_errores=True):
+        with open(ruta, "rb") as archivo:
+            try:
+                self.lexdata = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Archivo vacío: no se puede mapear
+                self.lexdata = b""
+        if hasattr(self.lexdata, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self.lexdata.madvise(mmap.MADV_SEQUENTIAL)
+        self.lexlen = len(self.lexdata)
+        self.lexpos = 0
+        self.lineno = 1
+        self.agrupar_errores = agrupar_errores
+        self.indice_lineas = _ColumnasMmap(self.lexdata)
+        self._ultima_comilla = self.lexdata.rfind(b'"')
+        self._ventana = None  # (inicio, fin, texto, byte, caracter) de la línea decodificada
+        self._liberado = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    def cerrar(self):
+        self.indice_lineas = None
+        if isinstance(self.lexdata, mmap.mmap):
+            self.lexdata.close()
+
+    def skip(self, n):
+        self.lexpos += n
+
+    def token(self):
+        """Devuelve el siguiente token o None al final del archivo."""
+        datos = self.lexdata
+        n = self.lexlen
+        ignorar = _IGNORAR
+        while self.lexpos < n:
+            pos = self.lexpos
+            if datos[pos] in ignorar:
+                self.lexpos = pos + 1
+                continue
+            if pos - self._liberado >= _LIBERAR_CADA:
+                self._liberar(pos)
+
+            for regex, indices in _REGLAS_BYTES:
+                m = regex.match(datos, pos)
+                if m:
+                    break
+            else:
+                tok = self._nuevo_token("error", _decodificar(datos[pos:pos + 1]), pos)
+                lexer.lexerrorf(tok)
+                continue
+
+            fin = m.end()
+            func, tipo = indices[m.lastindex]
+            if tipo in _REGLAS_NEUTRAS:
+                unicode = False
+            elif tipo == "ignore_INVALIDO":
+                unicode = _RE_NO_ASCII.search(datos, pos, fin) is not None
+            else:
+                unicode = (pos > 0 and datos[pos - 1] >= 0x80) or \
+                          (fin < n and datos[fin] >= 0x80) or \
+                          (fin + 1 < n and datos[fin + 1] >= 0x80)
+            if unicode:
+                fin, func, tipo, valor = self._paso_unicode(pos)
+            else:
+                valor = _decodificar(m.group())
+
+            tok = self._nuevo_token(tipo, valor, pos)
+            self.lexpos = fin
+            if func is None:
+                return tok
+            tok = func(tok)
+            if tok is not None:
+                return tok
+        return None
+
+    def _nuevo_token(self, tipo, valor, pos):
+        tok = lex.LexToken()
+        tok.type = tipo
+        tok.value = valor
+        tok.lineno = self.lineno
+        tok.lexpos = pos
+        tok.lexer = self
+        return tok
+
+    def _paso_unicode(self, pos):
+        """Reconoce en `pos` un solo lexema con las reglas de texto sobre la línea decodificada."""
+        datos = self.lexdata
+        ventana = self._ventana
+        if ventana is None or not (ventana[0] <= pos < ventana[1]):
+            inicio = datos.rfind(b"\n", 0, pos) + 1
+            fin = datos.find(b"\n", pos)
+            if fin < 0:
+                fin = self.lexlen
+            texto = _decodificar(datos[inicio:fin])
+            # Una comilla posterior a la línea mantiene abiertas las cadenas que cruzan de línea
+            if self._ultima_comilla >= fin:
+                texto += '\n"'
+            ventana = (inicio, fin, texto, inicio, 0)
+        inicio, fin, texto, byte, caracter = ventana
+        if pos < byte:
+            byte, caracter = inicio, 0
+        caracter += len(_decodificar(datos[byte:pos]))
+
+        for regex, indices in _REGLAS:
+            m = regex.match(texto, caracter)
+            if m:
+                break
+        func, tipo = indices[m.lastindex]
+        valor = m.group()
+        self._ventana = (inicio, fin, texto, pos, caracter)
+        return pos + len(valor.encode("utf-8", "surrogateescape")), func, tipo, valor
+
+    def _liberar(self, pos):
+        """Descarta de la memoria del proceso las páginas ya recorridas (se releen si hacen falta)."""
+        datos = self.lexdata
+        desde = self._liberado - self._liberado % mmap.PAGESIZE
+        hasta = pos - pos % mmap.PAGESIZE
+        if isinstance(datos, mmap.mmap) and hasattr(mmap, "MADV_DONTNEED") and hasta > desde:
+            datos.madvise(mmap.MADV_DONTNEED, desde, hasta - desde)
+        self._liberado = pos
+
+    def __iter__(self):
+        return iter(self.token, None)
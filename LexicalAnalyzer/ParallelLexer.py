@@ -0,0 +1,122 @@
+# ParallelLexer.py
+import os
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.Lexer import crear_lexer, _tramos_multilinea
+from LexicalAnalyzer.TokenBuffer import TokenBuffer
+
+# Por debajo de este tamaño (caracteres) repartir cuesta más que tokenizar
+MIN_PARALELO = 1 << 18
+
+
+def _cortes(codigo, partes):
+    """Posiciones donde partir `codigo` en `partes` trozos de tamaño parecido.
+
+    Cada corte queda justo después de un salto de línea que no está dentro de
+    una cadena (los comentarios terminan en el salto, así que nunca lo
+    contienen). Devuelve también las líneas con que empieza cada trozo, que
+    no cuentan los saltos dentro de cadenas, igual que el lexer.
+    """
+    tramos, _ = _tramos_multilinea(codigo)
+    cortes = [0]
+    lineas = [1]
+    linea = 1
+    t = 0  # Siguiente tramo multilínea por revisar
+    for k in range(1, partes):
+        objetivo = max(len(codigo) * k // partes, cortes[-1])
+        corte = codigo.find("\n", objetivo)
+        while corte != -1:
+            while t < len(tramos) and tramos[t][1] <= corte:
+                t += 1
+            if t == len(tramos) or tramos[t][0] > corte:
+                break
+            corte = codigo.find("\n", tramos[t][1])  # El salto cae dentro de una cadena
+        if corte == -1:
+            break
+        corte += 1
+        if corte <= cortes[-1]:
+            continue
+        # Saltos que el lexer cuenta entre el corte anterior y este
+        linea += codigo.count("\n", cortes[-1], corte)
+        for inicio, fin in tramos:
+            if cortes[-1] <= inicio and fin <= corte:
+                linea -= codigo.count("\n", inicio, fin)
+        cortes.append(corte)
+        lineas.append(linea)
+    return cortes, lineas
+
+
+def _tokenizar_trozo(texto, linea, backend, agrupar_errores):
+    """Tokeniza un trozo en un proceso trabajador.
+
+    Devuelve las columnas del TokenBuffer del trozo (posiciones relativas a
+    él) y los errores registrados.
+    """
+    lx = crear_lexer(backend, agrupar_errores=agrupar_errores)
+    lx.lineno = linea
+    # Los mensajes se imprimen al unir, en orden; aquí se descartan. Los topes de
+    # diagnósticos también se aplican al unir, sobre los errores de todos los trozos
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo), \
+            global_errors.aparte(con_topes=False) as registrados:
+        buffer = TokenBuffer.con_lexer(texto, lx)
+    columnas = (buffer.tipos, buffer.inicios, buffer.fines, buffer.lineas)
+    return columnas, registrados
+
+
+def tokenizar_paralelo(codigo, trabajadores=None, backend="ply", agrupar_errores=True, executor=None,
+                       min_paralelo=MIN_PARALELO):
+    """Tokeniza `codigo` repartiéndolo entre procesos; el resultado es el del `lexer` secuencial.
+
+    Devuelve un TokenBuffer con líneas y posiciones absolutas (listo para
+    `parse_buffer`) y agrega a `global_errors` (y a la consola) los mismos
+    errores léxicos, en el mismo orden y con el mismo tope, que una sola
+    pasada. Los trabajadores devuelven columnas (`array`), que viajan entre
+    procesos como bytes. Se puede pasar un `executor` ya creado para no pagar
+    el arranque de los procesos en cada llamada.
+    """
+    trabajadores = trabajadores or os.cpu_count() or 1
+    if trabajadores == 1 or len(codigo) < min_paralelo:
+        cortes, lineas = [0], [1]
+    else:
+        cortes, lineas = _cortes(codigo, trabajadores)
+    limites = cortes[1:] + [len(codigo)]
+    argumentos = [(codigo[inicio:fin], linea, backend, agrupar_errores)
+                  for inicio, fin, linea in zip(cortes, limites, lineas)]
+
+    if len(argumentos) == 1:
+        resultados = [_tokenizar_trozo(*argumentos[0])]
+    else:
+        propio = executor is None
+        if propio:
+            executor = ProcessPoolExecutor(max_workers=trabajadores)
+        try:
+            resultados = list(executor.map(_tokenizar_trozo, *zip(*argumentos)))
+        finally:
+            if propio:
+                executor.shutdown()
+
+    buffer = TokenBuffer(codigo)
+    for desplazamiento, (columnas, errores) in zip(cortes, resultados):
+        tipos, inicios, fines, lineas_trozo = columnas
+        buffer.tipos.extend(tipos)
+        buffer.lineas.extend(lineas_trozo)
+        if desplazamiento:
+            buffer.inicios.extend(map(desplazamiento.__add__, inicios))
+            buffer.fines.extend(map(desplazamiento.__add__, fines))
+        else:
+            buffer.inicios.extend(inicios)
+            buffer.fines.extend(fines)
+        _unir_errores(errores)
+    return buffer
+
+
+def _unir_errores(errores):
+    """Agrega los errores de un trozo, en orden, tras los de los trozos anteriores.
+
+    `global_errors` aplica sus topes como en la pasada secuencial: el error
+    que alcanza uno queda registrado con su aviso y lanza AnalisisDetenido.
+    """
+    for error in errores:
+        if global_errors.append(error):
+            print(error["mensaje"])
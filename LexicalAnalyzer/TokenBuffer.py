@@ -0,0 +1,145 @@
+# TokenBuffer.py
+from array import array
+from LexicalAnalyzer.Lexer import tokens
+from LexicalAnalyzer.DFALexer import DFALexer, valor_token
+
+# Identificador entero de cada tipo de token (cabe en un byte)
+TIPOS = tuple(tokens)
+ID_TIPO = {tipo: i for i, tipo in enumerate(TIPOS)}
+
+
+class TokenBuffer:
+    """Secuencia de tokens guardada por columnas en lugar de un LexToken por token.
+
+    Cada token ocupa una entrada en cuatro arreglos (`tipos`, `inicios`,
+    `fines`, `lineas`); el texto se toma de la fuente original y el valor de
+    los literales (`("ENTERO", 42)`, ...) solo se construye al pedirlo.
+    """
+
+    def __init__(self, fuente):
+        self.fuente = fuente
+        self.tipos = array("B")
+        self.inicios = array("I")
+        self.fines = array("I")
+        self.lineas = array("I")
+
+    @classmethod
+    def desde_codigo(cls, codigo, lexer=None):
+        """Tokeniza `codigo` con el lexer DFA directamente hacia las columnas.
+
+        `lexer` permite pasar un DFALexer ya configurado (línea inicial,
+        agrupación de errores); si no, se usa uno nuevo.
+        """
+        buffer = cls(codigo)
+        lx = lexer
+        if lx is None:
+            lx = DFALexer()
+        lx.input(codigo)
+        agregar_tipo = buffer.tipos.append
+        agregar_inicio = buffer.inicios.append
+        agregar_fin = buffer.fines.append
+        agregar_linea = buffer.lineas.append
+        for tipo, inicio, fin, linea in lx.escanear():
+            if tipo is None:
+                lx.reportar_error(inicio, fin, linea)
+                continue
+            agregar_tipo(ID_TIPO[tipo])
+            agregar_inicio(inicio)
+            agregar_fin(fin)
+            agregar_linea(linea)
+        return buffer
+
+    @classmethod
+    def desde_lexer(cls, codigo, lexer):
+        """Llena las columnas con los tokens de un lexer con `token()` (p. ej. el de PLY)."""
+        buffer = cls(codigo)
+        lexer.input(codigo)
+        for tok in iter(lexer.token, None):
+            buffer.tipos.append(ID_TIPO[tok.type])
+            buffer.inicios.append(tok.lexpos)
+            buffer.fines.append(lexer.lexpos)
+            buffer.lineas.append(tok.lineno)
+        return buffer
+
+    @classmethod
+    def con_lexer(cls, codigo, lexer):
+        """Tokeniza `codigo` con un lexer de cualquier backend; el DFA llena las columnas directamente."""
+        if isinstance(lexer, DFALexer):
+            return cls.desde_codigo(codigo, lexer=lexer)
+        return cls.desde_lexer(codigo, lexer)
+
+    def __len__(self):
+        return len(self.tipos)
+
+    def tipo(self, i):
+        return TIPOS[self.tipos[i]]
+
+    def texto(self, i):
+        return self.fuente[self.inicios[i]:self.fines[i]]
+
+    def valor(self, i):
+        """Valor del token como lo produce el lexer; se decodifica en cada acceso."""
+        return valor_token(TIPOS[self.tipos[i]], self.texto(i))
+
+    def linea(self, i):
+        return self.lineas[i]
+
+    def posicion(self, i):
+        return self.inicios[i]
+
+    def describir(self, i):
+        """Texto breve del token para mensajes de error."""
+        return f"'{self.texto(i)}' (tipo: {self.tipo(i)}) en línea {self.lineas[i]}"
+
+
+class TokenBuffered:
+    """Vista de un token del buffer con la interfaz que usa el parser de PLY.
+
+    El parser Pratt no las usa: lee las columnas por índice y solo crea una
+    para pasarle a `p_error` el token de un error. Solo existe mientras el
+    parser la retiene; `value` se lee del buffer al acceder, de modo que los
+    operadores y palabras clave nunca lo construyen.
+    `lexer` es el LexerBuffer que la entregó (como `LexToken.lexer`): con su
+    `lexdata` `p_error` calcula la columna.
+    """
+    __slots__ = ("buffer", "indice", "type", "lineno", "lexpos", "lexer")
+
+    def __init__(self, buffer, indice, lexer=None):
+        self.buffer = buffer
+        self.indice = indice
+        self.lexer = lexer
+        self.type = TIPOS[buffer.tipos[indice]]
+        self.lineno = buffer.lineas[indice]
+        self.lexpos = buffer.inicios[indice]
+
+    @property
+    def value(self):
+        return self.buffer.valor(self.indice)
+
+    def __repr__(self):
+        return f"TokenBuffered({self.type},{self.value!r},{self.lineno},{self.lexpos})"
+
+
+class LexerBuffer:
+    """Entrega al parser los tokens de un TokenBuffer (`token`, `lineno`, `lexpos`).
+
+    El parser de PLY pide una vista TokenBuffered por token; el parser Pratt
+    reconoce el LexerBuffer y lee `buffer` desde `siguiente` sin llamar a `token`.
+    """
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+        self.lexdata = buffer.fuente
+        self.siguiente = 0
+        self.lineno = 1
+        self.lexpos = 0
+
+    def token(self):
+        i = self.siguiente
+        if i >= len(self.buffer):
+            return None
+        self.siguiente = i + 1
+        tok = TokenBuffered(self.buffer, i, self)
+        self.lineno = tok.lineno
+        self.lexpos = tok.lexpos
+        return tok
@@ -0,0 +1,395 @@
+# SemanticAnalyzer/IncrementalAnalyzer.py
+"""Análisis semántico incremental: después de una edición re-analiza solo las sentencias afectadas.
+
+Guarda, por cada sentencia de primer nivel del programa, qué nombres
+declara o redefine (un `para` sobre una variable existente la vuelve
+entera), qué nombres usa que vienen de sentencias anteriores y los
+diagnósticos que produjo. Cuando el ParserIncremental cambia algunas
+sentencias, se analizan las nuevas y, si cambia lo que declara alguna, las
+que usan esos nombres hasta la siguiente sentencia que los vuelve a
+declarar. El resto conserva sus tipos (en los nodos) y sus diagnósticos.
+
+Las sentencias se ordenan por etiquetas con huecos entre ellas, no por su
+posición: insertar o quitar sentencias no renumera las siguientes. Los
+diagnósticos de cada sentencia se guardan con las líneas relativas a ella
+que da el ParserIncremental (ver `linea_sentencia`), así que una edición
+que mueve las siguientes de línea no los toca, y `errores` solo recorre
+las sentencias que tienen alguno.
+
+Uso junto al ParserIncremental:
+
+    parser = ParserIncremental(codigo)
+    semantico = AnalizadorIncremental(parser)
+    semantico.actualizar(parser.arbol_relativo)
+    parser.editar(3, 3, "x = x + 1;")
+    semantico.actualizar(parser.arbol_relativo, parser.ultimo_cambio)
+    semantico.errores  # Lo mismo que SemanticAnalyzer().analyze(parser.ast)
+"""
+import heapq
+from GlobalErrors.ErrorsManager import Diagnosticos
+from SyntaxAnalyzer.AST import NodoPrograma, NodoError
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from SemanticAnalyzer.SymbolTable import Simbolo
+
+# Distancia entre las etiquetas de orden de sentencias consecutivas al repartirlas
+SEPARACION = 1 << 16
+
+
+class _Sentencia:
+    """Lo que se sabe de una sentencia de primer nivel desde que se analizó por última vez."""
+    __slots__ = ("nodo", "orden", "define", "slots", "usa", "errores", "pendiente")
+
+    def __init__(self, nodo):
+        self.nodo = nodo
+        self.orden = 0  # Etiqueta creciente con la posición en `ast.declaraciones`
+        self.define = {}  # Nombre -> Simbolo tal como queda después de la sentencia
+        self.slots = {}  # Nombre -> slot de los símbolos que declara
+        self.usa = ()  # Nombres que toma de sentencias anteriores (o que no encontró)
+        self.errores = []  # Con las líneas de los nodos (relativas a la sentencia si lo son ellos)
+        self.pendiente = False  # En la cola de sentencias por analizar
+
+
+class _TablaSentencia:
+    """Tabla de símbolos que ve una sentencia mientras se analiza.
+
+    Tiene la interfaz de TablaSimbolos que usa el SemanticAnalyzer. Un nombre
+    se busca primero entre lo que la sentencia ya declaró y si no, en lo
+    visible en su posición; esto último queda anotado como uso.
+    `simbolos` tiene, por slot, los símbolos que la sentencia declaró o
+    encontró, para los identificadores que el analizador ya resolvió.
+    """
+
+    def __init__(self, incremental, sentencia):
+        self._incremental = incremental
+        self._sentencia = sentencia
+        self.locales = {}
+        self.slots = {}
+        self.simbolos = {}  # Slot -> Simbolo
+        # Nombre -> (Simbolo o None, tipo y constante al buscarlo por primera vez)
+        self.consultados = {}
+
+    def buscar(self, nombre):
+        simbolo = self.locales.get(nombre)
+        if simbolo is not None:
+            return simbolo
+        consultado = self.consultados.get(nombre)
+        if consultado is not None:
+            return consultado[0]
+        simbolo = self._incremental._visible(nombre, self._sentencia.orden)
+        if simbolo is None:
+            self.consultados[nombre] = (None, None, None)
+        else:
+            self.consultados[nombre] = (simbolo, simbolo.tipo, simbolo.constante)
+            self.simbolos[simbolo.slot] = simbolo
+        return simbolo
+
+    def declarar(self, nombre, tipo, linea, constante=False):
+        # Al re-analizar la sentencia, el nombre conserva el slot que tenía
+        slot = self._sentencia.slots.get(nombre)
+        if slot is None:
+            slot = self._incremental._nuevo_slot()
+        simbolo = Simbolo(nombre, tipo, linea, slot, constante)
+        self._incremental.simbolos[slot] = simbolo
+        self.locales[nombre] = simbolo
+        self.slots[nombre] = slot
+        self.simbolos[slot] = simbolo
+        return simbolo
+
+    def cerrar(self):
+        """Lo que la sentencia define: sus declaraciones y los símbolos anteriores que cambió.
+
+        El `para` cambia el símbolo que encuentra en el lugar; acá se le
+        devuelve el estado que tenía y el cambio queda en una copia propia de
+        la sentencia, para que las anteriores sigan viendo el original.
+        """
+        define = dict(self.locales)
+        for nombre, (simbolo, tipo, constante) in self.consultados.items():
+            if simbolo is None or (simbolo.tipo == tipo and simbolo.constante == constante):
+                continue
+            copia = Simbolo(nombre, simbolo.tipo, simbolo.linea, simbolo.slot, simbolo.constante)
+            simbolo.tipo, simbolo.constante = tipo, constante
+            define.setdefault(nombre, copia)
+        return define
+
+
+def _estado(simbolo):
+    return None if simbolo is None else (simbolo.tipo, simbolo.constante)
+
+
+class AnalizadorIncremental:
+    """Mantiene el análisis semántico de un AST que cambia por sentencias de primer nivel.
+
+    `errores` son los diagnósticos del AST actual, en el orden y sin los
+    repetidos de un análisis completo; no pasan por `global_errors`.
+    `rechequeadas` es cuántas sentencias se analizaron en la última
+    actualización. Si el programa tiene una sentencia de primer nivel
+    inválida (NodoError) el análisis completo se detiene en ella, así que se
+    analiza todo con el SemanticAnalyzer y la próxima actualización también
+    es completa.
+
+    `parser` es el ParserIncremental que produce el AST, y el AST que se
+    pasa es su `arbol_relativo`: mientras está en modo incremental las
+    líneas de sus sentencias son relativas y las absolutas se piden a él.
+    Sin `parser`, las del AST ya son absolutas.
+
+    `simbolos[slot]` tiene el Simbolo de cada slot o None si la sentencia
+    que lo declaraba ya no lo declara; como en TablaSimbolos, un slot no se
+    reutiliza. La línea de un Simbolo es relativa a su sentencia.
+    """
+
+    def __init__(self, parser=None):
+        self._parser = parser
+        self._diagnosticos = Diagnosticos()
+        self._analizador = SemanticAnalyzer(self._diagnosticos)
+        self._ast = None
+        self._sentencias = None  # Una _Sentencia por `ast.declaraciones`, o None si no hay estado
+        self._con_errores = []  # Las sentencias con diagnósticos, en orden
+        self._errores = None  # `errores` armado (None si cambió algo desde entonces)
+        self._errores_completo = []
+        self.rechequeadas = 0
+        self.simbolos = []  # Índice: slot
+        self._definiciones = {}  # Nombre -> sentencias que lo definen, en orden
+        self._usuarios = {}  # Nombre -> sentencias que lo usan
+        self._pendientes = []  # Cola (orden, sentencia) por analizar
+
+    # ---------------------------------------------------------------
+    # Actualización
+    # ---------------------------------------------------------------
+
+    def actualizar(self, ast, cambio=None):
+        """Analiza lo que cambió en `ast` y devuelve cuántas sentencias se analizaron.
+
+        `cambio` es el `ultimo_cambio` del ParserIncremental: (primera
+        sentencia, sentencias quitadas, sentencias nuevas), ya reemplazadas en
+        `ast.declaraciones`. Sin `cambio` (o si el AST no es el de la
+        actualización anterior) se analiza todo.
+        """
+        if self._parser is not None and ast is not self._parser.arbol_relativo:
+            raise ValueError("Con un ParserIncremental se analiza su `arbol_relativo`, no su `ast`")
+        self._errores = None
+        if cambio is None or ast is not self._ast or self._sentencias is None:
+            return self._analizar_todo(ast)
+        primera, quitadas, nuevas = cambio
+        declaraciones = ast.declaraciones
+        if len(self._sentencias) - quitadas + nuevas != len(declaraciones):
+            return self._analizar_todo(ast)
+        nodos = declaraciones[primera:primera + nuevas]
+        if any(isinstance(nodo, NodoError) for nodo in nodos):
+            return self._analizar_todo(ast)
+
+        sentencias = self._sentencias
+        definidos = set()
+        for sentencia in sentencias[primera:primera + quitadas]:
+            definidos.update(self._olvidar(sentencia))
+        sentencias[primera:primera + quitadas] = [_Sentencia(nodo) for nodo in nodos]
+        self._etiquetar(primera, nuevas)
+
+        # Lo que definían las sentencias quitadas: las siguientes que lo usaban lo ven distinto
+        anterior = sentencias[primera - 1].orden if primera else 0
+        for nombre in definidos:
+            self._propagar(nombre, anterior)
+        for sentencia in sentencias[primera:primera + nuevas]:
+            self._encolar(sentencia)
+        return self._analizar_pendientes()
+
+    def _analizar_todo(self, ast):
+        self._ast = ast
+        self._definiciones.clear()
+        self._usuarios.clear()
+        self._pendientes.clear()
+        self.simbolos.clear()
+        self._con_errores.clear()
+        self._errores_completo = []
+        declaraciones = ast.declaraciones if isinstance(ast, NodoPrograma) else None
+        if declaraciones is None or any(isinstance(nodo, NodoError) for nodo in declaraciones):
+            # Sin estado incremental: el análisis de siempre sobre todo el programa
+            self._sentencias = None
+            self._diagnosticos.clear()
+            SemanticAnalyzer(self._diagnosticos).analyze(ast)
+            self._errores_completo = list(self._diagnosticos)
+            self.rechequeadas = len(declaraciones or ())
+            return self.rechequeadas
+        self._sentencias = [_Sentencia(nodo) for nodo in declaraciones]
+        self._etiquetar(0, len(declaraciones))
+        for sentencia in self._sentencias:
+            self._encolar(sentencia)
+        return self._analizar_pendientes()
+
+    def _olvidar(self, sentencia):
+        """Quita de las dependencias una sentencia que se reemplaza y devuelve lo que definía."""
+        for nombre in sentencia.usa:
+            self._usuarios[nombre].discard(sentencia)
+        for nombre in sentencia.define:
+            self._definiciones[nombre].remove(sentencia)
+        for slot in sentencia.slots.values():
+            self.simbolos[slot] = None
+        if sentencia.errores:
+            self._con_errores.pop(self._posicion(self._con_errores, sentencia.orden))
+        return sentencia.define.keys()
+
+    def _etiquetar(self, primera, cantidad):
+        """Da `orden` a las `cantidad` sentencias nuevas desde `primera`, entre la anterior y la siguiente.
+
+        Si entre las vecinas no hay lugar, se reparten de nuevo las etiquetas
+        de un tramo alrededor, cada vez el doble de largo, hasta que el tramo
+        tiene lugar de sobra o llega al final (donde no hay límite).
+        """
+        if not cantidad:
+            return
+        sentencias = self._sentencias
+        desde, hasta, margen = primera, primera + cantidad, cantidad
+        while True:
+            bajo = sentencias[desde - 1].orden if desde else 0
+            if hasta == len(sentencias):
+                paso = SEPARACION
+                break
+            paso = (sentencias[hasta].orden - bajo) // (hasta - desde + 1)
+            if paso >= 2 and (hasta - desde == cantidad or paso >= SEPARACION // 64):
+                break
+            desde, hasta = max(desde - margen, 0), min(hasta + margen, len(sentencias))
+            margen *= 2
+        for sentencia in sentencias[desde:hasta]:
+            bajo += paso
+            sentencia.orden = bajo
+
+    # ---------------------------------------------------------------
+    # Análisis de una sentencia
+    # ---------------------------------------------------------------
+
+    def _encolar(self, sentencia):
+        if not sentencia.pendiente:
+            sentencia.pendiente = True
+            heapq.heappush(self._pendientes, (sentencia.orden, id(sentencia), sentencia))
+
+    def _analizar_pendientes(self):
+        """Analiza la cola en orden de posición (lo anterior a cada sentencia ya está al día)."""
+        pendientes = self._pendientes
+        analizadas = 0
+        while pendientes:
+            _, _, sentencia = heapq.heappop(pendientes)
+            sentencia.pendiente = False
+            self._analizar(sentencia)
+            analizadas += 1
+        self.rechequeadas = analizadas
+        return analizadas
+
+    def _analizar(self, sentencia):
+        tabla = _TablaSentencia(self, sentencia)
+        self._analizador.tabla = tabla
+        self._diagnosticos.clear()
+        self._analizador.analizar_sentencia(sentencia.nodo)
+        define = tabla.cerrar()
+        tenia = bool(sentencia.errores)
+        sentencia.errores = list(self._diagnosticos)
+        if tenia != bool(sentencia.errores):
+            posicion = self._posicion(self._con_errores, sentencia.orden)
+            if tenia:
+                self._con_errores.pop(posicion)
+            else:
+                self._con_errores.insert(posicion, sentencia)
+
+        for nombre, slot in sentencia.slots.items():
+            if nombre not in tabla.slots:  # Ya no lo declara
+                self.simbolos[slot] = None
+        sentencia.slots = tabla.slots
+
+        usa = tabla.consultados.keys()
+        for nombre in sentencia.usa:
+            if nombre not in usa:
+                self._usuarios[nombre].discard(sentencia)
+        for nombre in usa:
+            self._usuarios.setdefault(nombre, set()).add(sentencia)
+        sentencia.usa = tuple(usa)
+
+        anterior = sentencia.define
+        sentencia.define = define
+        for nombre in anterior.keys() | define.keys():
+            if _estado(anterior.get(nombre)) == _estado(define.get(nombre)):
+                continue
+            definidoras = self._definiciones.setdefault(nombre, [])
+            if nombre not in define:
+                definidoras.remove(sentencia)
+            elif nombre not in anterior:
+                definidoras.insert(self._posicion(definidoras, sentencia.orden), sentencia)
+            self._propagar(nombre, sentencia.orden)
+
+    # ---------------------------------------------------------------
+    # Dependencias
+    # ---------------------------------------------------------------
+
+    @staticmethod
+    def _posicion(sentencias, orden):
+        """Cuántas de `sentencias` (en orden) están antes de la etiqueta `orden`."""
+        bajo, alto = 0, len(sentencias)
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if sentencias[medio].orden < orden:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    def _visible(self, nombre, orden):
+        """El Simbolo `nombre` como lo deja la última sentencia anterior a `orden` que lo define."""
+        definidoras = self._definiciones.get(nombre)
+        if not definidoras:
+            return None
+        posicion = self._posicion(definidoras, orden)
+        return definidoras[posicion - 1].define[nombre] if posicion else None
+
+    def _propagar(self, nombre, orden):
+        """Encola las sentencias que ven `nombre` como lo define la sentencia de etiqueta `orden`.
+
+        Son las que lo usan después de `orden` y hasta la siguiente que lo
+        define, incluida (también lo usa, para decidir qué hacer con él).
+        """
+        usuarios = self._usuarios.get(nombre)
+        if not usuarios:
+            return
+        definidoras = self._definiciones.get(nombre, ())
+        posicion = self._posicion(definidoras, orden + 1)
+        limite = definidoras[posicion].orden if posicion < len(definidoras) else self._sentencias[-1].orden
+        for sentencia in usuarios:
+            if orden < sentencia.orden <= limite:
+                self._encolar(sentencia)
+
+    def _nuevo_slot(self):
+        self.simbolos.append(None)
+        return len(self.simbolos) - 1
+
+    # ---------------------------------------------------------------
+    # Resultado
+    # ---------------------------------------------------------------
+
+    @property
+    def errores(self):
+        """Diagnósticos del AST actual (una lista nueva en cada lectura).
+
+        Se arman recorriendo solo las sentencias con diagnósticos y se
+        guardan hasta la próxima actualización.
+        """
+        if self._sentencias is None:
+            return list(self._errores_completo)
+        if self._errores is None:
+            self._errores = self._reunir()
+        return list(self._errores)
+
+    def _reunir(self):
+        """Los diagnósticos de las sentencias, con líneas absolutas y sin los repetidos."""
+        con_errores = self._con_errores
+        if self._parser is not None and self._parser.incremental:
+            sentencias = self._sentencias
+            bases = self._parser.lineas_sentencias([self._posicion(sentencias, s.orden) for s in con_errores])
+        else:
+            bases = (1 for _ in con_errores)
+        vistos = set()
+        errores = []
+        for sentencia, base in zip(con_errores, bases):
+            for error in sentencia.errores:
+                if error["linea"] and base != 1:
+                    error = dict(error, linea=error["linea"] + base - 1)
+                clave = (error["linea"], error["tipo"], error["mensaje"])
+                if clave not in vistos:
+                    vistos.add(clave)
+                    errores.append(error)
+        return errores
@@ -1,49 +1,90 @@
 # SemanticAnalyzer/SemanticAnalyzer.py
 from GlobalErrors.ErrorsManager import global_errors
-from SyntaxAnalyzer.AST import NodoPrograma,NodoError
+from SyntaxAnalyzer.AST import NodoPrograma,NodoError,Visitante
 from SyntaxAnalyzer import AST
-
-class SemanticAnalyzer:
-    def __init__(self):
-        self.variables = {}  # {nombre: (tipo, valor, línea_declaración)}
-        self.constantes = {}  # {nombre: (tipo, valor, línea_declaración)}
-        self.current_scope = "global"
-        self.errors = global_errors
+from SemanticAnalyzer.SymbolTable import TablaSimbolos
+from SemanticAnalyzer.TypeRules import COMPATIBLES, tipo_binario
+
+class SemanticAnalyzer(Visitante):
+    def __init__(self, diagnosticos=None, expresiones_compartidas=False):
+        # Variables y constantes
+        self.tabla = TablaSimbolos()
+        # Dónde se registran los errores (por defecto, los de la compilación en curso)
+        self.errors = diagnosticos if diagnosticos is not None else global_errors
+        # Anotaciones del último análisis, fuera de los nodos (que pueden estar
+        # compartidos, ver AST.ExpresionesCompartidas), por `id` de nodo:
+        # `slots` el slot del símbolo de cada NodoIdentificador resuelto y
+        # `_memo` el (tipo, diagnósticos del subárbol) de cada NodoBinario,
+        # por (`id`, `_version`). `_version` cambia con cada cambio de la
+        # tabla (una declaración o un nombre que cambia de tipo), así que un
+        # nodo compartido no repite lo calculado con otra tabla. Un nombre
+        # tiene un solo slot (no hay ámbitos de bloque), así que el de un
+        # identificador compartido no depende de dónde aparece.
+        self.slots = {}
+        self._memo = {}
+        self._version = 0
+        # Si el AST se construyó con `compartir_expresiones` (un nodo para
+        # todas las apariciones de una expresión): sus nodos tienen la línea
+        # de la primera aparición, así que los diagnósticos de una expresión
+        # van a la línea de la sentencia que se visita (`_linea`). Si no, cada
+        # uno va a la línea de su nodo, como siempre.
+        self.expresiones_compartidas = expresiones_compartidas
+        self._linea = 0
+        # (mensaje, argumentos) de los diagnósticos desde el inicio de la sentencia
+        self._emitidos = []
 
     def analyze(self, ast):
         """Método principal para iniciar el análisis semántico"""
-        self.variables.clear()   # ✅ limpiar estado anterior
-        self.constantes.clear()  # ✅ limpiar constantes también
+        self.tabla.limpiar()   # ✅ limpiar estado anterior
+        self.slots.clear()
+        self._memo.clear()
         if isinstance(ast, NodoPrograma):
             self.visit_program(ast)
         else:
             self._add_error("El AST no comienza con un NodoPrograma", 0)
 
+    def analizar_sentencia(self, node):
+        """Analiza una sentencia de primer nivel sobre la tabla actual, sin limpiarla.
+
+        Lo usa el análisis incremental (ver IncrementalAnalyzer), que arma la
+        tabla de cada sentencia con lo que declaran las anteriores.
+        """
+        self.slots.clear()
+        self._memo.clear()
+        self.visit(node)
+
     def visit_program(self, node):
         """Visita un nodo programa"""
         for declaration in node.declaraciones:
             if isinstance(declaration, NodoError):
-                self._add_error(declaration.mensaje, declaration.linea)
+                # El parser ya registró el error de esta sentencia: el análisis se detiene sin repetirlo
                 return
             self.visit(declaration)
 
     def visit(self, node):
-        # Ignorar nodos de error para no contaminar el análisis
-        if node is None or isinstance(node, AST.NodoError):
-            return None  # No hacemos nada con NodoError
-
-        if isinstance(node, str):
-            self._add_error(f"Se esperaba un nodo AST pero se recibió un string: '{node}'", 0)
-            return None
-
-        method_name = f'visit_{type(node).__name__.lower()}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+        """Visita `node` y su subárbol con una pila explícita (`AST.recorrer`).
 
+        El método de cada clase de nodo (`visit_<clase en minúsculas>`) lo
+        resuelve `Visitante` una vez por clase. Los que visitan hijos son
+        generadores: `tipo = yield hijo`.
+        """
+        return self.visitar(node)
 
     def generic_visit(self, node):
         """Método genérico para nodos no implementados"""
-        self._add_error(f"Tipo de nodo no implementado: {type(node).__name__}", node.linea)
+        self._add_error("Tipo de nodo no implementado: {}", node.linea, type(node).__name__)
+
+    visita_generica = generic_visit
+
+    def visit_nodoerror(self, node):
+        # Ignorar nodos de error para no contaminar el análisis
+        return None
+
+    visit_nonetype = visit_nodoerror
+
+    def visit_str(self, node):
+        self._add_error("Se esperaba un nodo AST pero se recibió un string: '{}'", 0, node)
+        return None
 
     # ---------------------------------------------------------------
     # Métodos para visitar nodos específicos
@@ -51,39 +92,36 @@ class SemanticAnalyzer:
 
     def visit_nododeclaracion(self, node):
         """Verifica declaraciones de variables"""
+        self._sentencia(node)
         # Verificar si la variable ya fue declarada
         var_name = node.identificador.nombre  # Obtener el nombre del identificador
-        if var_name in self.variables or var_name in self.constantes:
-            self._add_error(f"Variable '{var_name}' ya declarada", node.linea)
+        if self.tabla.buscar(var_name) is not None:
+            self._add_error("Variable '{}' ya declarada", node.linea, var_name)
             return
 
         # Verificar tipo en asignación si existe
         # Si es constante, inferir su tipo real y sobrescribir
         if getattr(node, "es_constante", False):
-            tipo_real = self.visit(node.expresion)
+            tipo_real = yield node.expresion
             node.tipo = tipo_real
-            self.constantes[var_name] = (tipo_real, None, node.linea)
+            self.slots[id(node.identificador)] = self._declarar(var_name, tipo_real, node.linea, constante=True).slot
             return  # No continúa como variable normal
 
         # Verificar tipo en asignación si existe
         if node.expresion:
-            expr_type = self.visit(node.expresion)
+            expr_type = yield node.expresion
             if expr_type and not self._check_type_compatibility(node.tipo, expr_type, "declaración"):
                 self._add_error(
-                    f"Tipo incompatible en declaración: esperaba '{node.tipo}', obtuvo '{expr_type}'", 
-                    node.linea
+                    "Tipo incompatible en declaración: esperaba '{}', obtuvo '{}'",
+                    node.linea, node.tipo, expr_type
                 )
-        if var_name in self.constantes:
-            self._add_error(f"No se puede modificar la constante '{var_name}'", node.linea)
-            return
-
-
 
         # Registrar la variable
-        self.variables[var_name] = (node.tipo, None, node.linea)
+        self.slots[id(node.identificador)] = self._declarar(var_name, node.tipo, node.linea).slot
 
     def visit_nodoasignacion(self, node):
         """Verifica asignaciones de variables"""
+        self._sentencia(node)
         # Verificar que el identificador sea un nodo válido
         if not isinstance(node.identificador, AST.NodoIdentificador):
             self._add_error("Identificador inválido en asignación", node.linea)
@@ -92,25 +130,28 @@ class SemanticAnalyzer:
         # Extraer el nombre del identificador
         var_name = node.identificador.nombre
         
-        # Verificar si la variable existe
-        if var_name not in self.variables:
-            self._add_error(f"Variable '{var_name}' no declarada", node.linea)
+        # Verificar si la variable existe (las constantes no se asignan)
+        simbolo = self.tabla.buscar(var_name)
+        if simbolo is None or simbolo.constante:
+            self._add_error("Variable '{}' no declarada", node.linea, var_name)
             return
 
-        # Obtener tipo de la variable (usando var_name en lugar del nodo)
-        var_type = self.variables[var_name][0]
+        # Obtener tipo de la variable
+        self.slots[id(node.identificador)] = simbolo.slot
+        var_type = simbolo.tipo
         
         # Verificar la expresión
-        expr_type = self.visit(node.expresion)
+        expr_type = yield node.expresion
         
         # Verificar compatibilidad de tipos
         if expr_type and not self._check_type_compatibility(var_type, expr_type, "asignación"):
             self._add_error(
-                f"Tipo incompatible en asignación: esperaba '{var_type}', obtuvo '{expr_type}'", 
-                node.linea
+                "Tipo incompatible en asignación: esperaba '{}', obtuvo '{}'",
+                node.linea, var_type, expr_type
             )
 
     def visit_nodoif(self, node):
+        self._sentencia(node)
         # Validación de estructura general
         self._verificar_estructura('si', node, [
             ('condicion', "una condición válida"),
@@ -118,13 +159,13 @@ class SemanticAnalyzer:
         ])
 
         # Verifica tipo de condición
-        cond_type = self.visit(node.condicion)
+        cond_type = yield node.condicion
         if cond_type != "booleano":
             self._add_error("La condición del 'si' debe ser booleana", node.linea)
 
         # Verifica cuerpo del if
         for stmt in node.cuerpo_if:
-            self.visit(stmt)
+            yield stmt
             if isinstance(stmt, AST.NodoError):
                 self._add_error("La sentencia 'si' contiene instrucciones inválidas (posible error de estructura)", node.linea)
 
@@ -135,10 +176,11 @@ class SemanticAnalyzer:
                 self._add_error("La sentencia 'sino' está vacía o mal definida", node.linea)
             else:
                 for stmt in node.cuerpo_else:
-                    self.visit(stmt)
+                    yield stmt
 
     def visit_nodomientras(self, node):
         """Verifica sentencias while"""
+        self._sentencia(node)
         # Verificar que la condición sea booleana
         
         self._verificar_estructura('mientras', node, [
@@ -146,16 +188,17 @@ class SemanticAnalyzer:
             ('cuerpo', "un bloque de instrucciones después de 'HACER'")
         ])
         
-        cond_type = self.visit(node.condicion)
+        cond_type = yield node.condicion
         if cond_type != "booleano":
             self._add_error("La condición del 'mientras' debe ser booleana", node.linea)
 
         # Verificar cuerpo del while
         for stmt in node.cuerpo:
-            self.visit(stmt)
+            yield stmt
 
     def visit_nodopara(self, node):
         """Verifica sentencias for"""
+        self._sentencia(node)
         
         self._verificar_estructura('para', node, [
             ('inicio', "un valor inicial (DESDE)"),
@@ -165,14 +208,14 @@ class SemanticAnalyzer:
         # paso puede ser opcional, así que podrías omitirlo
         
         # Validar tipos de inicio, fin y paso
-        inicio_type = self.visit(node.inicio)
-        fin_type = self.visit(node.fin)
+        inicio_type = yield node.inicio
+        fin_type = yield node.fin
 
         if inicio_type != "entero" or fin_type != "entero":
             self._add_error("Los límites del 'para' deben ser enteros", node.linea)
 
         if node.paso:
-            paso_type = self.visit(node.paso)
+            paso_type = yield node.paso
             if paso_type != "entero":
                 self._add_error("El paso del 'para' debe ser entero", node.linea)
                 paso_valor = self._evaluate_literal(node.paso)
@@ -186,11 +229,19 @@ class SemanticAnalyzer:
 
 
         # ✅ Registrar la variable de control antes de visitar el cuerpo
-        self.variables[node.variable.nombre] = ("entero", None, node.linea)
+        # (si el nombre ya existe, aun como constante, pasa a ser esa variable entera)
+        simbolo = self.tabla.buscar(node.variable.nombre)
+        if simbolo is None:
+            simbolo = self._declarar(node.variable.nombre, "entero", node.linea)
+        elif simbolo.tipo != "entero" or simbolo.constante:
+            self._version += 1  # Las expresiones con esta variable cambian de tipo
+            simbolo.tipo = "entero"
+            simbolo.constante = False
+        self.slots[id(node.variable)] = simbolo.slot
 
         # Visitar cuerpo del ciclo
         for stmt in node.cuerpo:
-            self.visit(stmt)
+            yield stmt
 
             
     def visit_nodorepetir(self, node):
@@ -203,135 +254,94 @@ class SemanticAnalyzer:
 
         # Verificar cuerpo del repetir
         for stmt in node.cuerpo:
-            self.visit(stmt)
+            yield stmt
         
         # Verificar que la condición sea booleana
-        cond_type = self.visit(node.condicion)
+        self._sentencia(node, node.linea_condicion)
+        cond_type = yield node.condicion
         if cond_type != "booleano":
             self._add_error("La condición del 'hasta_que' debe ser booleana", node.linea)
 
     def visit_nodobinario(self, node):
         """Verifica operaciones binarias de manera optimizada"""
-        # Memoización: Verificar si ya hemos analizado este nodo
-        if hasattr(node, '_cached_type'):
-            return node._cached_type
-            
+        # Memoización: Verificar si ya hemos analizado este nodo (compartido, ver
+        # AST.ExpresionesCompartidas) con la misma tabla de símbolos. Sus
+        # diagnósticos se repiten en la línea de la sentencia actual.
+        clave = (id(node), self._version)
+        memo = self._memo.get(clave)
+        if memo is not None:
+            result_type, diagnosticos = memo
+            for message, argumentos in diagnosticos:
+                self._add_error(message, self._linea, *argumentos)
+            return result_type
+        inicio = len(self._emitidos)
+
         # Visitar subárboles solo una vez
-        left_type = self.visit(node.izquierda)
-        right_type = self.visit(node.derecha)
+        left_type = yield node.izquierda
+        right_type = yield node.derecha
         
-        print(f"👉 Operación: {node.operador} | Izq: {left_type} | Der: {right_type} (Línea {node.linea})")
+        print(f"👉 Operación: {node.operador} | Izq: {left_type} | Der: {right_type} (Línea {self._linea_de(node)})")
         
         # Validación temprana si hay tipos nulos (por errores previos)
         if left_type is None or right_type is None:
-            return None
-        
-        # Diccionario de operaciones para mejor rendimiento
-        OPERACIONES = {
-            # Operadores aritméticos
-            '+': self._validar_aritmetica,
-            '-': self._validar_aritmetica,
-            '*': self._validar_aritmetica,
-            '/': self._validar_aritmetica,
-            '%': self._validar_aritmetica,
-            
-            # Operadores lógicos
-            'AND': self._validar_logica,
-            'OR': self._validar_logica,
-            
-            # Operadores de comparación
-            '>': self._validar_comparacion,
-            '<': self._validar_comparacion,
-            '>=': self._validar_comparacion,
-            '<=': self._validar_comparacion,
-            '==': self._validar_comparacion,
-            '!=': self._validar_comparacion
-        }
-        
-        # Obtener la función de validación adecuada
-        validacion = OPERACIONES.get(node.operador)
-        if validacion is None:
-            self._add_error(f"Operador '{node.operador}' no reconocido", node.linea)
-            return None
-        
-        # Ejecutar validación específica
-        result_type = validacion(node, left_type, right_type)
+            result_type = None
+        else:
+            result_type = self._validar_binario(node, left_type, right_type)
         
         # Cachear el resultado para futuras visitas
-        node._cached_type = result_type
+        self._memo[clave] = (result_type, self._emitidos[inicio:])
         return result_type
 
-    def _validar_aritmetica(self, node, left_type, right_type):
-        """Valida operaciones aritméticas"""
-        if node.operador == '%':
-            if left_type != 'entero' or right_type != 'entero':
-                self._add_error(f"El operador '%' solo acepta operandos enteros", node.linea)
-                return None
-            return 'entero'
-
-        if left_type not in ['entero', 'decimal'] or right_type not in ['entero', 'decimal']:
-            self._add_error(f"Operación '{node.operador}' no válida para tipos '{left_type}' y '{right_type}'", node.linea)
-            return None
-        
-        if node.operador == '/' and isinstance(node.derecha, AST.NodoLiteral) and node.derecha.valor == 0:
-            self._add_error("División entre cero detectada", node.linea)
-
-        return 'decimal' if 'decimal' in [left_type, right_type] else 'entero'
-
-
-
-    def _validar_logica(self, node, left_type, right_type):
-        """Valida operaciones lógicas"""
-        if left_type != 'booleano' or right_type != 'booleano':
-            self._add_error(f"Operación '{node.operador}' requiere operandos booleanos", node.linea)
-            return None
-        return 'booleano'
-
-    def _validar_comparacion(self, node, left_type, right_type):
-        """Valida operaciones de comparación"""
-        if left_type != right_type:
-            self._add_error(f"Tipos incompatibles en comparación '{node.operador}': {left_type} y {right_type}", node.linea)
-            return None
-        return 'booleano'
+    def _validar_binario(self, node, left_type, right_type):
+        """Tipo del resultado y diagnóstico, precalculados por (operador, tipos) en TypeRules"""
+        result_type, mensaje = tipo_binario(node.operador, left_type, right_type)
+        if mensaje is not None:
+            self._add_error(mensaje, self._linea_de(node))
+        elif node.operador == '/' and isinstance(node.derecha, AST.NodoLiteral) and node.derecha.valor == 0:
+            self._add_error("División entre cero detectada", self._linea_de(node))
+        return result_type
 
     def visit_nodounario(self, node):
         """Verifica operaciones unarias"""
-        expr_type = self.visit(node.expresion)
+        expr_type = yield node.expresion
         
         if node.operador == 'NOT':
             if expr_type != 'booleano':
-                self._add_error("Operador 'NOT' requiere operando booleano", node.linea)
+                self._add_error("Operador 'NOT' requiere operando booleano", self._linea_de(node))
             return 'booleano'
         elif node.operador == '-':
             if expr_type not in ['entero', 'decimal']:
-                self._add_error("Negación solo aplica a números", node.linea)
+                self._add_error("Negación solo aplica a números", self._linea_de(node))
             return expr_type
         
         return None
 
     def visit_nodoidentificador(self, node):
         """Verifica referencias a variables"""
-        if node.nombre not in self.variables and node.nombre not in self.constantes:
-            self._add_error(f"Identificador '{node.nombre}' no declarado", node.linea)
+        # Un identificador compartido ya resuelto no vuelve a buscarse por nombre
+        slot = self.slots.get(id(node))
+        if slot is not None:
+            return self.tabla.simbolos[slot].tipo
+        simbolo = self.tabla.buscar(node.nombre)
+        if simbolo is None:
+            self._add_error("Identificador '{}' no declarado", self._linea_de(node), node.nombre)
             return None
         
         # Retornar el tipo de la variable/constante
-        if node.nombre in self.variables:
-            return self.variables[node.nombre][0]
-        else:
-            return self.constantes[node.nombre][0]
+        self.slots[id(node)] = simbolo.slot
+        return simbolo.tipo
         
     def visit_nodomostrar(self, node):
         """Análisis semántico para sentencias mostrar"""
+        self._sentencia(node)
         if not node.expresiones:
             self._add_error("La sentencia 'mostrar' debe incluir al menos una expresión", node.linea)
             return None
         
         for expr in node.expresiones:
-            expr_type = self.visit(expr)
+            expr_type = yield expr
             if expr_type is None:
-                self._add_error(f"Expresión inválida en 'mostrar'", 
-                            getattr(expr, 'linea', node.linea))
+                self._add_error("Expresión inválida en 'mostrar'", self._linea_de(expr))
         
         return None  # Mostrar no devuelve valor
 
@@ -343,16 +353,23 @@ class SemanticAnalyzer:
     # Métodos auxiliares
     # ---------------------------------------------------------------
 
+    def _sentencia(self, node, linea=None):
+        """Las expresiones que se visiten a continuación son de la sentencia `node` (en `linea`, o la suya)."""
+        self._linea = node.linea if linea is None else linea
+        self._emitidos.clear()
+
+    def _linea_de(self, node):
+        """Línea de los diagnósticos de la expresión `node` (ver `expresiones_compartidas`)."""
+        return self._linea if self.expresiones_compartidas else node.linea
+
+    def _declarar(self, nombre, tipo, linea, constante=False):
+        """`tabla.declarar`, invalidando lo memorizado: un nombre nuevo cambia lo que resuelven las expresiones."""
+        self._version += 1
+        return self.tabla.declarar(nombre, tipo, linea, constante)
+
     def _check_type_compatibility(self, expected_type, actual_type, context):
-        """Verifica compatibilidad de tipos"""
-        valid_combinations = {
-            "entero": ["entero"],
-            "decimal": ["entero", "decimal"],
-            "cadena": ["cadena"],
-            "booleano": ["booleano"],
-            "constante": ["entero", "decimal", "cadena", "booleano"],
-        }
-        return expected_type in valid_combinations and actual_type in valid_combinations[expected_type]
+        """Verifica compatibilidad de tipos (tabla `COMPATIBLES` de TypeRules)"""
+        return (expected_type, actual_type) in COMPATIBLES
     
     def _verificar_estructura(self, nombre, nodo, campos):
         """
@@ -368,15 +385,12 @@ class SemanticAnalyzer:
             valor = getattr(nodo, campo, None)
             if valor is None or (isinstance(valor, list) and len(valor) == 0):
                 self._add_error(
-                    f"La sentencia '{nombre}' no tiene {descripcion}",
-                    getattr(nodo, "linea", 0)
+                    "La sentencia '{}' no tiene {}",
+                    getattr(nodo, "linea", 0), nombre, descripcion
                 )
 
 
-    def _add_error(self, message, line):
-        """Agrega un error semántico a la lista global"""
-        self.errors.append({
-            "tipo": "semántico",
-            "linea": line,
-            "mensaje": f"❌ {message}"
-        })
\ No newline at end of file
+    def _add_error(self, message, line, *argumentos):
+        """Registra un error semántico; el texto es `message.format(*argumentos)` si hay argumentos"""
+        self._emitidos.append((message, argumentos))
+        self.errors.agregar("semántico", line, "❌ " + message, *argumentos)
\ No newline at end of file
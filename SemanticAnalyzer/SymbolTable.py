@@ -0,0 +1,57 @@
+# SemanticAnalyzer/SymbolTable.py
+"""Tabla de símbolos del análisis semántico: un registro por símbolo, en orden de declaración.
+
+El lenguaje no tiene ámbitos de bloque: lo declarado dentro de un `si`, un
+ciclo o un `para` sigue visible después, igual que en el Python plano que
+genera el TAC. Por eso la tabla es un solo diccionario nombre -> Simbolo.
+Cada símbolo lleva su posición en `simbolos` (`slot`); el analizador anota
+el de cada identificador que resuelve (`SemanticAnalyzer.slots`).
+"""
+
+
+class Simbolo:
+    """Un registro por símbolo declarado."""
+    __slots__ = ("nombre", "tipo", "linea", "slot", "constante")
+
+    def __init__(self, nombre, tipo, linea, slot, constante=False):
+        self.nombre = nombre
+        self.tipo = tipo  # "entero", "decimal", ... (para una constante, el de su expresión)
+        self.linea = linea  # Línea de la declaración
+        self.slot = slot
+        self.constante = constante
+
+    def __repr__(self):
+        clase = "constante" if self.constante else "variable"
+        return f"Simbolo({clase} {self.tipo} '{self.nombre}', slot={self.slot}, linea={self.linea})"
+
+
+class TablaSimbolos:
+    """Los símbolos declarados, por nombre y en orden de declaración."""
+
+    def __init__(self):
+        self.simbolos = []  # Índice: slot
+        self._por_nombre = {}
+
+    def limpiar(self):
+        """Vuelve al estado inicial, sin símbolos."""
+        self.simbolos.clear()
+        self._por_nombre.clear()
+
+    def declarar(self, nombre, tipo, linea, constante=False):
+        """Registra `nombre` con un slot nuevo y devuelve su Simbolo.
+
+        No comprueba redeclaraciones: el analizador decide con `buscar` qué
+        error informar.
+        """
+        simbolo = Simbolo(nombre, tipo, linea, len(self.simbolos), constante)
+        self.simbolos.append(simbolo)
+        self._por_nombre[nombre] = simbolo
+        return simbolo
+
+    def buscar(self, nombre):
+        """El Simbolo declarado con ese nombre, o None."""
+        return self._por_nombre.get(nombre)
+
+    def __len__(self):
+        """Cantidad de slots asignados."""
+        return len(self.simbolos)
@@ -0,0 +1,68 @@
+# SemanticAnalyzer/TypeRules.py
+"""Reglas de tipos del lenguaje, precalculadas en tablas al importar el módulo.
+
+`REGLAS_BINARIAS[(operador, tipo izquierdo, tipo derecho)]` es el par
+(tipo del resultado, mensaje de error o None) de cada combinación de los
+tipos conocidos; `tipo_binario` consulta la tabla y calcula (y guarda) las
+que falten. `COMPATIBLES` tiene los pares (tipo esperado, tipo obtenido)
+válidos en declaraciones y asignaciones.
+"""
+
+TIPOS = ("entero", "decimal", "cadena", "booleano", "constante")
+NUMERICOS = ("entero", "decimal")
+
+ARITMETICOS = ("+", "-", "*", "/", "%")
+LOGICOS = ("AND", "OR")
+COMPARACIONES = (">", "<", ">=", "<=", "==", "!=")
+
+
+def regla_binaria(operador, izquierdo, derecho):
+    """(tipo del resultado, mensaje de error o None) de `izquierdo operador derecho`."""
+    if operador == "%":
+        if izquierdo != "entero" or derecho != "entero":
+            return None, "El operador '%' solo acepta operandos enteros"
+        return "entero", None
+    if operador in ARITMETICOS:
+        if izquierdo not in NUMERICOS or derecho not in NUMERICOS:
+            return None, f"Operación '{operador}' no válida para tipos '{izquierdo}' y '{derecho}'"
+        return ("decimal" if "decimal" in (izquierdo, derecho) else "entero"), None
+    if operador in LOGICOS:
+        if izquierdo != "booleano" or derecho != "booleano":
+            return None, f"Operación '{operador}' requiere operandos booleanos"
+        return "booleano", None
+    if operador in COMPARACIONES:
+        if izquierdo != derecho:
+            return None, f"Tipos incompatibles en comparación '{operador}': {izquierdo} y {derecho}"
+        return "booleano", None
+    return None, f"Operador '{operador}' no reconocido"
+
+
+REGLAS_BINARIAS = {
+    (operador, izquierdo, derecho): regla_binaria(operador, izquierdo, derecho)
+    for operador in ARITMETICOS + LOGICOS + COMPARACIONES
+    for izquierdo in TIPOS
+    for derecho in TIPOS
+}
+
+
+def tipo_binario(operador, izquierdo, derecho):
+    """Como `regla_binaria`, desde la tabla."""
+    clave = (operador, izquierdo, derecho)
+    regla = REGLAS_BINARIAS.get(clave)
+    if regla is None:
+        # Operador o tipo fuera de la tabla (p. ej. 'and' en minúsculas): los
+        # operadores y tipos salen de conjuntos finitos, la tabla no crece sin fin
+        regla = REGLAS_BINARIAS[clave] = regla_binaria(operador, izquierdo, derecho)
+    return regla
+
+
+# Tipos que acepta cada tipo declarado
+_ACEPTA = {
+    "entero": ("entero",),
+    "decimal": ("entero", "decimal"),
+    "cadena": ("cadena",),
+    "booleano": ("booleano",),
+    "constante": ("entero", "decimal", "cadena", "booleano"),
+}
+
+COMPATIBLES = frozenset((esperado, obtenido) for esperado, tipos in _ACEPTA.items() for obtenido in tipos)
@@ -1,15 +1,68 @@
 # AST.py
+import sys
+from types import GeneratorType
+
+# Los nodos declaran `__slots__` (sin `__dict__` por instancia); el analizador
+# semántico guarda sus anotaciones en tablas propias, por `id` de nodo. Los nombres
+# (identificadores, tipos, operadores) se internan con `sys.intern` y los
+# valores de los literales se comparten entre nodos iguales.
+
+# Valores de literales ya vistos, por (tipo de Python, valor)
+_LITERALES = {}
+MAX_LITERALES_COMPARTIDOS = 1 << 16
+
+
+def compartir_literal(valor):
+    """Devuelve el objeto ya guardado igual a `valor` (mismo tipo), o guarda este."""
+    clave = (type(valor), valor)
+    compartido = _LITERALES.get(clave)
+    if compartido is None:
+        if len(_LITERALES) >= MAX_LITERALES_COMPARTIDOS:
+            _LITERALES.clear()  # Tope de memoria para el editor, que analiza sin parar
+        compartido = _LITERALES[clave] = valor
+    return compartido
+
+
 class Nodo:
     """Clase base para todos los nodos del AST."""
+    __slots__ = ("linea",)
+    _campos = ("linea",)  # Todos los slots de la clase, en orden de declaración
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._campos = cls._campos + tuple(cls.__dict__.get("__slots__", ()))
+
     def __init__(self, linea=0):
         self.linea = linea
     def accept(self, visitor):
-        """Patrón Visitor para recorrer el AST."""
-        return visitor.visit(self)
+        """Patrón Visitor para recorrer el AST (`visitor` es un `Visitante`)."""
+        return visitor.visitar(self)
+
+    def campos(self):
+        """Lista de (nombre, valor) de los atributos asignados (reemplaza a `__dict__`)."""
+        resultado = []
+        for nombre in self._campos:
+            try:
+                resultado.append((nombre, getattr(self, nombre)))
+            except AttributeError:
+                pass  # Atributo todavía sin asignar
+        return resultado
+
+    def hijos(self):
+        """Nodos hijos en el orden de sus campos (los de las listas, en orden; sin None)."""
+        resultado = []
+        for nombre in self._campos:
+            valor = getattr(self, nombre, None)
+            if isinstance(valor, Nodo):
+                resultado.append(valor)
+            elif type(valor) is list:
+                resultado.extend(elemento for elemento in valor if isinstance(elemento, Nodo))
+        return resultado
 
 
 class NodoPrograma(Nodo):
     """Nodo raíz del AST. Representa un programa completo."""
+    __slots__ = ("declaraciones",)
     def __init__(self, declaraciones, linea):
         super().__init__(linea)
         self.declaraciones = declaraciones  # Lista de nodos (declaraciones, if, while, etc.)
@@ -22,16 +75,19 @@ class NodoPrograma(Nodo):
 
 class NodoIf(Nodo):
     """Nodo para la estructura 'si-entonces-sino'."""
-    def __init__(self, condicion, cuerpo_if, cuerpo_else, linea):
+    __slots__ = ("condicion", "cuerpo_if", "cuerpo_else", "tiene_sino")
+    def __init__(self, condicion, cuerpo_if, cuerpo_else, linea, tiene_sino=False):
         self.condicion = condicion  # NodoExpresion (debe ser booleana)
         self.cuerpo_if = cuerpo_if    # Lista de nodos (bloque THEN)
         self.cuerpo_else = cuerpo_else  # Lista de nodos (bloque ELSE, opcional)
         self.linea = linea
+        self.tiene_sino = tiene_sino  # True si el usuario escribió "sino" (aunque el bloque esté vacío)
     def __repr__(self):
         return f"{type(self).__name__}(linea={self.linea})"
 
 class NodoMientras(Nodo):
     """Nodo para la estructura 'mientras-hacer'."""
+    __slots__ = ("condicion", "cuerpo")
     def __init__(self, condicion, cuerpo, linea):
         self.condicion = condicion  # NodoExpresion (debe ser booleana)
         self.cuerpo = cuerpo        # Lista de nodos (bloque DO)
@@ -41,15 +97,19 @@ class NodoMientras(Nodo):
 
 class NodoRepetir(Nodo):
     """Nodo para la estructura 'repetir-hasta_que'."""
-    def __init__(self, cuerpo, condicion, linea):
+    __slots__ = ("cuerpo", "condicion", "linea_condicion")
+    def __init__(self, cuerpo, condicion, linea, linea_condicion=None):
         self.cuerpo = cuerpo      # Lista de nodos (bloque REPEAT)
         self.condicion = condicion  # NodoExpresion (debe ser booleana)
         self.linea = linea
+        # Línea de HASTA_QUE: la de los diagnósticos de la condición
+        self.linea_condicion = linea if linea_condicion is None else linea_condicion
     def __repr__(self):
         return f"{type(self).__name__}(linea={self.linea})"
 
 class NodoPara(Nodo):
     """Nodo para la estructura 'para-desde-hasta-con_paso'."""
+    __slots__ = ("variable", "inicio", "fin", "paso", "cuerpo")
     def __init__(self, variable, inicio, fin, paso, cuerpo, linea):
         self.variable = variable  # NodoIdentificador (variable de iteración)
         self.inicio = inicio      # NodoExpresion (valor inicial, debe ser entero)
@@ -62,6 +122,7 @@ class NodoPara(Nodo):
 
 class NodoMostrar(Nodo):
     """Nodo para la estructura 'mostrar'."""
+    __slots__ = ("expresiones",)
     def __init__(self, expresiones, linea):
         self.expresiones = expresiones  # Lista de nodos expresión
         self.linea = linea
@@ -75,8 +136,9 @@ class NodoMostrar(Nodo):
 
 class NodoDeclaracion(Nodo):
     """Nodo para declaración de variables (con/sin asignación)."""
+    __slots__ = ("tipo", "identificador", "expresion", "es_constante")
     def __init__(self, tipo, identificador, expresion, linea, es_constante=False):
-        self.tipo = tipo          # Tipo de dato ("entero", "cadena", etc.)
+        self.tipo = sys.intern(tipo)  # Tipo de dato ("entero", "cadena", etc.)
         self.identificador = identificador  # Nombre de la variable
         self.expresion = expresion  # NodoExpresion (valor inicial, opcional)
         self.linea = linea
@@ -86,6 +148,7 @@ class NodoDeclaracion(Nodo):
 
 class NodoAsignacion(Nodo):
     """Nodo para asignación de variables."""
+    __slots__ = ("identificador", "expresion")
     def __init__(self, identificador, expresion, linea):
         self.identificador = identificador  # Nombre de la variable
         self.expresion = expresion  # NodoExpresion (valor a asignar)
@@ -95,8 +158,9 @@ class NodoAsignacion(Nodo):
 
 class NodoIdentificador(Nodo):
     """Nodo para referencias a variables/constantes."""
+    __slots__ = ("nombre",)
     def __init__(self, nombre, linea):
-        self.nombre = nombre      # Nombre del identificador
+        self.nombre = sys.intern(nombre)  # Nombre del identificador
         self.linea = linea
         
     def __repr__(self):
@@ -107,17 +171,19 @@ class NodoIdentificador(Nodo):
 
 class NodoLiteral(Nodo):
     """Nodo para valores literales (números, cadenas, booleanos)."""
+    __slots__ = ("tipo", "valor")
     def __init__(self, tipo, valor, linea):
-        self.tipo = tipo          # Tipo del literal ("entero", "cadena", etc.)
-        self.valor = valor        # Valor concreto (42, "hola", True, etc.)
+        self.tipo = sys.intern(tipo)  # Tipo del literal ("entero", "cadena", etc.)
+        self.valor = compartir_literal(valor)  # Valor concreto (42, "hola", True, etc.)
         self.linea = linea
     def __repr__(self):
         return f"{type(self).__name__}(linea={self.linea})"
 
 class NodoBinario(Nodo):
     """Nodo para operaciones binarias (+, -, *, /, AND, OR, etc.)."""
+    __slots__ = ("operador", "izquierda", "derecha", "tipo")
     def __init__(self, operador, izquierda, derecha, linea):
-        self.operador = operador
+        self.operador = sys.intern(operador)
         self.izquierda = izquierda
         self.derecha = derecha
         self.linea = linea
@@ -128,16 +194,189 @@ class NodoBinario(Nodo):
 
 class NodoUnario(Nodo):
     """Nodo para operaciones unarias (NOT, negativo)."""
+    __slots__ = ("operador", "expresion")
     def __init__(self, operador, expresion, linea):
-        self.operador = operador  # Operador ("NOT", "-")
+        self.operador = sys.intern(operador)  # Operador ("NOT", "-")
         self.expresion = expresion  # NodoExpresion
         self.linea = linea
     def __repr__(self):
         return f"{type(self).__name__}(linea={self.linea})"
     
 class NodoError(Nodo):
+    __slots__ = ("mensaje",)
     def __init__(self, mensaje, linea=0):
         super().__init__(linea)
         self.mensaje = mensaje
     def __repr__(self):
         return f"{type(self).__name__}(linea={self.linea})"
+
+
+# ---------------------------------------------------------------
+# Expresiones compartidas (hash-consing)
+# ---------------------------------------------------------------
+# Las expresiones del lenguaje no tienen efectos: dos apariciones con la
+# misma estructura valen lo mismo. En este modo (opcional, ver
+# `parse_buffer(compartir_expresiones=True)`) el parser construye un solo
+# nodo para todas ellas y el AST pasa a ser un grafo acíclico. Cada nodo
+# compartido conserva la línea de su primera aparición, así que nadie debe
+# modificarlo ni tomar de él la línea de un diagnóstico: el analizador
+# semántico (con `expresiones_compartidas=True`) usa la de la sentencia que
+# contiene la expresión, y el parser
+# incremental, que cuenta las líneas de los nodos desde su sentencia, no usa
+# este modo.
+
+class ExpresionesCompartidas:
+    """Construye las expresiones de un análisis reutilizando las estructuralmente iguales.
+
+    Como los hijos ya son únicos, la clave de un nodo compuesto usa su `id`;
+    la tabla mantiene vivos todos los nodos, así que los `id` no se reciclan
+    mientras se use. Hay que crear una tabla por análisis.
+    """
+    __slots__ = ("_nodos", "creados", "pedidos")
+
+    def __init__(self):
+        self._nodos = {}
+        self.creados = 0  # Nodos distintos construidos
+        self.pedidos = 0  # Expresiones que pidió el parser
+
+    def _compartir(self, clave, construir, *argumentos):
+        self.pedidos += 1
+        nodo = self._nodos.get(clave)
+        if nodo is None:
+            nodo = self._nodos[clave] = construir(*argumentos)
+            self.creados += 1
+        return nodo
+
+    def identificador(self, nombre, linea):
+        return self._compartir((NodoIdentificador, nombre), NodoIdentificador, nombre, linea)
+
+    def literal(self, tipo, valor, linea):
+        # El tipo de Python separa 1, 1.0 y True, que son iguales como claves
+        return self._compartir((NodoLiteral, tipo, type(valor), valor), NodoLiteral, tipo, valor, linea)
+
+    def binario(self, operador, izquierda, derecha, linea):
+        return self._compartir((NodoBinario, operador, id(izquierda), id(derecha)),
+                               NodoBinario, operador, izquierda, derecha, linea)
+
+    def unario(self, operador, expresion, linea):
+        return self._compartir((NodoUnario, operador, id(expresion)), NodoUnario, operador, expresion, linea)
+
+
+# ---------------------------------------------------------------
+# Recorridos sin recursión
+# ---------------------------------------------------------------
+# Una cadena como `a + a + ... + a` produce un espinazo de NodoBinario tan
+# profundo como términos tiene; recorrerlo con recursión de Python agota la
+# pila. Estos recorridos usan una pila explícita: la profundidad solo la
+# limita la memoria.
+
+def preorden(raiz):
+    """Itera los nodos de `raiz` (nodo o lista) en preorden."""
+    pendientes = [raiz]
+    while pendientes:
+        actual = pendientes.pop()
+        if type(actual) is list:
+            pendientes.extend(reversed(actual))
+        elif isinstance(actual, Nodo):
+            yield actual
+            hijos = actual.hijos()
+            hijos.reverse()
+            pendientes.extend(hijos)
+
+
+def recorrer(raiz, visitar):
+    """Devuelve `visitar(raiz)` resolviendo las visitas anidadas con una pila explícita.
+
+    `visitar(nodo)` devuelve el resultado del nodo o un generador. Dentro del
+    generador, `resultado = yield hijo` visita `hijo` con el mismo `visitar`
+    y continúa con su resultado; el `return` del generador es el resultado
+    del nodo. El código de cada visita se escribe como si fuera recursivo,
+    con el orden que necesite (pre, in o postorden). Las excepciones de una
+    visita llegan al `yield` de la visita padre, como con recursión.
+    """
+    valor = visitar(raiz)
+    if type(valor) is not GeneratorType:
+        return valor
+    pila = [valor]
+    apilar = pila.append
+    generador = valor
+    valor = None
+    error = None
+    while True:
+        try:
+            if error is None:
+                hijo = generador.send(valor)
+            else:
+                excepcion, error = error, None
+                hijo = generador.throw(excepcion)
+        except StopIteration as fin:
+            pila.pop()
+            valor = fin.value
+            if not pila:
+                return valor
+            generador = pila[-1]
+            continue
+        except BaseException as e:
+            pila.pop()
+            if not pila:
+                raise
+            generador = pila[-1]
+            valor, error = None, e
+            continue
+        try:
+            valor = visitar(hijo)
+        except BaseException as e:
+            valor, error = None, e
+            continue
+        if type(valor) is GeneratorType:
+            apilar(valor)
+            generador = valor
+            valor = None
+
+
+class Visitante:
+    """Base de los recorridos del AST con despacho precalculado por clase.
+
+    El método que atiende cada clase de nodo se busca una sola vez, por nombre
+    (`prefijo` + nombre de la clase en minúsculas, subiendo por la jerarquía
+    de clases), y queda en una tabla propia de cada subclase. Si ninguna
+    clase de la jerarquía tiene método se usa `visita_generica`. Los métodos
+    pueden ser generadores que visitan a sus hijos con `yield` (ver `recorrer`).
+    """
+    prefijo = "visit_"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._despacho = {}  # clase del nodo -> función sin enlazar
+
+    @classmethod
+    def nombre_metodo(cls, clase):
+        return cls.prefijo + clase.__name__.lower()
+
+    @classmethod
+    def metodo_para(cls, clase):
+        """Función que atiende a los nodos de `clase` (se resuelve una vez y se guarda)."""
+        metodo = cls._despacho.get(clase)
+        if metodo is None:
+            for base in clase.__mro__:
+                metodo = getattr(cls, cls.nombre_metodo(base), None)
+                if metodo is not None:
+                    break
+            else:
+                metodo = cls.visita_generica
+            cls._despacho[clase] = metodo
+        return metodo
+
+    def despachar(self, nodo):
+        """Atiende solo a `nodo`; devuelve su resultado o el generador de su visita."""
+        metodo = self._despacho.get(type(nodo))
+        if metodo is None:
+            metodo = self.metodo_para(type(nodo))
+        return metodo(self, nodo)
+
+    def visitar(self, nodo):
+        """Visita `nodo` y su subárbol sin recursión."""
+        return recorrer(nodo, self.despachar)
+
+    def visita_generica(self, nodo):
+        raise TypeError(f"{type(self).__name__} no sabe visitar {type(nodo).__name__}")
@@ -0,0 +1,409 @@
+# BinaryAST.py
+import functools
+import marshal
+import sys
+from array import array
+from operator import attrgetter
+from SyntaxAnalyzer import AST
+
+# Formato: MAGIA seguida de `marshal` de la tupla
+#   (formas, cadenas, otros, codigos, numeros)
+# formas:  por cada forma de nodo, (clase, nombres de atributos, clases de atributos)
+# cadenas: los textos distintos, una vez cada uno
+# otros:   decimales y enteros que no caben en `numeros` (negativos o de más de 32 bits)
+# codigos: un byte por valor; 0-9 son los tipos de abajo, 10+k es un nodo de la
+#          forma k y 255 (`_FORMA_LARGA`), uno cuya forma va en `numeros`
+# numeros: enteros sin signo de 32 bits (little endian) que acompañan a algunos códigos:
+#          el valor de un entero, el índice de una cadena, el largo de una
+#          lista, tupla o diccionario, el índice de un nodo ya escrito y los
+#          atributos en línea de los nodos
+# Los valores se escriben en postorden (cada compuesto después de sus
+# elementos), así que al leer basta una pila de valores: cada compuesto toma
+# los suyos del tope. Codificador y decodificador no usan recursión: un
+# espinazo de miles de NodoBinario no agota la pila de Python. Un nodo que
+# aparece más de una vez (las expresiones compartidas de
+# `AST.ExpresionesCompartidas`) se escribe la primera vez y después se
+# referencia por su índice, así que al leerlo sigue siendo un solo nodo.
+# La clase de cada atributo de una forma es "e" (entero de 32 bits), "c"
+# (cadena), "d" (decimal, índice en `otros`), "b" (booleano), "n" (None) o
+# "v" (cualquier otro valor). Solo los "v" tienen código propio y pasan por
+# la pila; los demás van en `numeros` justo después de los de sus hijos
+# ("n" ni eso), así que la línea, el nombre o el operador de un nodo no
+# cuestan un paso más.
+# Las tablas y los números van por `marshal` y `array`, que trabajan en C, y
+# cada forma se lee y se escribe con funciones generadas (`_constructor` y
+# `_separador`): en Python solo queda un paso por nodo y por valor compuesto.
+MAGIA = b"PAST\x04"
+# Desde la versión 3 `marshal` marca los objetos según cuántas referencias
+# tengan en ese momento: la 2 da los mismos bytes para el mismo AST
+_VERSION_MARSHAL = 2
+
+(_NINGUNO, _FALSO, _VERDADERO, _ENTERO, _OTRO, _CADENA, _LISTA, _TUPLA, _DICCIONARIO,
+ _REFERENCIA) = range(10)
+_NODO = 10
+_FORMA_LARGA = 255
+_MAX_FORMAS_CORTAS = _FORMA_LARGA - _NODO
+_MAX_NUMERO = 1 << 32
+
+# Marcas en la pila del codificador: el valor de debajo ya tiene sus elementos
+# escritos. Debajo de `_CIERRE_NODO` está la tupla (id del nodo, su código,
+# sus números en línea)
+_CIERRE = object()
+_CIERRE_NODO = object()
+
+# Clase de atributo (ver arriba) según el tipo del valor
+_CLASE_VALOR = {int: "e", str: "c", float: "d", bool: "b", type(None): "n"}
+
+# Clases que se pueden reconstruir: solo nodos del AST, nunca código arbitrario
+_CLASES = {nombre: clase for nombre, clase in vars(AST).items()
+           if isinstance(clase, type) and issubclass(clase, AST.Nodo)}
+
+
+class FormatoASTInvalido(ValueError):
+    """Los datos no son un AST codificado con este formato."""
+
+
+def _numeros_a_bytes(numeros):
+    if sys.byteorder != "little":
+        numeros.byteswap()
+    return numeros.tobytes()
+
+
+def _lector(campos):
+    """Función que devuelve la tupla de valores de `campos` de un nodo (AttributeError si falta alguno)."""
+    if len(campos) == 1:
+        obtener = attrgetter(campos[0])
+        return lambda nodo: (obtener(nodo),)
+    return attrgetter(*campos)
+
+
+class _Indices(dict):
+    """Índice de cada valor en el orden en que se vio por primera vez."""
+
+    def __missing__(self, valor):
+        indice = self[valor] = len(self)
+        return indice
+
+
+@functools.lru_cache(maxsize=1024)
+def _separador(clases, prefijo):
+    """Función que reparte los valores de un nodo: (números en línea, valores para la pila, al revés).
+
+    Se genera una por combinación de clases de atributos (como
+    `_constructor` al leer) y se reutiliza entre llamadas; los números
+    empiezan por `prefijo` (la forma, si es larga). Devuelve None si un
+    entero no cabe en 32 bits.
+    """
+    enteros = [f"0 <= c[{posicion}] < {_MAX_NUMERO}" for posicion, clase in enumerate(clases) if clase == "e"]
+    en_linea = [str(numero) for numero in prefijo]
+    en_linea += [f"cadenas[c[{posicion}]]" if clase == "c" else f"o{posicion}" if clase == "d" else f"c[{posicion}]"
+                 for posicion, clase in enumerate(clases) if clase in "ecdb"]
+    de_pila = [f"c[{posicion}]" for posicion, clase in enumerate(clases) if clase == "v"][::-1]
+    lineas = ["def separar(c, cadenas, otros):"]
+    if enteros:
+        lineas.append(f"    if not ({' and '.join(enteros)}):")
+        lineas.append("        return None")
+    for posicion, clase in enumerate(clases):
+        if clase == "d":
+            lineas.append(f"    o{posicion} = len(otros)")
+            lineas.append(f"    otros.append(c[{posicion}])")
+    lineas.append(f"    return [{', '.join(en_linea)}], [{', '.join(de_pila)}]")
+    espacio = {}
+    exec("\n".join(lineas), espacio)
+    return espacio["separar"]
+
+
+class _Codificador:
+    def __init__(self):
+        self.codigos = bytearray()
+        self.numeros = array("I")
+        self.cadenas = _Indices()
+        self.otros = []
+        self.formas = {}  # (nombre de clase, nombres de atributos, clases de atributos) -> índice de forma
+        # Clase de nodo -> lector de todos sus campos; False para los demás tipos
+        self.lectores = dict.fromkeys((list, tuple, dict, int, str, float, bool, type(None)), False)
+        self.planes = {}  # (clase, nombres, tipos de los valores) -> plan (ver `plan`)
+        self.planes_completos = {}  # (clase, *tipos de sus `_campos`) -> plan, el caso común
+
+    def plan(self, clase, nombres, tipos):
+        """(código del nodo, separador de sus valores, si no tiene ninguno por la pila).
+
+        Con `tipos` None todos los atributos van por la pila (para enteros
+        que no caben en 32 bits).
+        """
+        clave = (clase, nombres, tipos)
+        plan = self.planes.get(clave)
+        if plan is None:
+            if tipos is None:
+                clases = "v" * len(nombres)
+            else:
+                clases = "".join(_CLASE_VALOR.get(tipo, "v") for tipo in tipos)
+            forma = (clase.__name__, nombres, clases)
+            indice = self.formas.get(forma)
+            if indice is None:
+                indice = self.formas[forma] = len(self.formas)
+            if indice < _MAX_FORMAS_CORTAS:
+                codigo, prefijo = _NODO + indice, ()
+            else:
+                codigo, prefijo = _FORMA_LARGA, (indice,)
+            plan = self.planes[clave] = (codigo, _separador(clases, prefijo), "v" not in clases)
+        return plan
+
+    def valor(self, raiz):
+        codigos = self.codigos
+        numeros = self.numeros
+        escribir = codigos.append
+        numero = numeros.append
+        cadenas = self.cadenas
+        lectores = self.lectores
+        completos = self.planes_completos
+        otros = self.otros
+        escritos = {}  # id de nodo -> índice entre los nodos ya escritos
+        pendientes = [raiz]  # Valores por escribir; el próximo, al final
+        sacar = pendientes.pop
+        apilar = pendientes.append
+        agregar = pendientes.extend
+        while pendientes:
+            valor = sacar()
+            if valor is _CIERRE_NODO:
+                identidad, codigo, en_linea = sacar()
+                escribir(codigo)
+                numeros.extend(en_linea)
+                escritos[identidad] = len(escritos)
+                continue
+            if valor is _CIERRE:
+                valor = sacar()
+                tipo = type(valor)
+                escribir(_TUPLA if tipo is tuple else _DICCIONARIO if tipo is dict else _LISTA)
+                numero(len(valor))
+                continue
+            tipo = type(valor)
+            lector = lectores.get(tipo)
+            if lector is None and isinstance(valor, AST.Nodo):
+                lector = lectores[tipo] = _lector(tipo._campos)
+            if lector:
+                identidad = id(valor)
+                indice = escritos.get(identidad)
+                if indice is not None:
+                    escribir(_REFERENCIA)
+                    numero(indice)
+                    continue
+                nombres = tipo._campos
+                try:
+                    campos = lector(valor)
+                    clave = (tipo, *map(type, campos))
+                    plan = completos.get(clave)
+                    if plan is None:
+                        plan = completos[clave] = self.plan(tipo, nombres, clave[1:])
+                except AttributeError:
+                    # Algún atributo sin asignar: la forma es la de los que tiene
+                    asignados = valor.campos()
+                    nombres = tuple(nombre for nombre, _ in asignados)
+                    campos = tuple(campo for _, campo in asignados)
+                    plan = self.plan(tipo, nombres, tuple(map(type, campos)))
+                codigo, separar, hoja = plan
+                partes = separar(campos, cadenas, otros)
+                if partes is None:
+                    codigo, separar, hoja = self.plan(tipo, nombres, None)
+                    partes = separar(campos, cadenas, otros)
+                if hoja:
+                    # Sin valores por la pila: se escribe ya, sin pasar por `_CIERRE_NODO`
+                    escribir(codigo)
+                    numeros.extend(partes[0])
+                    escritos[identidad] = len(escritos)
+                    continue
+                apilar((identidad, codigo, partes[0]))
+                apilar(_CIERRE_NODO)
+                agregar(partes[1])
+            elif tipo is list:
+                if valor:
+                    apilar(valor)
+                    apilar(_CIERRE)
+                    agregar(reversed(valor))
+                else:
+                    escribir(_LISTA)
+                    numero(0)
+            elif tipo is int:
+                if 0 <= valor < _MAX_NUMERO:
+                    escribir(_ENTERO)
+                    numero(valor)
+                else:
+                    escribir(_OTRO)
+                    numero(len(otros))
+                    otros.append(valor)
+            elif tipo is str:
+                escribir(_CADENA)
+                numero(cadenas[valor])
+            elif valor is None:
+                escribir(_NINGUNO)
+            elif valor is True:
+                escribir(_VERDADERO)
+            elif valor is False:
+                escribir(_FALSO)
+            elif tipo is float:
+                escribir(_OTRO)
+                numero(len(otros))
+                otros.append(valor)
+            elif isinstance(valor, list) or tipo is tuple:
+                if valor:
+                    apilar(valor)
+                    apilar(_CIERRE)
+                    agregar(reversed(valor))
+                else:
+                    escribir(_TUPLA if tipo is tuple else _LISTA)
+                    numero(0)
+            elif tipo is dict:
+                apilar(valor)
+                apilar(_CIERRE)
+                for clave, elemento in reversed(list(valor.items())):
+                    apilar(elemento)
+                    apilar(clave)
+            else:
+                raise TypeError(f"No se puede codificar un valor de tipo {tipo.__name__} en el AST")
+
+
+def codificar_ast(nodo):
+    """Codifica un AST (normalmente un NodoPrograma) en bytes compactos.
+
+    También acepta cualquier valor hecho de nodos, listas, tuplas,
+    diccionarios, cadenas, números, booleanos y None (así guarda sus
+    entradas la caché del front end).
+    Los nodos se guardan como su forma (clase, nombres de atributos y clase
+    de valor de cada uno, una vez por combinación) y sus valores;
+    identificadores, literales de cadena y demás textos se guardan una sola
+    vez en una tabla y se referencian por índice. Se conservan todos los atributos, líneas incluidas, y los nodos
+    compartidos siguen siéndolo al decodificar.
+    """
+    codificador = _Codificador()
+    codificador.valor(nodo)
+    formas = [None] * len(codificador.formas)
+    for forma, indice in codificador.formas.items():
+        formas[indice] = forma
+    datos = (tuple(formas), tuple(codificador.cadenas), tuple(codificador.otros),
+             bytes(codificador.codigos), _numeros_a_bytes(codificador.numeros))
+    return MAGIA + marshal.dumps(datos, _VERSION_MARSHAL)
+
+
+@functools.lru_cache(maxsize=1024)
+def _constructor(clase, nombres, clases):
+    """Función que arma un nodo de `clase` y lo deja en la pila en lugar de sus valores.
+
+    Se genera una por forma y se reutiliza entre llamadas: los atributos de
+    la pila se asignan con una sola desestructuración (ValueError si hay
+    menos valores) y los que van en línea se leen de los números. Los
+    nombres ya se comprobaron contra `clase._campos`, así que son
+    identificadores de los slots de la clase.
+    """
+    de_pila = [nombre for nombre, clase_valor in zip(nombres, clases) if clase_valor == "v"]
+    lineas = ["def construir(pila, siguiente, cadenas, otros):", "    nodo = nuevo(clase)"]
+    if de_pila:
+        lineas.append(f"    {''.join(f'nodo.{nombre}, ' for nombre in de_pila)}= pila[-{len(de_pila)}:]")
+        lineas.append(f"    pila[-{len(de_pila)}:] = (nodo,)")
+    else:
+        lineas.append("    pila.append(nodo)")
+    for nombre, clase_valor in zip(nombres, clases):
+        if clase_valor == "e":
+            lineas.append(f"    nodo.{nombre} = siguiente()")
+        elif clase_valor == "c":
+            lineas.append(f"    nodo.{nombre} = cadenas[siguiente()]")
+        elif clase_valor == "d":
+            lineas.append(f"    nodo.{nombre} = otros[siguiente()]")
+        elif clase_valor == "b":
+            lineas.append(f"    nodo.{nombre} = logicos[siguiente()]")
+        elif clase_valor == "n":
+            lineas.append(f"    nodo.{nombre} = None")
+    lineas.append("    return nodo")
+    espacio = {"nuevo": clase.__new__, "clase": clase, "logicos": (False, True)}
+    exec("\n".join(lineas), espacio)
+    return espacio["construir"]
+
+
+def _formas(formas):
+    """Constructor de cada forma (ver `_constructor`), comprobando que son nodos y atributos conocidos."""
+    resultado = []
+    for nombre, nombres, clases in formas:
+        clase = _CLASES.get(nombre)
+        if clase is None:
+            raise FormatoASTInvalido(f"Clase de nodo desconocida: {nombre}")
+        for atributo in nombres:
+            if atributo not in clase._campos:
+                raise FormatoASTInvalido(f"Atributo desconocido en {nombre}: {atributo}")
+        if len(clases) != len(nombres) or clases.strip("ecdbnv"):
+            raise FormatoASTInvalido(f"Clases de atributos inválidas en {nombre}: {clases!r}")
+        resultado.append(_constructor(clase, nombres, clases))
+    return resultado
+
+
+def _decodificar(datos):
+    formas, cadenas, otros, codigos, numeros = datos
+    formas = _formas(formas)
+    if not all(type(cadena) is str for cadena in cadenas) \
+            or not all(type(otro) in (int, float) for otro in otros):
+        raise FormatoASTInvalido("Tabla de valores con tipos inesperados")
+    numeros = array("I", numeros)
+    if sys.byteorder != "little":
+        numeros.byteswap()
+    pendientes = iter(numeros)
+    siguiente = pendientes.__next__
+    nodos = []  # En el orden en que se escribieron, para las referencias
+    nuevo_nodo = nodos.append
+    pila = []
+    apilar = pila.append
+    for codigo in codigos:
+        if codigo >= _NODO:
+            construir = formas[siguiente()] if codigo == _FORMA_LARGA else formas[codigo - _NODO]
+            nuevo_nodo(construir(pila, siguiente, cadenas, otros))
+        elif codigo == _REFERENCIA:
+            apilar(nodos[siguiente()])
+        elif codigo == _LISTA:
+            cantidad = siguiente()
+            if cantidad:
+                if len(pila) < cantidad:
+                    raise FormatoASTInvalido("Faltan elementos para una lista")
+                pila[-cantidad:] = (pila[-cantidad:],)
+            else:
+                apilar([])
+        elif codigo == _ENTERO:
+            apilar(siguiente())
+        elif codigo == _CADENA:
+            apilar(cadenas[siguiente()])
+        elif codigo == _NINGUNO:
+            apilar(None)
+        elif codigo == _TUPLA or codigo == _DICCIONARIO:
+            cantidad = siguiente()
+            if codigo == _DICCIONARIO:
+                cantidad *= 2
+            if len(pila) < cantidad:
+                raise FormatoASTInvalido("Faltan elementos para una tupla o diccionario")
+            if cantidad:
+                elementos = pila[-cantidad:]
+                del pila[-cantidad:]
+            else:
+                elementos = []
+            apilar(tuple(elementos) if codigo == _TUPLA else dict(zip(elementos[::2], elementos[1::2])))
+        elif codigo == _VERDADERO:
+            apilar(True)
+        elif codigo == _FALSO:
+            apilar(False)
+        elif codigo == _OTRO:
+            apilar(otros[siguiente()])
+        else:
+            raise FormatoASTInvalido(f"Código de valor desconocido: {codigo}")
+    if len(pila) != 1:
+        raise FormatoASTInvalido("Los datos no forman un único valor")
+    if next(pendientes, None) is not None:
+        raise FormatoASTInvalido("Sobran números después del AST")
+    return pila[0]
+
+
+def decodificar_ast(datos):
+    """Reconstruye el AST codificado por `codificar_ast`."""
+    if not datos.startswith(MAGIA):
+        raise FormatoASTInvalido("Encabezado desconocido")
+    try:
+        return _decodificar(marshal.loads(memoryview(datos)[len(MAGIA):]))
+    except FormatoASTInvalido:
+        raise
+    except (EOFError, ValueError, TypeError, IndexError, AttributeError, StopIteration, MemoryError) as e:
+        # MemoryError: un largo dañado dentro de los datos de `marshal`
+        raise FormatoASTInvalido(f"Datos truncados o dañados: {e}") from e
@@ -0,0 +1,247 @@
+# FrontEndCache.py
+import hashlib
+import os
+import sys
+import tempfile
+from collections import namedtuple
+from GlobalErrors.ErrorsManager import global_errors, AnalisisDetenido
+from LexicalAnalyzer.Lexer import crear_lexer
+from LexicalAnalyzer.TokenBuffer import TokenBuffer, LexerBuffer
+from SyntaxAnalyzer.BinaryAST import codificar_ast, decodificar_ast
+from SyntaxAnalyzer.Parser import crear_parser
+
+# Tamaño máximo por defecto del directorio de caché (bytes)
+MAX_BYTES_CACHE = 64 << 20
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Archivos cuyo contenido define la salida del front end (todos los módulos que
+# importan el lexer y el parser, más esta caché): si cambian, cambia la versión
+_ARCHIVOS_FRONTEND = (
+    os.path.join("GlobalErrors", "ErrorsManager.py"),
+    os.path.join("LexicalAnalyzer", "Lexer.py"),
+    os.path.join("LexicalAnalyzer", "DFALexer.py"),
+    os.path.join("LexicalAnalyzer", "LineIndex.py"),
+    os.path.join("LexicalAnalyzer", "TokenBuffer.py"),
+    os.path.join("LexicalAnalyzer", "MmapLexer.py"),
+    os.path.join("SyntaxAnalyzer", "Parser.py"),
+    os.path.join("SyntaxAnalyzer", "PrattParser.py"),
+    os.path.join("SyntaxAnalyzer", "AST.py"),
+    os.path.join("SyntaxAnalyzer", "BinaryAST.py"),
+    os.path.join("SyntaxAnalyzer", "FrontEndCache.py"),
+)
+
+_EXTENSION = ".ast"
+
+ResultadoFrontEnd = namedtuple("ResultadoFrontEnd", "ast tokens errores acierto")
+
+
+def directorio_cache():
+    """Directorio de la caché: $PSEINT_CACHE_DIR o ~/.cache/pseint_compiler."""
+    directorio = os.environ.get("PSEINT_CACHE_DIR")
+    if directorio:
+        return directorio
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "pseint_compiler")
+
+
+_version = None
+
+
+def version_frontend():
+    """Hash de los módulos de `_ARCHIVOS_FRONTEND` (más la versión de Python que serializa)."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256(repr(sys.version_info[:2]).encode())
+        for relativo in _ARCHIVOS_FRONTEND:
+            with open(os.path.join(_RAIZ, relativo), "rb") as archivo:
+                h.update(archivo.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+class _LexerGrabador:
+    """Pasa al parser los tokens de `lexer` y guarda (tipo, valor, línea, posición) de cada uno."""
+
+    def __init__(self, lexer):
+        self.lexer = lexer
+        self.tokens = []
+
+    @property
+    def lineno(self):
+        return self.lexer.lineno
+
+    @property
+    def lexpos(self):
+        return self.lexer.lexpos
+
+    @property
+    def lexdata(self):
+        # PLY deja este objeto como `lexer` del token de error: `columna_token` lee su texto
+        return self.lexer.lexdata
+
+    def token(self):
+        tok = self.lexer.token()
+        if tok is not None:
+            self.tokens.append((tok.type, tok.value, tok.lineno, tok.lexpos))
+        return tok
+
+
+class CacheFrontEnd:
+    """Caché en disco del flujo de tokens, el AST y los diagnósticos de cada fuente.
+
+    La clave es el SHA-256 del texto junto con la versión del front end, las
+    opciones del lexer y del parser y los topes de `global_errors`, así que editar cualquier módulo del front end
+    (`_ARCHIVOS_FRONTEND`) invalida todo sin borrar nada a mano. Al superar
+    `max_bytes` se eliminan las entradas usadas hace más tiempo (la fecha de
+    modificación se renueva en cada acierto). Las entradas se guardan con el
+    formato de BinaryAST.py, que no usa recursión: un AST muy profundo se
+    guarda y se lee igual que uno plano. `aciertos`, `fallos` y `desalojos`
+    cuentan desde la creación.
+    """
+
+    def __init__(self, directorio=None, max_bytes=MAX_BYTES_CACHE):
+        self.directorio = directorio or directorio_cache()
+        self.max_bytes = max_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._bytes = None  # Total en disco; se mide en la primera escritura
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def clave(self, codigo, opciones=""):
+        h = hashlib.sha256(version_frontend().encode())
+        h.update(opciones.encode())
+        h.update(b"\0")
+        h.update(codigo.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + _EXTENSION)
+
+    def obtener(self, clave):
+        """Entrada guardada para `clave` (dict con tokens, ast y errores) o None."""
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, "rb") as archivo:
+                entrada = decodificar_ast(archivo.read())
+            os.utime(ruta)
+        except FileNotFoundError:
+            self.fallos += 1
+            return None
+        except Exception:
+            # Entrada truncada o de otra versión de las clases: se descarta
+            self._eliminar(ruta)
+            self.fallos += 1
+            return None
+        self.aciertos += 1
+        return entrada
+
+    def guardar(self, clave, tokens, ast, errores, detenido=False):
+        """Guarda la entrada de `clave`; devuelve False si no se pudo escribir (disco lleno, sin permisos...)."""
+        datos = codificar_ast({"tokens": tokens, "ast": ast, "errores": errores, "detenido": detenido})
+        ruta = self._ruta(clave)
+        temporal = None
+        try:
+            anterior = os.path.getsize(ruta) if os.path.exists(ruta) else 0
+            # Escritura atómica: otro proceso nunca ve una entrada a medias
+            descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+            with os.fdopen(descriptor, "wb") as archivo:
+                archivo.write(datos)
+            os.replace(temporal, ruta)
+            temporal = None
+            if self._bytes is None:
+                self._bytes = self._medir()
+            else:
+                self._bytes += len(datos) - anterior
+            if self._bytes > self.max_bytes:
+                self._desalojar()
+        except OSError:
+            # La caché es opcional: quien llama sigue con el resultado recién calculado
+            if temporal is not None:
+                self._eliminar(temporal)
+            return False
+        return True
+
+    def _entradas(self):
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(_EXTENSION):
+                yield entrada
+
+    def _medir(self):
+        return sum(entrada.stat().st_size for entrada in self._entradas())
+
+    def _eliminar(self, ruta):
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+
+    def _desalojar(self):
+        """Elimina las entradas menos usadas hasta quedar por debajo de `max_bytes`."""
+        entradas = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in self._entradas()))
+        total = sum(tamano for _, tamano, _ in entradas)
+        for _, tamano, ruta in entradas:
+            if total <= self.max_bytes:
+                break
+            self._eliminar(ruta)
+            total -= tamano
+            self.desalojos += 1
+        self._bytes = total
+
+    def limpiar(self):
+        for entrada in list(self._entradas()):
+            self._eliminar(entrada.path)
+        self._bytes = 0
+
+    def estadisticas(self):
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+            "entradas": sum(1 for _ in self._entradas()),
+            "bytes": self._medir(),
+        }
+
+    def analizar(self, codigo, backend="ply", backend_parser="ply", agrupar_errores=True, por_columnas=False):
+        """Análisis léxico y sintáctico de `codigo`, desde la caché si ya se hizo antes.
+
+        Con `por_columnas=True` los tokens pasan por un TokenBuffer, como en
+        `parse_buffer`.
+
+        En un acierto los diagnósticos guardados se vuelven a registrar en
+        `global_errors` con `restaurar` (ya pasaron por los topes cuando se
+        guardaron), igual que si el análisis se hubiera ejecutado. Si ese
+        análisis alcanzó un tope, también se guarda, y el acierto vuelve a
+        lanzar AnalisisDetenido.
+        """
+        # Los topes cambian qué diagnósticos se registran y dónde se detiene el análisis
+        opciones = (f"{backend}|{agrupar_errores}|{backend_parser}|{por_columnas}|{global_errors.max_por_fase}"
+                    f"|{global_errors.max_total}|{sorted(global_errors.max_por_tipo.items())}")
+        clave = self.clave(codigo, opciones)
+        entrada = self.obtener(clave)
+        if entrada is not None:
+            global_errors.restaurar(entrada["errores"])
+            if entrada["detenido"]:
+                global_errors.detenido = True
+                raise AnalisisDetenido(entrada["errores"][-1]["mensaje"])
+            return ResultadoFrontEnd(entrada["ast"], entrada["tokens"], entrada["errores"], True)
+
+        inicio_errores = len(global_errors)
+        lexer = crear_lexer(backend, agrupar_errores=agrupar_errores)
+        grabador = _LexerGrabador(lexer)
+        try:
+            if por_columnas:
+                buffer = TokenBuffer.con_lexer(codigo, lexer)
+                grabador.tokens = [(buffer.tipo(i), buffer.valor(i), buffer.linea(i), buffer.posicion(i))
+                                   for i in range(len(buffer))]
+                ast = crear_parser(backend_parser).parse(lexer=LexerBuffer(buffer), tracking=True)
+            else:
+                lexer.input(codigo)
+                ast = crear_parser(backend_parser).parse(lexer=grabador, tracking=True)
+        except AnalisisDetenido:
+            self.guardar(clave, grabador.tokens, None, list(global_errors[inicio_errores:]), detenido=True)
+            raise
+        errores = list(global_errors[inicio_errores:])
+        self.guardar(clave, grabador.tokens, ast, errores)
+        return ResultadoFrontEnd(ast, grabador.tokens, errores, False)
@@ -0,0 +1,364 @@
+# IncrementalParser.py
+from bisect import bisect_right
+import ply.lex as lex
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.IncrementalLexer import diferencia
+from LexicalAnalyzer.Lexer import crear_lexer
+from LexicalAnalyzer.LineIndex import IndiceLineas
+from SyntaxAnalyzer.AST import Nodo, NodoPrograma, NodoRepetir, preorden
+from SyntaxAnalyzer.Parser import obtener_parser
+
+# Caracteres que el lexer puede mirar antes de una edición y cambiar el token anterior
+_ANTICIPACION = 2
+
+# Sentencias por bloque: al desplazar lo que sigue a una edición solo se tocan los bloques
+SENTENCIAS_POR_BLOQUE = 256
+
+
+class _Tramo:
+    """Fuente de tokens para el parser.
+
+    Sin `fin`, entrega los tokens de `lexer` sobre `codigo` tal cual y recuerda el último
+    (el FIN del programa). Con `fin`, entrega un INICIO sintético, los tokens
+    que empiezan antes de `fin` y un FIN sintético: el tramo se analiza como
+    el cuerpo de un programa, con posiciones y líneas absolutas. `alineado`
+    indica si el primer token no consumido empieza exactamente en `fin`.
+    """
+
+    def __init__(self, lexer, codigo, inicio=0, linea=1, fin=None):
+        lexer.input(codigo)
+        lexer.lexpos = inicio
+        lexer.lineno = linea
+        self.lexer = lexer
+        self.fin = fin
+        self.ultimo = None
+        self.siguiente = None  # Primer token no consumido (modo tramo)
+        self.alineado = False
+        self._estado = 0 if fin is not None else 1
+
+    @property
+    def lineno(self):
+        return self.lexer.lineno
+
+    @property
+    def lexpos(self):
+        return self.lexer.lexpos
+
+    def _sintetico(self, tipo, valor, pos, linea):
+        tok = lex.LexToken()
+        tok.type = tipo
+        tok.value = valor
+        tok.lexpos = pos
+        tok.lineno = linea
+        tok.lexer = self.lexer
+        return tok
+
+    def token(self):
+        if self._estado == 0:
+            self._estado = 1
+            return self._sintetico("INICIO", "inicio", self.lexer.lexpos, self.lexer.lineno)
+        if self._estado == 1:
+            tok = self.lexer.token()
+            if self.fin is None:
+                if tok is not None:
+                    self.ultimo = tok
+                return tok
+            if tok is not None and tok.lexpos < self.fin:
+                return tok
+            self._estado = 2
+            self.siguiente = tok
+            self.alineado = tok is not None and tok.lexpos == self.fin
+            linea = tok.lineno if tok is not None else self.lexer.lineno
+            return self._sintetico("FIN", "fin", self.fin, linea)
+        return None
+
+
+def _agrupar(origenes, primero):
+    """Reparte pares (offset, línea) absolutos en bloques.
+
+    Devuelve las listas del ParserIncremental para esos bloques: offsets y
+    líneas relativos a la base de su bloque, y por bloque la base (offset,
+    línea) y la posición de su primera sentencia, que es `primero` para el
+    primero.
+    """
+    inicios, lineas, posiciones, bases, primeros = [], [], [], [], []
+    for i in range(0, len(origenes), SENTENCIAS_POR_BLOQUE):
+        tramo = origenes[i:i + SENTENCIAS_POR_BLOQUE]
+        pos, linea = tramo[0]
+        inicios.append([inicio - pos for inicio, _ in tramo])
+        lineas.append([linea_sentencia - linea for _, linea_sentencia in tramo])
+        posiciones.append(pos)
+        bases.append(linea)
+        primeros.append(primero + i)
+    return inicios, lineas, posiciones, bases, primeros
+
+
+def _desplazar(nodo, dlinea):
+    """Suma `dlinea` a las líneas de `nodo` y sus descendientes."""
+    if not dlinea:
+        return
+    for actual in preorden(nodo):
+        actual.linea += dlinea
+        if type(actual) is NodoRepetir:
+            actual.linea_condicion += dlinea
+
+
+def _relativizar(nodo, linea):
+    """Cuenta las líneas de `nodo` y sus descendientes desde `linea`, que pasa a ser la 1."""
+    _desplazar(nodo, 1 - linea)
+
+
+def _copia_absoluta(raiz, linea):
+    """Copia de `raiz` y sus descendientes con las líneas contadas desde `linea` y no desde 1."""
+    dlinea = linea - 1
+    copias = {}
+    for nodo in preorden(raiz):
+        copia = object.__new__(type(nodo))
+        for nombre, valor in nodo.campos():
+            setattr(copia, nombre, valor)
+        copia.linea += dlinea
+        if type(nodo) is NodoRepetir:
+            copia.linea_condicion += dlinea
+        copias[id(nodo)] = copia
+    for copia in copias.values():
+        for nombre, valor in copia.campos():
+            if isinstance(valor, Nodo):
+                setattr(copia, nombre, copias[id(valor)])
+            elif type(valor) is list:
+                setattr(copia, nombre, [copias[id(e)] if isinstance(e, Nodo) else e for e in valor])
+    return copias[id(raiz)]
+
+
+class ParserIncremental:
+    """Mantiene el AST de un documento y re-analiza solo las sentencias editadas.
+
+    Conserva las sentencias de primer nivel (`arbol_relativo.declaraciones`) con el
+    offset y la línea donde empieza cada una. Una edición re-analiza solo las
+    sentencias cuyo tramo la toca (el tramo de una sentencia llega hasta el
+    inicio de la siguiente, o hasta el FIN del programa) como si fueran el
+    cuerpo de un programa, y empalma los nodos nuevos en la lista. Si el
+    tramo deja de terminar en el inicio de la sentencia siguiente (una
+    comilla abierta, por ejemplo), si la edición cae fuera del cuerpo o si
+    hay errores, se analiza todo de nuevo.
+
+    El árbol que se mantiene es `arbol_relativo`: mientras `incremental`
+    es True, las líneas de los nodos de cada sentencia de primer nivel se
+    cuentan desde la línea donde empieza, que es la 1 (`linea_sentencia` da
+    la absoluta), y los offsets y líneas de inicio se guardan por bloques
+    relativos a una base, como los tokens de LexerIncremental: una edición
+    que agrega o quita líneas solo mueve la base de los bloques siguientes y
+    no toca sus nodos. Solo el AnalizadorIncremental lo usa así. `ast` es el
+    AST de siempre, con líneas absolutas, para el SemanticAnalyzer, el TAC o
+    el controlador. Se arma al leerlo con una copia por sentencia que se
+    conserva entre ediciones: después de una edición solo se copian las
+    sentencias nuevas, y a las que cambiaron de línea se les corrige la línea
+    en su copia. Por eso el `ast` leído antes de una edición deja de valer
+    después; quien solo necesita posiciones puede usar `arbol_relativo` con
+    `linea_sentencia`, que no copia nada.
+
+    Los diagnósticos del texto actual quedan en `errores`, no en
+    `global_errors`. `ultimo_cambio` es (primera sentencia, sentencias
+    quitadas, sentencias nuevas) de la última edición, o None si se analizó
+    todo.
+    """
+
+    def __init__(self, codigo="", backend="ply"):
+        self.backend = backend
+        self.codigo = ""
+        self.arbol_relativo = None
+        self._ast = None  # Árbol con líneas absolutas (None si hay que armarlo)
+        self._copias = []  # Por sentencia de primer nivel: [copia absoluta, su línea] o None
+        self.errores = []
+        self.ultimo_cambio = None
+        self.cargar(codigo)
+
+    # ---------------------------------------------------------------
+    # Análisis completo
+    # ---------------------------------------------------------------
+
+    def cargar(self, codigo):
+        """Descarta todo y analiza `codigo` desde el principio."""
+        self.codigo = codigo
+        self.lineas = IndiceLineas(codigo)
+        self.ultimo_cambio = None
+        # Por bloque de sentencias de primer nivel: offset y línea de cada una, relativos a la base
+        self._inicios, self._lineas_bloque = [], []
+        # Por bloque: base (offset, línea) y posición de su primera sentencia en `arbol_relativo.declaraciones`
+        self._posiciones, self._bases, self._primeros = [], [], []
+        self._fin_cuerpo = None  # (offset, línea) del FIN del programa
+
+        tramo = _Tramo(crear_lexer(self.backend), codigo)
+        self.arbol_relativo, self.errores, origenes = self._analizar(tramo)
+        self._ast = None
+        self._copias = []
+        if self.errores or not isinstance(self.arbol_relativo, NodoPrograma) or tramo.ultimo is None \
+                or tramo.ultimo.type != "FIN":
+            return
+        declaraciones = self.arbol_relativo.declaraciones
+        if not declaraciones or not all(id(d) in origenes for d in declaraciones):
+            return
+        for declaracion in declaraciones:
+            _relativizar(declaracion, origenes[id(declaracion)][1])
+        (self._inicios, self._lineas_bloque, self._posiciones, self._bases,
+         self._primeros) = _agrupar([origenes[id(d)] for d in declaraciones], 0)
+        self._fin_cuerpo = (tramo.ultimo.lexpos, tramo.ultimo.lineno)
+
+    def _analizar(self, tramo):
+        """Ejecuta el parser sobre `tramo`.
+
+        Devuelve el AST, los errores que agregó (quitándolos de
+        `global_errors`) y el (offset, línea) de inicio de cada sentencia.
+        """
+        parser = obtener_parser()
+        parser.origenes = {}
+        try:
+            with global_errors.aparte() as errores:
+                ast = parser.parse(lexer=tramo, tracking=True)
+            origenes = parser.origenes
+        finally:
+            parser.origenes = None
+        return ast, errores, origenes
+
+    @property
+    def ast(self):
+        """El AST del texto actual con las líneas absolutas de siempre (no lo compartas con `arbol_relativo`)."""
+        if self._ast is None:
+            arbol = self.arbol_relativo
+            if not self.incremental:
+                self._ast = arbol  # Sin estado incremental las líneas ya son absolutas
+            else:
+                declaraciones = arbol.declaraciones
+                if len(self._copias) != len(declaraciones):
+                    self._copias = [None] * len(declaraciones)
+                for i, linea in enumerate(self.lineas_sentencias(range(len(declaraciones)))):
+                    guardada = self._copias[i]
+                    if guardada is None:
+                        self._copias[i] = [_copia_absoluta(declaraciones[i], linea), linea]
+                    elif guardada[1] != linea:
+                        _desplazar(guardada[0], linea - guardada[1])
+                        guardada[1] = linea
+                copias = [copia for copia, _ in self._copias]
+                self._ast = NodoPrograma(declaraciones=copias, linea=arbol.linea)
+        return self._ast
+
+    @property
+    def incremental(self):
+        """True si la próxima edición puede re-analizar solo algunas sentencias."""
+        return self._fin_cuerpo is not None
+
+    # ---------------------------------------------------------------
+    # Posiciones de las sentencias
+    # ---------------------------------------------------------------
+
+    def _origen(self, b, j):
+        """(offset, línea) absolutos de la sentencia `j` del bloque `b`, o del FIN si no hay más."""
+        if j == len(self._inicios[b]):
+            b, j = b + 1, 0
+        if b == len(self._inicios):
+            return self._fin_cuerpo
+        return self._posiciones[b] + self._inicios[b][j], self._bases[b] + self._lineas_bloque[b][j]
+
+    def _buscar(self, pos):
+        """(bloque, índice) de la última sentencia que empieza en `pos` o antes (la primera si ninguna)."""
+        b = max(bisect_right(self._posiciones, pos) - 1, 0)
+        return b, max(bisect_right(self._inicios[b], pos - self._posiciones[b]) - 1, 0)
+
+    def linea_sentencia(self, indice):
+        """Línea absoluta donde empieza `arbol_relativo.declaraciones[indice]`."""
+        b = bisect_right(self._primeros, indice) - 1
+        return self._bases[b] + self._lineas_bloque[b][indice - self._primeros[b]]
+
+    def lineas_sentencias(self, indices):
+        """Línea absoluta donde empieza cada sentencia de `indices`."""
+        return map(self.linea_sentencia, indices)
+
+    # ---------------------------------------------------------------
+    # Edición
+    # ---------------------------------------------------------------
+
+    def editar(self, linea_inicio, linea_fin, texto):
+        """Reemplaza las líneas `linea_inicio`..`linea_fin` (inclusive, desde 1) por `texto`.
+
+        `texto` no incluye el salto de línea final de `linea_fin`.
+        """
+        return self.editar_rango(self.lineas.inicio_linea(linea_inicio), self.lineas.fin_linea(linea_fin), texto)
+
+    def actualizar(self, codigo):
+        """Pasa a analizar `codigo` re-analizando solo el tramo que cambió desde el texto actual.
+
+        Sin cambios, `ultimo_cambio` queda en (0, 0, 0): no se quitó ni se agregó nada.
+        """
+        cambio = diferencia(self.codigo, codigo)
+        if cambio is None:
+            self.ultimo_cambio = (0, 0, 0) if self.incremental else None
+            return
+        self.editar_rango(*cambio)
+
+    def editar_rango(self, inicio, fin, texto):
+        """Reemplaza `codigo[inicio:fin]` por `texto` y re-analiza lo necesario."""
+        viejo = self.codigo
+        nuevo = viejo[:inicio] + texto + viejo[fin:]
+        if not self.incremental or inicio < self._posiciones[0] or fin > self._fin_cuerpo[0]:
+            return self.cargar(nuevo)
+
+        delta = len(texto) - (fin - inicio)
+        # Sentencias cuyo tramo toca la edición (con margen para el token anterior)
+        bp, jp = self._buscar(inicio - _ANTICIPACION)
+        bu, ju = self._buscar(fin)
+        desde, linea_desde = self._origen(bp, jp)
+        hasta, linea_hasta = self._origen(bu, ju + 1)
+
+        tramo = _Tramo(crear_lexer(self.backend), nuevo, desde, linea_desde, hasta + delta)
+        try:
+            ast, errores, origenes = self._analizar(tramo)
+        except Exception:
+            # La recuperación de errores del parser puede fallar: el análisis completo decide
+            return self.cargar(nuevo)
+        if errores or not tramo.alineado or not isinstance(ast, NodoPrograma):
+            return self.cargar(nuevo)
+        nuevas = [d for d in ast.declaraciones if d is not None]
+        primera, ultima = self._primeros[bp] + jp, self._primeros[bu] + ju
+        declaraciones = self.arbol_relativo.declaraciones
+        if not all(id(d) in origenes for d in nuevas) or \
+                (not nuevas and primera == 0 and ultima == len(declaraciones) - 1):
+            return self.cargar(nuevo)
+
+        self.codigo = nuevo
+        self.lineas.reemplazar(inicio, fin, texto, nuevo)
+        dlinea = tramo.siguiente.lineno - linea_hasta
+        for declaracion in nuevas:
+            _relativizar(declaracion, origenes[id(declaracion)][1])
+        declaraciones[primera:ultima + 1] = nuevas
+        if self._copias:
+            self._copias[primera:ultima + 1] = [None] * len(nuevas)
+        self._empalmar(bp, jp, bu, ju, [origenes[id(d)] for d in nuevas], delta, dlinea)
+        self._fin_cuerpo = (self._fin_cuerpo[0] + delta, self._fin_cuerpo[1] + dlinea)
+        self.ultimo_cambio = (primera, ultima + 1 - primera, len(nuevas))
+        self._ast = None
+
+    def _empalmar(self, bp, jp, bu, ju, nuevos, delta, dlinea):
+        """Sustituye las sentencias de (bp, jp) a (bu, ju) inclusive por las de orígenes `nuevos`.
+
+        Solo se rearman los bloques `bp`..`bu`; los siguientes mueven su base.
+        """
+        pos, linea = self._posiciones[bp], self._bases[bp]
+        origenes = [(pos + inicio, linea + linea_sentencia)
+                    for inicio, linea_sentencia in zip(self._inicios[bp][:jp], self._lineas_bloque[bp][:jp])]
+        origenes.extend(nuevos)
+        pos, linea = self._posiciones[bu] + delta, self._bases[bu] + dlinea
+        origenes.extend((pos + inicio, linea + linea_sentencia)
+                        for inicio, linea_sentencia in zip(self._inicios[bu][ju + 1:], self._lineas_bloque[bu][ju + 1:]))
+        dcantidad = len(nuevos) - (self._primeros[bu] + ju - self._primeros[bp] - jp + 1)
+        siguiente = bu + 1
+        if delta:
+            self._posiciones[siguiente:] = [pos + delta for pos in self._posiciones[siguiente:]]
+        if dlinea:
+            self._bases[siguiente:] = [linea + dlinea for linea in self._bases[siguiente:]]
+        if dcantidad:
+            self._primeros[siguiente:] = [primero + dcantidad for primero in self._primeros[siguiente:]]
+        inicios, lineas, posiciones, bases, primeros = _agrupar(origenes, self._primeros[bp])
+        self._inicios[bp:siguiente] = inicios
+        self._lineas_bloque[bp:siguiente] = lineas
+        self._posiciones[bp:siguiente] = posiciones
+        self._bases[bp:siguiente] = bases
+        self._primeros[bp:siguiente] = primeros
@@ -1,13 +1,15 @@
+import hashlib
+import os
+import sys
 import ply.yacc as yacc
 from ply.yacc import errok
-from LexicalAnalyzer.Lexer import tokens
+from LexicalAnalyzer.Lexer import tokens, LexerFlujo, crear_lexer
+from LexicalAnalyzer.TokenBuffer import TokenBuffer, LexerBuffer
+from LexicalAnalyzer.LineIndex import indice_lineas
 from GlobalErrors.ErrorsManager import global_errors
-from SyntaxAnalyzer.AST import Nodo,NodoIf,NodoAsignacion,NodoDeclaracion,NodoBinario,NodoIdentificador,NodoLiteral,NodoMientras,NodoMostrar,NodoRepetir,NodoPara,NodoUnario,NodoPrograma,NodoError
-from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from SyntaxAnalyzer.AST import Nodo,NodoIf,NodoAsignacion,NodoDeclaracion,NodoBinario,NodoIdentificador,NodoLiteral,NodoMientras,NodoMostrar,NodoRepetir,NodoPara,NodoUnario,NodoPrograma,NodoError,ExpresionesCompartidas
 
 
-semantic_analyzer = SemanticAnalyzer()
-
 # Definir precedencia para resolver conflictos
 precedence = (
     ("left", "OR"),
@@ -35,28 +37,20 @@ class SemanticError(Exception):
     """Excepción para errores semánticos."""
     pass
 
-if not isinstance(global_errors, list):
-    global_errors = []
-
-variables = {}  
-constantes = {} 
 
-
-# Modifica la función p_programa:
+# El parser solo construye el AST: el análisis semántico es una fase aparte
+# (SemanticAnalyzer), que el compilador ejecuta una vez sobre el resultado.
 def p_programa(p):
     """programa : INICIO declaraciones FIN"""
-    program_node = NodoPrograma(declaraciones=p[2], linea=p.lineno(1))
-    
-    # Realizar análisis semántico
-    semantic_analyzer.analyze(program_node)
-    
-    p[0] = program_node
+    p[0] = NodoPrograma(declaraciones=p[2], linea=p.lineno(1))
 
 def p_declaraciones(p):
     """declaraciones : declaraciones declaracion
                     | declaracion"""
     if len(p) == 3:
-        p[0] = p[1] + [p[2]]  
+        # Se agrega sobre la misma lista: copiarla en cada reducción haría el bloque O(n²)
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = [p[1]] 
 
@@ -73,6 +67,10 @@ def p_declaracion(p):
                 | empty"""
     
     p[0]=p[1]
+    origenes = getattr(p.parser, "origenes", None)
+    if origenes is not None and p[0] is not None:
+        # Dónde empieza cada sentencia (offset, línea); solo lo pide ParserIncremental
+        origenes[id(p[0])] = (p.lexpos(1), p.lineno(1))
 
 
 def p_empty(p):
@@ -86,12 +84,10 @@ def normalizar_tipo(tipo):
 def p_sentencia_if_simple(p):
     "sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones FIN_SI"
     p[0] = NodoIf(condicion=p[3], cuerpo_if=p[6], cuerpo_else=[], linea=p.lineno(1))
-    p[0].tiene_sino = False  # ← agregamos esta bandera
 
 def p_sentencia_if_con_sino(p):
     "sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones SINO declaraciones FIN_SI"
-    p[0] = NodoIf(condicion=p[3], cuerpo_if=p[6], cuerpo_else=p[8], linea=p.lineno(1))
-    p[0].tiene_sino = True  # ← también aquí
+    p[0] = NodoIf(condicion=p[3], cuerpo_if=p[6], cuerpo_else=p[8], linea=p.lineno(1), tiene_sino=True)
 
 def p_sentencia_mientras(p):
     """sentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaraciones FIN_MIENTRAS"""
@@ -128,7 +124,8 @@ def p_sentencia_repetir(p):
     p[0] = NodoRepetir(
         cuerpo=p[2],          # Lista de nodos (declaraciones dentro del REPETIR)
         condicion=p[5],       # Nodo de la expresión (condición del HASTA_QUE)
-        linea=p.lineno(1)     # Línea donde empieza la sentencia
+        linea=p.lineno(1),    # Línea donde empieza la sentencia
+        linea_condicion=p.lineno(3)
     )
 
 def p_sentencia_mostrar(p):
@@ -158,6 +155,10 @@ def p_expresion_binaria(p):
                  | expresion MENOR_IGUAL expresion
                  | expresion IGUAL_IGUAL expresion
                  | expresion DIFERENTE expresion'''
+    compartidas = p.parser.compartidas
+    if compartidas is not None:
+        p[0] = compartidas.binario(p[2], p[1], p[3], p.lineno(2))
+        return
     p[0] = NodoBinario(
         operador=p[2],
         izquierda=p[1],
@@ -167,6 +168,10 @@ def p_expresion_binaria(p):
 
 def p_expresion_unaria(p):
     "expresion : NOT expresion"
+    compartidas = p.parser.compartidas
+    if compartidas is not None:
+        p[0] = compartidas.unario("NOT", p[2], p.lineno(1))
+        return
     p[0] = NodoUnario(operador="NOT", expresion=p[2], linea=p.lineno(1))
 
 def p_expresion_paren(p):
@@ -179,10 +184,18 @@ def p_expresion_literal(p):
                  | LITERAL_CADENA
                  | LITERAL_BOOLEANO'''
     tipo, valor = p[1]
+    compartidas = p.parser.compartidas
+    if compartidas is not None:
+        p[0] = compartidas.literal(normalizar_tipo(tipo), valor, p.lineno(1))
+        return
     p[0] = NodoLiteral(tipo=normalizar_tipo(tipo), valor=valor, linea=p.lineno(1))
 
 def p_expresion_identificador(p):
     "expresion : IDENTIFICADOR"
+    compartidas = p.parser.compartidas
+    if compartidas is not None:
+        p[0] = compartidas.identificador(p[1], p.lineno(1))
+        return
     p[0] = NodoIdentificador(nombre=p[1], linea=p.lineno(1))
 
 
@@ -192,7 +205,8 @@ def p_lista_expresiones(p):
     if len(p) == 4:
         if not isinstance(p[1], list):
             p[1] = [p[1]]  # Convertir a lista si no lo es
-        p[0] = p[1] + [p[3]]
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         # Asegurar que siempre devolvemos una lista de nodos
         p[0] = [p[1]] if isinstance(p[1], Nodo) else []
@@ -266,10 +280,13 @@ def es_tipo_valido(tipo_variable, tipo_valor):
     
     return tipo_valor in tipos_permitidos[tipo_variable]
 
+MENSAJE_SENTENCIA_INVALIDA = "Error de sintaxis: se esperaba una sentencia válida"
+MENSAJE_EXPRESION_INVALIDA = "Error en la expresión: sintaxis inválida"
+
 def p_declaracion_error(p):
     "declaracion : error PUNTO_COMA"
     linea = p.lineno(1)
-    mensaje = "Error de sintaxis: se esperaba una sentencia válida"
+    mensaje = MENSAJE_SENTENCIA_INVALIDA
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -281,13 +298,21 @@ def p_declaracion_error(p):
 
 
 
+MENSAJE_TOKEN_INESPERADO = "❌ Error de sintaxis en línea {}: se encontró token inesperado '{}' (tipo: {})"
+
+def columna_token(tok):
+    """Columna (desde 1) de `tok` en el texto de su lexer, o None si no se conoce."""
+    lx = getattr(tok, "lexer", None)
+    if getattr(lx, "lexdata", None) is None:
+        return None
+    return indice_lineas(lx).columna(tok.lexpos)
+
+
 def p_error(p):
     if p:
-        global_errors.append({
-            "tipo": "sintáctico",
-            "linea": p.lineno,
-            "mensaje": f"❌ Error de sintaxis en línea {p.lineno}: se encontró token inesperado '{p.value}' (tipo: {p.type})"
-        })
+        # El mensaje se arma recién al mostrarlo: en una cascada de errores la mayoría se descarta
+        global_errors.agregar("sintáctico", p.lineno, MENSAJE_TOKEN_INESPERADO, p.lineno, p.value, p.type,
+                              columna=columna_token(p))
     else:
         global_errors.append({
             "tipo": "sintáctico",
@@ -303,13 +328,44 @@ def p_error(p):
 # Reglas de produccion con manejo de errores para cada sentencia
 # Esto debe añadirse junto con tus reglas normales, no reemplazarlas
 
+# Mensaje de cada producción de error, por función (PrattParser.py usa la misma tabla)
+MENSAJES_ERROR = {
+    "p_error_if_sin_condicion": "La sentencia 'si' no tiene una condición válida entre paréntesis",
+    "p_error_if_sin_declaraciones": "La sentencia 'si' no tiene cuerpo de declaraciones después de ENTONCES",
+    "p_error_if_sin_fin": "La sentencia 'si' no tiene 'FIN_SI'",
+    "p_error_mientras_sin_condicion": "La sentencia 'mientras' no tiene una condición válida",
+    "p_error_mientras_sin_hacer": "La sentencia 'mientras' no tiene 'HACER'",
+    "p_error_mientras_sin_declaraciones": "La sentencia 'mientras' no tiene cuerpo de declaraciones después de HACER",
+    "p_error_mientras_si_fin_mientras": "La sentencia 'mientras' no tiene 'FIN_MIENTRAS'",
+    "p_error_para_sin_limites": "La sentencia 'para' tiene una sintaxis inválida en los límites (DESDE/HASTA)",
+    "p_error_para_sin_hacer": "La sentencia 'para' no tiene 'HACER'",
+    "p_error_para_sin_declaraciones": "La sentencia 'para' no tiene cuerpo de declaraciones después de 'HACER'",
+    "p_error_para_sin_fin_para": "La sentencia 'para' no tiene 'FIN_PARA'",
+    "p_error_repetir_sin_condicion": "La sentencia 'repetir' no tiene una condición válida en 'HASTA_QUE'",
+    "p_error_repetir_sin_hasta_que": "La sentencia 'repetir' no tiene 'HASTA_QUE'",
+    "p_error_repetir_sin_declaraciones": "La sentencia 'repetir' no tiene cuerpo de declaraciones después de 'REPETIR'",
+    "p_error_mostrar_sin_expresion": "La sentencia 'mostrar' no tiene expresiones válidas para mostrar",
+    "p_error_mostrar_sin_punto_coma": "La sentencia 'mostrar' no tiene punto y coma",
+    "p_error_declaracion_incompleta": "Declaración incompleta: falta el identificador o asignación",
+    "p_error_declaracion_incompleta_punto_coma": "Declaración incompleta: falta el punto y coma",
+    "p_error_asignacion_invalida": "Asignación inválida: la expresión no es válida ",
+    "p_error_asignacion_invalida_punto_coma": "Asignación inválida: la expresión no es válida y falta el punto y coma",
+    "p_declaracion_con_asignacion_sin_tipo": "Asignación inválida: la expresión no es válida y falta el tipo",
+    "p_declaracion_con_asignacion_sin_identificador": "Asignación inválida: la expresión no es válida y falta el identificador",
+    "p_declaracion_con_asignacion_sin_asignacion": "Asignación inválida: la expresión no es válida y falta el signo de asignación '='",
+    "p_declaracion_con_asignacion_sin_expresion": "Asignación inválida: la expresión no es válida y falta el valor",
+    "p_declaracion_con_asignacion_sin_punto_coma": "Asignación inválida: la expresión no es válida y falta el punto y coma",
+}
+# p_error_if_sin_entonces guarda el mensaje ya con el prefijo
+MENSAJE_IF_SIN_ENTONCES = "❌ Falta la palabra clave 'ENTONCES' después de la condición en la sentencia 'si'"
+
 # ================================
 # SENTENCIA IF (con errores)
 # ================================
 def p_error_if_sin_condicion(p):
     """sentencia_if : SI  ENTONCES declaraciones FIN_SI"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'si' no tiene una condición válida entre paréntesis"
+    mensaje = MENSAJES_ERROR["p_error_if_sin_condicion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -321,7 +377,7 @@ def p_error_if_sin_condicion(p):
 def p_error_if_sin_entonces(p):
     """sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_SI"""
     linea = p.lineno(1)
-    mensaje = "❌ Falta la palabra clave 'ENTONCES' después de la condición en la sentencia 'si'"
+    mensaje = MENSAJE_IF_SIN_ENTONCES
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -333,7 +389,7 @@ def p_error_if_sin_entonces(p):
 def p_error_if_sin_declaraciones(p):
     """sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES FIN_SI"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'si' no tiene cuerpo de declaraciones después de ENTONCES"
+    mensaje = MENSAJES_ERROR["p_error_if_sin_declaraciones"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -345,7 +401,7 @@ def p_error_if_sin_declaraciones(p):
 def p_error_if_sin_fin(p):
     """sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'si' no tiene 'FIN_SI'"
+    mensaje = MENSAJES_ERROR["p_error_if_sin_fin"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -360,7 +416,7 @@ def p_error_if_sin_fin(p):
 def p_error_mientras_sin_condicion(p):
     """sentencia_mientras : MIENTRAS  HACER declaraciones FIN_MIENTRAS"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mientras' no tiene una condición válida"
+    mensaje = MENSAJES_ERROR["p_error_mientras_sin_condicion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -372,7 +428,7 @@ def p_error_mientras_sin_condicion(p):
 def p_error_mientras_sin_hacer(p):
     """sentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_MIENTRAS"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mientras' no tiene 'HACER'"
+    mensaje = MENSAJES_ERROR["p_error_mientras_sin_hacer"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -384,7 +440,7 @@ def p_error_mientras_sin_hacer(p):
 def p_error_mientras_sin_declaraciones(p):
     """sentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER  FIN_MIENTRAS"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mientras' no tiene cuerpo de declaraciones después de HACER"
+    mensaje = MENSAJES_ERROR["p_error_mientras_sin_declaraciones"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -396,7 +452,7 @@ def p_error_mientras_sin_declaraciones(p):
 def p_error_mientras_si_fin_mientras(p):
     """sentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaraciones"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mientras' no tiene 'FIN_MIENTRAS'"
+    mensaje = MENSAJES_ERROR["p_error_mientras_si_fin_mientras"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -411,7 +467,7 @@ def p_error_mientras_si_fin_mientras(p):
 def p_error_para_sin_limites(p):
     """sentencia_para : PARA IDENTIFICADOR HACER declaraciones FIN_PARA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'para' tiene una sintaxis inválida en los límites (DESDE/HASTA)"
+    mensaje = MENSAJES_ERROR["p_error_para_sin_limites"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -423,7 +479,7 @@ def p_error_para_sin_limites(p):
 def p_error_para_sin_hacer(p):
     """sentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion declaraciones FIN_PARA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'para' no tiene 'HACER'"
+    mensaje = MENSAJES_ERROR["p_error_para_sin_hacer"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -435,7 +491,7 @@ def p_error_para_sin_hacer(p):
 def p_error_para_sin_declaraciones(p):
     """sentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER FIN_PARA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'para' no tiene cuerpo de declaraciones después de 'HACER'"
+    mensaje = MENSAJES_ERROR["p_error_para_sin_declaraciones"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -447,7 +503,7 @@ def p_error_para_sin_declaraciones(p):
 def p_error_para_sin_fin_para(p):
     """sentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER declaraciones"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'para' no tiene 'FIN_PARA'"
+    mensaje = MENSAJES_ERROR["p_error_para_sin_fin_para"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -462,7 +518,7 @@ def p_error_para_sin_fin_para(p):
 def p_error_repetir_sin_condicion(p):
     """sentencia_repetir : REPETIR declaraciones HASTA_QUE  PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'repetir' no tiene una condición válida en 'HASTA_QUE'"
+    mensaje = MENSAJES_ERROR["p_error_repetir_sin_condicion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -474,7 +530,7 @@ def p_error_repetir_sin_condicion(p):
 def p_error_repetir_sin_hasta_que(p):
     """sentencia_repetir : REPETIR declaraciones  PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'repetir' no tiene 'HASTA_QUE'"
+    mensaje = MENSAJES_ERROR["p_error_repetir_sin_hasta_que"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -486,7 +542,7 @@ def p_error_repetir_sin_hasta_que(p):
 def p_error_repetir_sin_declaraciones(p):
     """sentencia_repetir : REPETIR  HASTA_QUE PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'repetir' no tiene cuerpo de declaraciones después de 'REPETIR'"
+    mensaje = MENSAJES_ERROR["p_error_repetir_sin_declaraciones"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -501,7 +557,7 @@ def p_error_repetir_sin_declaraciones(p):
 def p_error_mostrar_sin_expresion(p):
     """sentencia_mostrar : MOSTRAR  PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mostrar' no tiene expresiones válidas para mostrar"
+    mensaje = MENSAJES_ERROR["p_error_mostrar_sin_expresion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -513,7 +569,7 @@ def p_error_mostrar_sin_expresion(p):
 def p_error_mostrar_sin_punto_coma(p):
     """sentencia_mostrar : MOSTRAR lista_expresiones"""
     linea = p.lineno(1)
-    mensaje = "La sentencia 'mostrar' no tiene punto y coma"
+    mensaje = MENSAJES_ERROR["p_error_mostrar_sin_punto_coma"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -528,7 +584,7 @@ def p_error_mostrar_sin_punto_coma(p):
 def p_error_declaracion_incompleta(p):
     """declaracion : TIPO PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Declaración incompleta: falta el identificador o asignación"
+    mensaje = MENSAJES_ERROR["p_error_declaracion_incompleta"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -540,7 +596,7 @@ def p_error_declaracion_incompleta(p):
 def p_error_declaracion_incompleta_punto_coma(p):
     """declaracion : TIPO IDENTIFICADOR"""
     linea = p.lineno(1)
-    mensaje = "Declaración incompleta: falta el punto y coma"
+    mensaje = MENSAJES_ERROR["p_error_declaracion_incompleta_punto_coma"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -555,7 +611,7 @@ def p_error_declaracion_incompleta_punto_coma(p):
 def p_error_asignacion_invalida(p):
     """asignacion : IDENTIFICADOR ASIGNACION PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida "
+    mensaje = MENSAJES_ERROR["p_error_asignacion_invalida"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -569,7 +625,7 @@ def p_expresion_error(p):
     global_errors.append({
         "tipo": "sintáctico",
         "linea": p.lineno(1),
-        "mensaje": "Error en la expresión: sintaxis inválida"
+        "mensaje": MENSAJE_EXPRESION_INVALIDA
     })
     p[0] = NodoLiteral(tipo="entero", valor=0, linea=p.lineno(1))  # Valor de recuperación
 
@@ -577,7 +633,7 @@ def p_expresion_error(p):
 def p_error_asignacion_invalida_punto_coma(p):
     """asignacion : IDENTIFICADOR ASIGNACION expresion"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el punto y coma"
+    mensaje = MENSAJES_ERROR["p_error_asignacion_invalida_punto_coma"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -589,7 +645,7 @@ def p_error_asignacion_invalida_punto_coma(p):
 def p_declaracion_con_asignacion_sin_tipo(p):
     """declaracion_con_asignacion :  IDENTIFICADOR ASIGNACION expresion PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el tipo"
+    mensaje = MENSAJES_ERROR["p_declaracion_con_asignacion_sin_tipo"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -600,7 +656,7 @@ def p_declaracion_con_asignacion_sin_tipo(p):
 def p_declaracion_con_asignacion_sin_identificador(p):
     """declaracion_con_asignacion : TIPO ASIGNACION expresion PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el identificador"
+    mensaje = MENSAJES_ERROR["p_declaracion_con_asignacion_sin_identificador"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -611,7 +667,7 @@ def p_declaracion_con_asignacion_sin_identificador(p):
 def p_declaracion_con_asignacion_sin_asignacion(p):
     """declaracion_con_asignacion : TIPO IDENTIFICADOR  expresion PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el signo de asignación '='"
+    mensaje = MENSAJES_ERROR["p_declaracion_con_asignacion_sin_asignacion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -622,7 +678,7 @@ def p_declaracion_con_asignacion_sin_asignacion(p):
 def p_declaracion_con_asignacion_sin_expresion(p):
     """declaracion_con_asignacion : TIPO IDENTIFICADOR ASIGNACION  PUNTO_COMA"""
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el valor"
+    mensaje = MENSAJES_ERROR["p_declaracion_con_asignacion_sin_expresion"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -634,7 +690,7 @@ def p_declaracion_con_asignacion_sin_expresion(p):
 def p_declaracion_con_asignacion_sin_punto_coma(p):
     """declaracion_con_asignacion : TIPO IDENTIFICADOR ASIGNACION expresion """
     linea = p.lineno(1)
-    mensaje = "Asignación inválida: la expresión no es válida y falta el punto y coma"
+    mensaje = MENSAJES_ERROR["p_declaracion_con_asignacion_sin_punto_coma"]
     global_errors.append({
         "tipo": "sintáctico",
         "linea": linea,
@@ -654,11 +710,126 @@ def p_declaracion_con_asignacion_sin_punto_coma(p):
 
 
 # Construcción del Parser
-parser = yacc.yacc(start="programa", debug=False, write_tables=True)
+_INICIO_GRAMATICA = "programa"
+
+def firma_gramatica():
+    """Hash de las producciones, la precedencia y los tokens (y de la versión de las tablas de PLY)."""
+    h = hashlib.sha256(f"{yacc.__tabversion__}|{_INICIO_GRAMATICA}|{precedence!r}|{tokens!r}".encode())
+    reglas = [f for nombre, f in globals().items() if nombre.startswith("p_") and callable(f)]
+    for regla in sorted(reglas, key=lambda f: f.__code__.co_firstlineno):
+        h.update(f"\0{regla.__name__}\0{regla.__doc__}".encode())
+    return h.hexdigest()[:16]
+
+def ruta_tablas():
+    """Archivo de las tablas LALR en la caché del usuario, uno por versión de la gramática."""
+    from SyntaxAnalyzer.FrontEndCache import directorio_cache  # Diferido: solo al cargar las tablas
+    return os.path.join(directorio_cache(), f"parsetab-{firma_gramatica()}.pickle")
+
+_parser = None
+
+def obtener_parser():
+    """Devuelve el parser LALR, construyéndolo la primera vez que se necesita.
+
+    Las tablas se leen de `ruta_tablas()`; si no existen (o no coinciden con
+    la gramática) PLY las genera y las guarda ahí, nunca junto al código.
+    """
+    global _parser
+    if _parser is None:
+        ruta = ruta_tablas()
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        except OSError:
+            pass  # Sin caché escribible: PLY solo avisa que no pudo guardar las tablas
+        _parser = yacc.yacc(module=sys.modules[__name__], start=_INICIO_GRAMATICA,
+                            debug=False, write_tables=True, picklefile=ruta)
+        _parser.compartidas = None  # ExpresionesCompartidas del análisis en curso (ver parse_buffer)
+    return _parser
+
+class _ParserPerezoso:
+    """Ocupa el lugar de `parser`: importar el módulo no analiza la gramática ni lee tablas.
+
+    Los atributos asignados (como `mostrar_en_consola`) quedan en este objeto;
+    el resto se delega al parser real.
+    """
+
+    def __getattr__(self, nombre):
+        return getattr(obtener_parser(), nombre)
+
+    def parse(self, *args, **kwargs):
+        return obtener_parser().parse(*args, **kwargs)
+
+parser = _ParserPerezoso()
+
+# Backends que puede elegir el usuario (editor y `BatchCompiler --parser`): "ply" (tablas LALR de este módulo)
+BACKENDS_PARSER = ("ply",)
+# Solo para comparaciones y mediciones (benchmarks): "pratt" (PrattParser.py).
+# Da el mismo AST para los programas válidos y el mismo primer diagnóstico,
+# pero después del primer error no se recupera en los mismos puntos que PLY
+BACKENDS_PARSER_EXPERIMENTALES = ("pratt",)
+
+def crear_parser(backend="ply"):
+    """Devuelve un parser del backend indicado (de BACKENDS_PARSER o BACKENDS_PARSER_EXPERIMENTALES)."""
+    if backend == "ply":
+        return obtener_parser()
+    elif backend == "pratt":
+        from SyntaxAnalyzer.PrattParser import ParserPratt
+        return ParserPratt()
+    else:
+        opciones = ", ".join(BACKENDS_PARSER + BACKENDS_PARSER_EXPERIMENTALES)
+        raise ValueError(f"Backend de parser desconocido: '{backend}' (opciones: {opciones})")
 
 def parse(self, code, **kwargs):
     self.code = code  # Almacenar el contenido del área de texto
     return super().parse(code, **kwargs)
 
 # Definir mostrar_en_consola como un atributo del parser
-parser.mostrar_en_consola = None
\ No newline at end of file
+parser.mostrar_en_consola = None
+
+def parse_flujo(fuente, tam_bloque=None, **kwargs):
+    """Analiza un programa leído por bloques (archivo abierto o iterable de cadenas).
+
+    El texto nunca se carga completo en memoria: el parser consume los tokens
+    a medida que `LexerFlujo` los produce.
+    """
+    kwargs.setdefault("tracking", True)
+    lexer_flujo = LexerFlujo(fuente, tam_bloque) if tam_bloque else LexerFlujo(fuente)
+    return parser.parse(lexer=lexer_flujo, **kwargs)
+
+def parse_archivo(ruta, **kwargs):
+    """Analiza el archivo UTF-8 `ruta` mapeándolo en memoria en lugar de leerlo a una cadena.
+
+    Pensado para compilar archivos grandes sin el editor; `lexpos` de los
+    tokens queda en bytes.
+    """
+    from LexicalAnalyzer.MmapLexer import MmapLexer  # Diferido: importar el parser no necesita mmap
+
+    kwargs.setdefault("tracking", True)
+    with MmapLexer(ruta) as lexer_archivo:
+        return parser.parse(lexer=lexer_archivo, **kwargs)
+
+def parse_buffer(codigo, backend="ply", compartir_expresiones=False, backend_lexer="dfa", **kwargs):
+    """Analiza `codigo` (o un TokenBuffer ya construido) leyendo los tokens por columnas.
+
+    El texto se tokeniza entero con el lexer `backend_lexer` ("dfa" o "ply")
+    antes de analizar.
+
+    Con `compartir_expresiones=True` las expresiones estructuralmente iguales
+    son un mismo nodo (`AST.ExpresionesCompartidas`); sus líneas son las de
+    la primera aparición. El TAC no cambia. Hay que analizar el resultado con
+    `SemanticAnalyzer(expresiones_compartidas=True)`: un error de tipos dentro
+    de una expresión repetida se informa en cada aparición, en la línea de
+    su sentencia (no en la de la expresión si ocupa varias líneas).
+    """
+    kwargs.setdefault("tracking", True)
+    if isinstance(codigo, TokenBuffer):
+        buffer = codigo
+    else:
+        buffer = TokenBuffer.con_lexer(codigo, crear_lexer(backend_lexer))
+    analizador = crear_parser(backend)
+    if not compartir_expresiones:
+        return analizador.parse(lexer=LexerBuffer(buffer), **kwargs)
+    analizador.compartidas = ExpresionesCompartidas()
+    try:
+        return analizador.parse(lexer=LexerBuffer(buffer), **kwargs)
+    finally:
+        analizador.compartidas = None
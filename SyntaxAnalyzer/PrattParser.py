@@ -0,0 +1,622 @@
+# PrattParser.py
+"""Parser escrito a mano: descenso recursivo (con pila explícita) para sentencias y Pratt para expresiones.
+
+Reconoce la misma gramática que `Parser.py` (incluidas sus producciones de
+error) y construye los mismos nodos `Nodo*`, con las mismas líneas, sin pasar
+por las tablas LALR de PLY. Se elige con `crear_parser("pratt")`, solo para
+comparaciones y mediciones: no está entre los BACKENDS_PARSER que puede
+elegir el usuario.
+
+Los conflictos de la gramática se resuelven como los resuelve PLY (se
+prefiere desplazar). Para programas válidos el AST es idéntico; para
+programas con errores el primer diagnóstico es el mismo (mensaje, línea y
+columna). `benchmarks/ParserComparison.py` comprueba las dos cosas.
+Después del primer error la recuperación es parecida a la de PLY (el
+símbolo `error` pasa a ser el siguiente token, un operando que falta se
+vuelve el literal 0 y una sentencia inválida se descarta hasta el
+siguiente `;`), pero no se sincroniza en los mismos puntos: PLY desapila
+estados hasta uno que acepte `error`, y este parser retoma en la sentencia
+o expresión que estaba leyendo. Por eso los diagnósticos que siguen al
+primero pueden ser otros, o más: un `inicio` de más, por ejemplo, corta
+una sola sentencia aquí y varias en PLY. Donde PLY no termina o se
+detiene con una excepción, este parser sigue con la misma recuperación.
+
+Como la pila de PLY, la de este parser es explícita: los bloques anidados y
+los paréntesis, `not` y operandos pendientes se apilan en listas, así que
+acepta el mismo anidamiento que PLY sin RecursionError.
+"""
+from operator import attrgetter
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.Lexer import crear_lexer
+from LexicalAnalyzer.TokenBuffer import TIPOS, LexerBuffer, TokenBuffered
+from SyntaxAnalyzer.Parser import (precedence, normalizar_tipo, p_error, MENSAJES_ERROR, MENSAJE_IF_SIN_ENTONCES,
+                                   MENSAJE_SENTENCIA_INVALIDA, MENSAJE_EXPRESION_INVALIDA)
+from SyntaxAnalyzer.AST import NodoIf, NodoAsignacion, NodoDeclaracion, NodoBinario, NodoIdentificador, NodoLiteral, NodoMientras, NodoMostrar, NodoRepetir, NodoPara, NodoUnario, NodoPrograma, NodoError
+
+FIN_ARCHIVO = "$end"
+ERROR = "error"  # Tipo del token actual mientras representa al símbolo `error` de PLY
+
+# Tokens con los que empieza una sentencia
+INICIO_SENTENCIA = frozenset(("TIPO", "IDENTIFICADOR", "CONSTANTE", "SI", "MIENTRAS", "PARA", "REPETIR", "MOSTRAR"))
+
+# Tokens que pueden seguir a una sentencia (lookahead LALR de sus reducciones)
+SIGUIENTES_SENTENCIA = INICIO_SENTENCIA | {"FIN", "FIN_SI", "SINO", "FIN_MIENTRAS", "FIN_PARA", "HASTA_QUE",
+                                           "PARENTESIS_IZQ", ERROR}
+
+# `TIPO IDENTIFICADOR` sin punto y coma: no incluye lo que puede empezar una expresión
+SIGUIENTES_DECLARACION_INCOMPLETA = SIGUIENTES_SENTENCIA - {"IDENTIFICADOR", "PARENTESIS_IZQ", ERROR}
+
+# Tokens ante los que PLY reduce `declaraciones` vacío (la lista queda como [None])
+SIGUIENTES_VACIO = frozenset(("FIN", "FIN_SI", "SINO", "FIN_MIENTRAS", "FIN_PARA", "HASTA_QUE", "PARENTESIS_IZQ"))
+
+# Tokens ante los que se reduce `expresion : error`; el resto se descarta
+SIGUIENTES_EXPRESION_ERROR = frozenset((
+    "IDENTIFICADOR", "TIPO", "PUNTO_COMA", "PARENTESIS_IZQ", "PARENTESIS_DER", "SUMA", "RESTA",
+    "MULTIPLICACION", "DIVISION", "MODULO", "COMA", "MAYOR_QUE", "MENOR_QUE", "MAYOR_IGUAL",
+    "MENOR_IGUAL", "IGUAL_IGUAL", "DIFERENTE", "CONSTANTE", "FIN", "SI", "SINO", "FIN_SI",
+    "MIENTRAS", "FIN_MIENTRAS", "PARA", "HASTA", "CON_PASO", "FIN_PARA", "REPETIR", "HASTA_QUE",
+    "MOSTRAR", "HACER", "AND", "OR", ERROR))
+
+LITERALES = frozenset(("LITERAL_ENTERO", "LITERAL_DECIMAL", "LITERAL_CADENA", "LITERAL_BOOLEANO"))
+
+# Nivel de cada operador según la tabla `precedence` de Parser.py (1 = el que liga menos)
+NIVELES = {}
+ASOCIATIVIDAD = {}
+for _nivel, (_asociatividad, *_operadores) in enumerate(precedence, 1):
+    for _operador in _operadores:
+        NIVELES[_operador] = _nivel
+        ASOCIATIVIDAD[_operador] = _asociatividad
+NIVEL_NOT = NIVELES.pop("NOT")
+del ASOCIATIVIDAD["NOT"]
+
+
+# Clases de lo que `expresion` deja abierto mientras lee un operando
+_PARENTESIS, _NOT, _BINARIO = range(3)
+
+
+class _Abandono(Exception):
+    """El archivo terminó durante la recuperación: PLY devuelve None."""
+
+
+class _SentenciaInvalida(Exception):
+    """Token inesperado dentro de una sentencia; se recupera en la lista que la contiene."""
+
+
+class _Analisis:
+    """Estado de un análisis: token actual y ventana de silencio tras un error.
+
+    Los tokens solo se leen con `linea`, `valor` y `tipo_de`, así que una
+    subclase puede representarlos de otra forma (ver `_AnalisisBuffer`).
+    """
+
+    linea = attrgetter("lineno")
+    valor = attrgetter("value")
+    tipo_de = attrgetter("type")
+
+    def __init__(self, lexer, compartidas=None):
+        self.lexer = lexer
+        self.compartidas = compartidas  # ExpresionesCompartidas, o None para construir nodos nuevos
+        self._token = lexer.token
+        self.silencio = 0  # Igual que `errorcount` de PLY: p_error solo se llama si es 0
+        self.tok = None
+        self.tipo = None
+        self._leer()
+
+    # ---------------------------------------------------------------
+    # Tokens y errores
+    # ---------------------------------------------------------------
+
+    def _leer(self):
+        tok = self.tok = self._token()
+        self.tipo = tok.type if tok is not None else FIN_ARCHIVO
+
+    def avanzar(self):
+        """Consume el token actual y lo devuelve (un desplazamiento de PLY)."""
+        tok = self.tok
+        if self.silencio:
+            self.silencio -= 1
+        tok_siguiente = self.tok = self._token()
+        self.tipo = tok_siguiente.type if tok_siguiente is not None else FIN_ARCHIVO
+        return tok
+
+    def error(self):
+        """Token actual inesperado: se reporta con `p_error` y pasa a ser el símbolo `error`."""
+        if not self.silencio:
+            p_error(self._token_error())
+        self.silencio = 3
+        if self.tok is None:
+            raise _Abandono()
+        self.tipo = ERROR
+
+    def _token_error(self):
+        """El token actual como lo recibe `p_error` (None al final del archivo)."""
+        if self.tok is not None and not hasattr(self.tok, "lexer"):
+            self.tok.lexer = self.lexer  # Igual que PLY, para que p_error calcule la columna
+        return self.tok
+
+    def esperar(self, tipo):
+        if self.tipo != tipo:
+            self.error()
+            raise _SentenciaInvalida()
+        return self.avanzar()
+
+    def _desplazar_error(self, aceptados):
+        """Desplaza `error` y descarta tokens hasta uno de `aceptados`."""
+        self.silencio = 2
+        self.tipo = self.tipo_de(self.tok)
+        while self.tipo not in aceptados:
+            if self.tok is None:
+                raise _Abandono()
+            self.silencio = 3
+            self._leer()
+
+    def recuperar(self, linea):
+        """`declaracion : error PUNTO_COMA` — descarta hasta el siguiente `;`."""
+        self._desplazar_error(("PUNTO_COMA",))
+        self.avanzar()
+        global_errors.append({"tipo": "sintáctico", "linea": linea, "mensaje": MENSAJE_SENTENCIA_INVALIDA})
+        return NodoError(mensaje=MENSAJE_SENTENCIA_INVALIDA, linea=linea)
+
+    def produccion_error(self, funcion, linea):
+        """Diagnóstico y nodo de una producción de error de Parser.py.
+
+        PLY solo reduce con un siguiente token válido: si no lo es, el error de
+        sintaxis de ese token se informa antes que el de la producción.
+        """
+        if self.tipo not in SIGUIENTES_SENTENCIA:
+            self.error()
+        if funcion == "p_error_if_sin_entonces":
+            mensaje = MENSAJE_IF_SIN_ENTONCES
+            global_errors.append({"tipo": "sintáctico", "linea": linea, "mensaje": mensaje})
+        else:
+            mensaje = MENSAJES_ERROR[funcion]
+            global_errors.append({"tipo": "sintáctico", "linea": linea, "mensaje": f"❌ {mensaje}"})
+        return NodoError(mensaje=mensaje, linea=linea)
+
+    # ---------------------------------------------------------------
+    # Programa y listas de sentencias
+    # ---------------------------------------------------------------
+
+    def programa(self):
+        # Sin estado al que volver, PLY descarta lo que haya antes de INICIO
+        while self.tipo != "INICIO":
+            self.error()
+            self._leer()
+        inicio = self.avanzar()
+        declaraciones = self.declaraciones(("FIN",))
+        while True:
+            fin = self.avanzar()
+            if self.tok is None:
+                return NodoPrograma(declaraciones=declaraciones, linea=self.linea(inicio))
+            # Algo después de FIN: se deshace FIN y se recupera como sentencia inválida
+            self.error()
+            declaraciones.append(self.recuperar(self.linea(fin)))
+            self.declaraciones(("FIN",), declaraciones)
+
+    def declaraciones(self, cierres, lista=None):
+        """Sentencias hasta uno de `cierres`, que queda sin consumir.
+
+        Una lista vacía se devuelve como [None], como la produce `empty` en PLY.
+        Las sentencias con bloques (`_BLOQUES`) son generadores que entregan
+        los cierres de cada cuerpo que necesitan y reciben su lista; las que
+        están a medio leer se apilan en `abiertos`, así que el anidamiento no
+        está limitado por la pila de Python.
+        """
+        if lista is None:
+            lista = []
+        sentencia = self.sentencia
+        bloques = self._BLOQUES
+        # (sentencia de bloque suspendida, su primer token, lista y cierres de la que la contiene)
+        abiertos = []
+        while True:
+            tipo = self.tipo
+            if tipo in INICIO_SENTENCIA:
+                bloque = bloques.get(tipo)
+                if bloque is None:
+                    lista.append(sentencia())
+                    continue
+                tok = self.tok
+                generador = bloque(self)
+                cuerpo = None
+            elif tipo in cierres:
+                if not lista:
+                    lista.append(None)
+                if not abiertos:
+                    return lista
+                cuerpo = lista
+                generador, tok, lista, cierres = abiertos.pop()
+            else:
+                if tipo != ERROR:
+                    self.error()
+                lista.append(self.recuperar(self.linea(self.tok)))
+                continue
+            try:
+                pedido = generador.send(cuerpo)
+            except StopIteration as fin:
+                lista.append(fin.value)
+            except _SentenciaInvalida:
+                lista.append(self.recuperar(self.linea(tok)))
+            else:
+                abiertos.append((generador, tok, lista, cierres))
+                lista, cierres = [], pedido
+
+    def sentencia(self):
+        """Sentencia sin bloques (las de `_SENTENCIAS`)."""
+        tok = self.tok
+        try:
+            return self._SENTENCIAS[self.tipo](self)
+        except _SentenciaInvalida:
+            # PLY deshace la sentencia a medias; el error queda en la línea de su primer token
+            return self.recuperar(self.linea(tok))
+
+    # ---------------------------------------------------------------
+    # Declaraciones y asignaciones
+    # ---------------------------------------------------------------
+
+    def declaracion(self):
+        tipo = self.avanzar()
+        linea = self.linea(tipo)
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return self.produccion_error("p_error_declaracion_incompleta", linea)
+        if self.tipo == "ASIGNACION":
+            self.avanzar()
+            self.expresion()
+            self.esperar("PUNTO_COMA")
+            return self.produccion_error("p_declaracion_con_asignacion_sin_identificador", linea)
+        ident = self.esperar("IDENTIFICADOR")
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return NodoDeclaracion(tipo=self.valor(tipo),
+                                   identificador=NodoIdentificador(nombre=self.valor(ident), linea=self.linea(ident)),
+                                   expresion=None, linea=self.linea(ident))
+        if self.tipo == "ASIGNACION":
+            self.avanzar()
+            if self.tipo == "PUNTO_COMA":
+                self.avanzar()
+                return self.produccion_error("p_declaracion_con_asignacion_sin_expresion", linea)
+            expresion = self.expresion()
+            if self.tipo == "PUNTO_COMA":
+                self.avanzar()
+                return NodoDeclaracion(tipo=self.valor(tipo),
+                                       identificador=NodoIdentificador(nombre=self.valor(ident), linea=self.linea(ident)),
+                                       expresion=expresion, linea=self.linea(ident))
+            if self.tipo not in SIGUIENTES_SENTENCIA:
+                self.error()
+            return self.produccion_error("p_declaracion_con_asignacion_sin_punto_coma", linea)
+        if self.tipo in SIGUIENTES_DECLARACION_INCOMPLETA:
+            return self.produccion_error("p_error_declaracion_incompleta_punto_coma", linea)
+        self.expresion()
+        self.esperar("PUNTO_COMA")
+        return self.produccion_error("p_declaracion_con_asignacion_sin_asignacion", linea)
+
+    def asignacion(self):
+        ident = self.avanzar()
+        linea = self.linea(ident)
+        self.esperar("ASIGNACION")
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return self.produccion_error("p_error_asignacion_invalida", linea)
+        expresion = self.expresion()
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return NodoAsignacion(identificador=NodoIdentificador(nombre=self.valor(ident), linea=linea),
+                                  expresion=expresion, linea=linea)
+        if self.tipo not in SIGUIENTES_SENTENCIA:
+            self.error()
+        return self.produccion_error("p_error_asignacion_invalida_punto_coma", linea)
+
+    def constante(self):
+        self.avanzar()
+        ident = self.esperar("IDENTIFICADOR")
+        self.esperar("ASIGNACION")
+        expresion = self.expresion()
+        self.esperar("PUNTO_COMA")
+        return NodoDeclaracion(tipo='constante',
+                               identificador=NodoIdentificador(nombre=self.valor(ident), linea=self.linea(ident)),
+                               expresion=expresion, linea=self.linea(ident), es_constante=True)
+
+    # ---------------------------------------------------------------
+    # Estructuras de control
+    # ---------------------------------------------------------------
+    # Generadores: `cuerpo = yield cierres` pide a `declaraciones` las
+    # sentencias hasta uno de `cierres`; lo que devuelven es el nodo.
+
+    def _inicia_cuerpo(self):
+        return self.tipo in INICIO_SENTENCIA or self.tipo in SIGUIENTES_VACIO
+
+    def si(self):
+        linea = self.linea(self.avanzar())
+        if self.tipo == "ENTONCES":
+            self.avanzar()
+            yield ("FIN_SI",)
+            self.avanzar()
+            return self.produccion_error("p_error_if_sin_condicion", linea)
+        self.esperar("PARENTESIS_IZQ")
+        condicion = self.expresion()
+        self.esperar("PARENTESIS_DER")
+        if self.tipo == "ENTONCES":
+            self.avanzar()
+            if self.tipo == "FIN_SI":
+                self.avanzar()
+                return self.produccion_error("p_error_if_sin_declaraciones", linea)
+            cuerpo_if = yield ("FIN_SI", "SINO")
+            sino = self.tipo == "SINO"
+            self.avanzar()
+            if sino:
+                cuerpo_else = yield ("FIN_SI",)
+                self.avanzar()
+                return NodoIf(condicion=condicion, cuerpo_if=cuerpo_if, cuerpo_else=cuerpo_else, linea=linea,
+                              tiene_sino=True)
+            return NodoIf(condicion=condicion, cuerpo_if=cuerpo_if, cuerpo_else=[], linea=linea)
+        if not self._inicia_cuerpo():
+            self.error()
+            raise _SentenciaInvalida()
+        yield ("FIN_SI",)
+        self.avanzar()
+        return self.produccion_error("p_error_if_sin_entonces", linea)
+
+    def mientras(self):
+        linea = self.linea(self.avanzar())
+        if self.tipo == "HACER":
+            self.avanzar()
+            yield ("FIN_MIENTRAS",)
+            self.avanzar()
+            return self.produccion_error("p_error_mientras_sin_condicion", linea)
+        self.esperar("PARENTESIS_IZQ")
+        condicion = self.expresion()
+        self.esperar("PARENTESIS_DER")
+        if self.tipo == "HACER":
+            self.avanzar()
+            if self.tipo == "FIN_MIENTRAS":
+                self.avanzar()
+                return self.produccion_error("p_error_mientras_sin_declaraciones", linea)
+            cuerpo = yield ("FIN_MIENTRAS",)
+            self.avanzar()
+            return NodoMientras(condicion=condicion, cuerpo=cuerpo, linea=linea)
+        if not self._inicia_cuerpo():
+            self.error()
+            raise _SentenciaInvalida()
+        yield ("FIN_MIENTRAS",)
+        self.avanzar()
+        return self.produccion_error("p_error_mientras_sin_hacer", linea)
+
+    def para(self):
+        linea = self.linea(self.avanzar())
+        variable = self.esperar("IDENTIFICADOR")
+        if self.tipo == "HACER":
+            self.avanzar()
+            yield ("FIN_PARA",)
+            self.avanzar()
+            return self.produccion_error("p_error_para_sin_limites", linea)
+        self.esperar("DESDE")
+        inicio = self.expresion()
+        self.esperar("HASTA")
+        fin = self.expresion()
+        paso = None
+        if self.tipo == "CON_PASO":
+            self.avanzar()
+            paso = self.expresion()
+            self.esperar("HACER")
+        elif self.tipo == "HACER":
+            self.avanzar()
+            if self.tipo == "FIN_PARA":
+                self.avanzar()
+                return self.produccion_error("p_error_para_sin_declaraciones", linea)
+        elif self._inicia_cuerpo():
+            yield ("FIN_PARA",)
+            self.avanzar()
+            return self.produccion_error("p_error_para_sin_hacer", linea)
+        else:
+            self.error()
+            raise _SentenciaInvalida()
+        cuerpo = yield ("FIN_PARA",)
+        self.avanzar()
+        return NodoPara(variable=NodoIdentificador(nombre=self.valor(variable), linea=self.linea(variable)),
+                        inicio=inicio, fin=fin, paso=paso, cuerpo=cuerpo, linea=linea)
+
+    def _condicion_repetir(self):
+        self.esperar("PARENTESIS_IZQ")
+        condicion = self.expresion()
+        self.esperar("PARENTESIS_DER")
+        self.esperar("PUNTO_COMA")
+        return condicion
+
+    def repetir(self):
+        linea = self.linea(self.avanzar())
+        if self.tipo == "HASTA_QUE":
+            self.avanzar()
+            self._condicion_repetir()
+            return self.produccion_error("p_error_repetir_sin_declaraciones", linea)
+        cuerpo = yield ("HASTA_QUE", "PARENTESIS_IZQ")
+        if self.tipo == "PARENTESIS_IZQ":
+            self._condicion_repetir()
+            return self.produccion_error("p_error_repetir_sin_hasta_que", linea)
+        linea_condicion = self.linea(self.avanzar())
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return self.produccion_error("p_error_repetir_sin_condicion", linea)
+        condicion = self._condicion_repetir()
+        return NodoRepetir(cuerpo=cuerpo, condicion=condicion, linea=linea, linea_condicion=linea_condicion)
+
+    def mostrar(self):
+        linea = self.linea(self.avanzar())
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return self.produccion_error("p_error_mostrar_sin_expresion", linea)
+        expresiones = [self.expresion()]
+        while self.tipo == "COMA":
+            self.avanzar()
+            expresiones.append(self.expresion())
+        if self.tipo == "PUNTO_COMA":
+            self.avanzar()
+            return NodoMostrar(expresiones=expresiones, linea=linea)
+        if self.tipo not in SIGUIENTES_SENTENCIA:
+            self.error()
+        return self.produccion_error("p_error_mostrar_sin_punto_coma", linea)
+
+    _SENTENCIAS = {
+        "TIPO": declaracion,
+        "IDENTIFICADOR": asignacion,
+        "CONSTANTE": constante,
+        "MOSTRAR": mostrar,
+    }
+
+    _BLOQUES = {
+        "SI": si,
+        "MIENTRAS": mientras,
+        "PARA": para,
+        "REPETIR": repetir,
+    }
+
+    # ---------------------------------------------------------------
+    # Expresiones (Pratt)
+    # ---------------------------------------------------------------
+
+    def expresion(self, nivel_minimo=0):
+        """Expresión cuyos operadores ligan más que `nivel_minimo`.
+
+        Los paréntesis, los `not` y los operandos derechos pendientes se
+        apilan en `abiertos` en lugar de recursar, así que la profundidad de
+        la expresión no está limitada por la pila de Python (igual que en
+        PLY). Tras un error el token actual queda como `error`, que no es
+        operador: las expresiones que lo contienen terminan y la sentencia
+        decide.
+        """
+        niveles = NIVELES
+        compartidas = self.compartidas
+        # (clase, nivel mínimo en que sigue la expresión que lo contiene, dato)
+        abiertos = []
+        while True:
+            tok = self.tok
+            tipo = self.tipo
+            if tipo == "PARENTESIS_IZQ":
+                self.avanzar()
+                abiertos.append((_PARENTESIS, nivel_minimo, None))
+                nivel_minimo = 0
+                continue
+            if tipo == "NOT":
+                self.avanzar()
+                abiertos.append((_NOT, nivel_minimo, tok))
+                nivel_minimo = NIVEL_NOT
+                continue
+            izquierda = self._operando(tok, tipo)
+
+            while True:
+                nivel = niveles.get(self.tipo)
+                if nivel is not None and nivel > nivel_minimo:
+                    asociatividad = ASOCIATIVIDAD[self.tipo]
+                    operador = self.avanzar()
+                    abiertos.append((_BINARIO, nivel_minimo, (izquierda, operador, asociatividad, nivel)))
+                    nivel_minimo = nivel - 1 if asociatividad == "right" else nivel
+                    break  # Sigue con el operando derecho
+                if not abiertos:
+                    return izquierda
+                clase, nivel_minimo, dato = abiertos.pop()
+                if clase is _PARENTESIS:
+                    if self.tipo == "PARENTESIS_DER":
+                        self.avanzar()
+                    elif self.tipo != ERROR:
+                        self.error()
+                elif clase is _NOT:
+                    if compartidas is not None:
+                        izquierda = compartidas.unario("NOT", izquierda, self.linea(dato))
+                    else:
+                        izquierda = NodoUnario(operador="NOT", expresion=izquierda, linea=self.linea(dato))
+                else:
+                    anterior, operador, asociatividad, nivel = dato
+                    if compartidas is not None:
+                        izquierda = compartidas.binario(self.valor(operador), anterior, izquierda, self.linea(operador))
+                    else:
+                        izquierda = NodoBinario(operador=self.valor(operador), izquierda=anterior, derecha=izquierda,
+                                                linea=self.linea(operador))
+                    if asociatividad == "nonassoc" and niveles.get(self.tipo) == nivel:
+                        self.error()
+
+    def _operando(self, tok, tipo):
+        """Identificador, literal o `expresion : error` (el operando que falta vale 0)."""
+        compartidas = self.compartidas
+        if tipo == "IDENTIFICADOR":
+            self.avanzar()
+            if compartidas is not None:
+                return compartidas.identificador(self.valor(tok), self.linea(tok))
+            return NodoIdentificador(nombre=self.valor(tok), linea=self.linea(tok))
+        if tipo in LITERALES:
+            self.avanzar()
+            tipo_literal, valor = self.valor(tok)
+            if compartidas is not None:
+                return compartidas.literal(normalizar_tipo(tipo_literal), valor, self.linea(tok))
+            return NodoLiteral(tipo=normalizar_tipo(tipo_literal), valor=valor, linea=self.linea(tok))
+        self.error()
+        self._desplazar_error(SIGUIENTES_EXPRESION_ERROR)
+        global_errors.append({"tipo": "sintáctico", "linea": self.linea(tok), "mensaje": MENSAJE_EXPRESION_INVALIDA})
+        return NodoLiteral(tipo="entero", valor=0, linea=self.linea(tok))
+
+
+class _AnalisisBuffer(_Analisis):
+    """Análisis que lee los tokens de un LexerBuffer directamente de las columnas del TokenBuffer.
+
+    Un token es su índice en el buffer: no se crea un objeto por token, y el
+    valor (`valor`) solo se decodifica para identificadores, tipos, literales
+    y operadores. `p_error` recibe una vista TokenBuffered del token.
+    """
+
+    def __init__(self, lexer, compartidas=None):
+        buffer = self.buffer = lexer.buffer
+        self.linea = buffer.lineas.__getitem__
+        self.valor = buffer.valor
+        self._tipos = buffer.tipos
+        self._cantidad = len(buffer)
+        self._siguiente = lexer.siguiente
+        super().__init__(lexer, compartidas)
+
+    def tipo_de(self, i):
+        return TIPOS[self._tipos[i]]
+
+    def _indice(self):
+        """Índice del siguiente token del buffer, o None al final."""
+        i = self._siguiente
+        if i >= self._cantidad:
+            return None
+        self._siguiente = i + 1
+        return i
+
+    def _leer(self):
+        i = self.tok = self._indice()
+        self.tipo = TIPOS[self._tipos[i]] if i is not None else FIN_ARCHIVO
+
+    def avanzar(self):
+        i = self.tok
+        if self.silencio:
+            self.silencio -= 1
+        siguiente = self.tok = self._indice()
+        self.tipo = TIPOS[self._tipos[siguiente]] if siguiente is not None else FIN_ARCHIVO
+        return i
+
+    def _token_error(self):
+        if self.tok is None:
+            return None
+        return TokenBuffered(self.buffer, self.tok, self.lexer)
+
+
+class ParserPratt:
+    """Alternativa al parser LALR con la misma interfaz `parse()`."""
+
+    compartidas = None  # Igual que en el parser LALR: lo asigna `parse_buffer(compartir_expresiones=True)`
+
+    def parse(self, input=None, lexer=None, debug=False, tracking=False):
+        """Analiza `input` (o los tokens que ya tenga `lexer`) y devuelve el NodoPrograma.
+
+        Las líneas se calculan siempre como con `tracking=True`; devuelve None
+        cuando PLY también lo haría (el archivo termina durante un error). Con
+        un LexerBuffer los tokens se leen de las columnas del TokenBuffer.
+        """
+        if lexer is None:
+            lexer = crear_lexer()
+        if input is not None:
+            lexer.input(input)
+        try:
+            analisis = _AnalisisBuffer if isinstance(lexer, LexerBuffer) else _Analisis
+            return analisis(lexer, self.compartidas).programa()
+        except _Abandono:
+            return None
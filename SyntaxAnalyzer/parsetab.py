@@ -1,105 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'programaleftORleftANDrightNOTleftSUMARESTAleftMULTIPLICACIONDIVISIONMODULOnonassocMAYOR_QUEMENOR_QUEMAYOR_IGUALMENOR_IGUALnonassocIGUAL_IGUALDIFERENTEAND ASIGNACION COMA CONSTANTE CON_PASO DESDE DIFERENTE DIVISION ENTONCES FIN FIN_MIENTRAS FIN_PARA FIN_SI HACER HASTA HASTA_QUE IDENTIFICADOR IGUAL_IGUAL INICIO LITERAL_BOOLEANO LITERAL_CADENA LITERAL_DECIMAL LITERAL_ENTERO MAYOR_IGUAL MAYOR_QUE MENOR_IGUAL MENOR_QUE MIENTRAS MODULO MOSTRAR MULTIPLICACION NOT OR PARA PARENTESIS_DER PARENTESIS_IZQ PUNTO_COMA REPETIR RESTA SI SINO SUMA TIPOprograma : INICIO declaraciones FINdeclaraciones : declaraciones declaracion\n| declaraciondeclaracion : declaracion_simple\n| declaracion_con_asignacion\n| asignacion\n| constante\n| sentencia_if\n| sentencia_mientras\n| sentencia_para\n| sentencia_repetir\n| sentencia_mostrar\n| emptyempty :sentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones FIN_SIsentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones SINO declaraciones FIN_SIsentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaraciones FIN_MIENTRASsentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER declaraciones FIN_PARA\n| PARA IDENTIFICADOR DESDE expresion HASTA expresion CON_PASO expresion HACER declaraciones FIN_PARAsentencia_repetir : REPETIR declaraciones HASTA_QUE PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMAsentencia_mostrar : MOSTRAR lista_expresiones PUNTO_COMAexpresion : expresion SUMA expresion\n| expresion RESTA expresion\n| expresion MULTIPLICACION expresion\n| expresion DIVISION expresion\n| expresion MODULO expresion\n| expresion AND expresion\n| expresion OR expresion\n| expresion MAYOR_QUE expresion\n| expresion MENOR_QUE expresion\n| expresion MAYOR_IGUAL expresion\n| expresion MENOR_IGUAL expresion\n| expresion IGUAL_IGUAL expresion\n| expresion DIFERENTE expresionexpresion : NOT expresionexpresion : PARENTESIS_IZQ expresion PARENTESIS_DERexpresion : LITERAL_ENTERO\n| LITERAL_DECIMAL\n| LITERAL_CADENA\n| LITERAL_BOOLEANOexpresion : IDENTIFICADORlista_expresiones : lista_expresiones COMA expresion\n| expresiondeclaracion_simple : TIPO IDENTIFICADOR PUNTO_COMAdeclaracion_con_asignacion : TIPO IDENTIFICADOR ASIGNACION expresion PUNTO_COMAasignacion : IDENTIFICADOR ASIGNACION expresion PUNTO_COMAconstante : CONSTANTE IDENTIFICADOR ASIGNACION expresion PUNTO_COMAdeclaracion : error PUNTO_COMAsentencia_if : SI  ENTONCES declaraciones FIN_SIsentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_SIsentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES FIN_SIsentencia_if : SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaracionessentencia_mientras : MIENTRAS  HACER declaraciones FIN_MIENTRASsentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_MIENTRASsentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER  FIN_MIENTRASsentencia_mientras : MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaracionessentencia_para : PARA IDENTIFICADOR HACER declaraciones FIN_PARAsentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion declaraciones FIN_PARAsentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER FIN_PARAsentencia_para : PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER declaracionessentencia_repetir : REPETIR declaraciones HASTA_QUE  PUNTO_COMAsentencia_repetir : REPETIR declaraciones  PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMAsentencia_repetir : REPETIR  HASTA_QUE PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMAsentencia_mostrar : MOSTRAR  PUNTO_COMAsentencia_mostrar : MOSTRAR lista_expresionesdeclaracion : TIPO PUNTO_COMAdeclaracion : TIPO IDENTIFICADORasignacion : IDENTIFICADOR ASIGNACION PUNTO_COMAexpresion : errorasignacion : IDENTIFICADOR ASIGNACION expresiondeclaracion_con_asignacion :  IDENTIFICADOR ASIGNACION expresion PUNTO_COMAdeclaracion_con_asignacion : TIPO ASIGNACION expresion PUNTO_COMAdeclaracion_con_asignacion : TIPO IDENTIFICADOR  expresion PUNTO_COMAdeclaracion_con_asignacion : TIPO IDENTIFICADOR ASIGNACION  PUNTO_COMAdeclaracion_con_asignacion : TIPO IDENTIFICADOR ASIGNACION expresion '
-    
-_lr_action_items = {'INICIO':([0,],[2,]),'$end':([1,24,],[0,-1,]),'error':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,23,25,26,27,28,29,30,32,33,34,35,37,39,40,41,42,43,44,45,46,47,48,49,50,51,54,55,56,58,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,86,87,89,90,91,92,94,95,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,],[15,15,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,15,49,-2,-48,-66,49,49,49,49,15,49,15,15,-65,-64,-43,49,49,-37,-38,-39,-40,-41,-69,-44,49,-70,-68,49,15,15,49,15,49,49,-21,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-35,-75,-74,-73,-72,-46,15,-49,15,-53,15,49,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,15,15,15,15,49,-57,15,-51,-50,15,-55,-54,15,-62,-63,-15,15,-17,15,15,49,-20,15,15,-59,-58,-16,-18,15,15,-19,]),'TIPO':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[16,16,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,16,-2,-48,-66,-67,16,16,16,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,16,16,16,-21,-35,-75,-74,-73,-72,-46,16,-49,16,-53,16,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,16,16,16,16,-57,16,-51,-50,16,-55,-54,16,-62,-63,-15,16,-17,16,16,-20,16,16,-59,-58,-16,-18,16,16,-19,]),'IDENTIFICADOR':([2,3,4,5,6,7,8,9,10,11,12,13,14,16,18,21,22,23,25,26,27,28,29,30,32,33,34,35,37,39,40,41,42,43,44,45,46,47,48,49,50,51,54,55,56,58,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,86,87,89,90,91,92,94,95,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,140,141,142,143,144,145,147,148,149,150,151,],[17,17,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,28,31,36,17,48,-2,-48,-66,48,48,48,48,17,48,17,17,-65,-64,-43,48,48,-37,-38,-39,-40,-41,-69,-44,48,-70,-68,48,17,17,48,17,48,48,-21,48,48,48,48,48,48,48,48,48,48,48,48,48,48,-35,-75,-74,-73,-72,-46,17,-49,17,-53,17,48,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,17,17,17,17,48,-57,17,-51,-50,17,-55,-54,17,-62,-63,-15,17,-17,17,17,48,-20,17,17,-59,-58,-16,-18,17,17,-19,]),'CONSTANTE':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[18,18,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,18,-2,-48,-66,-67,18,18,18,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,18,18,18,-21,-35,-75,-74,-73,-72,-46,18,-49,18,-53,18,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,18,18,18,18,-57,18,-51,-50,18,-55,-54,18,-62,-63,-15,18,-17,18,18,-20,18,18,-59,-58,-16,-18,18,18,-19,]),'SI':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[19,19,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,19,-2,-48,-66,-67,19,19,19,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,19,19,19,-21,-35,-75,-74,-73,-72,-46,19,-49,19,-53,19,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,19,19,19,19,-57,19,-51,-50,19,-55,-54,19,-62,-63,-15,19,-17,19,19,-20,19,19,-59,-58,-16,-18,19,19,-19,]),'MIENTRAS':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[20,20,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,20,-2,-48,-66,-67,20,20,20,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,20,20,20,-21,-35,-75,-74,-73,-72,-46,20,-49,20,-53,20,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,20,20,20,20,-57,20,-51,-50,20,-55,-54,20,-62,-63,-15,20,-17,20,20,-20,20,20,-59,-58,-16,-18,20,20,-19,]),'PARA':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[21,21,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,21,-2,-48,-66,-67,21,21,21,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,21,21,21,-21,-35,-75,-74,-73,-72,-46,21,-49,21,-53,21,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,21,21,21,21,-57,21,-51,-50,21,-55,-54,21,-62,-63,-15,21,-17,21,21,-20,21,21,-59,-58,-16,-18,21,21,-19,]),'REPETIR':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[22,22,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,22,-2,-48,-66,-67,22,22,22,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,22,22,22,-21,-35,-75,-74,-73,-72,-46,22,-49,22,-53,22,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,22,22,22,22,-57,22,-51,-50,22,-55,-54,22,-62,-63,-15,22,-17,22,22,-20,22,22,-59,-58,-16,-18,22,22,-19,]),'MOSTRAR':([2,3,4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,33,35,37,39,40,41,44,45,46,47,48,49,50,54,55,58,60,62,66,81,83,84,85,86,87,89,90,91,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,121,125,126,127,128,129,130,131,133,134,135,136,137,138,139,141,142,143,144,145,147,148,149,150,151,],[23,23,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,23,-2,-48,-66,-67,23,23,23,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,23,23,23,-21,-35,-75,-74,-73,-72,-46,23,-49,23,-53,23,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,23,23,23,23,-57,23,-51,-50,23,-55,-54,23,-62,-63,-15,23,-17,23,23,-20,23,23,-59,-58,-16,-18,23,23,-19,]),'FIN':([2,3,4,5,6,7,8,9,10,11,12,13,14,25,26,27,28,39,40,41,44,45,46,47,48,49,50,54,55,66,81,83,84,85,86,87,90,92,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,121,125,126,127,128,129,130,133,134,135,137,138,141,143,144,145,147,148,151,],[-14,24,-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-2,-48,-66,-67,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,-21,-35,-75,-74,-73,-72,-46,-49,-53,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,-14,-57,-14,-51,-50,-14,-55,-54,-62,-63,-15,-17,-14,-20,-14,-59,-58,-16,-18,-19,]),'HASTA_QUE':([4,5,6,7,8,9,10,11,12,13,14,22,25,26,27,28,37,39,40,41,44,45,46,47,48,49,50,54,55,66,81,83,84,85,86,87,90,92,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,121,125,126,127,128,129,130,133,134,135,137,138,141,143,144,145,147,148,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,38,-2,-48,-66,-67,63,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,-21,-35,-75,-74,-73,-72,-46,-49,-53,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,-14,-57,-14,-51,-50,-14,-55,-54,-62,-63,-15,-17,-14,-20,-14,-59,-58,-16,-18,-19,]),'PARENTESIS_IZQ':([4,5,6,7,8,9,10,11,12,13,14,19,20,22,23,25,26,27,28,29,30,32,34,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,54,55,56,61,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,83,84,85,86,87,90,92,95,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,120,121,125,126,127,128,129,130,133,134,135,137,138,140,141,143,144,145,147,148,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,32,34,-14,43,-2,-48,-66,43,43,43,43,43,64,65,-65,-64,-43,43,43,-37,-38,-39,-40,-41,-69,-44,43,-70,-68,43,43,95,43,43,-21,43,43,43,43,43,43,43,43,43,43,43,43,43,43,-35,-75,-74,-73,-72,-46,-49,-53,43,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,-14,43,-57,-14,-51,-50,-14,-55,-54,-62,-63,-15,-17,-14,43,-20,-14,-59,-58,-16,-18,-19,]),'FIN_SI':([4,5,6,7,8,9,10,11,12,13,14,25,26,27,28,33,39,40,41,44,45,46,47,48,49,50,54,55,58,66,81,83,84,85,86,87,89,90,92,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,125,126,127,128,129,130,133,134,135,136,137,138,141,142,143,144,145,147,148,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-2,-48,-66,-67,-14,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,90,-21,-35,-75,-74,-73,-72,-46,-14,-49,-53,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,126,127,-14,-57,135,-51,-50,-14,-55,-54,-62,-63,-15,-14,-17,-14,-20,147,-14,-59,-58,-16,-18,-19,]),'FIN_MIENTRAS':([4,5,6,7,8,9,10,11,12,13,14,25,26,27,28,35,39,40,41,44,45,46,47,48,49,50,54,55,60,66,81,83,84,85,86,87,90,91,92,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,121,125,126,127,128,129,130,133,134,135,137,138,141,143,144,145,147,148,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-2,-48,-66,-67,-14,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,92,-21,-35,-75,-74,-73,-72,-46,-49,-14,-53,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,129,130,-57,-14,-51,-50,137,-55,-54,-62,-63,-15,-17,-14,-20,-14,-59,-58,-16,-18,-19,]),'FIN_PARA':([4,5,6,7,8,9,10,11,12,13,14,25,26,27,28,39,40,41,44,45,46,47,48,49,50,54,55,62,66,81,83,84,85,86,87,90,92,94,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,121,125,126,127,128,129,130,131,133,134,135,137,138,139,141,143,144,145,147,148,149,150,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-2,-48,-66,-67,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,-14,-21,-35,-75,-74,-73,-72,-46,-49,-53,121,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,-14,-57,-14,-51,-50,-14,-55,-54,-14,-62,-63,-15,-17,144,145,-20,148,-59,-58,-16,-18,-14,151,-19,]),'SINO':([4,5,6,7,8,9,10,11,12,13,14,25,26,27,28,39,40,41,44,45,46,47,48,49,50,54,55,66,81,83,84,85,86,87,90,92,96,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,121,125,126,127,128,129,130,133,134,135,137,138,141,143,144,145,147,148,151,],[-3,-4,-5,-6,-7,-8,-9,-10,-11,-12,-13,-2,-48,-66,-67,-65,-64,-43,-37,-38,-39,-40,-41,-69,-44,-70,-68,-21,-35,-75,-74,-73,-72,-46,-49,-53,-61,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,-45,-47,-14,-14,-57,136,-51,-50,-14,-55,-54,-62,-63,-15,-17,-14,-20,-14,-59,-58,-16,-18,-19,]),'PUNTO_COMA':([15,16,23,28,30,39,41,44,45,46,47,48,49,51,52,53,54,63,81,83,88,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,123,124,132,],[26,27,40,50,55,66,-43,-37,-38,-39,-40,-41,-69,84,85,86,87,96,-35,114,115,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,133,134,141,]),'ASIGNACION':([16,17,28,31,],[29,30,51,56,]),'ENTONCES':([19,89,],[33,116,]),'HACER':([20,36,44,45,46,47,48,49,81,91,100,101,102,103,104,105,106,107,108,109,110,111,112,113,131,146,],[35,62,-37,-38,-39,-40,-41,-69,-35,118,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,138,149,]),'NOT':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'LITERAL_ENTERO':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,]),'LITERAL_DECIMAL':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'LITERAL_CADENA':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'LITERAL_BOOLEANO':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'DESDE':([36,],[61,]),'COMA':([39,41,44,45,46,47,48,49,81,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,],[67,-43,-37,-38,-39,-40,-41,-69,-35,-42,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,]),'SUMA':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[68,-37,-38,-39,-40,-41,-69,68,68,68,68,68,68,68,68,68,68,68,68,68,-22,-23,-24,-25,-26,68,68,-29,-30,-31,-32,-33,-34,-36,68,68,68,]),'RESTA':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[69,-37,-38,-39,-40,-41,-69,69,69,69,69,69,69,69,69,69,69,69,69,69,-22,-23,-24,-25,-26,69,69,-29,-30,-31,-32,-33,-34,-36,69,69,69,]),'MULTIPLICACION':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[70,-37,-38,-39,-40,-41,-69,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,-24,-25,-26,70,70,-29,-30,-31,-32,-33,-34,-36,70,70,70,]),'DIVISION':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[71,-37,-38,-39,-40,-41,-69,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,-24,-25,-26,71,71,-29,-30,-31,-32,-33,-34,-36,71,71,71,]),'MODULO':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[72,-37,-38,-39,-40,-41,-69,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-24,-25,-26,72,72,-29,-30,-31,-32,-33,-34,-36,72,72,72,]),'AND':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[73,-37,-38,-39,-40,-41,-69,73,73,73,73,73,-35,73,73,73,73,73,73,73,-22,-23,-24,-25,-26,-27,73,-29,-30,-31,-32,-33,-34,-36,73,73,73,]),'OR':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[74,-37,-38,-39,-40,-41,-69,74,74,74,74,74,-35,74,74,74,74,74,74,74,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,74,74,74,]),'MAYOR_QUE':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[75,-37,-38,-39,-40,-41,-69,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,None,None,None,None,-33,-34,-36,75,75,75,]),'MENOR_QUE':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[76,-37,-38,-39,-40,-41,-69,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,None,None,None,None,-33,-34,-36,76,76,76,]),'MAYOR_IGUAL':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[77,-37,-38,-39,-40,-41,-69,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,None,None,None,None,-33,-34,-36,77,77,77,]),'MENOR_IGUAL':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[78,-37,-38,-39,-40,-41,-69,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,None,None,None,None,-33,-34,-36,78,78,78,]),'IGUAL_IGUAL':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[79,-37,-38,-39,-40,-41,-69,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,None,None,-36,79,79,79,]),'DIFERENTE':([41,44,45,46,47,48,49,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,131,146,],[80,-37,-38,-39,-40,-41,-69,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,None,None,-36,80,80,80,]),'PARENTESIS_DER':([44,45,46,47,48,49,57,59,81,82,97,98,100,101,102,103,104,105,106,107,108,109,110,111,112,113,122,],[-37,-38,-39,-40,-41,-69,89,91,-35,113,123,124,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,132,]),'HASTA':([44,45,46,47,48,49,81,93,100,101,102,103,104,105,106,107,108,109,110,111,112,113,],[-37,-38,-39,-40,-41,-69,-35,120,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,]),'CON_PASO':([44,45,46,47,48,49,81,100,101,102,103,104,105,106,107,108,109,110,111,112,113,131,],[-37,-38,-39,-40,-41,-69,-35,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-36,140,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'programa':([0,],[1,]),'declaraciones':([2,22,33,35,62,89,91,116,118,131,136,138,149,],[3,37,58,60,94,117,119,125,128,139,142,143,150,]),'declaracion':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[4,25,4,4,4,25,25,25,4,4,4,25,4,25,4,25,25,25,4,4,4,25,25,25,4,25,]),'declaracion_simple':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,]),'declaracion_con_asignacion':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'asignacion':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'constante':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'sentencia_if':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'sentencia_mientras':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'sentencia_para':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'sentencia_repetir':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'sentencia_mostrar':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'empty':([2,3,22,33,35,37,58,60,62,89,91,94,116,117,118,119,125,128,131,136,138,139,142,143,149,150,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'lista_expresiones':([23,],[39,]),'expresion':([23,28,29,30,32,34,42,43,51,56,61,64,65,67,68,69,70,71,72,73,74,75,76,77,78,79,80,95,120,140,],[41,52,53,54,57,59,81,82,83,88,93,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,122,131,146,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> programa","S'",1,None,None,None),
-  ('programa -> INICIO declaraciones FIN','programa',3,'p_programa','Parser.py',47),
-  ('declaraciones -> declaraciones declaracion','declaraciones',2,'p_declaraciones','Parser.py',56),
-  ('declaraciones -> declaracion','declaraciones',1,'p_declaraciones','Parser.py',57),
-  ('declaracion -> declaracion_simple','declaracion',1,'p_declaracion','Parser.py',64),
-  ('declaracion -> declaracion_con_asignacion','declaracion',1,'p_declaracion','Parser.py',65),
-  ('declaracion -> asignacion','declaracion',1,'p_declaracion','Parser.py',66),
-  ('declaracion -> constante','declaracion',1,'p_declaracion','Parser.py',67),
-  ('declaracion -> sentencia_if','declaracion',1,'p_declaracion','Parser.py',68),
-  ('declaracion -> sentencia_mientras','declaracion',1,'p_declaracion','Parser.py',69),
-  ('declaracion -> sentencia_para','declaracion',1,'p_declaracion','Parser.py',70),
-  ('declaracion -> sentencia_repetir','declaracion',1,'p_declaracion','Parser.py',71),
-  ('declaracion -> sentencia_mostrar','declaracion',1,'p_declaracion','Parser.py',72),
-  ('declaracion -> empty','declaracion',1,'p_declaracion','Parser.py',73),
-  ('empty -> <empty>','empty',0,'p_empty','Parser.py',79),
-  ('sentencia_if -> SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones FIN_SI','sentencia_if',7,'p_sentencia_if_simple','Parser.py',87),
-  ('sentencia_if -> SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones SINO declaraciones FIN_SI','sentencia_if',9,'p_sentencia_if_con_sino','Parser.py',92),
-  ('sentencia_mientras -> MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaraciones FIN_MIENTRAS','sentencia_mientras',7,'p_sentencia_mientras','Parser.py',97),
-  ('sentencia_para -> PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER declaraciones FIN_PARA','sentencia_para',9,'p_sentencia_para','Parser.py',106),
-  ('sentencia_para -> PARA IDENTIFICADOR DESDE expresion HASTA expresion CON_PASO expresion HACER declaraciones FIN_PARA','sentencia_para',11,'p_sentencia_para','Parser.py',107),
-  ('sentencia_repetir -> REPETIR declaraciones HASTA_QUE PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMA','sentencia_repetir',7,'p_sentencia_repetir','Parser.py',127),
-  ('sentencia_mostrar -> MOSTRAR lista_expresiones PUNTO_COMA','sentencia_mostrar',3,'p_sentencia_mostrar','Parser.py',135),
-  ('expresion -> expresion SUMA expresion','expresion',3,'p_expresion_binaria','Parser.py',148),
-  ('expresion -> expresion RESTA expresion','expresion',3,'p_expresion_binaria','Parser.py',149),
-  ('expresion -> expresion MULTIPLICACION expresion','expresion',3,'p_expresion_binaria','Parser.py',150),
-  ('expresion -> expresion DIVISION expresion','expresion',3,'p_expresion_binaria','Parser.py',151),
-  ('expresion -> expresion MODULO expresion','expresion',3,'p_expresion_binaria','Parser.py',152),
-  ('expresion -> expresion AND expresion','expresion',3,'p_expresion_binaria','Parser.py',153),
-  ('expresion -> expresion OR expresion','expresion',3,'p_expresion_binaria','Parser.py',154),
-  ('expresion -> expresion MAYOR_QUE expresion','expresion',3,'p_expresion_binaria','Parser.py',155),
-  ('expresion -> expresion MENOR_QUE expresion','expresion',3,'p_expresion_binaria','Parser.py',156),
-  ('expresion -> expresion MAYOR_IGUAL expresion','expresion',3,'p_expresion_binaria','Parser.py',157),
-  ('expresion -> expresion MENOR_IGUAL expresion','expresion',3,'p_expresion_binaria','Parser.py',158),
-  ('expresion -> expresion IGUAL_IGUAL expresion','expresion',3,'p_expresion_binaria','Parser.py',159),
-  ('expresion -> expresion DIFERENTE expresion','expresion',3,'p_expresion_binaria','Parser.py',160),
-  ('expresion -> NOT expresion','expresion',2,'p_expresion_unaria','Parser.py',169),
-  ('expresion -> PARENTESIS_IZQ expresion PARENTESIS_DER','expresion',3,'p_expresion_paren','Parser.py',173),
-  ('expresion -> LITERAL_ENTERO','expresion',1,'p_expresion_literal','Parser.py',177),
-  ('expresion -> LITERAL_DECIMAL','expresion',1,'p_expresion_literal','Parser.py',178),
-  ('expresion -> LITERAL_CADENA','expresion',1,'p_expresion_literal','Parser.py',179),
-  ('expresion -> LITERAL_BOOLEANO','expresion',1,'p_expresion_literal','Parser.py',180),
-  ('expresion -> IDENTIFICADOR','expresion',1,'p_expresion_identificador','Parser.py',185),
-  ('lista_expresiones -> lista_expresiones COMA expresion','lista_expresiones',3,'p_lista_expresiones','Parser.py',190),
-  ('lista_expresiones -> expresion','lista_expresiones',1,'p_lista_expresiones','Parser.py',191),
-  ('declaracion_simple -> TIPO IDENTIFICADOR PUNTO_COMA','declaracion_simple',3,'p_declaracion_simple','Parser.py',202),
-  ('declaracion_con_asignacion -> TIPO IDENTIFICADOR ASIGNACION expresion PUNTO_COMA','declaracion_con_asignacion',5,'p_declaracion_con_asignacion','Parser.py',212),
-  ('asignacion -> IDENTIFICADOR ASIGNACION expresion PUNTO_COMA','asignacion',4,'p_asignacion','Parser.py',222),
-  ('constante -> CONSTANTE IDENTIFICADOR ASIGNACION expresion PUNTO_COMA','constante',5,'p_constante','Parser.py',237),
-  ('declaracion -> error PUNTO_COMA','declaracion',2,'p_declaracion_error','Parser.py',270),
-  ('sentencia_if -> SI ENTONCES declaraciones FIN_SI','sentencia_if',4,'p_error_if_sin_condicion','Parser.py',310),
-  ('sentencia_if -> SI PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_SI','sentencia_if',6,'p_error_if_sin_entonces','Parser.py',322),
-  ('sentencia_if -> SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES FIN_SI','sentencia_if',6,'p_error_if_sin_declaraciones','Parser.py',334),
-  ('sentencia_if -> SI PARENTESIS_IZQ expresion PARENTESIS_DER ENTONCES declaraciones','sentencia_if',6,'p_error_if_sin_fin','Parser.py',346),
-  ('sentencia_mientras -> MIENTRAS HACER declaraciones FIN_MIENTRAS','sentencia_mientras',4,'p_error_mientras_sin_condicion','Parser.py',361),
-  ('sentencia_mientras -> MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER declaraciones FIN_MIENTRAS','sentencia_mientras',6,'p_error_mientras_sin_hacer','Parser.py',373),
-  ('sentencia_mientras -> MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER FIN_MIENTRAS','sentencia_mientras',6,'p_error_mientras_sin_declaraciones','Parser.py',385),
-  ('sentencia_mientras -> MIENTRAS PARENTESIS_IZQ expresion PARENTESIS_DER HACER declaraciones','sentencia_mientras',6,'p_error_mientras_si_fin_mientras','Parser.py',397),
-  ('sentencia_para -> PARA IDENTIFICADOR HACER declaraciones FIN_PARA','sentencia_para',5,'p_error_para_sin_limites','Parser.py',412),
-  ('sentencia_para -> PARA IDENTIFICADOR DESDE expresion HASTA expresion declaraciones FIN_PARA','sentencia_para',8,'p_error_para_sin_hacer','Parser.py',424),
-  ('sentencia_para -> PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER FIN_PARA','sentencia_para',8,'p_error_para_sin_declaraciones','Parser.py',436),
-  ('sentencia_para -> PARA IDENTIFICADOR DESDE expresion HASTA expresion HACER declaraciones','sentencia_para',8,'p_error_para_sin_fin_para','Parser.py',448),
-  ('sentencia_repetir -> REPETIR declaraciones HASTA_QUE PUNTO_COMA','sentencia_repetir',4,'p_error_repetir_sin_condicion','Parser.py',463),
-  ('sentencia_repetir -> REPETIR declaraciones PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMA','sentencia_repetir',6,'p_error_repetir_sin_hasta_que','Parser.py',475),
-  ('sentencia_repetir -> REPETIR HASTA_QUE PARENTESIS_IZQ expresion PARENTESIS_DER PUNTO_COMA','sentencia_repetir',6,'p_error_repetir_sin_declaraciones','Parser.py',487),
-  ('sentencia_mostrar -> MOSTRAR PUNTO_COMA','sentencia_mostrar',2,'p_error_mostrar_sin_expresion','Parser.py',502),
-  ('sentencia_mostrar -> MOSTRAR lista_expresiones','sentencia_mostrar',2,'p_error_mostrar_sin_punto_coma','Parser.py',514),
-  ('declaracion -> TIPO PUNTO_COMA','declaracion',2,'p_error_declaracion_incompleta','Parser.py',529),
-  ('declaracion -> TIPO IDENTIFICADOR','declaracion',2,'p_error_declaracion_incompleta_punto_coma','Parser.py',541),
-  ('asignacion -> IDENTIFICADOR ASIGNACION PUNTO_COMA','asignacion',3,'p_error_asignacion_invalida','Parser.py',556),
-  ('expresion -> error','expresion',1,'p_expresion_error','Parser.py',568),
-  ('asignacion -> IDENTIFICADOR ASIGNACION expresion','asignacion',3,'p_error_asignacion_invalida_punto_coma','Parser.py',578),
-  ('declaracion_con_asignacion -> IDENTIFICADOR ASIGNACION expresion PUNTO_COMA','declaracion_con_asignacion',4,'p_declaracion_con_asignacion_sin_tipo','Parser.py',590),
-  ('declaracion_con_asignacion -> TIPO ASIGNACION expresion PUNTO_COMA','declaracion_con_asignacion',4,'p_declaracion_con_asignacion_sin_identificador','Parser.py',601),
-  ('declaracion_con_asignacion -> TIPO IDENTIFICADOR expresion PUNTO_COMA','declaracion_con_asignacion',4,'p_declaracion_con_asignacion_sin_asignacion','Parser.py',612),
-  ('declaracion_con_asignacion -> TIPO IDENTIFICADOR ASIGNACION PUNTO_COMA','declaracion_con_asignacion',4,'p_declaracion_con_asignacion_sin_expresion','Parser.py',623),
-  ('declaracion_con_asignacion -> TIPO IDENTIFICADOR ASIGNACION expresion','declaracion_con_asignacion',4,'p_declaracion_con_asignacion_sin_punto_coma','Parser.py',635),
-]
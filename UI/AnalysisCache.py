@@ -0,0 +1,64 @@
+# AnalysisCache.py
+import hashlib
+from collections import OrderedDict, namedtuple
+
+# Programas analizados que se conservan por defecto
+MAX_ANALYSES = 64
+
+# python_code es None si el análisis terminó con errores antes de traducir
+AnalysisResult = namedtuple("AnalysisResult", "python_code errors")
+
+
+class AnalysisCache:
+    """Caché en memoria (LRU) del resultado completo de analizar un programa.
+
+    La clave es el SHA-256 del código junto con las opciones del compilador,
+    y el valor el código Python final más los diagnósticos. Al superar
+    `max_entries` se descarta el programa usado hace más tiempo. `invalidate()`
+    vacía la caché cuando cambia algo que la clave no cubre (la configuración
+    del compilador, un módulo recargado).
+    """
+
+    def __init__(self, max_entries=MAX_ANALYSES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, code, options=()):
+        h = hashlib.sha256(repr(options).encode())
+        h.update(b"\0")
+        h.update(code.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def get(self, key):
+        """Resultado guardado para `key` (con los errores copiados) o None."""
+        result = self._entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return AnalysisResult(result.python_code, [dict(error) for error in result.errors])
+
+    def put(self, key, python_code, errors):
+        self._entries[key] = AnalysisResult(python_code, [dict(error) for error in errors])
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+        }
@@ -1,11 +1,35 @@
 import tkinter as tk
 from tkinter import ttk
-from SyntaxAnalyzer.Parser import TIPOS_DE_DATOS
 from LexicalAnalyzer.Lexer import reserved
+from LexicalAnalyzer.IncrementalLexer import LexerIncremental
+
+# Etiqueta de resaltado de cada tipo de token (los que no están quedan sin color)
+ETIQUETAS_TOKEN = {tipo: "keyword" for tipo in reserved.values()}
+ETIQUETAS_TOKEN.update({
+    "TIPO": "datatype",
+    "LITERAL_CADENA": "string",
+    "LITERAL_BOOLEANO": "boolean",
+    "SUMA": "operator",
+    "RESTA": "operator",
+    "MULTIPLICACION": "operator",
+    "DIVISION": "operator",
+    "ASIGNACION": "operator",
+    "AND": "operator",
+    "OR": "operator",
+    "NOT": "operator",
+})
+ETIQUETAS_RESALTADO = ("keyword", "datatype", "comment", "string", "operator", "boolean", "lexical_error")
+
+# Comandos del widget Text que cambian su contenido
+COMANDOS_EDICION = ("insert", "delete", "replace")
+
 
 class CodeEditor(tk.Frame):
-    def __init__(self, parent):
+    def __init__(self, parent, lexer_backend="ply"):
         super().__init__(parent)
+        # Tokens del texto del editor: cada cambio re-tokeniza y re-resalta solo lo editado
+        self.lexer = LexerIncremental("", lexer_backend)
+        self._numeradas = 0  # Líneas que muestra la numeración
         self._setup_editor()
         self._setup_line_numbers()
         self._bind_events()
@@ -32,6 +56,21 @@ class CodeEditor(tk.Frame):
         
         # Configurar tags para resaltado de sintaxis
         self._setup_syntax_highlighting()
+        self._interceptar_ediciones()
+
+    def _interceptar_ediciones(self):
+        """Hace pasar por `_comando_texto` los comandos de Tcl del área de texto.
+
+        Tk escribe en el widget (teclas, pegar, deshacer) con sus comandos
+        `insert`, `delete` y `replace`: sus índices dicen qué rango cambió,
+        sin leer el buffer ni compararlo con el anterior.
+        """
+        widget = str(self.text_area)
+        self._comando_original = widget + "_original"
+        self.tk.call("rename", widget, self._comando_original)
+        self.tk.createcommand(widget, self._comando_texto)
+        # Tk borra el comando original con el widget; el de Python queda a cargo nuestro
+        self.text_area.bind("<Destroy>", lambda event: self.tk.deletecommand(widget), add="+")
         
     def _setup_line_numbers(self):
         # Numeración de líneas
@@ -51,23 +90,21 @@ class CodeEditor(tk.Frame):
         
     def _setup_syntax_highlighting(self):
         # Configurar colores para resaltado
-        self.text_area.tag_configure("keyword", foreground="#0000FF")
-        self.text_area.tag_configure("datatype", foreground="#800080")
-        self.text_area.tag_configure("comment", foreground="#808080", font=('Consolas', 12, 'italic'))
-        self.text_area.tag_configure("string", foreground="#008000")
-        self.text_area.tag_configure("operator", foreground="black", font=('Consolas', 12, 'bold'))
-        self.text_area.tag_configure("boolean", foreground="#B22222")
+        # (PSeInt Style)
+        self.text_area.tag_configure("keyword", foreground="#0000FF")  # Azul fuerte
+        self.text_area.tag_configure("datatype", foreground="#800080")  # Púrpura
+        self.text_area.tag_configure("comment", foreground="#808080", font=("Consolas", 10, "italic"))
+        self.text_area.tag_configure("string", foreground="#008000")  # Verde oscuro
+        self.text_area.tag_configure("operator", foreground="black", font=("TkDefaultFont", 10, "bold"))
+        self.text_area.tag_configure("boolean", foreground="#B22222")  # Rojo oscuro
+        self.text_area.tag_configure("lexical_error", foreground="red", underline=True)
         self.text_area.tag_configure("error", background="red", foreground="white")
         
     def _bind_events(self):
-        self.text_area.bind("<KeyRelease>", self._on_key_release)
+        # El resaltado y la numeración se actualizan en `_comando_texto`, con cada edición
         self.text_area.bind("<Return>", self._auto_indent)
         self.text_area.bind("<Configure>", self._update_line_numbers)
         
-    def _on_key_release(self, event=None):
-        self._update_line_numbers()
-        self._highlight_syntax()
-        
     def _auto_indent(self, event=None):
         """Agrega tabulación automática al presionar Enter"""
         cursor_index = self.text_area.index(tk.INSERT)
@@ -85,76 +122,105 @@ class CodeEditor(tk.Frame):
         return "break"  # Evita que Tkinter agregue un salto de línea por defecto
 
     def _update_line_numbers(self, event=None):
-        """Actualiza la numeración de líneas en el área de texto."""
-        lines = self.text_area.get("1.0", tk.END).count("\n") + 1
+        """Ajusta la numeración a las líneas del texto, agregando o quitando solo las que cambiaron."""
+        lines = len(self.lexer.lineas) + 1
+        if lines == self._numeradas:
+            return
         self.line_numbers.config(state=tk.NORMAL)
-        self.line_numbers.delete("1.0", tk.END)
-        for line in range(1, lines + 1):
-            self.line_numbers.insert(tk.END, f"{line}\n")
+        if lines > self._numeradas:
+            self.line_numbers.insert(tk.END, "".join(f"{line}\n" for line in range(self._numeradas + 1, lines + 1)))
+        else:
+            self.line_numbers.delete(f"{lines + 1}.0", f"{self._numeradas + 1}.0")
         self.line_numbers.config(state=tk.DISABLED)
+        self._numeradas = lines
+
+    def _comando_texto(self, operacion, *argumentos):
+        """Ejecuta un comando del área de texto; si es una edición, la pasa al lexer y re-resalta lo editado.
 
-    def _highlight_syntax(self, event=None):
-        """Resalta palabras clave, tipos de datos, cadenas, comentarios, operadores y comparadores."""
+        El costo por tecla no depende del largo del archivo: el
+        LexerIncremental re-tokeniza el tramo editado (`ultimo_tramo`) y
+        solo esas líneas se vuelven a resaltar. Las etiquetas del resto se
+        mueven con el texto.
+        """
+        comando = (self._comando_original, operacion) + argumentos
+        if operacion not in COMANDOS_EDICION:
+            return self.tk.call(comando)
+        cambio = self._rango_edicion(operacion, argumentos)
+        resultado = self.tk.call(comando)
+        if cambio is None:
+            # Varios rangos en un solo comando (Tk no lo hace al editar): se tokeniza todo otra vez
+            self.lexer.cargar(self.tk.call(self._comando_original, "get", "1.0", "end-1c"))
+            inicio = fin = 0
+        else:
+            inicio, fin, texto = cambio
+            if fin == inicio and not texto:
+                return resultado
+            self.lexer.editar_rango(inicio, fin, texto)
+            fin = inicio + len(texto)
+        desde, hasta = self.lexer.ultimo_tramo
+        self._resaltar(min(inicio, desde), max(fin, hasta))
         self._update_line_numbers()
+        return resultado
 
-        # 🔹 Categorías basadas en Lexer y Parser
-        keywords = list(reserved.keys())  # Palabras clave en el Lexer
-        datatypes = list(TIPOS_DE_DATOS.values())  # Tipos de datos en el Parser
-        operators = ["\\+", "-", "\\*", "/", "=", "AND", "OR", "NOT"]
-        comparators = [">", "<", ">=", "<=", "==", "!="]
-        boolean_values = ["verdadero", "falso"]
+    def _rango_edicion(self, operacion, argumentos):
+        """(inicio, fin, texto) que reemplaza el comando en el texto, o None si toca varios rangos."""
+        if operacion == "insert":
+            inicio = self._offset(argumentos[0])
+            return inicio, inicio, "".join(argumentos[1::2])
+        if operacion == "replace":
+            inicio = self._offset(argumentos[0])
+            return inicio, max(self._offset(argumentos[1]), inicio), "".join(argumentos[2::2])
+        if len(argumentos) > 2:
+            return None
+        inicio = self._offset(argumentos[0])
+        if len(argumentos) == 1:
+            # Sin segundo índice se borra un carácter (nunca el salto de línea final de Tk)
+            return inicio, min(inicio + 1, len(self.lexer.codigo)), ""
+        return inicio, max(self._offset(argumentos[1]), inicio), ""
 
-        # 🔹 Configurar colores (PSeInt Style)
-        self.text_area.tag_configure("keyword", foreground="#0000FF")  # Azul fuerte
-        self.text_area.tag_configure("datatype", foreground="#800080")  # Púrpura
-        self.text_area.tag_configure(
-            "comment", foreground="#808080", font=("Consolas", 10, "italic")
-        )
-        self.text_area.tag_configure("string", foreground="#008000")  # Verde oscuro
-        self.text_area.tag_configure(
-            "operator", foreground="black", font=("TkDefaultFont", 10, "bold")
-        )
-        self.text_area.tag_configure("boolean", foreground="#B22222")  # Rojo oscuro
+    def _offset(self, indice):
+        """Offset en el texto del índice de Tk `indice` (Tk no escribe después de "end-1c")."""
+        original = self._comando_original
+        if self.tk.getboolean(self.tk.call(original, "compare", indice, ">", "end-1c")):
+            indice = "end-1c"
+        linea, columna = map(int, str(self.tk.call(original, "index", indice)).split("."))
+        return self.lexer.lineas.inicio_linea(linea) + columna
 
-        # 🔹 Limpiar resaltado previo
-        for tag in [
-            "keyword",
-            "datatype",
-            "comment",
-            "string",
-            "operator",
-            "comparator",
-            "boolean",
-        ]:
-            self.text_area.tag_remove(tag, "1.0", tk.END)
-
-        # 🔹 Aplicar resaltado en el orden correcto
-
-        # 1. Resaltar comentarios primero
-        self._apply_regex_highlight("comment", r"//.*")
-
-        # 2. Resaltar cadenas de texto
-        self._apply_regex_highlight("string", r'"[^"]*"')
-
-        # 3. Resaltar palabras clave, tipos de datos, operadores, etc.
-        for word in keywords:
-            self._apply_highlight("keyword", word)
-        for word in datatypes:
-            self._apply_highlight("datatype", word)
-        for word in boolean_values:
-            self._apply_highlight("boolean", word)
-        for op in operators:
-            self._apply_regex_highlight("operator", op)
-
-        # 🔹 Asegurar que palabras clave no se mezclen con paréntesis o símbolos
-        self._apply_regex_highlight(
-            "keyword", r"\b(?:" + "|".join(keywords) + r")\b(?!\s*\))"
-        )
+    def _indice(self, pos):
+        """Índice de Tk ("línea.columna") del offset `pos` del texto."""
+        linea, columna = self.lexer.lineas.linea_columna(pos)
+        return f"{linea}.{columna - 1}"
+
+    def _resaltar(self, inicio, fin):
+        """Vuelve a resaltar las líneas que contienen `[inicio, fin)` con los tokens del lexer."""
+        lineas = self.lexer.lineas
+        codigo = self.lexer.codigo
+        inicio = lineas.inicio_linea(lineas.linea(inicio))
+        fin = lineas.fin_linea(lineas.linea(max(fin - 1, inicio)))
+        desde, hasta = self._indice(inicio), self._indice(fin)
+        for tag in ETIQUETAS_RESALTADO:
+            self.text_area.tag_remove(tag, desde, hasta)
+
+        anterior = inicio
+        for tipo, inicio_token, fin_token in self.lexer.tokens_en(inicio, fin):
+            self._resaltar_comentarios(codigo, anterior, inicio_token)
+            etiqueta = ETIQUETAS_TOKEN.get(tipo)
+            if etiqueta is not None:
+                self.text_area.tag_add(etiqueta, self._indice(inicio_token), self._indice(fin_token))
+            anterior = fin_token
+        self._resaltar_comentarios(codigo, anterior, fin)
+        for inicio_error, fin_error in self.lexer.errores_en(inicio, fin):
+            self.text_area.tag_add("lexical_error", self._indice(inicio_error), self._indice(fin_error))
+
+    def _resaltar_comentarios(self, codigo, inicio, fin):
+        """Resalta los comentarios entre dos tokens (`codigo[inicio:fin]` no tiene tokens)."""
+        comentario = codigo.find("//", inicio, fin)
+        while comentario != -1:
+            final = codigo.find("\n", comentario, fin)
+            final = fin if final == -1 else final
+            self.text_area.tag_add("comment", self._indice(comentario), self._indice(final))
+            comentario = codigo.find("//", final, fin)
 
-        # 🔹 Volver a resaltar operadores para evitar interferencias con el "="
-        self.text_area.tag_remove("operator", "1.0", tk.END)
-        self._apply_regex_highlight("operator", r"\b(?:" + "|".join(operators) + r")\b")
-        
     def _sync_scroll(self, *args):
         """Sincroniza el scroll del editor con los números de línea"""
         self.line_numbers.yview_moveto(args[0])
@@ -164,36 +230,18 @@ class CodeEditor(tk.Frame):
         """Obtiene el código del editor"""
         return self.text_area.get("1.0", tk.END).strip()
         
-    def highlight_error_line(self, line_number):
-        """Resalta una línea con error"""
+    def highlight_error_line(self, line_number, column=None, end_column=None):
+        """Resalta una línea con error, o solo sus columnas si se conocen (desde 1, inclusive)"""
         self.text_area.tag_remove("error", "1.0", tk.END)
         if isinstance(line_number, int):
-            start = f"{line_number}.0"
-            end = f"{line_number}.end"
+            if isinstance(column, int):
+                start = f"{line_number}.{column - 1}"
+                end = f"{line_number}.{end_column}" if isinstance(end_column, int) else f"{start} wordend"
+            else:
+                start = f"{line_number}.0"
+                end = f"{line_number}.end"
             self.text_area.tag_add("error", start, end)
             
     def grid(self, **kwargs):
         super().grid(**kwargs)
         return self
-    
-    def _apply_regex_highlight(self, tag, pattern):
-        """Aplica resaltado basado en expresiones regulares"""
-        start = "1.0"
-        while True:
-            start = self.text_area.search(pattern, start, stopindex=tk.END, regexp=True)
-            if not start:
-                break
-            end = f"{start} lineend"
-            self.text_area.tag_add(tag, start, end)
-            start = end
-
-    def _apply_highlight(self, tag, word):
-        """Aplica resaltado a palabras clave"""
-        start = "1.0"
-        while True:
-            start = self.text_area.search(r"\m" + word + r"\M", start, stopindex=tk.END, regexp=True)
-            if not start:
-                break
-            end = f"{start}+{len(word)}c"
-            self.text_area.tag_add(tag, start, end)
-            start = end
\ No newline at end of file
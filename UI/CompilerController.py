@@ -1,22 +1,47 @@
 import sys
 import ast
+import time
 from io import StringIO
 from threading import Thread
 from queue import Queue
 from SyntaxAnalyzer.AST import NodoPrograma, NodoError
-from GlobalErrors.ErrorsManager import global_errors
-from LexicalAnalyzer.Lexer import lexer
-from SyntaxAnalyzer.Parser import parser, variables, constantes
+from GlobalErrors.ErrorsManager import global_errors, AnalisisDetenido, MAX_DIAGNOSTICOS_POR_FASE, MAX_DIAGNOSTICOS
+from LexicalAnalyzer.Lexer import lexer, crear_lexer, MAX_ERRORES_LEXICOS
+from SyntaxAnalyzer.Parser import parser, crear_parser, parse_buffer, BACKENDS_PARSER
+from SyntaxAnalyzer.IncrementalParser import ParserIncremental
 from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from SemanticAnalyzer.IncrementalAnalyzer import AnalizadorIncremental
 from CodeGenerator.TACGenerator import TACGenerator
 from CodeGenerator.Translator import Translator
 from CodeGenerator.Optimizer import Optimizer
+from UI.AnalysisCache import AnalysisCache
 
 class CompilerController:
-    def __init__(self, code_editor, error_panel, console_panel):
+    def __init__(self, code_editor, error_panel, console_panel, lexer_backend="ply", use_token_buffer=False,
+                 max_lexical_errors=MAX_ERRORES_LEXICOS, frontend_cache=None, analysis_cache=None, parser_backend="ply",
+                 max_diagnostics_per_phase=MAX_DIAGNOSTICOS_POR_FASE, max_diagnostics=MAX_DIAGNOSTICOS,
+                 incremental_analysis=False):
         self.code_editor = code_editor
         self.error_panel = error_panel
         self.console_panel = console_panel
+        self.lexer_backend = lexer_backend  # "ply" o "dfa"
+        if parser_backend not in BACKENDS_PARSER:
+            raise ValueError(f"Backend de parser no disponible en el editor: '{parser_backend}' "
+                             f"(opciones: {', '.join(BACKENDS_PARSER)})")
+        self.parser_backend = parser_backend  # Uno de BACKENDS_PARSER (el Pratt es solo para comparaciones)
+        self.use_token_buffer = use_token_buffer  # Tokens por columnas (TokenBuffer)
+        self.max_lexical_errors = max_lexical_errors  # Tope de errores léxicos (None = sin tope)
+        # Topes de diagnósticos de una compilación: al alcanzarlos el análisis se detiene (None = sin tope)
+        self.max_diagnostics_per_phase = max_diagnostics_per_phase
+        self.max_diagnostics = max_diagnostics
+        self.frontend_cache = frontend_cache  # CacheFrontEnd opcional para tokens y AST
+        self.phase_timings = {}  # Segundos de cada fase en la última compilación
+        # Resultado completo (Python + errores) de códigos ya analizados
+        self.analysis_cache = analysis_cache if analysis_cache is not None else AnalysisCache()
+        # Re-analizar solo las sentencias que cambiaron desde la compilación anterior
+        # (ParserIncremental y AnalizadorIncremental); usa el parser PLY sin TokenBuffer ni frontend_cache
+        self.incremental_analysis = incremental_analysis
+        self._incremental = None  # (ParserIncremental, AnalizadorIncremental) del último código analizado
         
         self._execution_thread = None
         self._should_stop = False
@@ -28,55 +53,102 @@ class CompilerController:
         """Configura los callbacks para el parser"""
         parser.mostrar_en_consola = self.console_panel.mostrar_en_consola
 
+    def configure(self, **settings):
+        """Cambia opciones del compilador (p. ej. lexer_backend) e invalida los análisis guardados"""
+        for name, value in settings.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Opción de compilador desconocida: {name}")
+            setattr(self, name, value)
+        self.invalidate_analysis_cache()
+
+    def invalidate_analysis_cache(self):
+        """Descarta los análisis guardados (llamar si cambia algo que afecta la compilación)"""
+        self.analysis_cache.invalidate()
+        self._incremental = None
+
+    def _compiler_options(self):
+        """Opciones que cambian el resultado del análisis: forman parte de la clave de la caché"""
+        return (self.lexer_backend, self.parser_backend, self.use_token_buffer, self.max_lexical_errors,
+                self.max_diagnostics_per_phase, self.max_diagnostics, self.incremental_analysis)
+
     def analyze_code(self):
         """Orquesta todo el proceso de compilación"""
         try:
             self._prepare_compilation_environment()
             code = self.code_editor.get_code()
 
+            # 0. Código ya analizado con las mismas opciones: se reutiliza el resultado
+            cache_key = self.analysis_cache.key(code, self._compiler_options())
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                print("♻️ Código sin cambios: se reutiliza el análisis anterior")
+                global_errors.restaurar(cached.errors)  # Sin los topes: ya los aplicó el análisis guardado
+                if cached.python_code is not None:
+                    self._timed("ejecución", self._execute_python_code, cached.python_code)
+                return
+
             # 1. Análisis léxico y sintáctico
             print("🔍 Realizando análisis léxico y sintáctico...")
-            ast_node = self._perform_lexical_syntactic_analysis(code)
+            ast_node = self._timed("léxico y sintáctico", self._perform_lexical_syntactic_analysis, code)
             # NO detener, aunque ast_node sea None. Queremos ver todo.
 
             # 2. Análisis semántico
             print("🔍 Realizando análisis semántico...")
             if ast_node:  # Solo hacer semántico si hubo un AST válido
-                self._perform_semantic_analysis(ast_node)
+                self._timed("semántico", self._perform_semantic_analysis, ast_node)
             # Igual, no detener todavía
 
             # 3. Verificar errores después de los tres análisis
             if self._has_errors():
                 print("🚫 Errores detectados. No se generará código.")
+                self.analysis_cache.put(cache_key, None, global_errors)
                 return  # ⚠️ No continuar si hay errores
 
             # 4. Generación de código intermedio TAC
             print("🔧 Generando código intermedio...")
-            tac_code = self._generate_intermediate_code(ast_node)
+            if self._incremental is not None:
+                ast_node = self._incremental[0].ast  # Las mismas líneas absolutas del AST completo
+            tac_code = self._timed("código intermedio", self._generate_intermediate_code, ast_node)
 
             # 5. Optimización
             print("⚡ Optimizando código...")
-            optimized_tac = self._optimize_code(tac_code)
+            optimized_tac = self._timed("optimización", self._optimize_code, tac_code)
 
             # 6. Traducción a Python
             print("🔄 Traduciendo a Python...")
-            python_code = self._translate_to_python(optimized_tac)
+            python_code = self._timed("traducción", self._translate_to_python, optimized_tac)
+            self.analysis_cache.put(cache_key, python_code, global_errors)
 
             # 7. Ejecución de código
             print("⚡ Ejecutando código...")
-            self._execute_python_code(python_code)
+            self._timed("ejecución", self._execute_python_code, python_code)
 
         except Exception as e:
             self._handle_unexpected_error(e)
         finally:
+            self._report_phase_timings()
             self._display_errors()
 
+    def _timed(self, phase, func, *args):
+        """Ejecuta una fase y guarda su duración en `phase_timings`"""
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self.phase_timings[phase] = time.perf_counter() - start
+
+    def _report_phase_timings(self):
+        """Imprime cuánto tardó cada fase de la última compilación"""
+        if self.phase_timings:
+            summary = ", ".join(f"{phase} {seconds * 1000:.1f} ms" for phase, seconds in self.phase_timings.items())
+            print(f"⏱️ Tiempos por fase: {summary}")
+
 
     def _prepare_compilation_environment(self):
         """Reinicia todos los estados para una nueva compilación"""
-        global_errors.clear()
-        variables.clear()
-        constantes.clear()
+        global_errors.reiniciar(self.max_diagnostics_per_phase, self.max_diagnostics,
+                                {"léxico": self.max_lexical_errors})
+        self.phase_timings = {}
         lexer.lineno = 1
         self.error_panel.clear()
         self.console_panel.clear()
@@ -86,8 +158,16 @@ class CompilerController:
         """Realiza análisis léxico y sintáctico"""
         print("🔍 Realizando análisis sintáctico...")
         try:
-            lexer.lineno = 1  # Reiniciar contador de líneas
-            ast_node = parser.parse(code, lexer=lexer, tracking=True)
+            if self.incremental_analysis:
+                ast_node = self._incremental_parse(code)
+            elif self.frontend_cache is not None:
+                ast_node = self.frontend_cache.analizar(code, self.lexer_backend, self.parser_backend,
+                                                        por_columnas=self.use_token_buffer).ast
+            elif self.use_token_buffer:
+                ast_node = parse_buffer(code, backend=self.parser_backend, backend_lexer=self.lexer_backend)
+            else:
+                code_lexer = crear_lexer(self.lexer_backend)  # Lexer nuevo: empieza en la línea 1
+                ast_node = crear_parser(self.parser_backend).parse(code, lexer=code_lexer, tracking=True)
             
             # Verificar si el AST es None o contiene NodoError
             if ast_node is None:
@@ -101,26 +181,61 @@ class CompilerController:
                 return None
             
             return ast_node
+        except AnalisisDetenido:
+            return None  # El aviso del tope ya está entre los errores
         except Exception as e:
             self._add_error("sintáctico", f"Error de sintaxis: {str(e)}", 0)
             return None
 
+    def _incremental_parse(self, code):
+        """Análisis léxico y sintáctico con el ParserIncremental: re-analiza solo lo que cambió desde la compilación anterior.
+
+        Devuelve su `arbol_relativo` (líneas relativas a cada sentencia), que
+        es lo que analiza el AnalizadorIncremental; los diagnósticos pasan a
+        `global_errors` con sus topes. Si el análisis alcanza un tope o falla
+        se descarta el estado incremental y se analiza todo de la forma
+        habitual, que registra el aviso o el error.
+        """
+        try:
+            if self._incremental is None:
+                parser = ParserIncremental(code, self.lexer_backend)
+                self._incremental = (parser, AnalizadorIncremental(parser))
+            else:
+                parser = self._incremental[0]
+                parser.actualizar(code)
+        except Exception:
+            # Un tope alcanzado (AnalisisDetenido) o un fallo del parser dejan el estado a
+            # medias y lo registrado fuera de `global_errors`: se repite el análisis completo
+            self._incremental = None
+            code_lexer = crear_lexer(self.lexer_backend)
+            return crear_parser(self.parser_backend).parse(code, lexer=code_lexer, tracking=True)
+        global_errors.extend(parser.errores)
+        return parser.arbol_relativo
+
     def _perform_semantic_analysis(self, ast_node):
         """Realiza análisis semántico"""
         print("🔍 Realizando análisis semántico...")
         try:
+            if self._incremental is not None:
+                parser, analyzer = self._incremental
+                analyzer.actualizar(ast_node, parser.ultimo_cambio)
+                global_errors.extend(analyzer.errores)
+                return
             #reiniciar el lexer para el análisis semántico
             lexer.lineno = 1
-            analyzer = SemanticAnalyzer()
+            analyzer = SemanticAnalyzer(global_errors)
             analyzer.analyze(ast_node)
+        except AnalisisDetenido:
+            pass  # El aviso del tope ya está entre los errores
         except Exception as e:
+            self._incremental = None  # El análisis incremental pudo quedar a medias
             self._add_error("semántico", f"Error semántico: {str(e)}", 0)
 
     def _generate_intermediate_code(self, ast_node):
         """Genera código de tres direcciones (TAC)"""
         print("🔧 Generando código intermedio...")
         try:
-            tac_gen = TACGenerator()
+            tac_gen = TACGenerator(global_errors)
             tac_code = tac_gen.generate(ast_node)
             return tac_code
         except Exception as e:
@@ -257,6 +372,12 @@ class CompilerController:
                 error_groups[error["tipo"]] = []
             error_groups[error["tipo"]].append(error)
 
+        # Resaltar en el editor el primer error con posición conocida
+        for error in global_errors:
+            if error.get("linea") and error.get("columna"):
+                self.code_editor.highlight_error_line(error["linea"], error["columna"], error.get("columna_fin"))
+                break
+
         # Mostrar en el panel de errores
         for error_type, errors in error_groups.items():
             self.error_panel.add_error_section(f"Errores {error_type}")
@@ -0,0 +1,102 @@
+# benchmarks/ASTMemoryBenchmark.py
+"""Mide la memoria que ocupa el AST: bytes por nodo con `__slots__` y con `__dict__`.
+
+Uso: `python -m benchmarks.ASTMemoryBenchmark [--sentencias 100000]`
+
+Analiza un programa generado con muchas variables y literales repetidos y
+mide con `tracemalloc` cuánto queda reservado por el AST. Para comparar con
+la representación anterior (un `__dict__` por nodo, nombres y valores
+literales como objetos nuevos en cada aparición, tal como salen del lexer)
+copia el mismo árbol a clases equivalentes sin slots y mide esa copia.
+Termina con código 1 si el AST actual no ocupa menos.
+"""
+import sys
+from LexicalAnalyzer.TokenBuffer import TokenBuffer
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.Parser import parse_buffer
+from benchmarks.Common import analizar_generado, linea_de_comandos, programa_variado, reservado, silencio
+
+SENTENCIAS = 100_000
+
+
+def contar_nodos(ast):
+    return sum(1 for _ in AST.preorden(ast))
+
+
+# Clases con `__dict__` por instancia, una por clase de nodo (la representación anterior)
+_CON_DICT = {clase: type(clase.__name__, (), {}) for clase in vars(AST).values()
+             if isinstance(clase, type) and issubclass(clase, AST.Nodo)}
+
+
+# Atributos que antes eran el valor del token tal cual (un objeto nuevo por aparición).
+# `linea` también se copia: con TokenBuffer cada token trae su propio int, con o sin slots.
+_DESDE_TOKENS = {
+    AST.NodoIdentificador: ("nombre",),
+    AST.NodoLiteral: ("valor",),
+    AST.NodoDeclaracion: ("tipo",),
+    AST.NodoBinario: ("operador",),
+}
+
+
+def _copia_nueva(valor):
+    """Un objeto igual a `valor` pero distinto, como el que creaba el lexer en cada token."""
+    if type(valor) is str:
+        return (valor + " ")[:-1]
+    if type(valor) is float:
+        return valor + 0.0
+    if type(valor) is int:
+        return -(-valor)
+    return valor
+
+
+def copia_con_dict(ast):
+    """Copia `ast` a nodos con `__dict__`, sin nombres internados ni literales compartidos."""
+    raiz = []
+    pendientes = [(ast, raiz.append)]
+    while pendientes:
+        actual, guardar = pendientes.pop()
+        if isinstance(actual, list):
+            lista = [None] * len(actual)
+            guardar(lista)
+            pendientes.extend((elemento, lambda valor, lista=lista, i=i: lista.__setitem__(i, valor))
+                              for i, elemento in enumerate(actual))
+        elif isinstance(actual, AST.Nodo):
+            copia = _CON_DICT[type(actual)]()
+            for nombre, valor in actual.campos():
+                # Se asigna en el mismo orden que los constructores: las instancias comparten las claves
+                if nombre == "linea" or nombre in _DESDE_TOKENS.get(type(actual), ()):
+                    valor = _copia_nueva(valor)
+                setattr(copia, nombre, valor)
+            guardar(copia)
+            pendientes.extend((valor, lambda nuevo, copia=copia, nombre=nombre: setattr(copia, nombre, nuevo))
+                              for nombre, valor in actual.campos() if isinstance(valor, (AST.Nodo, list)))
+        else:
+            guardar(actual)
+    return raiz[0]
+
+
+def ejecutar(sentencias=SENTENCIAS):
+    """Imprime la comparación y devuelve True si el AST con slots ocupa menos."""
+    buffer = TokenBuffer.desde_codigo(programa_variado(sentencias))
+    with silencio():
+        parse_buffer("inicio\nfin\n")  # Tablas cargadas antes de medir
+    ast, despues = reservado(analizar_generado, buffer)
+    _, antes = reservado(copia_con_dict, ast)
+    nodos = contar_nodos(ast)
+    print(f"{sentencias} sentencias, {nodos} nodos")
+    print(f"  con __dict__  {antes / 2**20:8.1f} MiB  {antes / nodos:6.1f} bytes/nodo")
+    print(f"  con slots     {despues / 2**20:8.1f} MiB  {despues / nodos:6.1f} bytes/nodo"
+          f"  ({despues / antes:.0%})")
+    return despues < antes
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias del programa generado")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+# benchmarks/BinaryASTBenchmark.py
+"""Compara el formato binario del AST con `pickle` en tamaño y velocidad.
+
+Uso: `python -m benchmarks.BinaryASTBenchmark [--sentencias 5000]`
+
+Genera programas planos, anidados y variados (los mismos de
+`ScalingBenchmark`), los analiza una vez y mide cuántos bytes ocupa el AST
+y cuánto tarda en codificarse y decodificarse con
+`codificar_ast`/`decodificar_ast` y con `pickle` (protocolo más alto). El
+variado se mide también con expresiones compartidas (hash-consing), el
+grafo que arma `parse_buffer(compartir_expresiones=True)`.
+Antes de medir comprueba que el AST decodificado es idéntico al original,
+líneas incluidas, y que los nodos compartidos siguen siéndolo (los mismos
+nodos distintos antes y después). Termina con código 1 si falla alguna
+comprobación o si, en los árboles sin compartir (los que guarda
+`CacheFrontEnd`), el formato binario no es más rápido que `pickle` al
+codificar y al decodificar. Con expresiones compartidas solo se informan
+los tiempos: `pickle` resuelve cada referencia repetida en C.
+"""
+import pickle
+import sys
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.BinaryAST import codificar_ast, decodificar_ast
+from benchmarks.Common import (analizar_generado, iguales, linea_de_comandos, mejor,
+                               programa_anidado, programa_plano, programa_variado)
+
+SENTENCIAS = 5_000
+REPETICIONES_TIEMPO = 7  # Más que `REPETICIONES`: el resultado decide el código de salida
+
+# (nombre, generador, compartir_expresiones)
+PROGRAMAS = (
+    ("plano", programa_plano, False),
+    ("anidado", programa_anidado, False),
+    ("variado", programa_variado, False),
+    ("variado compartido", programa_variado, True),
+)
+
+
+def nodos_distintos(ast):
+    return len({id(nodo) for nodo in AST.preorden(ast)})
+
+
+def medir(ast):
+    """Devuelve {formato: (bytes, s codificar, s decodificar)} para `ast`."""
+    binario = codificar_ast(ast)
+    decodificado = decodificar_ast(binario)
+    if not iguales(ast, decodificado):
+        raise RuntimeError("el AST decodificado no coincide con el original")
+    if nodos_distintos(decodificado) != nodos_distintos(ast):
+        raise RuntimeError(f"el AST decodificado tiene {nodos_distintos(decodificado)} nodos distintos, "
+                           f"el original {nodos_distintos(ast)}")
+    volcado = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+    return {
+        "binario": (len(binario),
+                    mejor(codificar_ast, ast, repeticiones=REPETICIONES_TIEMPO),
+                    mejor(decodificar_ast, binario, repeticiones=REPETICIONES_TIEMPO)),
+        "pickle": (len(volcado),
+                   mejor(pickle.dumps, ast, pickle.HIGHEST_PROTOCOL, repeticiones=REPETICIONES_TIEMPO),
+                   mejor(pickle.loads, volcado, repeticiones=REPETICIONES_TIEMPO)),
+    }
+
+
+def ejecutar(sentencias=SENTENCIAS):
+    """Imprime la comparación de cada programa; devuelve True si pasan todas las comprobaciones."""
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite, 10_000))  # pickle recorre el árbol recursivamente
+    correcto = True
+    try:
+        for nombre, generar, compartir in PROGRAMAS:
+            ast = analizar_generado(generar(sentencias), compartir_expresiones=compartir)
+            try:
+                resultados = medir(ast)
+            except RuntimeError as e:
+                print(f"❌ {nombre}: {e}")
+                correcto = False
+                continue
+            tamano_pickle = resultados["pickle"][0]
+            print(f"{nombre} ({sentencias} sentencias)")
+            for formato, (tamano, codificar, decodificar) in resultados.items():
+                print(f"  {formato:8} {tamano:>11} bytes ({tamano / tamano_pickle:5.1%})"
+                      f"  codificar {codificar * 1e3:8.1f} ms  decodificar {decodificar * 1e3:8.1f} ms")
+            _, codificar, decodificar = resultados["binario"]
+            _, codificar_pickle, decodificar_pickle = resultados["pickle"]
+            if not compartir and (codificar >= codificar_pickle or decodificar >= decodificar_pickle):
+                print(f"❌ {nombre}: el formato binario no es más rápido que pickle")
+                correcto = False
+    finally:
+        sys.setrecursionlimit(limite)
+    if correcto:
+        print("✅ El formato binario le gana a pickle en los árboles y conserva los nodos compartidos")
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias de cada programa generado")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
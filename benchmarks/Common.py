@@ -0,0 +1,142 @@
+# benchmarks/Common.py
+"""Lo que comparten los benchmarks y las comprobaciones: programas generados, medición y línea de comandos."""
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+from GlobalErrors.ErrorsManager import global_errors
+from SyntaxAnalyzer.AST import Nodo
+from SyntaxAnalyzer.Parser import parse_buffer
+
+REPETICIONES = 3
+
+# Variables de `programa_variado`
+_VARIABLES = 40
+
+# Sentencias por nivel y niveles de cada grupo anidado de `programa_anidado`
+_POR_NIVEL = 10
+_PROFUNDIDAD = 10
+
+
+# ---------------------------------------------------------------
+# Programas generados
+# ---------------------------------------------------------------
+
+def programa_plano(n):
+    """Programa válido de `n` sentencias en un solo bloque."""
+    lineas = ["inicio", "entero x = 0;"]
+    lineas.extend("x = x + %d;" % (i % 7) for i in range(n - 1))
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def programa_anidado(n):
+    """Programa válido de `n` sentencias en bloques `si` de profundidad acotada."""
+    lineas = ["inicio", "entero x = 0;"]
+    restantes = n - 1
+    while restantes > 0:
+        abiertos = 0
+        while abiertos < _PROFUNDIDAD and restantes > 0:
+            lineas.append("si (x > %d) entonces" % abiertos)
+            abiertos += 1
+            restantes -= 1
+            for i in range(min(_POR_NIVEL - 1, restantes)):
+                lineas.append("mostrar x, %d;" % i)
+                restantes -= 1
+        lineas.extend(["fin_si"] * abiertos)
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def programa_variado(n):
+    """Programa válido de `n` sentencias que reutiliza variables, cadenas y decimales."""
+    lineas = ["inicio"]
+    lineas.extend(f"decimal saldo_{i} = {i}.5;" for i in range(_VARIABLES))
+    i = _VARIABLES
+    while i < n:
+        a, b, c = i % _VARIABLES, (i * 7) % _VARIABLES, (i * 13) % _VARIABLES
+        if i % 4 == 3 and i + 2 < n:
+            lineas.extend((f"si (saldo_{a} > 100.0) entonces", f"mostrar \"saldo alto\", saldo_{a};", "fin_si"))
+            i += 2
+        elif i % 2:
+            lineas.append(f"mostrar \"total\", saldo_{a} + saldo_{b};")
+        else:
+            lineas.append(f"saldo_{a} = saldo_{b} * 2.5 + saldo_{c} - 1.0;")
+        i += 1
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def analizar_generado(codigo, **opciones):
+    """AST de `parse_buffer(codigo, **opciones)` sin imprimir nada.
+
+    Lanza RuntimeError si el programa generado tiene errores, que
+    invalidarían la medición.
+    """
+    inicio_errores = len(global_errors)
+    with silencio():
+        ast = parse_buffer(codigo, **opciones)
+    if len(global_errors) != inicio_errores:
+        raise RuntimeError(f"el programa generado tiene errores: {global_errors[inicio_errores]}")
+    return ast
+
+
+# ---------------------------------------------------------------
+# Medición
+# ---------------------------------------------------------------
+
+def silencio():
+    """Contexto que descarta lo que las fases imprimen mientras se mide."""
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+def mejor(funcion, *argumentos, repeticiones=REPETICIONES):
+    """Segundos de la más rápida de `repeticiones` llamadas a `funcion(*argumentos)`."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*argumentos)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def reservado(funcion, *argumentos):
+    """(resultado, bytes que siguen reservados después de llamar a `funcion`)."""
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        resultado = funcion(*argumentos)
+        return resultado, tracemalloc.get_traced_memory()[0] - antes
+    finally:
+        tracemalloc.stop()
+
+
+def iguales(a, b):
+    """True si dos ASTs tienen las mismas clases y los mismos atributos."""
+    pendientes = [(a, b)]
+    while pendientes:
+        x, y = pendientes.pop()
+        if type(x) is not type(y):
+            return False
+        if isinstance(x, Nodo):
+            campos_x, campos_y = x.campos(), y.campos()
+            if [nombre for nombre, _ in campos_x] != [nombre for nombre, _ in campos_y]:
+                return False
+            pendientes.extend((a, b) for (_, a), (_, b) in zip(campos_x, campos_y))
+        elif isinstance(x, list):
+            if len(x) != len(y):
+                return False
+            pendientes.extend(zip(x, y))
+        elif x != y:
+            return False
+    return True
+
+
+# ---------------------------------------------------------------
+# Línea de comandos
+# ---------------------------------------------------------------
+
+def linea_de_comandos(documento):
+    """ArgumentParser con la primera línea de `documento` (el docstring del módulo) como descripción."""
+    return argparse.ArgumentParser(description=documento.splitlines()[0])
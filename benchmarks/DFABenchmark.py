@@ -0,0 +1,76 @@
+# benchmarks/DFABenchmark.py
+"""Compara los tokens por segundo del lexer de PLY y del lexer DFA.
+
+Uso: `python -m benchmarks.DFABenchmark [--sentencias 200000]`
+
+Tokeniza un programa generado (palabras clave, tipos, identificadores,
+enteros, decimales y cadenas) con el lexer de PLY, con `DFALexer.token()`
+(un LexToken por token, como lo usa el parser) y con `DFALexer.escanear()`
+(tuplas, sin LexToken ni valores). Antes de medir comprueba que los tres
+dan los mismos tokens, y termina con código 1 si no coinciden.
+"""
+import sys
+from LexicalAnalyzer.DFALexer import DFALexer
+from LexicalAnalyzer.Lexer import crear_lexer
+from benchmarks.Common import linea_de_comandos, mejor, programa_variado
+
+SENTENCIAS = 200_000
+
+
+def _lexer(backend, codigo):
+    lx = crear_lexer(backend) if backend == "ply" else DFALexer()
+    lx.input(codigo)
+    return lx
+
+
+def con_token(codigo, backend):
+    """Tokens (tipo, valor, línea, posición) de llamar a `token()` hasta el final."""
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in iter(_lexer(backend, codigo).token, None)]
+
+
+def con_escanear(codigo):
+    """Tokens (tipo, línea, posición) de `DFALexer.escanear()`."""
+    return [(tipo, linea, inicio) for tipo, inicio, _, linea in _lexer("dfa", codigo).escanear()]
+
+
+def recorrer_token(codigo, backend):
+    for _ in iter(_lexer(backend, codigo).token, None):
+        pass
+
+
+def recorrer_escanear(codigo):
+    for _ in _lexer("dfa", codigo).escanear():
+        pass
+
+
+def ejecutar(sentencias=SENTENCIAS):
+    """Imprime los tokens por segundo de cada variante; devuelve True si las tres coinciden."""
+    codigo = programa_variado(sentencias)
+    referencia = con_token(codigo, "ply")
+    if con_token(codigo, "dfa") != referencia:
+        print("❌ DFALexer.token() no produce los mismos tokens que PLY")
+        return False
+    if con_escanear(codigo) != [(tipo, linea, inicio) for tipo, _, linea, inicio in referencia]:
+        print("❌ DFALexer.escanear() no produce los mismos tokens que PLY")
+        return False
+    print(f"{sentencias} sentencias, {len(referencia)} tokens ({len(codigo) / 1e6:.1f} MB)")
+    base = None
+    variantes = (("ply", recorrer_token, "ply"), ("dfa token()", recorrer_token, "dfa"),
+                 ("dfa escanear()", recorrer_escanear))
+    for nombre, recorrer, *backend in variantes:
+        segundos = mejor(recorrer, codigo, *backend)
+        base = base or segundos
+        print(f"  {nombre:15} {segundos:7.2f} s  {len(referencia) / segundos / 1e6:6.2f} M tokens/s"
+              f"  (x{base / segundos:.2f})")
+    return True
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS, help="sentencias del programa generado")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# benchmarks/DeepTreeCheck.py
+"""Comprueba que la caché del front end, el análisis semántico y el TAC recorren árboles muy profundos.
+
+Uso: `python -m benchmarks.DeepTreeCheck [--terminos 50000]`
+
+Genera `entero x = a + a + ... + a;` con muchos términos: el parser la
+convierte en un espinazo de NodoBinario tan profundo como términos tiene.
+Guarda el AST en la caché del front end (en un directorio temporal) y lo
+vuelve a leer, lo analiza y genera su TAC con el límite de recursión por
+defecto, e imprime cuánto tarda cada fase. Termina con código 1 si alguna
+fase falla (por ejemplo, con RecursionError) o el resultado no es el
+esperado.
+"""
+import sys
+import tempfile
+import time
+from GlobalErrors.ErrorsManager import global_errors
+from SyntaxAnalyzer.FrontEndCache import CacheFrontEnd
+from SyntaxAnalyzer.Parser import parse_buffer
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from CodeGenerator.TACGenerator import TACGenerator
+from benchmarks.Common import linea_de_comandos, silencio
+
+TERMINOS = 50_000
+
+
+def programa_cadena(terminos):
+    """Programa con una suma izquierda de `terminos` términos."""
+    return "inicio\nentero a = 1;\nentero x = " + " + ".join(["a"] * terminos) + ";\nmostrar x;\nfin\n"
+
+
+def _desde_cache(codigo):
+    """AST de `codigo` guardado en una caché vacía y leído de vuelta (un fallo y un acierto)."""
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheFrontEnd(directorio)
+        cache.analizar(codigo)
+        resultado = cache.analizar(codigo)
+    if not resultado.acierto:
+        raise RuntimeError("la segunda lectura no salió de la caché")
+    return resultado.ast
+
+
+def ejecutar(terminos=TERMINOS):
+    """Imprime el tiempo de cada fase y devuelve True si todas terminan bien."""
+    global_errors.clear()
+    codigo = programa_cadena(terminos)
+    fases = (
+        ("parser", lambda _: parse_buffer(codigo)),
+        ("caché", lambda _: _desde_cache(codigo)),
+        ("semántico", lambda ast: SemanticAnalyzer().analyze(ast) or ast),
+        ("TAC", lambda ast: TACGenerator().generate(ast)),
+    )
+    resultado = None
+    for nombre, fase in fases:
+        inicio = time.perf_counter()
+        try:
+            with silencio():
+                resultado = fase(resultado)
+        except RecursionError:
+            print(f"❌ {nombre}: se superó el límite de recursión ({sys.getrecursionlimit()})")
+            return False
+        print(f"{nombre:10} {time.perf_counter() - inicio:8.2f} s")
+        if global_errors:
+            print(f"❌ {nombre}: {global_errors[0]['mensaje']}")
+            return False
+    # Una suma por cada `+`, más la declaración de `a`, la de `x` y el print
+    esperadas = (terminos - 1) + 3
+    if len(resultado) != esperadas:
+        print(f"❌ TAC: {len(resultado)} instrucciones, se esperaban {esperadas}")
+        return False
+    print(f"✅ {terminos} términos con límite de recursión {sys.getrecursionlimit()}")
+    return True
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--terminos", type=int, default=TERMINOS, help="términos de la suma generada")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.terminos) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# benchmarks/DiagnosticsBenchmark.py
+"""Mide el front end con un programa lleno de errores, con y sin topes de diagnósticos.
+
+Uso: `python -m benchmarks.DiagnosticsBenchmark [--sentencias 100000] [--parser ply|pratt]`
+
+Analiza (parser y análisis semántico) dos programas generados donde casi
+todas las sentencias tienen un error, uno sintáctico y otro semántico, sin
+topes y con los topes por defecto del compilador. Termina con código 1 si
+con topes el análisis no se detiene con el aviso, si los diagnósticos no son
+los primeros de la versión sin topes o si no termina antes. También
+comprueba que la caché del front end repite los diagnósticos (y la
+detención) del programa sintáctico con cada juego de topes, sin reutilizar
+lo guardado con otros topes.
+"""
+import sys
+import tempfile
+import time
+from GlobalErrors.ErrorsManager import (global_errors, AnalisisDetenido,
+                                        MAX_DIAGNOSTICOS_POR_FASE, MAX_DIAGNOSTICOS)
+from SyntaxAnalyzer.AST import NodoPrograma
+from SyntaxAnalyzer.FrontEndCache import CacheFrontEnd
+from SyntaxAnalyzer.Parser import parse_buffer, BACKENDS_PARSER, BACKENDS_PARSER_EXPERIMENTALES
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from benchmarks.Common import linea_de_comandos, silencio
+
+SENTENCIAS = 100_000
+
+
+def programa_sintactico(n):
+    """Programa de `n` sentencias donde dos de cada tres tienen una suma sin segundo operando."""
+    lineas = ["inicio", "entero x = 0;"]
+    lineas.extend("x = x + ;" if i % 3 else "x = x + %d;" % (i % 7) for i in range(n - 1))
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def programa_semantico(n):
+    """Programa sin errores de sintaxis de `n` sentencias, casi todas con un error de tipos o de nombres."""
+    lineas = ["inicio", "entero x = 0;", "cadena c = \"a\";"]
+    plantillas = ("x = c * {i};", "mostrar y{i} + x;", "x = x + {i};", "entero z{i} = c;")
+    lineas.extend(plantillas[i % len(plantillas)].format(i=i) for i in range(n - 2))
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def _compilar(codigo, backend, max_por_fase, max_total):
+    """(segundos, diagnósticos, si se detuvo) de parser y análisis semántico con esos topes."""
+    global_errors.reiniciar(max_por_fase, max_total)
+    with silencio():
+        inicio = time.perf_counter()
+        try:
+            ast = parse_buffer(codigo, backend=backend)
+            if isinstance(ast, NodoPrograma):
+                SemanticAnalyzer(global_errors).analyze(ast)
+        except AnalisisDetenido:
+            pass
+        segundos = time.perf_counter() - inicio
+    resultado = segundos, list(global_errors), global_errors.detenido
+    global_errors.reiniciar()
+    return resultado
+
+
+def _desde_cache(cache, codigo, backend, max_por_fase, max_total):
+    """(diagnósticos, si se detuvo) del front end de `codigo` pasando por `cache`, con esos topes."""
+    global_errors.reiniciar(max_por_fase, max_total)
+    with silencio():
+        try:
+            cache.analizar(codigo, backend_parser=backend)
+        except AnalisisDetenido:
+            pass
+    resultado = list(global_errors), global_errors.detenido
+    global_errors.reiniciar()
+    return resultado
+
+
+def comprobar_cache(codigo, backend):
+    """Descripción del primer problema al repetir el front end desde la caché, o None."""
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheFrontEnd(directorio)
+        for topes in ((None, None), (MAX_DIAGNOSTICOS_POR_FASE, MAX_DIAGNOSTICOS)):
+            fallos = cache.fallos
+            guardado = _desde_cache(cache, codigo, backend, *topes)
+            if cache.fallos == fallos:
+                return f"con topes {topes} se reutilizó una entrada guardada con otros topes"
+            if _desde_cache(cache, codigo, backend, *topes) != guardado:
+                return f"con topes {topes} el acierto no repite los diagnósticos del análisis guardado"
+    return None
+
+
+def ejecutar(sentencias=SENTENCIAS, backend="ply"):
+    """Imprime la comparación y devuelve True si con topes el análisis se detiene antes y con los mismos primeros errores."""
+    parse_buffer("inicio\nfin\n", backend=backend)  # Tablas cargadas antes de medir
+    correcto = True
+    for nombre, generar in (("sintáctico", programa_sintactico), ("semántico", programa_semantico)):
+        codigo = generar(sentencias)
+        sin_topes, todos, _ = _compilar(codigo, backend, None, None)
+        con_topes, primeros, detenido = _compilar(codigo, backend, MAX_DIAGNOSTICOS_POR_FASE, MAX_DIAGNOSTICOS)
+        print(f"{nombre:11} {sentencias} sentencias ({backend})")
+        print(f"  sin topes {sin_topes:7.2f} s  {len(todos):7d} diagnósticos")
+        print(f"  con topes {con_topes:7.2f} s  {len(primeros):7d} diagnósticos"
+              f"  (x{sin_topes / max(con_topes, 1e-9):.1f})")
+        if not detenido:
+            print(f"❌ Con topes el análisis del programa {nombre} no se detuvo")
+            correcto = False
+        elif primeros[:-1] != todos[:len(primeros) - 1]:
+            print(f"❌ Con topes los diagnósticos del programa {nombre} no son los primeros de la versión sin topes")
+            correcto = False
+        if con_topes >= sin_topes:
+            print(f"❌ Con topes el análisis del programa {nombre} no terminó antes")
+            correcto = False
+    problema = comprobar_cache(programa_sintactico(sentencias), backend)
+    if problema is not None:
+        print(f"❌ Caché del front end: {problema}")
+        correcto = False
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias de cada programa generado")
+    argumentos.add_argument("--parser", choices=BACKENDS_PARSER + BACKENDS_PARSER_EXPERIMENTALES, default="ply",
+                            help="backend del parser")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias, opciones.parser) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
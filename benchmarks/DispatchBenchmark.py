@@ -0,0 +1,109 @@
+# benchmarks/DispatchBenchmark.py
+"""Mide cuánto cuesta elegir el método de cada nodo en los recorridos del AST.
+
+Uso: `python -m benchmarks.DispatchBenchmark [--sentencias 100000]`
+
+Para los nodos de un programa generado compara, por nodo, la búsqueda que
+hacía cada fase antes (el semántico armaba `visit_<clase>` y llamaba a
+`getattr`; el TAC recorría una cadena de `isinstance`) con la tabla por
+clase de `Visitante`. Solo se mide la elección del método, sin ejecutarlo;
+al final se mide cada fase completa sobre el mismo programa.
+"""
+import sys
+import time
+from GlobalErrors.ErrorsManager import global_errors
+from SyntaxAnalyzer import AST
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from CodeGenerator.TACGenerator import TACGenerator
+from benchmarks.Common import analizar_generado, linea_de_comandos, mejor, programa_variado, silencio
+
+SENTENCIAS = 100_000
+REPETICIONES = 5
+
+
+def _semantico_anterior(analizador):
+    def elegir(nodo):
+        return getattr(analizador, f'visit_{type(nodo).__name__.lower()}', analizador.generic_visit)
+    return elegir
+
+
+def _tac_anterior(generador):
+    # Mismo orden de comprobaciones que tenía TACGenerator.generate
+    cadena = ((AST.NodoPrograma, generador.generate_programa), (AST.NodoBinario, generador.generate_binario),
+              (AST.NodoLiteral, generador.generate_literal), (AST.NodoIdentificador, generador.generate_identificador),
+              (AST.NodoIf, generador.generate_if), (AST.NodoMientras, generador.generate_mientras),
+              (AST.NodoRepetir, generador.generate_repetir), (AST.NodoPara, generador.generate_para),
+              (AST.NodoMostrar, generador.generate_mostrar), (AST.NodoDeclaracion, generador.generate_declaracion),
+              (AST.NodoAsignacion, generador.generate_asignacion), (AST.NodoUnario, generador.generate_unario))
+
+    def elegir(nodo):
+        if nodo is None:
+            return None
+        if isinstance(nodo, AST.NodoError):
+            return None
+        for clase, metodo in cadena:
+            if isinstance(nodo, clase):
+                return metodo
+        return None
+    return elegir
+
+
+def _tabla(visitante):
+    despacho = visitante._despacho
+    metodo_para = visitante.metodo_para
+
+    def elegir(nodo):
+        metodo = despacho.get(type(nodo))
+        if metodo is None:
+            metodo = metodo_para(type(nodo))
+        return metodo
+    return elegir
+
+
+def _ns_por_nodo(elegir, nodos):
+    """Nanosegundos por nodo de `elegir`, descontando el costo de llamar a una función vacía."""
+    def vacia(nodo):
+        return nodo
+
+    def recorrer(funcion):
+        for nodo in nodos:
+            funcion(nodo)
+
+    neto = mejor(recorrer, elegir, repeticiones=REPETICIONES) - mejor(recorrer, vacia, repeticiones=REPETICIONES)
+    return max(neto, 0.0) / len(nodos) * 1e9
+
+
+def ejecutar(sentencias=SENTENCIAS):
+    ast = analizar_generado(programa_variado(sentencias))
+    nodos = list(AST.preorden(ast))
+    print(f"{sentencias} sentencias, {len(nodos)} nodos — elección del método, ns por nodo")
+    analizador, generador = SemanticAnalyzer(), TACGenerator()
+    for fase, anterior, actual in (("semántico", _semantico_anterior(analizador), _tabla(analizador)),
+                                   ("TAC", _tac_anterior(generador), _tabla(generador))):
+        antes = _ns_por_nodo(anterior, nodos)
+        ahora = _ns_por_nodo(actual, nodos)
+        print(f"  {fase:10} antes {antes:6.1f}  tabla {ahora:6.1f}  (x{antes / max(ahora, 1e-9):.1f})")
+
+    inicio_errores = len(global_errors)
+    with silencio():
+        inicio = time.perf_counter()
+        SemanticAnalyzer().analyze(ast)
+        semantico = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        TACGenerator().generate(ast)
+        tac = time.perf_counter() - inicio
+    del global_errors[inicio_errores:]
+    print(f"Fases completas: semántico {semantico:.2f} s, TAC {tac:.2f} s")
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias del programa generado")
+    opciones = argumentos.parse_args(argv)
+    ejecutar(opciones.sentencias)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
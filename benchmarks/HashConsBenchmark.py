@@ -0,0 +1,142 @@
+# benchmarks/HashConsBenchmark.py
+"""Mide el AST con expresiones compartidas (hash-consing) frente al AST de siempre.
+
+Uso: `python -m benchmarks.HashConsBenchmark [--sentencias 100000] [--parser ply|pratt]`
+
+Analiza un programa generado que repite las mismas fórmulas sobre pocas
+variables (una de ellas con un error de tipos, repetido en muchas líneas),
+con y sin `compartir_expresiones`. Compara los nodos distintos,
+la memoria que queda reservada por el AST (`tracemalloc`) y el tiempo del
+análisis semántico, que con nodos compartidos calcula el tipo de cada
+subexpresión una sola vez. Además analiza con y sin compartir unos
+programas chicos (`REGRESIONES`) en los que la tabla de símbolos cambia
+entre dos apariciones de la misma expresión. Termina con código 1 si los
+dos árboles no generan el mismo TAC y los mismos diagnósticos, o si
+compartir no ahorra memoria.
+"""
+import sys
+import time
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.TokenBuffer import TokenBuffer
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.Parser import parse_buffer, BACKENDS_PARSER, BACKENDS_PARSER_EXPERIMENTALES
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from CodeGenerator.TACGenerator import TACGenerator
+from benchmarks.Common import REPETICIONES, analizar_generado, linea_de_comandos, reservado, silencio
+
+SENTENCIAS = 100_000
+
+_VARIABLES = 8
+_FORMULAS = (
+    "saldo_{a} * tasa + saldo_{b}",
+    "(saldo_{a} + saldo_{b}) * (1.0 + tasa) - comision",
+    "saldo_{a} * 2.5 + saldo_{b} * 2.5",
+    "saldo_{a} * nombre + saldo_{b}",  # Error de tipos: cada línea lo informa en la suya
+)
+
+# Programas en que una expresión compartida se resuelve distinto en cada aparición
+REGRESIONES = (
+    # Usada antes de declarar la variable y después
+    "inicio\nmostrar a + 1;\nentero a = 5;\nmostrar a + 1;\nfin\n",
+    # El `para` cambia el tipo de una variable ya declarada
+    "inicio\ndecimal i = 0.5;\nmostrar i * 2;\npara i desde 1 hasta 3 hacer\nmostrar i * 2;\nfin_para\nfin\n",
+)
+
+
+def programa_repetitivo(n):
+    """Programa sin errores de sintaxis de `n` sentencias que repite unas pocas fórmulas sobre pocas variables."""
+    lineas = ["inicio", "decimal tasa = 0.05;", "decimal comision = 1.5;", "cadena nombre = \"n\";"]
+    lineas.extend(f"decimal saldo_{i} = {i}.0;" for i in range(_VARIABLES))
+    i = len(lineas) - 1
+    while i < n:
+        a, b = i % _VARIABLES, (i * 3) % _VARIABLES
+        formula = _FORMULAS[i % len(_FORMULAS)].format(a=a, b=b)
+        if i % 5 == 4 and i + 2 < n:
+            lineas.extend((f"si (({formula}) > 100.0) entonces", f"mostrar \"alto\", {formula};", "fin_si"))
+            i += 2
+        elif i % 2:
+            lineas.append(f"mostrar \"total\", {formula};")
+        else:
+            lineas.append(f"saldo_{a} = {formula};")
+        i += 1
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+def _analizar(ast, compartidas=False):
+    """(segundos del análisis semántico, diagnósticos que produjo), el mejor de REPETICIONES.
+
+    `compartidas` indica que `ast` se construyó con `compartir_expresiones`.
+    """
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio_errores = len(global_errors)
+        with silencio():
+            inicio = time.perf_counter()
+            SemanticAnalyzer(expresiones_compartidas=compartidas).analyze(ast)
+            tiempos.append(time.perf_counter() - inicio)
+        diagnosticos = global_errors[inicio_errores:]
+        del global_errors[inicio_errores:]
+    return min(tiempos), diagnosticos
+
+
+def comprobar_regresiones(backend="ply"):
+    """Índice del primer programa de REGRESIONES cuyos diagnósticos cambian al compartir, o None."""
+    for i, codigo in enumerate(REGRESIONES):
+        arbol = analizar_generado(codigo, backend=backend)
+        grafo = analizar_generado(codigo, backend=backend, compartir_expresiones=True)
+        if _analizar(arbol)[1] != _analizar(grafo, compartidas=True)[1]:
+            return i
+    return None
+
+
+def ejecutar(sentencias=SENTENCIAS, backend="ply"):
+    """Imprime la comparación y devuelve True si ambos árboles son equivalentes y compartir ocupa menos."""
+    codigo = programa_repetitivo(sentencias)
+    with silencio():
+        parse_buffer("inicio\nfin\n", backend=backend)  # Tablas cargadas antes de medir
+    arbol, memoria_arbol = reservado(lambda buffer: analizar_generado(buffer, backend=backend),
+                                     TokenBuffer.desde_codigo(codigo))
+    grafo, memoria_grafo = reservado(lambda buffer: analizar_generado(buffer, backend=backend,
+                                                                      compartir_expresiones=True),
+                                     TokenBuffer.desde_codigo(codigo))
+
+    apariciones = sum(1 for _ in AST.preorden(grafo))
+    distintos = len({id(nodo) for nodo in AST.preorden(grafo)})
+    tiempo_arbol, diagnosticos_arbol = _analizar(arbol)
+    tiempo_grafo, diagnosticos_grafo = _analizar(grafo, compartidas=True)
+    with silencio():
+        iguales = TACGenerator().generate(arbol) == TACGenerator().generate(grafo)
+
+    print(f"{sentencias} sentencias ({backend}), {apariciones} nodos, {distintos} distintos al compartir, "
+          f"{len(diagnosticos_arbol)} diagnósticos")
+    print(f"  memoria   árbol {memoria_arbol / 2**20:7.1f} MiB   compartido {memoria_grafo / 2**20:7.1f} MiB"
+          f"  ({memoria_grafo / memoria_arbol:.0%})")
+    print(f"  semántico árbol {tiempo_arbol:7.2f} s     compartido {tiempo_grafo:7.2f} s"
+          f"  (x{tiempo_arbol / max(tiempo_grafo, 1e-9):.1f})")
+    correcto = True
+    regresion = comprobar_regresiones(backend)
+    if regresion is not None:
+        print(f"❌ Los diagnósticos del programa {regresion} de REGRESIONES cambian al compartir expresiones")
+        correcto = False
+    if not iguales:
+        print("❌ El TAC del AST compartido no coincide con el del árbol")
+        correcto = False
+    if diagnosticos_arbol != diagnosticos_grafo:
+        print("❌ Los diagnósticos del AST compartido no coinciden con los del árbol")
+        correcto = False
+    return correcto and memoria_grafo < memoria_arbol
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias del programa generado")
+    argumentos.add_argument("--parser", choices=BACKENDS_PARSER + BACKENDS_PARSER_EXPERIMENTALES, default="ply",
+                            help="backend del parser")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias, opciones.parser) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
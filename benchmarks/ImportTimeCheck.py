@@ -0,0 +1,109 @@
+# benchmarks/ImportTimeCheck.py
+"""Comprueba que importar `SyntaxAnalyzer.Parser` no construye las tablas LALR y mide cuánto tarda.
+
+Uso: `python -m benchmarks.ImportTimeCheck [--presupuesto 300]`
+
+Importa el módulo en un proceso nuevo: en frío (sin `.pyc` ni tablas en
+caché: `PYTHONPYCACHEPREFIX` y `PSEINT_CACHE_DIR` apuntan a directorios
+temporales vacíos) y en caliente (los `__pycache__` de siempre, llenados
+por una importación previa, y la caché de tablas de la primera vez), como
+al abrir el editor por segunda vez. Después de importar, el proceso comprueba que
+`obtener_parser` no se llamó y que no se escribió nada en la caché ni junto
+al código; luego analiza un programa mínimo, que sí construye o lee las
+tablas. Imprime el tiempo de importar y el del primer análisis frente al
+presupuesto (en milisegundos) y termina con código 1 si la importación
+construye las tablas, escribe archivos o, en caliente, se pasa del
+presupuesto.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from benchmarks.Common import linea_de_comandos
+
+# Milisegundos que puede tardar la importación en caliente
+PRESUPUESTO = 300
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Archivos que PLY escribía junto a la gramática antes de usar la caché del usuario
+_GENERADOS = (os.path.join("SyntaxAnalyzer", "parsetab.py"), os.path.join("SyntaxAnalyzer", "parser.out"))
+
+# Lo que corre el proceso nuevo: imprime una línea JSON con las mediciones
+_PROCESO = """
+import json, os, sys, time
+cache = os.environ["PSEINT_CACHE_DIR"]
+listar = lambda: set(os.listdir(cache)) if os.path.isdir(cache) else set()
+previos = listar()
+inicio = time.perf_counter()
+import SyntaxAnalyzer.Parser as P
+importar = time.perf_counter() - inicio
+tablas_al_importar = P._parser is not None
+escritos = sorted(listar() - previos)
+inicio = time.perf_counter()
+P.parse_buffer("inicio\\nfin\\n")
+analizar = time.perf_counter() - inicio
+print(json.dumps({"importar": importar, "tablas": tablas_al_importar, "escritos": escritos,
+                  "analizar": analizar, "guardadas": os.path.exists(P.ruta_tablas())}))
+"""
+
+
+def medir(cache, pycache=None):
+    """Mediciones (dict) de importar el parser en un proceso nuevo con esa caché de tablas.
+
+    Con `pycache` los `.pyc` se leen y escriben en ese directorio; sin él,
+    en los `__pycache__` de siempre.
+    """
+    entorno = dict(os.environ, PSEINT_CACHE_DIR=cache, PYTHONWARNINGS="ignore")
+    entorno.pop("PYTHONPYCACHEPREFIX", None)
+    if pycache is not None:
+        entorno["PYTHONPYCACHEPREFIX"] = pycache
+    entorno["PYTHONPATH"] = os.pathsep.join(filter(None, (_RAIZ, os.environ.get("PYTHONPATH"))))
+    salida = subprocess.run([sys.executable, "-c", _PROCESO], cwd=_RAIZ, env=entorno,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    return json.loads(salida.stdout.splitlines()[-1])
+
+
+def ejecutar(presupuesto=PRESUPUESTO):
+    """Imprime las mediciones en frío y en caliente; devuelve True si la importación es perezosa y cabe en el presupuesto."""
+    previos = {ruta for ruta in _GENERADOS if os.path.exists(os.path.join(_RAIZ, ruta))}
+    correcto = True
+    with tempfile.TemporaryDirectory() as directorio:
+        cache, pycache = os.path.join(directorio, "cache"), os.path.join(directorio, "pycache")
+        frio = medir(cache, pycache)
+        medir(cache)  # Deja los `.pyc` en los `__pycache__` de siempre
+        for nombre, datos in (("en frío", frio), ("en caliente", medir(cache))):
+            print(f"{nombre:12} importar {datos['importar'] * 1000:7.1f} ms  (presupuesto {presupuesto} ms)"
+                  f"  primer análisis {datos['analizar'] * 1000:7.1f} ms")
+            if datos["tablas"]:
+                print(f"❌ {nombre}: importar el módulo construyó las tablas LALR")
+                correcto = False
+            if datos["escritos"]:
+                print(f"❌ {nombre}: importar el módulo escribió en la caché: {', '.join(datos['escritos'])}")
+                correcto = False
+            if not datos["guardadas"]:
+                print(f"❌ {nombre}: el primer análisis no dejó las tablas en la caché")
+                correcto = False
+            if nombre == "en caliente" and datos["importar"] * 1000 > presupuesto:
+                print(f"❌ {nombre}: la importación se pasó del presupuesto")
+                correcto = False
+    generados = {ruta for ruta in _GENERADOS if os.path.exists(os.path.join(_RAIZ, ruta))} - previos
+    if generados:
+        print(f"❌ Se escribieron archivos junto al código: {', '.join(sorted(generados))}")
+        correcto = False
+    if correcto:
+        print("✅ Importar el parser no construye ni escribe las tablas")
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--presupuesto", type=float, default=PRESUPUESTO,
+                            help="milisegundos que puede tardar la importación en caliente")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.presupuesto) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
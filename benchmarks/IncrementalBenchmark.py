@@ -0,0 +1,202 @@
+# benchmarks/IncrementalBenchmark.py
+"""Compara el análisis semántico incremental con el análisis completo después de cada edición.
+
+Uso: `python -m benchmarks.IncrementalBenchmark [--ediciones 300] [--max 100000] [--semilla 5]`
+
+Primero aplica ediciones al azar (reemplazar, insertar y borrar sentencias
+que declaran, usan y redefinen unas pocas variables) a un programa chico
+con el ParserIncremental y el AnalizadorIncremental, y después de cada una
+compara los diagnósticos con los de analizar todo el texto de cero, y el
+`ast` del ParserIncremental (líneas absolutas) con el de parsear todo. Después
+mide, en programas de 1k, 10k y 100k sentencias, cuánto tardan el parser y
+el análisis semántico (con la lectura de `errores`) por edición frente al
+análisis completo. Las ediciones medidas reemplazan, insertan y borran
+líneas, así que casi todas mueven de línea el resto del programa. Termina
+con código 1 si algún diagnóstico o AST no coincide o si el tiempo del análisis
+semántico por edición crece claramente con el tamaño del programa (el del
+parser incluye copiar el texto, que sí crece).
+"""
+import random
+import sys
+import time
+from GlobalErrors.ErrorsManager import Diagnosticos
+from SyntaxAnalyzer.IncrementalParser import ParserIncremental
+from SyntaxAnalyzer.Parser import parse_buffer
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from SemanticAnalyzer.IncrementalAnalyzer import AnalizadorIncremental
+from benchmarks.Common import iguales, linea_de_comandos, silencio
+
+EDICIONES = 300
+TAMANOS = (1_000, 10_000, 100_000)
+MEDICIONES = 300  # Ediciones medidas por tamaño
+ERRORES = 20  # Sentencias con un error en los programas medidos
+
+# Cuánto puede crecer el tiempo por edición entre el programa más chico y el más grande
+MAX_CRECIMIENTO = 3.0
+
+_NOMBRES = ("a", "b", "c", "d")
+_SENTENCIAS = (
+    "entero {x} = {k};",
+    "decimal {x} = {y} + 1.5;",
+    "cadena {x} = \"t\";",
+    "constante {x} = {y} * 2;",
+    "{x} = {y} + {k};",
+    "{x} = {y} / 0;",
+    "mostrar {x} + {y}, {k};",
+    "si ({x} > {y}) entonces\nmostrar {x};\nfin_si",
+    "para {x} desde 1 hasta {k} hacer\nmostrar {y};\nfin_para",
+    "mientras ({x} < {k}) hacer\n{x} = {x} + 1;\nfin_mientras",
+)
+
+
+def _sentencia(azar):
+    plantilla = azar.choice(_SENTENCIAS)
+    return plantilla.format(x=azar.choice(_NOMBRES), y=azar.choice(_NOMBRES), k=azar.randint(0, 9))
+
+
+def _analisis_completo(codigo):
+    """(AST, diagnósticos) de parsear y analizar `codigo` de cero."""
+    with silencio():
+        ast = parse_buffer(codigo)
+    return ast, _diagnosticos(ast)
+
+
+def _diagnosticos(ast):
+    """Diagnósticos del SemanticAnalyzer sobre `ast`."""
+    diagnosticos = Diagnosticos()
+    with silencio():
+        SemanticAnalyzer(diagnosticos).analyze(ast)
+    return list(diagnosticos)
+
+
+def _editar(parser, sentencias, azar):
+    """Reemplaza, inserta o borra una sentencia de primer nivel elegida al azar.
+
+    `sentencias` es el texto de cada sentencia de primer nivel del cuerpo
+    (una línea vacía cuenta como una); se actualiza con la edición.
+    """
+    k = azar.randrange(len(sentencias))
+    linea = 2 + sum(sentencia.count("\n") + 1 for sentencia in sentencias[:k])
+    operacion = azar.random()
+    if operacion < 0.6:
+        nuevas = [_sentencia(azar)]
+    elif operacion < 0.8:
+        nuevas = [sentencias[k], _sentencia(azar)]
+    else:
+        nuevas = [""]
+    parser.editar(linea, linea + sentencias[k].count("\n"), "\n".join(nuevas))
+    sentencias[k:k + 1] = nuevas
+
+
+def comprobar(ediciones=EDICIONES, semilla=5):
+    """Aplica `ediciones` al azar y devuelve True si el incremental siempre coincide con el completo."""
+    azar = random.Random(semilla)
+    sentencias = [_sentencia(azar) for _ in range(60)]
+    with silencio():
+        parser = ParserIncremental("inicio\n" + "\n".join(sentencias) + "\nfin\n")
+        semantico = AnalizadorIncremental(parser)
+        semantico.actualizar(parser.arbol_relativo, parser.ultimo_cambio)
+    incrementales = rechequeadas = 0
+    for edicion in range(ediciones):
+        with silencio():
+            _editar(parser, sentencias, azar)
+            semantico.actualizar(parser.arbol_relativo, parser.ultimo_cambio)
+        if parser.ultimo_cambio is not None:
+            incrementales += 1
+            rechequeadas += semantico.rechequeadas
+        ast, esperados = _analisis_completo(parser.codigo)
+        if semantico.errores != esperados:
+            print(f"❌ Edición {edicion}: los diagnósticos incrementales no coinciden con los del análisis completo")
+            print(f"   incremental: {semantico.errores}")
+            print(f"   completo:    {esperados}")
+            return False
+        # `ast` tiene las líneas absolutas: sirve tal cual para el SemanticAnalyzer
+        if not iguales(parser.ast, ast) or _diagnosticos(parser.ast) != esperados:
+            print(f"❌ Edición {edicion}: el `ast` del ParserIncremental no es el del análisis completo")
+            return False
+    print(f"✅ {ediciones} ediciones ({incrementales} incrementales, "
+          f"{rechequeadas / max(incrementales, 1):.1f} sentencias analizadas en promedio)")
+    return True
+
+
+def programa_grande(n):
+    """Líneas de un programa de `n` sentencias: declaraciones y después usos, `ERRORES` con una variable sin declarar."""
+    lineas = ["inicio"]
+    lineas.extend(f"entero v{i} = {i};" for i in range(50))
+    lineas.extend(f"v{i % 50} = v{(i * 7) % 50} + {i % 9};" if i % (n // ERRORES) else f"v{i % 50} = w{i};"
+                  for i in range(n - 50))
+    lineas.append("fin")
+    return lineas
+
+
+def _mediana(tiempos):
+    return sorted(tiempos)[len(tiempos) // 2]
+
+
+def medir(n, mediciones=MEDICIONES, semilla=5):
+    """(segundos del parser y del análisis semántico por edición, segundos del análisis completo).
+
+    En un programa de `n` sentencias, cada edición reemplaza una asignación
+    de la segunda mitad, inserta una después de ella o la borra (ninguna
+    declaración cambia).
+    """
+    azar = random.Random(semilla)
+    lineas = programa_grande(n)
+    with silencio():
+        parser = ParserIncremental("\n".join(lineas) + "\n")
+        semantico = AnalizadorIncremental(parser)
+        inicio = time.perf_counter()
+        semantico.actualizar(parser.arbol_relativo)
+        semantico.errores
+        completo = time.perf_counter() - inicio
+        sintacticos, semanticos = [], []
+        for medicion in range(mediciones):
+            linea = azar.randint(n // 2, len(lineas) - 2)
+            nueva = f"v{azar.randrange(50)} = v{azar.randrange(50)} * {azar.randint(1, 9)};"
+            inicio = time.perf_counter()
+            if medicion % 3 == 0:
+                parser.editar(linea, linea, nueva)
+                lineas[linea - 1] = nueva
+            elif medicion % 3 == 1:
+                parser.editar(linea, linea, lineas[linea - 1] + "\n" + nueva)
+                lineas.insert(linea, nueva)
+            else:
+                # Junta la línea con la siguiente, que queda sola
+                parser.editar(linea, linea + 1, lineas[linea])
+                del lineas[linea - 1]
+            medio = time.perf_counter()
+            semantico.actualizar(parser.arbol_relativo, parser.ultimo_cambio)
+            semantico.errores
+            sintacticos.append(medio - inicio)
+            semanticos.append(time.perf_counter() - medio)
+    return _mediana(sintacticos), _mediana(semanticos), completo
+
+
+def ejecutar(ediciones=EDICIONES, maximo=TAMANOS[-1], semilla=5):
+    """Imprime la comprobación y las mediciones; devuelve True si todo coincide y el costo no crece."""
+    if not comprobar(ediciones, semilla):
+        return False
+    por_edicion = []
+    for n in (tamano for tamano in TAMANOS if tamano <= maximo):
+        parser, semantico, completo = medir(n, semilla=semilla)
+        por_edicion.append((parser, semantico))
+        print(f"{n:8} sentencias  parser {parser * 1e6:8.1f} µs  semántico {semantico * 1e6:8.1f} µs"
+              f"  análisis completo {completo * 1000:8.1f} ms  (x{completo / max(semantico, 1e-9):.0f})")
+    primero, ultimo = por_edicion[0][1], por_edicion[-1][1]
+    if ultimo > primero * MAX_CRECIMIENTO:
+        print(f"❌ El tiempo del análisis semántico por edición creció x{ultimo / primero:.1f} con el tamaño del programa")
+        return False
+    return True
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--ediciones", type=int, default=EDICIONES, help="ediciones al azar a comprobar")
+    argumentos.add_argument("--max", type=int, default=TAMANOS[-1], help="tamaño máximo de programa a medir")
+    argumentos.add_argument("--semilla", type=int, default=5, help="semilla de las ediciones al azar")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.ediciones, opciones.max, opciones.semilla) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# benchmarks/IncrementalLexerCheck.py
+"""Comprueba el LexerIncremental contra tokenizar todo el texto y mide cuánto ahorra por edición.
+
+Uso: `python -m benchmarks.IncrementalLexerCheck [--ediciones 2000] [--semilla 0] [--sentencias 100000]`
+
+Con cada backend aplica ediciones al azar (trozos de palabras clave,
+números, cadenas y comillas sueltas, comentarios, saltos de línea y
+caracteres inválidos) sobre un texto chico y, después de cada una, compara
+los tokens (tipo, valor, posición y línea) y los errores léxicos con los de
+tokenizar el texto completo de cero, sin tope de errores; las ediciones no
+deben imprimir ni agregar nada a `global_errors`. También comprueba lo que
+usa el editor para resaltar: `tokens_en` y `errores_en` sobre todo el
+texto, y que fuera de `ultimo_tramo` los tokens sean los de antes de la
+edición. Después mide, en un programa de `--sentencias` sentencias, una
+edición de una línea frente a tokenizar todo. Termina con código 1 si algún
+caso no coincide.
+"""
+import contextlib
+import io
+import random
+import sys
+import time
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.IncrementalLexer import LexerIncremental
+from LexicalAnalyzer.Lexer import BACKENDS_LEXER, crear_lexer
+from benchmarks.Common import linea_de_comandos, mejor, programa_plano, silencio
+
+EDICIONES = 2000
+SENTENCIAS = 100_000
+MEDICIONES = 200
+
+_PIEZAS = ("x", "y1", " ", "\n", "\n", "12", ".5", "3.25", "\"", "\"ab\"", "// nota", "si", "fin_si",
+           "entero ", "mostrar", ";", "=", "==", "!", "!=", "+", "(", ")", "@", "$#", "ñ")
+
+
+def _texto(azar, piezas):
+    return "".join(azar.choice(_PIEZAS) for _ in range(piezas))
+
+
+def completo(codigo, backend):
+    """(tokens, rangos (tipo, inicio, fin), errores) de tokenizar `codigo` de cero con `backend`, sin tope de errores."""
+    lx = crear_lexer(backend)
+    lx.input(codigo)
+    tokens, rangos = [], []
+    with silencio(), global_errors.aparte(con_topes=False) as errores:
+        for tok in iter(lx.token, None):
+            tokens.append((tok.type, tok.value, tok.lexpos, tok.lineno))
+            rangos.append((tok.type, tok.lexpos, lx.lexpos))
+    return tokens, rangos, errores
+
+
+def _fuera_del_tramo(lexer, previos, rangos, delta):
+    """True si los tokens de `rangos` fuera de `lexer.ultimo_tramo` son los `previos` (corridos `delta` después)."""
+    desde, hasta = lexer.ultimo_tramo
+    antes = [rango for rango in rangos if rango[2] <= desde]
+    despues = [(tipo, inicio - delta, fin - delta) for tipo, inicio, fin in rangos if inicio >= hasta]
+    return antes == previos[:len(antes)] and despues == previos[len(previos) - len(despues):]
+
+
+def comprobar(backend, ediciones=EDICIONES, semilla=0):
+    """Descripción del primer caso en que el incremental no coincide con el completo, o None."""
+    azar = random.Random(semilla)
+    lexer = LexerIncremental(_texto(azar, 200), backend)
+    previos = list(lexer.tokens_en(0, len(lexer.codigo)))
+    for edicion in range(ediciones):
+        lineas = len(lexer.lineas)
+        primera = azar.randint(1, lineas)
+        ultima = min(lineas, primera + azar.randrange(3))
+        texto = _texto(azar, azar.randrange(6))
+        largo = len(lexer.codigo)
+        registrados, salida = len(global_errors), io.StringIO()
+        with contextlib.redirect_stdout(salida):
+            lexer.editar(primera, ultima, texto)
+        if salida.getvalue() or len(global_errors) != registrados:
+            return f"edición {edicion} ({primera}-{ultima} por {texto!r}): imprimió o registró errores globales"
+        tokens, rangos, errores = completo(lexer.codigo, backend)
+        if [(tok.type, tok.value, tok.lexpos, tok.lineno) for tok in lexer] != tokens:
+            return f"edición {edicion} ({primera}-{ultima} por {texto!r}): los tokens no coinciden"
+        if lexer.errores != errores:
+            return f"edición {edicion} ({primera}-{ultima} por {texto!r}): los errores léxicos no coinciden"
+        columnas = [(lexer.lineas.columna(inicio), lexer.lineas.columna(inicio) + fin - inicio - 1)
+                    for inicio, fin in lexer.errores_en(0, len(lexer.codigo))]
+        if list(lexer.tokens_en(0, len(lexer.codigo))) != rangos or \
+                columnas != [(error["columna"], error["columna_fin"]) for error in errores]:
+            return f"edición {edicion} ({primera}-{ultima} por {texto!r}): `tokens_en` o `errores_en` no coinciden"
+        if not _fuera_del_tramo(lexer, previos, rangos, len(lexer.codigo) - largo):
+            return f"edición {edicion} ({primera}-{ultima} por {texto!r}): cambiaron tokens fuera de `ultimo_tramo`"
+        previos = rangos
+    return None
+
+
+def medir(backend, sentencias=SENTENCIAS, semilla=0):
+    """(segundos por edición de una línea, segundos de tokenizar todo) en un programa de `sentencias` sentencias."""
+    azar = random.Random(semilla)
+    codigo = programa_plano(sentencias)
+    completo_ = mejor(completo, codigo, backend, repeticiones=1)
+    lexer = LexerIncremental(codigo, backend)
+    tiempos = []
+    for _ in range(MEDICIONES):
+        linea = azar.randint(2, sentencias)
+        inicio = time.perf_counter()
+        lexer.editar(linea, linea, f"x = x * {azar.randint(1, 9)};")
+        tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2], completo_
+
+
+def ejecutar(ediciones=EDICIONES, semilla=0, sentencias=SENTENCIAS):
+    """Imprime la comprobación y las mediciones de cada backend; devuelve True si todo coincide."""
+    correcto = True
+    for backend in BACKENDS_LEXER:
+        diferencia = comprobar(backend, ediciones, semilla)
+        if diferencia is not None:
+            print(f"❌ {backend}: {diferencia}")
+            correcto = False
+            continue
+        print(f"✅ {backend}: {ediciones} ediciones coinciden con tokenizar todo")
+        if sentencias:
+            edicion, todo = medir(backend, sentencias, semilla)
+            print(f"  {sentencias} sentencias  edición {edicion * 1e6:8.1f} µs  todo {todo * 1000:8.1f} ms"
+                  f"  (x{todo / max(edicion, 1e-9):.0f})")
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--ediciones", type=int, default=EDICIONES, help="ediciones al azar a comprobar")
+    argumentos.add_argument("--semilla", type=int, default=0, help="semilla de las ediciones al azar")
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias del programa medido (0 = no medir)")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.ediciones, opciones.semilla, opciones.sentencias) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
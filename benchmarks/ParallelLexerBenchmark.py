@@ -0,0 +1,90 @@
+# benchmarks/ParallelLexerBenchmark.py
+"""Mide la aceleración de `tokenizar_paralelo` con 1, 2, 4 y 8 trabajadores.
+
+Uso: `python -m benchmarks.ParallelLexerBenchmark [--sentencias 400000] [--backend ply]`
+
+Tokeniza un programa generado de varios MB, con cadenas multilínea y
+caracteres inválidos repartidos para que los cortes y los errores también
+se pongan a prueba. Con cada cantidad de trabajadores compara el TokenBuffer
+y los errores léxicos con los del lexer secuencial e informa el tiempo y la
+aceleración respecto de él. Los procesos se crean antes de medir (el
+arranque no cuenta). Termina con código 1 si algún resultado no coincide;
+la aceleración depende de los núcleos de la máquina y no se comprueba.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.Lexer import BACKENDS_LEXER, crear_lexer
+from LexicalAnalyzer.ParallelLexer import tokenizar_paralelo
+from LexicalAnalyzer.TokenBuffer import TokenBuffer
+from benchmarks.Common import linea_de_comandos, mejor, programa_variado, silencio
+
+SENTENCIAS = 400_000
+TRABAJADORES = (1, 2, 4, 8)
+
+# Cada cuántas sentencias se intercala una cadena multilínea y un error léxico
+_CADA = 5_000
+
+
+def programa(n):
+    """`programa_variado(n)` con cadenas de varias líneas y caracteres inválidos intercalados."""
+    lineas = programa_variado(n).splitlines()
+    for i in range(len(lineas) - _CADA, 1, -_CADA):
+        lineas[i:i] = ['mostrar "una cadena', 'de dos líneas";', "saldo_0 = saldo_1 @ 2;"]
+    return "\n".join(lineas) + "\n"
+
+
+def _columnas(buffer):
+    return buffer.tipos, buffer.inicios, buffer.fines, buffer.lineas
+
+
+def secuencial(codigo, backend):
+    """(columnas del TokenBuffer, errores léxicos) del lexer secuencial, sin tope de errores."""
+    lx = crear_lexer(backend)
+    with silencio(), global_errors.aparte(con_topes=False) as errores:
+        if backend == "dfa":
+            buffer = TokenBuffer.desde_codigo(codigo, lexer=lx)
+        else:
+            buffer = TokenBuffer.desde_lexer(codigo, lx)
+    return _columnas(buffer), errores
+
+
+def paralelo(codigo, backend, trabajadores, executor):
+    """(columnas del TokenBuffer, errores léxicos) de `tokenizar_paralelo`, sin tope de errores."""
+    with silencio(), global_errors.aparte(con_topes=False) as errores:
+        buffer = tokenizar_paralelo(codigo, trabajadores, backend, executor=executor)
+    return _columnas(buffer), errores
+
+
+def ejecutar(sentencias=SENTENCIAS, backend="ply", trabajadores=TRABAJADORES):
+    """Imprime tiempos y aceleraciones; devuelve True si todos los resultados coinciden con el secuencial."""
+    codigo = programa(sentencias)
+    referencia = secuencial(codigo, backend)
+    base = mejor(secuencial, codigo, backend, repeticiones=1)
+    print(f"{sentencias} sentencias ({len(codigo) / 1e6:.1f} MB), {len(referencia[0][0])} tokens,"
+          f" {len(referencia[1])} errores, {os.cpu_count()} núcleos, backend {backend}")
+    print(f"  secuencial     {base:7.2f} s")
+    correcto = True
+    for cantidad in trabajadores:
+        with ProcessPoolExecutor(max_workers=cantidad) as executor:
+            resultado = paralelo(codigo, backend, cantidad, executor)  # También arranca los procesos
+            if resultado != referencia:
+                print(f"  ❌ {cantidad} trabajadores: el resultado no coincide con el lexer secuencial")
+                correcto = False
+                continue
+            segundos = mejor(paralelo, codigo, backend, cantidad, executor, repeticiones=1)
+        print(f"  {cantidad} trabajadores {segundos:7.2f} s  (x{base / segundos:.2f})")
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS, help="sentencias del programa generado")
+    argumentos.add_argument("--backend", choices=BACKENDS_LEXER, default="ply", help="lexer de cada trabajador")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias, opciones.backend) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
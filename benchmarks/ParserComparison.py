@@ -0,0 +1,319 @@
+# benchmarks/ParserComparison.py
+"""Compara el parser LALR de PLY con el parser Pratt: resultados y velocidad.
+
+Uso: `python -m benchmarks.ParserComparison [--aleatorios 2000] [--semilla 0] [--sentencias 100000]`
+
+Analiza con ambos backends un corpus fijo (cada construcción y cada
+producción de error de `Parser.py`) y programas aleatorios, la mitad con
+tokens borrados, insertados o cambiados. Para los programas que PLY acepta
+sin errores los ASTs deben ser idénticos, líneas incluidas, y el parser
+Pratt no debe reportar nada; para los que tienen errores el primer
+diagnóstico debe coincidir (mensaje, línea y columna), también al leer los
+tokens de un `TokenBuffer` (`parse_buffer`) con cualquiera de los dos. Los
+casos en que PLY no termina o lanza una excepción solo exigen que el parser
+Pratt termine. Los diagnósticos que siguen al primero no se exigen (el
+parser Pratt no se recupera en los mismos puntos que PLY, ver
+PrattParser.py): se informa en cuántos casos la lista completa es distinta.
+También compara programas muy anidados (`programas_profundos`: paréntesis,
+`not` encadenados y bloques), más profundos que lo que admite la pila de
+Python si el parser recursara.
+Después mide el tiempo de análisis de los programas de `ScalingBenchmark`
+con el lexer incluido y con los tokens ya leídos en un `TokenBuffer`.
+
+Termina con código 1 si algún caso no coincide.
+"""
+import random
+import signal
+import sys
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.Lexer import crear_lexer
+from LexicalAnalyzer.TokenBuffer import TokenBuffer
+from SyntaxAnalyzer.Parser import crear_parser, parse_buffer
+from benchmarks.Common import iguales, linea_de_comandos, mejor, programa_anidado, programa_plano, silencio
+
+ALEATORIOS = 2000
+SENTENCIAS = 100_000
+
+# Segundos que se le dan a PLY por caso: con algunas entradas inválidas no termina
+LIMITE_PLY = 0.5
+
+# Anidamiento de los programas de `programas_profundos`
+PROFUNDIDAD = 10_000
+
+CORPUS = (
+    # Programas válidos
+    "inicio\nfin\n",
+    "inicio\nentero x;\ndecimal y = 2.5;\ncadena c = \"hola\";\nbooleano b = verdadero;\nfin\n",
+    "inicio\nCONSTANTE PI = 3.14;\nentero x = 1 + 2 * 3 - 4 / 2 % 3;\nx = (x + 1) * 2;\nfin\n",
+    "inicio\nbooleano b = not verdadero and falso or 1 < 2 and 3 >= 2 or 4 != 5;\nfin\n",
+    "inicio\nbooleano b = not not (1 <= 2) == (3 > 4);\nmostrar b, 1 + 2, \"x\";\nfin\n",
+    "inicio\nentero x = 0;\nsi (x > 0) entonces\nmostrar x;\nfin_si\n"
+    "si (x == 0) entonces\nx = 1;\nsino\nx = 2;\nfin_si\nfin\n",
+    "inicio\nentero i = 0;\nmientras (i < 3) hacer\ni = i + 1;\nfin_mientras\nfin\n",
+    "inicio\nentero i;\npara i desde 1 hasta 10 hacer\nmostrar i;\nfin_para\n"
+    "para i desde 10 hasta 1 con_paso 0 - 1 hacer\nmostrar i;\nfin_para\nfin\n",
+    "inicio\nentero x = 0;\nrepetir\nx = x + 1;\nhasta_que (x >= 3);\nfin\n",
+    "inicio\nentero x = 0;\nsi (x > 0) entonces\nmientras (x > 0) hacer\nrepetir\nx = x - 1;\n"
+    "hasta_que (x < 5);\nfin_mientras\nsino\nfin_si\nfin\n",
+    # Producciones de error
+    "inicio\nsi entonces\nmostrar 1;\nfin_si\nfin\n",
+    "inicio\nsi (1 < 2)\nmostrar 1;\nfin_si\nfin\n",
+    "inicio\nsi (1 < 2) entonces\nfin_si\nfin\n",
+    "inicio\nmientras hacer\nmostrar 1;\nfin_mientras\nfin\n",
+    "inicio\nmientras (1 < 2)\nmostrar 1;\nfin_mientras\nfin\n",
+    "inicio\nmientras (1 < 2) hacer\nfin_mientras\nfin\n",
+    "inicio\nentero i;\npara i hacer\nmostrar i;\nfin_para\nfin\n",
+    "inicio\nentero i;\npara i desde 1 hasta 3\nmostrar i;\nfin_para\nfin\n",
+    "inicio\nentero i;\npara i desde 1 hasta 3 hacer\nfin_para\nfin\n",
+    "inicio\nrepetir\nmostrar 1;\nhasta_que;\nfin\n",
+    "inicio\nrepetir\nmostrar 1;\n(verdadero);\nfin\n",
+    "inicio\nrepetir\nhasta_que (verdadero);\nfin\n",
+    "inicio\nmostrar;\nfin\n",
+    "inicio\nmostrar 1, 2\nfin\n",
+    "inicio\nentero;\nfin\n",
+    "inicio\nentero x\nfin\n",
+    "inicio\nentero x;\nx = ;\nfin\n",
+    "inicio\nentero x;\nx = 1\nfin\n",
+    "inicio\nentero = 1;\nfin\n",
+    "inicio\nentero x 1;\nfin\n",
+    "inicio\nentero x = ;\nfin\n",
+    "inicio\nentero x = 1\nfin\n",
+    # Errores que recupera `p_error`
+    "inicio\nentero x = 1 +;\nmostrar x;\nfin\n",
+    "inicio\nentero x = (1 + 2;\nfin\n",
+    "inicio\nbooleano b = 1 < 2 < 3;\nfin\n",
+    "inicio\nmostrar 1 == 2 == 3;\nfin\n",
+    "inicio\n= 1;\nmostrar 2;\nfin\n",
+    "entero x;\ninicio\nfin\n",
+    "inicio\nfin\nmostrar 1;\n",
+    "inicio\nmostrar 1;\n",
+    "inicio\nsi (1) entonces\nmostrar 1;\nfin\n",
+)
+
+_ATOMOS = ("a", "1", "2.5", '"s"', "verdadero", "x")
+_OPERADORES = ("+", "-", "*", "/", "%", "and", "or", ">", "<", ">=", "<=", "==", "!=")
+_TOKENS_MUTACION = ("inicio", "fin", "si", "entonces", "sino", "fin_si", "mientras", "hacer", "fin_mientras",
+                    "para", "desde", "hasta", "con_paso", "fin_para", "repetir", "hasta_que", "mostrar",
+                    "entero", "CONSTANTE", "x", "1", ";", "(", ")", ",", "=", "+", "<", "==", "not", "and", '"t"')
+
+
+def programas_profundos(profundidad=PROFUNDIDAD):
+    """Programas con `profundidad` paréntesis o `not` anidados y con bloques anidados (un quinto)."""
+    n = profundidad
+    bloques = n // 5
+    control = ("si (x > 0) entonces", "mientras (x < 3) hacer", "para x desde 1 hasta 2 hacer", "repetir")
+    cierres = ("fin_si", "fin_mientras", "fin_para", "hasta_que (x > 1);")
+    aperturas = [control[i % 4] for i in range(bloques)]
+    finales = [cierres[i % 4] for i in reversed(range(bloques))]
+    return (
+        f"inicio\nentero x = {'(' * n}1{')' * n};\nfin\n",
+        f"inicio\nbooleano b = {'not ' * n}verdadero;\nfin\n",
+        f"inicio\nentero x = {'(1 + ' * n}1{')' * n};\nfin\n",
+        "inicio\nentero x = 0;\n" + "\n".join(aperturas) + "\nx = x + 1;\n" + "\n".join(finales) + "\nfin\n",
+        "inicio\nentero x = 0;\n" + "si (x > 0) entonces\n" * bloques + "x = 1;\n" + "sino\nfin_si\n" * bloques + "fin\n",
+        # Con errores: paréntesis sin cerrar y bloques sin `entonces`
+        f"inicio\nentero x = {'(' * n}1;\nmostrar x;\nfin\n",
+        "inicio\nentero x = 0;\n" + "si (x > 0)\n" * bloques + "x = 1;\n" + "fin_si\n" * bloques + "fin\n",
+    )
+
+
+class _TiempoAgotado(BaseException):
+    """PLY no terminó a tiempo (BaseException para que no la capture el propio parser)."""
+
+
+def _expresion(azar, profundidad=0):
+    opcion = azar.random()
+    if profundidad > 3 or opcion < 0.35:
+        return azar.choice(_ATOMOS)
+    if opcion < 0.75:
+        return f"{_expresion(azar, profundidad + 1)} {azar.choice(_OPERADORES)} {_expresion(azar, profundidad + 1)}"
+    if opcion < 0.85:
+        return f"not {_expresion(azar, profundidad + 1)}"
+    return f"({_expresion(azar, profundidad + 1)})"
+
+
+def _sentencias(azar, profundidad, cantidad):
+    return "\n".join(_sentencia(azar, profundidad) for _ in range(cantidad))
+
+
+def _cuerpo(azar, profundidad):
+    return _sentencias(azar, profundidad + 1, azar.randint(0, 3))
+
+
+def _sentencia(azar, profundidad):
+    opcion = azar.randrange(9 if profundidad < 3 else 4)
+    if opcion == 0:
+        return f"entero v{azar.randrange(5)} = {_expresion(azar)};"
+    if opcion == 1:
+        return f"x = {_expresion(azar)};"
+    if opcion == 2:
+        return f"mostrar {_expresion(azar)}, {_expresion(azar)};"
+    if opcion == 3:
+        return f"cadena c{azar.randrange(3)};"
+    if opcion == 4:
+        return f"si ({_expresion(azar)}) entonces\n{_cuerpo(azar, profundidad)}\nfin_si"
+    if opcion == 5:
+        return (f"si ({_expresion(azar)}) entonces\n{_cuerpo(azar, profundidad)}\n"
+                f"sino\n{_cuerpo(azar, profundidad)}\nfin_si")
+    if opcion == 6:
+        return f"mientras ({_expresion(azar)}) hacer\n{_cuerpo(azar, profundidad)}\nfin_mientras"
+    if opcion == 7:
+        return (f"para i desde {_expresion(azar)} hasta {_expresion(azar)} con_paso 2 hacer\n"
+                f"{_cuerpo(azar, profundidad)}\nfin_para")
+    return f"repetir\n{_cuerpo(azar, profundidad)}\nhasta_que ({_expresion(azar)});"
+
+
+def programa_aleatorio(azar):
+    """Programa sintácticamente plausible (puede tener operadores no asociativos encadenados)."""
+    return "inicio\n" + _sentencias(azar, 0, azar.randint(0, 6)) + "\nfin\n"
+
+
+def mutar(azar, codigo):
+    """Borra, inserta o cambia uno o dos tokens de `codigo`."""
+    for simbolo in "(),;":
+        codigo = codigo.replace(simbolo, f" {simbolo} ")
+    partes = codigo.split()
+    for _ in range(azar.choice((1, 1, 1, 2))):
+        i = azar.randrange(len(partes) + 1)
+        opcion = azar.random()
+        if opcion < 0.4 and partes:
+            del partes[min(i, len(partes) - 1)]
+        elif opcion < 0.7:
+            partes.insert(i, azar.choice(_TOKENS_MUTACION))
+        elif partes:
+            partes[min(i, len(partes) - 1)] = azar.choice(_TOKENS_MUTACION)
+    return " ".join(partes)
+
+
+def _al_agotarse(numero, marco):
+    raise _TiempoAgotado()
+
+
+def analizar(backend, codigo, limite=None, buffer=False):
+    """(AST, diagnósticos, nombre de la excepción o None) de analizar `codigo` con `backend`.
+
+    Con `buffer` los tokens se leen de un TokenBuffer (`parse_buffer`) en
+    lugar de pedírselos al lexer de PLY.
+    """
+    inicio_errores = len(global_errors)
+    ast = excepcion = None
+    if limite:
+        anterior = signal.signal(signal.SIGALRM, _al_agotarse)
+        signal.setitimer(signal.ITIMER_REAL, limite)
+    try:
+        with silencio():
+            if buffer:
+                ast = parse_buffer(codigo, backend=backend)
+            else:
+                ast = crear_parser(backend).parse(codigo, lexer=crear_lexer(), tracking=True)
+    except _TiempoAgotado:
+        excepcion = "tiempo agotado"
+    except Exception as e:
+        excepcion = type(e).__name__
+    finally:
+        if limite:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, anterior)
+    errores = global_errors[inicio_errores:]
+    del global_errors[inicio_errores:]
+    return ast, errores, excepcion
+
+
+def comparar(codigo, distintas=None):
+    """Descripción de la diferencia entre ambos backends para `codigo`, o None si coinciden.
+
+    Si coincide el primer diagnóstico pero no la lista completa, agrega
+    `codigo` a `distintas`.
+    """
+    # Sin temporizador (Windows) solo se comparan programas que PLY siempre termina
+    limite = LIMITE_PLY if hasattr(signal, "setitimer") else None
+    ast_ply, errores_ply, excepcion_ply = analizar("ply", codigo, limite)
+    ast_pratt, errores_pratt, excepcion_pratt = analizar("pratt", codigo)
+    if excepcion_pratt:
+        return f"el parser Pratt lanzó {excepcion_pratt}"
+    if excepcion_ply:
+        return None
+    if not errores_ply:
+        if errores_pratt:
+            return f"el parser Pratt reporta errores en un programa válido: {errores_pratt[0]}"
+        if not iguales(ast_ply, ast_pratt):
+            return "los ASTs son distintos"
+        return None
+    if not errores_pratt:
+        return f"el parser Pratt no reporta el error: {errores_ply[0]}"
+    if errores_ply[0] != errores_pratt[0]:
+        return f"primer diagnóstico distinto: PLY {errores_ply[0]} / Pratt {errores_pratt[0]}"
+    if errores_ply != errores_pratt and distintas is not None:
+        distintas.append(codigo)
+    for backend in ("ply", "pratt"):
+        _, errores_buffer, excepcion = analizar(backend, codigo, limite if backend == "ply" else None, buffer=True)
+        if excepcion is None and errores_buffer[:1] != errores_ply[:1]:
+            primero = errores_buffer[0] if errores_buffer else None
+            return f"primer diagnóstico distinto con TokenBuffer ({backend}): {primero} / PLY {errores_ply[0]}"
+    return None
+
+
+def verificar(aleatorios=ALEATORIOS, semilla=0, distintas=None):
+    """Compara el corpus fijo y `aleatorios` programas generados; devuelve la lista de fallos.
+
+    Agrega a `distintas` los casos con el mismo primer diagnóstico y distinta lista completa.
+    """
+    azar = random.Random(semilla)
+    casos = list(CORPUS) + list(programas_profundos())
+    for i in range(aleatorios):
+        codigo = programa_aleatorio(azar)
+        casos.append(mutar(azar, codigo) if i % 2 else codigo)
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limite, 5_000))  # `iguales` no recursa, pero los `repr` de los fallos sí
+    try:
+        return [(codigo, diferencia) for codigo in casos
+                if (diferencia := comparar(codigo, distintas)) is not None]
+    finally:
+        sys.setrecursionlimit(limite)
+
+
+def medir(sentencias=SENTENCIAS):
+    """Imprime µs por sentencia de cada backend, con lexer y solo parser (tokens en un TokenBuffer)."""
+    for nombre, generar in (("plano", programa_plano), ("anidado", programa_anidado)):
+        codigo = generar(sentencias)
+        buffer = TokenBuffer.desde_codigo(codigo)
+        print(f"{nombre} ({sentencias} sentencias)")
+        tiempos = {}
+        for backend in ("ply", "pratt"):
+            analizador = crear_parser(backend)
+            with silencio():
+                con_lexer = mejor(lambda: analizador.parse(codigo, lexer=crear_lexer(), tracking=True))
+                solo_parser = mejor(lambda: parse_buffer(buffer, backend=backend))
+            tiempos[backend] = solo_parser
+            print(f"  {backend:6} con lexer {con_lexer / sentencias * 1e6:6.2f} µs/sentencia"
+                  f"  solo parser {solo_parser / sentencias * 1e6:6.2f} µs/sentencia")
+        print(f"  Pratt x{tiempos['ply'] / tiempos['pratt']:.1f} más rápido sin contar el lexer")
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--aleatorios", type=int, default=ALEATORIOS, help="programas generados a comparar")
+    argumentos.add_argument("--semilla", type=int, default=0, help="semilla del generador")
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS,
+                            help="sentencias de cada programa medido (0 = no medir)")
+    opciones = argumentos.parse_args(argv)
+
+    inicio_errores = len(global_errors)
+    distintas = []
+    fallos = verificar(opciones.aleatorios, opciones.semilla, distintas)
+    del global_errors[inicio_errores:]
+    total = len(CORPUS) + len(programas_profundos()) + opciones.aleatorios
+    if fallos:
+        print(f"❌ {len(fallos)} de {total} casos no coinciden")
+        for codigo, diferencia in fallos[:10]:
+            print(f"  {codigo!r}\n    {diferencia}")
+        return 1
+    print(f"✅ {total} casos coinciden")
+    print(f"  {len(distintas)} con otros diagnósticos después del primero (recuperación distinta de la de PLY)")
+    if opciones.sentencias:
+        medir(opciones.sentencias)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
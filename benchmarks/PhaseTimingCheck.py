@@ -0,0 +1,127 @@
+# benchmarks/PhaseTimingCheck.py
+"""Comprueba que el análisis semántico corre una sola vez por compilación y mide cada fase.
+
+Uso: `python -m benchmarks.PhaseTimingCheck [--sentencias 2000]`
+
+Mide por separado, sobre un programa generado, el léxico (solo tokenizar),
+el léxico y sintáctico (construir el AST) y el semántico, contando las
+llamadas a `SemanticAnalyzer.analyze`: construir el AST no debe hacer
+ninguna. Después compila el mismo programa con CompilerController (con
+paneles que no muestran nada), imprime sus `phase_timings` y exige una sola
+llamada a `analyze`. Por último compila un programa con una variable no
+declarada, que debe dar un único diagnóstico. Termina con código 1 si algo
+de esto falla.
+"""
+import contextlib
+import sys
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.Lexer import crear_lexer
+from SyntaxAnalyzer.Parser import crear_parser, parse_buffer
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from UI.CompilerController import CompilerController
+from benchmarks.Common import linea_de_comandos, mejor, programa_variado, silencio
+
+# CompilerController también optimiza el TAC, que crece más rápido que lineal con el programa
+SENTENCIAS = 2_000
+
+# Una asignación a una variable no declarada: un solo diagnóstico, aunque el programa pase por todas las fases
+NO_DECLARADA = "inicio\nentero x = 1;\ny = x + 1;\nmostrar x;\nfin\n"
+
+
+class _Panel:
+    """Editor, panel de errores o consola que no muestra nada (CompilerController sin interfaz)."""
+
+    def __init__(self, codigo=""):
+        self.codigo = codigo
+
+    def get_code(self):
+        return self.codigo
+
+    def __getattr__(self, nombre):
+        return lambda *argumentos, **opciones: None
+
+
+@contextlib.contextmanager
+def contando_analisis():
+    """Contexto que cuenta las llamadas a `SemanticAnalyzer.analyze`; produce una lista con la cuenta."""
+    original = SemanticAnalyzer.analyze
+    cuenta = [0]
+
+    def analyze(self, ast):
+        cuenta[0] += 1
+        return original(self, ast)
+
+    SemanticAnalyzer.analyze = analyze
+    try:
+        yield cuenta
+    finally:
+        SemanticAnalyzer.analyze = original
+
+
+def _tokenizar(codigo):
+    lx = crear_lexer()
+    lx.input(codigo)
+    while lx.token() is not None:
+        pass
+
+
+def _construir(codigo):
+    return crear_parser().parse(codigo, lexer=crear_lexer(), tracking=True)
+
+
+def compilar(codigo):
+    """(phase_timings, llamadas a `analyze`, errores) de compilar `codigo` con CompilerController."""
+    controlador = CompilerController(_Panel(codigo), _Panel(), _Panel())
+    with silencio(), contando_analisis() as cuenta:
+        controlador.analyze_code()
+    errores = list(global_errors)
+    global_errors.clear()
+    return controlador.phase_timings, cuenta[0], errores
+
+
+def ejecutar(sentencias=SENTENCIAS):
+    """Imprime los tiempos por fase y devuelve True si el semántico corre exactamente una vez."""
+    codigo = programa_variado(sentencias)
+    correcto = True
+    with silencio():
+        parse_buffer("inicio\nfin\n")  # Tablas cargadas antes de medir
+        with contando_analisis() as cuenta:
+            lexico = mejor(_tokenizar, codigo)
+            sintactico = mejor(_construir, codigo)
+            ast = _construir(codigo)
+        semantico = mejor(lambda: SemanticAnalyzer().analyze(ast))
+    global_errors.clear()
+    print(f"{sentencias} sentencias, cada fase por separado")
+    print(f"  léxico {lexico * 1000:8.1f} ms  léxico y sintáctico {sintactico * 1000:8.1f} ms"
+          f"  semántico {semantico * 1000:8.1f} ms")
+    if cuenta[0]:
+        print(f"❌ Construir el AST llamó {cuenta[0]} veces a SemanticAnalyzer.analyze")
+        correcto = False
+
+    tiempos, llamadas, errores = compilar(codigo)
+    print("  CompilerController  " + ", ".join(f"{fase} {segundos * 1000:.1f} ms" for fase, segundos in tiempos.items()))
+    if errores:
+        print(f"❌ El programa generado tiene errores: {errores[0]}")
+        correcto = False
+    if llamadas != 1:
+        print(f"❌ Una compilación llamó {llamadas} veces a SemanticAnalyzer.analyze")
+        correcto = False
+
+    _, llamadas, errores = compilar(NO_DECLARADA)
+    if llamadas != 1 or len(errores) != 1:
+        print(f"❌ Una variable no declarada dio {len(errores)} diagnósticos en {llamadas} análisis semánticos")
+        correcto = False
+    if correcto:
+        print("✅ El análisis semántico corre una sola vez por compilación")
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--sentencias", type=int, default=SENTENCIAS, help="sentencias del programa generado")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.sentencias) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
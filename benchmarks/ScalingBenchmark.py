@@ -0,0 +1,53 @@
+# benchmarks/ScalingBenchmark.py
+"""Mide cómo crece el tiempo del parser con el tamaño del programa.
+
+Uso: `python -m benchmarks.ScalingBenchmark [--max 1000000]`
+
+Analiza programas generados de 10k, 100k y 1M sentencias, planos (un solo
+bloque) y anidados (bloques `si` de profundidad acotada), y termina con
+código 1 si el tiempo por sentencia crece claramente entre un tamaño y el
+siguiente (crecimiento superlineal).
+"""
+import sys
+from SyntaxAnalyzer.Parser import parse_buffer
+from benchmarks.Common import analizar_generado, linea_de_comandos, mejor, programa_anidado, programa_plano
+
+TAMANOS = (10_000, 100_000, 1_000_000)
+
+# Cuánto puede crecer el tiempo por sentencia al multiplicar el tamaño por 10
+MAX_CRECIMIENTO = 3.0
+
+
+def medir(codigo):
+    """Segundos que tarda `parse_buffer` en analizar `codigo` (mejor de 2 si es corto)."""
+    return mejor(analizar_generado, codigo, repeticiones=2 if len(codigo) < 1 << 20 else 1)
+
+
+def ejecutar(tamanos=TAMANOS, max_crecimiento=MAX_CRECIMIENTO):
+    """Imprime los tiempos y devuelve True si ningún caso crece de forma superlineal."""
+    parse_buffer("inicio\nfin\n")  # Tablas cargadas antes de medir
+    correcto = True
+    for nombre, generar in (("plano", programa_plano), ("anidado", programa_anidado)):
+        anterior = None
+        for n in tamanos:
+            segundos = medir(generar(n))
+            por_sentencia = segundos / n * 1e6
+            print(f"{nombre:8} {n:>9} sentencias  {segundos:8.2f} s  {por_sentencia:6.2f} µs/sentencia")
+            if anterior is not None and por_sentencia > anterior * max_crecimiento:
+                print(f"  ❌ El tiempo por sentencia creció x{por_sentencia / anterior:.1f}")
+                correcto = False
+            anterior = por_sentencia
+    return correcto
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--max", type=int, default=TAMANOS[-1],
+                            help="tamaño más grande a medir (sentencias)")
+    opciones = argumentos.parse_args(argv)
+    tamanos = [n for n in TAMANOS if n <= opciones.max]
+    return 0 if ejecutar(tamanos) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+# benchmarks/TypeRulesBenchmark.py
+"""Mide el chequeo de tipos de las operaciones binarias con las tablas de TypeRules.
+
+Uso: `python -m benchmarks.TypeRulesBenchmark [--operaciones 1000000]`
+
+Genera un programa con alrededor de `--operaciones` operaciones binarias
+(aritméticas, comparaciones y algunas con tipos inválidos) y lo analiza con
+el SemanticAnalyzer actual y con una copia de la versión anterior, que
+armaba un diccionario de validadores por nodo y elegía con `if`. Mide la
+decisión de tipos sola (sobre los mismos operandos ya tipados) y el
+análisis completo. Termina con código 1 si los diagnósticos no coinciden.
+"""
+import sys
+import time
+from GlobalErrors.ErrorsManager import global_errors
+from SyntaxAnalyzer import AST
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from benchmarks.Common import REPETICIONES, analizar_generado, linea_de_comandos, silencio
+
+OPERACIONES = 1_000_000
+
+_DECLARACIONES = (
+    [f"entero e{i} = {i + 1};" for i in range(6)]
+    + [f"decimal d{i} = {i}.5;" for i in range(6)]
+    + ["cadena c0 = \"x\";"]
+)
+# (sentencia, operaciones binarias que contiene)
+_SENTENCIAS = (
+    ("e{k} = e1 + e2 * e3 - e4 % e5 + e1 * e2 - e3 + e4 * e5 - e1;", 10),
+    ("d{k} = d1 * e2 + d3 / e4 - d1 * d2 + e3 - d4 / d5 + e1 - d0;", 10),
+    ("si ((e1 + e2 > e3 * 2) == (e3 % e4 != e5 - 1)) entonces\nmostrar d1 + d2 * e{k};\nfin_si", 9),
+    ("mostrar c0 + e{k}, d{k} % e1, e1 * e2 - d3;", 4),
+)
+
+
+def programa_operaciones(operaciones):
+    """Programa con al menos `operaciones` operaciones binarias; algunas son errores de tipos."""
+    lineas = ["inicio", *_DECLARACIONES]
+    hechas = i = 0
+    while hechas < operaciones:
+        plantilla, cantidad = _SENTENCIAS[i % len(_SENTENCIAS)]
+        lineas.append(plantilla.format(k=i % 6))
+        hechas += cantidad
+        i += 1
+    lineas.append("fin")
+    return "\n".join(lineas) + "\n"
+
+
+class _AnalizadorAnterior(SemanticAnalyzer):
+    """SemanticAnalyzer con el chequeo de operaciones binarias de antes de TypeRules."""
+
+    def _validar_binario(self, node, left_type, right_type):
+        OPERACIONES = {
+            '+': self._validar_aritmetica, '-': self._validar_aritmetica, '*': self._validar_aritmetica,
+            '/': self._validar_aritmetica, '%': self._validar_aritmetica,
+            'AND': self._validar_logica, 'OR': self._validar_logica,
+            '>': self._validar_comparacion, '<': self._validar_comparacion, '>=': self._validar_comparacion,
+            '<=': self._validar_comparacion, '==': self._validar_comparacion, '!=': self._validar_comparacion
+        }
+        validacion = OPERACIONES.get(node.operador)
+        if validacion is None:
+            self._add_error(f"Operador '{node.operador}' no reconocido", self._linea)
+            return None
+        return validacion(node, left_type, right_type)
+
+    def _validar_aritmetica(self, node, left_type, right_type):
+        if node.operador == '%':
+            if left_type != 'entero' or right_type != 'entero':
+                self._add_error(f"El operador '%' solo acepta operandos enteros", self._linea)
+                return None
+            return 'entero'
+        if left_type not in ['entero', 'decimal'] or right_type not in ['entero', 'decimal']:
+            self._add_error(f"Operación '{node.operador}' no válida para tipos '{left_type}' y '{right_type}'", self._linea)
+            return None
+        if node.operador == '/' and isinstance(node.derecha, AST.NodoLiteral) and node.derecha.valor == 0:
+            self._add_error("División entre cero detectada", self._linea)
+        return 'decimal' if 'decimal' in [left_type, right_type] else 'entero'
+
+    def _validar_logica(self, node, left_type, right_type):
+        if left_type != 'booleano' or right_type != 'booleano':
+            self._add_error(f"Operación '{node.operador}' requiere operandos booleanos", self._linea)
+            return None
+        return 'booleano'
+
+    def _validar_comparacion(self, node, left_type, right_type):
+        if left_type != right_type:
+            self._add_error(f"Tipos incompatibles en comparación '{node.operador}': {left_type} y {right_type}", self._linea)
+            return None
+        return 'booleano'
+
+    def _check_type_compatibility(self, expected_type, actual_type, context):
+        valid_combinations = {
+            "entero": ["entero"],
+            "decimal": ["entero", "decimal"],
+            "cadena": ["cadena"],
+            "booleano": ["booleano"],
+            "constante": ["entero", "decimal", "cadena", "booleano"],
+        }
+        return expected_type in valid_combinations and actual_type in valid_combinations[expected_type]
+
+
+def _analizar(clase, ast):
+    """(mejor tiempo de `clase().analyze(ast)`, diagnósticos, analizador)."""
+    tiempos = []
+    for _ in range(REPETICIONES):
+        analizador = clase()
+        inicio_errores = len(global_errors)
+        with silencio():
+            inicio = time.perf_counter()
+            analizador.analyze(ast)
+            tiempos.append(time.perf_counter() - inicio)
+        diagnosticos = global_errors[inicio_errores:]
+        del global_errors[inicio_errores:]
+    return min(tiempos), diagnosticos, analizador
+
+
+def _operandos(ast, analizador):
+    """(nodo, tipo izquierdo, tipo derecho) de cada NodoBinario con operandos tipados, tras analizar."""
+    simbolos = analizador.tabla.simbolos
+    # El memo es por (`id`, versión de la tabla): queda el tipo de la última versión
+    tipos = {nodo: tipo for (nodo, _), (tipo, _) in analizador._memo.items()}
+    slots = analizador.slots
+
+    def tipo(nodo):
+        if isinstance(nodo, AST.NodoBinario):
+            return tipos[id(nodo)]
+        if isinstance(nodo, AST.NodoIdentificador):
+            return simbolos[slots[id(nodo)]].tipo
+        return nodo.tipo
+
+    operandos = ((nodo, tipo(nodo.izquierda), tipo(nodo.derecha)) for nodo in AST.preorden(ast)
+                 if isinstance(nodo, AST.NodoBinario))
+    return [(nodo, izquierdo, derecho) for nodo, izquierdo, derecho in operandos
+            if izquierdo is not None and derecho is not None]
+
+
+def _decision_por_operacion(decidir, operandos):
+    """Nanosegundos por operación de `decidir(nodo, izquierdo, derecho)` (el mejor de REPETICIONES)."""
+    tiempos = []
+    for _ in range(REPETICIONES):
+        inicio_errores = len(global_errors)
+        inicio = time.perf_counter()
+        for nodo, izquierdo, derecho in operandos:
+            decidir(nodo, izquierdo, derecho)
+        tiempos.append(time.perf_counter() - inicio)
+        del global_errors[inicio_errores:]
+    return min(tiempos) / len(operandos) * 1e9
+
+
+def ejecutar(operaciones=OPERACIONES):
+    """Imprime la comparación y devuelve True si ambas versiones dan los mismos diagnósticos."""
+    ast = analizar_generado(programa_operaciones(operaciones), backend="pratt")
+
+    anterior, diagnosticos_anterior, analizador_anterior = _analizar(_AnalizadorAnterior, ast)
+    actual, diagnosticos_actual, analizador = _analizar(SemanticAnalyzer, ast)
+    operandos = _operandos(ast, analizador)
+
+    decision_anterior = _decision_por_operacion(analizador_anterior._validar_binario, operandos)
+    decision_actual = _decision_por_operacion(analizador._validar_binario, operandos)
+
+    print(f"{len(operandos)} operaciones binarias con operandos tipados, {len(diagnosticos_actual)} diagnósticos")
+    print(f"  decisión de tipos  antes {decision_anterior:6.0f} ns/op  tabla {decision_actual:6.0f} ns/op"
+          f"  (x{decision_anterior / max(decision_actual, 1e-9):.1f})")
+    print(f"  análisis completo  antes {anterior:6.2f} s      tabla {actual:6.2f} s"
+          f"  (x{anterior / max(actual, 1e-9):.2f})")
+    if diagnosticos_anterior != diagnosticos_actual:
+        print("❌ Los diagnósticos no coinciden con los de la versión anterior")
+        return False
+    return True
+
+
+def main(argv=None):
+    argumentos = linea_de_comandos(__doc__)
+    argumentos.add_argument("--operaciones", type=int, default=OPERACIONES,
+                            help="operaciones binarias del programa generado")
+    opciones = argumentos.parse_args(argv)
+    return 0 if ejecutar(opciones.operaciones) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
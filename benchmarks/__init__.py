@@ -0,0 +1 @@
+"""Benchmarks y comprobaciones del compilador (`python -m benchmarks.<Modulo>`); no se instalan con el paquete."""
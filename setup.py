@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
     name="pseint_compiler",
     version="0.1",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks", "benchmarks.*")),
     package_dir={'': '.'},
     install_requires=[
         'ply>=3.11',
@@ -0,0 +1,18 @@
+# tests/conftest.py
+"""Configuración común de las pruebas: `python -m pytest` desde la raíz del repositorio."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GlobalErrors.ErrorsManager import global_errors  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def diagnosticos_limpios():
+    """Cada prueba empieza y termina con `global_errors` vacío y sin topes."""
+    global_errors.reiniciar()
+    yield global_errors
+    global_errors.reiniciar()
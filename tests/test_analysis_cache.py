@@ -0,0 +1,86 @@
+# tests/test_analysis_cache.py
+"""AnalysisCache: LRU de análisis completos y su uso en CompilerController."""
+from GlobalErrors.ErrorsManager import global_errors
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from UI.AnalysisCache import AnalysisCache
+from UI.CompilerController import CompilerController
+
+PROGRAMA = "inicio\nentero x = 2;\nmostrar x * 3;\nfin\n"
+CON_ERRORES = "inicio\nx = 1;\nmostrar y;\nfin\n"
+
+
+class _Panel:
+    """Editor, panel de errores o consola sin interfaz."""
+
+    def __init__(self, codigo=""):
+        self.codigo = codigo
+
+    def get_code(self):
+        return self.codigo
+
+    def __getattr__(self, nombre):
+        return lambda *argumentos, **opciones: None
+
+
+def test_clave_depende_del_codigo_y_las_opciones():
+    cache = AnalysisCache()
+    clave = cache.key(PROGRAMA, ("ply",))
+    assert clave == cache.key(PROGRAMA, ("ply",))
+    assert clave != cache.key(PROGRAMA, ("dfa",))
+    assert clave != cache.key(PROGRAMA + " ", ("ply",))
+
+
+def test_acierto_fallo_y_copias_de_errores():
+    cache = AnalysisCache()
+    errores = [{"tipo": "semántico", "linea": 2, "mensaje": "m"}]
+    assert cache.get("a") is None
+    cache.put("a", "print(1)", errores)
+    errores[0]["linea"] = 99
+    resultado = cache.get("a")
+    assert resultado.python_code == "print(1)"
+    assert resultado.errors == [{"tipo": "semántico", "linea": 2, "mensaje": "m"}]
+    resultado.errors[0]["mensaje"] = "otro"
+    assert cache.get("a").errors[0]["mensaje"] == "m"
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_desaloja_la_usada_hace_mas_tiempo():
+    cache = AnalysisCache(max_entries=2)
+    cache.put("a", "a", [])
+    cache.put("b", "b", [])
+    cache.get("a")
+    cache.put("c", "c", [])
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.evictions == 1 and len(cache) == 2
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def _compilar(controlador, codigo, monkeypatch):
+    """Errores y cantidad de análisis semánticos de una compilación con `controlador`."""
+    llamadas = []
+    original = SemanticAnalyzer.analyze
+    monkeypatch.setattr(SemanticAnalyzer, "analyze", lambda self, ast: llamadas.append(1) or original(self, ast))
+    controlador.code_editor.codigo = codigo
+    controlador.analyze_code()
+    monkeypatch.setattr(SemanticAnalyzer, "analyze", original)
+    return list(global_errors), len(llamadas)
+
+
+def test_controlador_reutiliza_el_analisis(monkeypatch, capsys):
+    controlador = CompilerController(_Panel(), _Panel(), _Panel())
+    for codigo, con_errores in ((PROGRAMA, False), (CON_ERRORES, True)):
+        errores, analisis = _compilar(controlador, codigo, monkeypatch)
+        assert analisis == 1 and bool(errores) == con_errores
+        assert _compilar(controlador, codigo, monkeypatch) == (errores, 0)
+    assert controlador.analysis_cache.hits == 2
+    assert "♻️" in capsys.readouterr().out
+
+
+def test_configure_invalida(monkeypatch):
+    controlador = CompilerController(_Panel(), _Panel(), _Panel())
+    _compilar(controlador, PROGRAMA, monkeypatch)
+    controlador.configure(lexer_backend="dfa")
+    assert len(controlador.analysis_cache) == 0
+    assert _compilar(controlador, PROGRAMA, monkeypatch)[1] == 1
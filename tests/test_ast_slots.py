@@ -0,0 +1,155 @@
+# tests/test_ast_slots.py
+"""Nodos del AST con `__slots__`, nombres internados y valores de literales compartidos."""
+import sys
+
+import pytest
+
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.Parser import parse_buffer
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from benchmarks.Common import iguales
+
+PROGRAMA = (
+    "inicio\n"
+    "entero contador = 123456789;\n"
+    "decimal precio = 2.5;\n"
+    "cadena saludo = \"hola\";\n"
+    "booleano listo = verdadero;\n"
+    "constante LIMITE = 10;\n"
+    "si (contador > LIMITE) entonces\n"
+    "mostrar saludo, -precio;\n"
+    "sino\n"
+    "listo = not listo;\n"
+    "fin_si\n"
+    "mientras (contador < 3) hacer\n"
+    "contador = contador + 1;\n"
+    "fin_mientras\n"
+    "repetir\n"
+    "contador = contador - 1;\n"
+    "hasta_que (contador <= 0);\n"
+    "para i desde 1 hasta 5 con_paso 1 hacer\n"
+    "mostrar i;\n"
+    "fin_para\n"
+    "fin\n"
+)
+
+
+def _clases_de_nodo():
+    pendientes, clases = [AST.Nodo], []
+    while pendientes:
+        clase = pendientes.pop()
+        clases.append(clase)
+        pendientes.extend(clase.__subclasses__())
+    return clases
+
+
+def _nombre(*partes):
+    # Armado en tiempo de ejecución: un literal del test ya estaría internado
+    return "".join(partes)
+
+
+@pytest.mark.parametrize("clase", [c for c in _clases_de_nodo() if c.__module__ == AST.__name__],
+                         ids=lambda clase: clase.__name__)
+def test_cada_clase_declara_sus_slots(clase):
+    assert "__slots__" in clase.__dict__
+    assert "__dict__" not in dir(clase)
+    assert set(clase._campos) == {nombre for base in clase.__mro__
+                                  for nombre in base.__dict__.get("__slots__", ())}
+
+
+def test_los_nodos_del_parser_no_tienen_dict(capsys):
+    ast = parse_buffer(PROGRAMA)
+    tipos = set()
+    for nodo in AST.preorden(ast):
+        tipos.add(type(nodo))
+        assert not hasattr(nodo, "__dict__")
+        with pytest.raises(AttributeError):
+            nodo.atributo_inventado = 1
+    assert {AST.NodoPrograma, AST.NodoIf, AST.NodoMientras, AST.NodoRepetir, AST.NodoPara,
+            AST.NodoMostrar, AST.NodoDeclaracion, AST.NodoAsignacion, AST.NodoIdentificador,
+            AST.NodoLiteral, AST.NodoBinario, AST.NodoUnario} <= tipos
+
+
+def test_campos_omite_los_slots_sin_asignar():
+    nodo = AST.NodoLiteral.__new__(AST.NodoLiteral)
+    assert nodo.campos() == []
+    nodo.linea = 4
+    nodo.valor = 7
+    assert nodo.campos() == [("linea", 4), ("valor", 7)]
+
+
+def test_nombres_internados():
+    primero = AST.NodoIdentificador(_nombre("cont", "ador"), 1)
+    segundo = AST.NodoIdentificador(_nombre("conta", "dor"), 2)
+    assert primero.nombre is segundo.nombre
+    declaracion = AST.NodoDeclaracion(_nombre("ent", "ero"), primero, None, 1)
+    assert declaracion.tipo is sys.intern("entero")
+    binario = AST.NodoBinario(_nombre("=", "="), primero, segundo, 1)
+    unario = AST.NodoUnario(_nombre("NO", "T"), primero, 1)
+    assert binario.operador is sys.intern("==")
+    assert unario.operador is sys.intern("NOT")
+
+
+def test_nombres_internados_entre_analisis(capsys):
+    def identificadores(ast):
+        return {nodo.nombre: nodo.nombre for nodo in AST.preorden(ast)
+                if isinstance(nodo, AST.NodoIdentificador)}
+
+    primero = identificadores(parse_buffer(PROGRAMA))
+    segundo = identificadores(parse_buffer(PROGRAMA.replace("inicio", "inicio ")))
+    assert primero.keys() == segundo.keys()
+    assert all(primero[nombre] is segundo[nombre] for nombre in primero)
+
+
+def test_compartir_literal_por_tipo_y_valor():
+    grande = int(_nombre("98765", "43210"))
+    assert AST.compartir_literal(grande) is AST.compartir_literal(int(_nombre("9876543", "210")))
+    texto = AST.compartir_literal(_nombre("ho", "la mundo"))
+    assert AST.compartir_literal(_nombre("hola", " mundo")) is texto
+    # 1, 1.0 y True son iguales para Python pero no son el mismo literal
+    assert type(AST.compartir_literal(1.0)) is float
+    assert AST.compartir_literal(True) is True
+    assert type(AST.compartir_literal(1)) is int
+
+
+def test_literales_de_dos_analisis_comparten_el_valor(capsys):
+    def valores(ast):
+        return [nodo.valor for nodo in AST.preorden(ast) if isinstance(nodo, AST.NodoLiteral)]
+
+    primero = valores(parse_buffer(PROGRAMA))
+    segundo = valores(parse_buffer(PROGRAMA))
+    assert 123456789 in primero and "hola" in primero
+    assert len(primero) == len(segundo)
+    assert all(a is b for a, b in zip(primero, segundo))
+    # Los nodos no se comparten: cada uno tiene su línea
+    literales = [nodo for nodo in AST.preorden(parse_buffer(PROGRAMA))
+                 if isinstance(nodo, AST.NodoLiteral)]
+    assert len({id(nodo) for nodo in literales}) == len(literales)
+
+
+def test_tope_de_literales_compartidos(monkeypatch):
+    monkeypatch.setattr(AST, "_LITERALES", {})
+    monkeypatch.setattr(AST, "MAX_LITERALES_COMPARTIDOS", 4)
+    for valor in range(4):
+        AST.compartir_literal(valor + 1000)
+    assert len(AST._LITERALES) == 4
+    AST.compartir_literal(2000)
+    assert len(AST._LITERALES) == 1
+
+
+def test_el_analisis_semantico_anota_fuera_de_los_nodos(capsys):
+    ast = parse_buffer(PROGRAMA)
+    referencia = parse_buffer(PROGRAMA)
+    analizador = SemanticAnalyzer()
+    analizador.analyze(ast)
+    # La constante toma el tipo de su expresión; el resto del árbol queda igual
+    for nodo in AST.preorden(referencia):
+        if isinstance(nodo, AST.NodoDeclaracion) and nodo.es_constante:
+            nodo.tipo = "entero"
+    assert iguales(ast, referencia)
+    identificadores = {id(nodo): nodo for nodo in AST.preorden(ast)
+                       if isinstance(nodo, AST.NodoIdentificador)}
+    assert analizador.slots
+    assert set(analizador.slots) <= set(identificadores)
+    for clave, slot in analizador.slots.items():
+        assert analizador.tabla.simbolos[slot].nombre == identificadores[clave].nombre
@@ -0,0 +1,112 @@
+# tests/test_binary_ast.py
+"""BinaryAST: codificar y decodificar da el mismo árbol, con los nodos compartidos todavía compartidos."""
+import random
+
+import pytest
+
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.BinaryAST import MAGIA, FormatoASTInvalido, codificar_ast, decodificar_ast
+from SyntaxAnalyzer.Parser import parse_buffer
+from benchmarks.Common import iguales, programa_variado
+from benchmarks.ParserComparison import CORPUS, programa_aleatorio
+
+
+def _ida_y_vuelta(valor):
+    return decodificar_ast(codificar_ast(valor))
+
+
+def _distintos(ast):
+    return len({id(nodo) for nodo in AST.preorden(ast)})
+
+
+@pytest.mark.parametrize("codigo", CORPUS[:12])
+def test_programas_del_corpus(codigo, capsys):
+    ast = parse_buffer(codigo)
+    assert iguales(_ida_y_vuelta(ast), ast)
+
+
+def test_programas_aleatorios(capsys):
+    azar = random.Random(7)
+    for _ in range(100):
+        try:
+            ast = parse_buffer(programa_aleatorio(azar))
+        except (NameError, TypeError):
+            continue  # La recuperación de errores de PLY falla en algunos programas inválidos
+        if ast is not None:
+            assert iguales(_ida_y_vuelta(ast), ast)
+
+
+def test_lineas_y_atributos_opcionales():
+    ast = parse_buffer("inicio\nentero i;\nrepetir\ni = i + 1;\nhasta_que (i >= 3);\n"
+                       "si (i > 1) entonces\nsino\nfin_si\nfin\n")
+    copia = _ida_y_vuelta(ast)
+    repetir, si = copia.declaraciones[1], copia.declaraciones[2]
+    assert (repetir.linea, repetir.linea_condicion) == (3, 5)
+    assert si.tiene_sino and si.cuerpo_else == ast.declaraciones[2].cuerpo_else
+    assert [n.linea for n in AST.preorden(copia)] == [n.linea for n in AST.preorden(ast)]
+
+
+@pytest.mark.parametrize("valor", [
+    0, 1, -1, (1 << 32) - 1, 1 << 32, -(1 << 40), 1 << 100, 2.5, -0.0, float("inf"),
+    "", "ñandú ∑ 𝔘", "\udcff", True, False, None,
+    [], (), {}, [1, [2, [3, ()]]], {"a": [1, "b"], 2: (None, 1.5)}, (True, False, None),
+])
+def test_valores_basicos(valor):
+    copia = _ida_y_vuelta(valor)
+    assert copia == valor and type(copia) is type(valor)
+
+
+def test_entrada_de_la_cache_front_end():
+    ast = parse_buffer(CORPUS[3])
+    entrada = {"tokens": [("TIPO", "entero", 2, 7)], "ast": ast,
+               "errores": [{"tipo": "léxico", "linea": 1, "mensaje": "m", "columna": 3}], "detenido": False}
+    copia = _ida_y_vuelta(entrada)
+    assert iguales(copia.pop("ast"), ast)
+    entrada.pop("ast")
+    assert copia == entrada
+
+
+def test_nodos_compartidos_siguen_compartidos():
+    ast = parse_buffer(programa_variado(300), compartir_expresiones=True)
+    copia = _ida_y_vuelta(ast)
+    assert iguales(copia, ast)
+    assert _distintos(copia) == _distintos(ast) < sum(1 for _ in AST.preorden(ast))
+
+
+def test_identidad_de_un_nodo_referenciado_dos_veces():
+    x = AST.NodoIdentificador("x", 2)
+    suma = AST.NodoBinario("+", x, x, 2)
+    programa = AST.NodoPrograma([AST.NodoMostrar([suma, suma, x], 2)], 1)
+    mostrar = _ida_y_vuelta(programa).declaraciones[0]
+    a, b, c = mostrar.expresiones
+    assert a is b and a.izquierda is a.derecha is c
+
+
+def test_arbol_profundo_sin_recursion():
+    nodo = AST.NodoLiteral("entero", 1, 1)
+    for _ in range(50_000):
+        nodo = AST.NodoUnario("-", nodo, 1)
+    copia = _ida_y_vuelta(nodo)
+    profundidad = 0
+    while isinstance(copia, AST.NodoUnario):
+        copia, profundidad = copia.expresion, profundidad + 1
+    assert profundidad == 50_000 and copia.valor == 1
+
+
+def test_bytes_deterministas():
+    ast = parse_buffer(programa_variado(100))
+    assert codificar_ast(ast) == codificar_ast(parse_buffer(programa_variado(100)))
+    assert codificar_ast(ast).startswith(MAGIA)
+
+
+@pytest.mark.parametrize("datos", [b"", b"PAST", MAGIA, b"XXXX\x04" + b"\0" * 20, MAGIA + b"\xff" * 40])
+def test_datos_invalidos(datos):
+    with pytest.raises(FormatoASTInvalido):
+        decodificar_ast(datos)
+
+
+def test_datos_truncados():
+    datos = codificar_ast(parse_buffer(CORPUS[5]))
+    for corte in range(len(MAGIA), len(datos), max(1, len(datos) // 50)):
+        with pytest.raises(FormatoASTInvalido):
+            decodificar_ast(datos[:corte])
@@ -0,0 +1,77 @@
+# tests/test_dfa_lexer.py
+"""El lexer DFA produce los mismos tokens y errores léxicos que el de PLY."""
+import random
+
+import pytest
+
+from GlobalErrors.ErrorsManager import global_errors
+from LexicalAnalyzer.DFALexer import DFALexer
+from LexicalAnalyzer.Lexer import crear_lexer
+from benchmarks.ParserComparison import CORPUS, mutar, programa_aleatorio
+
+# Casos de borde del léxico: prefijos de palabras reservadas, números, operadores y caracteres inválidos
+BORDES = (
+    "sino si fin_si fin sinox finales hasta hasta_que con_paso con",
+    "verdadero falso verdaderos Verdadero entero enteros CONSTANTE constante",
+    "12 12.5 12. .5 1.2.3 007 3.14159e10",
+    "a==b a=b a!=b a!b ! != <= >= < > <> =<",
+    "x//comentario\ny // otro \"con comillas\"\nz",
+    '"cadena" "sin cerrar\nmostrar "dos\nlíneas";',
+    "año ñandú _x x_1 ĉapelo 𝔘nicode",
+    "@#$ ?? ¿¡ ~` \\ | & ^ [ ] { }",
+    "\t\tentero\tx\t=\t1;\r\n",
+    "",
+)
+
+
+def _tokens(backend, codigo):
+    """(tokens, diagnósticos) de tokenizar `codigo` con `backend`."""
+    global_errors.reiniciar()
+    lx = crear_lexer(backend)
+    lx.input(codigo)
+    tokens = [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in iter(lx.token, None)]
+    return tokens, list(global_errors)
+
+
+@pytest.mark.parametrize("codigo", CORPUS + BORDES)
+def test_mismos_tokens_que_ply(codigo):
+    assert _tokens("dfa", codigo) == _tokens("ply", codigo)
+
+
+def test_mismos_tokens_en_programas_aleatorios():
+    azar = random.Random(2)
+    for _ in range(200):
+        programa = programa_aleatorio(azar)
+        for codigo in (programa, mutar(azar, programa)):
+            assert _tokens("dfa", codigo) == _tokens("ply", codigo), codigo
+
+
+@pytest.mark.parametrize("agrupar", [True, False])
+def test_mismos_errores_lexicos(agrupar):
+    codigo = "inicio\nentero x = 1 @@@ $;\nmostrar \"abc;\nfin\n"
+    resultados = []
+    for backend in ("ply", "dfa"):
+        global_errors.reiniciar()
+        lx = crear_lexer(backend, agrupar_errores=agrupar)
+        lx.input(codigo)
+        resultados.append(([tok.type for tok in iter(lx.token, None)], list(global_errors)))
+    assert resultados[0] == resultados[1]
+    assert resultados[0][1]
+
+
+def test_escanear_da_los_mismos_tramos():
+    codigo = CORPUS[4] + BORDES[0] + " 12 12.5 007"  # Sin caracteres inválidos: esos los reporta quien llama
+    lx = crear_lexer("ply")
+    lx.input(codigo)
+    esperado = [(tok.lexpos, tok.lineno) for tok in iter(lx.token, None)]
+    dfa = DFALexer()
+    dfa.input(codigo)
+    assert [(inicio, linea) for _, inicio, _, linea in dfa.escanear()] == esperado
+
+
+def test_clone_no_comparte_la_posicion():
+    dfa = DFALexer()
+    dfa.input("entero x = 1;")
+    dfa.token()
+    copia = dfa.clone()
+    assert copia.token().value == dfa.token().value == "x"
@@ -0,0 +1,154 @@
+# tests/test_diagnosticos.py
+"""Diagnosticos: repetidos, topes por fase, por tipo y total, y corte temprano del análisis."""
+import pytest
+
+from GlobalErrors.ErrorsManager import AnalisisDetenido, Diagnosticos, global_errors
+from SyntaxAnalyzer.Parser import parse_buffer
+
+
+def _llenar(diagnosticos, tipo, cantidad, desde=1):
+    for linea in range(desde, desde + cantidad):
+        diagnosticos.agregar(tipo, linea, "❌ error {}", linea)
+
+
+def test_se_lee_como_lista_de_diccionarios():
+    diagnosticos = Diagnosticos()
+    assert diagnosticos.agregar("léxico", 2, "❌ Carácter '{}'", "@", columna=7)
+    diagnosticos.append({"tipo": "semántico", "linea": 3, "mensaje": "❌ otro"})
+    assert len(diagnosticos) == 2 and diagnosticos
+    assert diagnosticos[0] == {"tipo": "léxico", "linea": 2, "mensaje": "❌ Carácter '@'", "columna": 7}
+    assert diagnosticos[1:] == [{"tipo": "semántico", "linea": 3, "mensaje": "❌ otro"}]
+    assert diagnosticos == list(diagnosticos)
+    assert diagnosticos.por_fase("léxico") == 1 and diagnosticos.por_fase("sintáctico") == 0
+
+
+def test_repetidos_con_plantilla_o_armados():
+    diagnosticos = Diagnosticos()
+    assert diagnosticos.agregar("semántico", 4, "❌ Variable '{}' no declarada", "x")
+    assert not diagnosticos.agregar("semántico", 4, "❌ Variable 'x' no declarada")
+    assert not diagnosticos.append({"tipo": "semántico", "linea": 4, "mensaje": "❌ Variable 'x' no declarada"})
+    # Otra línea u otra fase no es un repetido
+    assert diagnosticos.agregar("semántico", 5, "❌ Variable 'x' no declarada")
+    assert diagnosticos.agregar("sintáctico", 4, "❌ Variable 'x' no declarada")
+    assert len(diagnosticos) == 3
+    assert diagnosticos.descartados == 2
+
+
+def test_sin_deduplicar():
+    diagnosticos = Diagnosticos(deduplicar=False)
+    diagnosticos.agregar("léxico", 1, "❌ a")
+    diagnosticos.agregar("léxico", 1, "❌ a")
+    assert len(diagnosticos) == 2
+
+
+def test_tope_por_fase_detiene_y_descarta_lo_que_sigue():
+    diagnosticos = Diagnosticos(max_por_fase=3)
+    _llenar(diagnosticos, "léxico", 2)
+    with pytest.raises(AnalisisDetenido, match="límite de 3 errores de tipo 'léxico'"):
+        _llenar(diagnosticos, "léxico", 5, desde=3)
+    assert diagnosticos.detenido
+    assert [d["mensaje"] for d in diagnosticos] == [
+        "❌ error 1", "❌ error 2", "❌ error 3",
+        "⚠️ Se alcanzó el límite de 3 errores de tipo 'léxico'; el análisis se detiene"]
+    # Detenido, todo se descarta sin volver a lanzar (aunque sea de otra fase)
+    assert not diagnosticos.agregar("semántico", 9, "❌ tarde")
+    assert len(diagnosticos) == 4 and diagnosticos.descartados == 1
+    assert diagnosticos.por_fase("léxico") == 3  # El aviso no cuenta
+
+
+def test_tope_total():
+    diagnosticos = Diagnosticos(max_por_fase=10, max_total=4)
+    _llenar(diagnosticos, "léxico", 2)
+    _llenar(diagnosticos, "sintáctico", 1)
+    with pytest.raises(AnalisisDetenido, match="límite de 4 errores; el análisis se detiene"):
+        _llenar(diagnosticos, "semántico", 3)
+    assert len(diagnosticos) == 5
+    assert diagnosticos[-1]["tipo"] == "semántico"
+
+
+def test_max_por_tipo_reemplaza_al_tope_por_fase():
+    diagnosticos = Diagnosticos(max_por_fase=2, max_por_tipo={"léxico": 5, "semántico": None})
+    _llenar(diagnosticos, "semántico", 20)  # None: esa fase sin tope
+    _llenar(diagnosticos, "léxico", 4)
+    assert not diagnosticos.detenido
+    with pytest.raises(AnalisisDetenido, match="límite de 5 errores de tipo 'léxico'"):
+        _llenar(diagnosticos, "léxico", 1, desde=5)
+    otros = Diagnosticos(max_por_fase=2, max_por_tipo={"léxico": 5})
+    with pytest.raises(AnalisisDetenido, match="tipo 'sintáctico'"):
+        _llenar(otros, "sintáctico", 2)
+
+
+def test_reiniciar_fija_topes_y_vacia():
+    diagnosticos = Diagnosticos()
+    _llenar(diagnosticos, "léxico", 3)
+    diagnosticos.reiniciar(max_por_fase=1)
+    assert not diagnosticos and diagnosticos.descartados == 0
+    with pytest.raises(AnalisisDetenido):
+        _llenar(diagnosticos, "léxico", 1)
+    diagnosticos.reiniciar()
+    assert not diagnosticos.detenido
+    _llenar(diagnosticos, "léxico", 3)
+    assert len(diagnosticos) == 3
+
+
+def test_restaurar_no_aplica_topes():
+    origen = Diagnosticos(max_por_fase=2)
+    with pytest.raises(AnalisisDetenido):
+        _llenar(origen, "léxico", 2)
+    guardados = list(origen)
+    destino = Diagnosticos(max_por_fase=2)
+    destino.restaurar(guardados)
+    destino.restaurar(guardados)  # Los repetidos se descartan
+    assert destino == guardados
+    assert not destino.detenido and destino.por_fase("léxico") == 3
+
+
+def test_aparte_vuelve_al_estado_anterior():
+    diagnosticos = Diagnosticos(max_por_fase=2)
+    _llenar(diagnosticos, "léxico", 1)
+    with diagnosticos.aparte() as registrados:
+        _llenar(diagnosticos, "léxico", 1)  # Repetido afuera, no adentro
+        with pytest.raises(AnalisisDetenido):
+            _llenar(diagnosticos, "léxico", 1, desde=5)
+    assert [d["mensaje"] for d in registrados][:2] == ["❌ error 1", "❌ error 5"]
+    assert registrados[-1]["mensaje"].startswith("⚠️")
+    assert len(diagnosticos) == 1 and not diagnosticos.detenido
+    assert diagnosticos.max_por_fase == 2
+
+
+def test_aparte_sin_topes():
+    diagnosticos = Diagnosticos(max_por_fase=2, max_total=3, max_por_tipo={"léxico": 1})
+    with diagnosticos.aparte(con_topes=False) as registrados:
+        _llenar(diagnosticos, "léxico", 10)
+    assert len(registrados) == 10
+    assert (diagnosticos.max_por_fase, diagnosticos.max_total, diagnosticos.max_por_tipo) == (2, 3, {"léxico": 1})
+    # Quien recibe la lista aplica los topes al agregarla
+    with pytest.raises(AnalisisDetenido):
+        diagnosticos.extend(registrados)
+    assert len(diagnosticos) == 2
+
+
+def test_del_deja_de_contar_lo_quitado():
+    diagnosticos = Diagnosticos(max_por_fase=3)
+    _llenar(diagnosticos, "sintáctico", 2)
+    del diagnosticos[-1]
+    assert diagnosticos.por_fase("sintáctico") == 1
+    assert diagnosticos.agregar("sintáctico", 2, "❌ error {}", 2)  # Ya no es un repetido
+    with pytest.raises(AnalisisDetenido):
+        _llenar(diagnosticos, "sintáctico", 1, desde=3)
+    del diagnosticos[-2:]  # El último y el aviso
+    assert not diagnosticos.detenido
+    assert diagnosticos.por_fase("sintáctico") == 2
+    diagnosticos.clear()
+    assert not diagnosticos and diagnosticos.por_fase("sintáctico") == 0
+
+
+def test_el_lexer_se_detiene_en_el_tope(capsys):
+    global_errors.reiniciar(max_por_tipo={"léxico": 5})
+    codigo = "inicio\n" + "entero x@ = 1;\n" * 50 + "fin\n"
+    with pytest.raises(AnalisisDetenido):
+        parse_buffer(codigo)
+    assert global_errors.por_fase("léxico") == 5
+    assert len(global_errors) == 6
+    assert global_errors[-1]["mensaje"] == \
+        "⚠️ Se alcanzó el límite de 5 errores de tipo 'léxico'; el análisis se detiene"
@@ -0,0 +1,60 @@
+# tests/test_errores_lexicos.py
+"""Una racha de caracteres inválidos es un solo error léxico con columnas inicial y final."""
+import pytest
+
+from GlobalErrors.ErrorsManager import AnalisisDetenido, global_errors
+from LexicalAnalyzer.Lexer import crear_lexer, mensaje_error_lexico
+
+CODIGO = "entero x = 1 @#$;\n  ¿¡ y\n"
+
+BACKENDS = ("ply", "dfa")
+
+
+def _tipos(backend, codigo, agrupar_errores=True):
+    lx = crear_lexer(backend, agrupar_errores=agrupar_errores)
+    lx.input(codigo)
+    return [tok.type for tok in iter(lx.token, None)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_racha_es_un_solo_error(backend, capsys):
+    tipos = _tipos(backend, CODIGO)
+    assert tipos == ["TIPO", "IDENTIFICADOR", "ASIGNACION", "LITERAL_ENTERO", "PUNTO_COMA", "IDENTIFICADOR"]
+    assert [(e["linea"], e["columna"], e["columna_fin"]) for e in global_errors] == [(1, 14, 16), (2, 3, 4)]
+    assert global_errors[0]["mensaje"] == "❌ Error léxico en línea 1, columnas 14-16: 3 caracteres inesperados '@#$'"
+    # Se imprime una vez por racha, no por carácter
+    assert capsys.readouterr().out.count("Error léxico") == 2
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_sin_agrupar_un_error_por_caracter(backend):
+    _tipos(backend, CODIGO, agrupar_errores=False)
+    assert [(e["linea"], e["columna"], e["columna_fin"]) for e in global_errors] == [
+        (1, 14, 14), (1, 15, 15), (1, 16, 16), (2, 3, 3), (2, 4, 4)]
+    assert global_errors[0]["mensaje"] == "❌ Error léxico en línea 1, columna 14: Carácter inesperado '@'"
+
+
+def test_muestra_recortada_en_rachas_largas():
+    mensaje, argumentos = mensaje_error_lexico("@" * 30, 3, 5)
+    assert mensaje.format(*argumentos) == (
+        "❌ Error léxico en línea 3, columnas 5-34: 30 caracteres inesperados '" + "@" * 20 + "...'")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_tope_de_errores_lexicos_detiene(backend):
+    global_errors.reiniciar(max_por_tipo={"léxico": 2})
+    with pytest.raises(AnalisisDetenido):
+        _tipos(backend, "a @ b # c $ d %% e\n", agrupar_errores=False)
+    assert global_errors.por_fase("léxico") == 2
+    assert global_errors.detenido
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_errores_aparte_no_pasan_por_global_errors(backend, capsys):
+    lx = crear_lexer(backend)
+    lx.errores_aparte = []
+    lx.input(CODIGO)
+    list(iter(lx.token, None))
+    assert lx.errores_aparte == [(13, "@#$", 1), (20, "¿¡", 2)]
+    assert not global_errors
+    assert capsys.readouterr().out == ""
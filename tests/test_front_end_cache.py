@@ -0,0 +1,114 @@
+# tests/test_front_end_cache.py
+"""CacheFrontEnd: aciertos, fallos, desalojo por tamaño y escritura que falla."""
+import os
+import tempfile
+
+import pytest
+
+from GlobalErrors.ErrorsManager import AnalisisDetenido, global_errors
+from SyntaxAnalyzer.FrontEndCache import CacheFrontEnd
+from benchmarks.Common import iguales
+
+PROGRAMA = "inicio\nentero x = 1;\nmostrar x + 2;\nfin\n"
+CON_ERRORES = "inicio\nentero y = 1 $;\nentero x = 1 +;\nmostrar x;\nfin\n"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CacheFrontEnd(str(tmp_path))
+
+
+def _entradas(cache):
+    return sorted(nombre for nombre in os.listdir(cache.directorio) if nombre.endswith(".ast"))
+
+
+def test_fallo_y_despues_acierto(cache):
+    primero = cache.analizar(PROGRAMA)
+    segundo = cache.analizar(PROGRAMA)
+    assert (primero.acierto, segundo.acierto) == (False, True)
+    assert (cache.fallos, cache.aciertos) == (1, 1)
+    assert iguales(primero.ast, segundo.ast)
+    assert segundo.tokens == primero.tokens
+    assert len(_entradas(cache)) == 1
+
+
+@pytest.mark.parametrize("por_columnas", [False, True])
+def test_acierto_restaura_los_mismos_diagnosticos(cache, por_columnas):
+    cache.analizar(CON_ERRORES, por_columnas=por_columnas)
+    esperados = list(global_errors)
+    assert esperados and any(e.get("columna") for e in esperados)
+    global_errors.reiniciar()
+    resultado = cache.analizar(CON_ERRORES, por_columnas=por_columnas)
+    assert resultado.acierto
+    assert list(global_errors) == esperados == resultado.errores
+
+
+def test_opciones_y_topes_son_parte_de_la_clave(cache):
+    cache.analizar(PROGRAMA)
+    assert not cache.analizar(PROGRAMA, backend="dfa").acierto
+    assert not cache.analizar(PROGRAMA, por_columnas=True).acierto
+    global_errors.reiniciar(max_por_fase=5)
+    assert not cache.analizar(PROGRAMA).acierto
+    assert cache.analizar(PROGRAMA).acierto
+
+
+def test_analisis_detenido_se_guarda_y_se_repite(cache):
+    global_errors.reiniciar(max_por_tipo={"léxico": 1})
+    with pytest.raises(AnalisisDetenido):
+        cache.analizar(CON_ERRORES)
+    esperados = list(global_errors)
+    global_errors.reiniciar(max_por_tipo={"léxico": 1})
+    with pytest.raises(AnalisisDetenido):
+        cache.analizar(CON_ERRORES)
+    assert cache.aciertos == 1
+    assert list(global_errors) == esperados
+    assert global_errors.detenido
+
+
+def test_entrada_corrupta_se_descarta(cache):
+    cache.analizar(PROGRAMA)
+    ruta = os.path.join(cache.directorio, _entradas(cache)[0])
+    with open(ruta, "wb") as archivo:
+        archivo.write(b"PAST\x04basura")
+    resultado = cache.analizar(PROGRAMA)
+    assert not resultado.acierto
+    assert cache.fallos == 2
+    assert cache.analizar(PROGRAMA).acierto
+
+
+def test_desalojo_de_las_menos_usadas(cache):
+    programas = [f"inicio\nentero x{i} = {i};\nmostrar x{i};\nfin\n" for i in range(4)]
+    for i, programa in enumerate(programas[:3]):
+        antes = set(_entradas(cache))
+        cache.analizar(programa)
+        (nueva,) = set(_entradas(cache)) - antes
+        # Fechas de uso explícitas: la del programa 0 es la más vieja
+        os.utime(os.path.join(cache.directorio, nueva), (1000 + i, 1000 + i))
+    cache.max_bytes = cache.estadisticas()["bytes"]
+    assert cache.analizar(programas[0]).acierto  # Renueva su fecha: ahora la más vieja es la del 1
+    cache.analizar(programas[3])
+    assert cache.desalojos == 1
+    assert cache.estadisticas()["bytes"] <= cache.max_bytes
+    assert cache.analizar(programas[0]).acierto
+    assert cache.analizar(programas[2]).acierto
+    assert not cache.analizar(programas[1]).acierto
+
+
+def test_escritura_fallida_no_rompe_el_analisis(cache, monkeypatch):
+    def sin_espacio(*args, **kwargs):
+        raise OSError(28, "No queda espacio en el dispositivo")
+
+    monkeypatch.setattr(tempfile, "mkstemp", sin_espacio)
+    resultado = cache.analizar(PROGRAMA)
+    assert not resultado.acierto and resultado.ast is not None
+    assert _entradas(cache) == []
+    assert not cache.guardar("clave", [], None, [])
+
+
+def test_reemplazo_fallido_borra_el_temporal(cache, monkeypatch):
+    def falla(*args):
+        raise PermissionError(13, "Permiso denegado")
+
+    monkeypatch.setattr(os, "replace", falla)
+    assert not cache.guardar("clave", [], None, [])
+    assert os.listdir(cache.directorio) == []
@@ -0,0 +1,70 @@
+# tests/test_lexer_flujo.py
+"""LexerFlujo: leer la fuente por bloques da los mismos tokens que el lexer sobre el texto completo."""
+import io
+
+import pytest
+
+from LexicalAnalyzer.Lexer import LexerFlujo, crear_lexer, tokenizar_flujo
+from SyntaxAnalyzer.Parser import crear_parser, parse_flujo
+from benchmarks.Common import iguales
+
+PROGRAMA = (
+    'inicio\n'
+    'entero x = 10;\n'
+    'cadena s = "una cadena\nde dos líneas";\n'
+    '// comentario con "comillas" y ; punto y coma\n'
+    'decimal d = 3.25;\n'
+    'si (x > 5) entonces\n'
+    '    mostrar "x es grande", x;\n'
+    'fin_si\n'
+    'mostrar s;\n'
+    'fin\n'
+)
+
+
+def _tokens(tokens):
+    return [(tok.type, tok.value, tok.lineno, tok.lexpos) for tok in tokens]
+
+
+def _completo(codigo):
+    lx = crear_lexer()
+    lx.input(codigo)
+    return _tokens(iter(lx.token, None))
+
+
+def _en_bloques(codigo, tam):
+    return [codigo[i:i + tam] for i in range(0, len(codigo), tam)]
+
+
+@pytest.mark.parametrize("tam", [1, 2, 3, 7, 16, 64, 4096])
+def test_tokens_iguales_al_texto_completo(tam):
+    assert _tokens(LexerFlujo(_en_bloques(PROGRAMA, tam))) == _completo(PROGRAMA)
+
+
+def test_archivo_abierto():
+    assert _tokens(tokenizar_flujo(io.StringIO(PROGRAMA), tam_bloque=5)) == _completo(PROGRAMA)
+
+
+def test_comilla_sin_cerrar_al_final():
+    codigo = 'inicio\nmostrar "abc;\nentero y = 1;\nfin\n'
+    assert _tokens(LexerFlujo(_en_bloques(codigo, 4))) == _completo(codigo)
+
+
+def test_bloques_vacios_se_ignoran():
+    bloques = ["", PROGRAMA[:10], "", PROGRAMA[10:], ""]
+    assert _tokens(LexerFlujo(bloques)) == _completo(PROGRAMA)
+
+
+def test_posiciones_absolutas():
+    flujo = LexerFlujo(_en_bloques(PROGRAMA, 8))
+    for tok in flujo:
+        assert tok.lexer is flujo
+        assert flujo.lexpos >= tok.lexpos
+        if tok.type == "IDENTIFICADOR":
+            assert PROGRAMA[tok.lexpos:tok.lexpos + len(tok.value)] == tok.value
+    assert flujo.lexpos == len(PROGRAMA)
+
+
+def test_parse_flujo_da_el_mismo_ast():
+    esperado = crear_parser().parse(PROGRAMA, lexer=crear_lexer(), tracking=True)
+    assert iguales(parse_flujo(_en_bloques(PROGRAMA, 6)), esperado)
@@ -0,0 +1,53 @@
+# tests/test_listas_lineales.py
+"""Las listas de sentencias y de expresiones se arman en su lugar, en orden y sin compartirse."""
+import pytest
+
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.Parser import crear_parser, parse_buffer
+from LexicalAnalyzer.Lexer import crear_lexer
+
+N = 3_000
+
+
+def _parsear(codigo, backend):
+    if backend == "buffer":
+        return parse_buffer(codigo)
+    return crear_parser(backend).parse(codigo, lexer=crear_lexer(), tracking=True)
+
+
+BACKENDS = ("ply", "buffer", "pratt")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bloque_plano_largo_en_orden(backend):
+    lineas = ["inicio", "entero x = 0;"] + [f"x = x + {i};" for i in range(N)] + ["fin"]
+    ast = _parsear("\n".join(lineas), backend)
+    declaraciones = ast.declaraciones
+    assert len(declaraciones) == N + 1
+    assert [d.expresion.derecha.valor for d in declaraciones[1:]] == list(range(N))
+    assert [d.linea for d in declaraciones] == list(range(2, N + 3))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_lista_de_expresiones_larga_en_orden(backend):
+    ast = _parsear("inicio\nmostrar " + ", ".join(str(i) for i in range(N)) + ";\nfin\n", backend)
+    (mostrar,) = ast.declaraciones
+    assert [e.valor for e in mostrar.expresiones] == list(range(N))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bloques_anidados_no_comparten_listas(backend):
+    codigo = ("inicio\nentero x = 0;\n"
+              "si (x > 0) entonces\nx = 1;\nx = 2;\nsino\nx = 3;\nfin_si\n"
+              "mientras (x < 5) hacer\nx = x + 1;\nmostrar x, 1;\nfin_mientras\n"
+              "si (x > 0) entonces\nx = 4;\nfin_si\n"
+              "mostrar x, 2;\nfin\n")
+    ast = _parsear(codigo, backend)
+    listas = [valor for nodo in AST.preorden(ast) for _, valor in nodo.campos() if type(valor) is list]
+    assert len({id(lista) for lista in listas}) == len(listas)
+    primero, segundo = ast.declaraciones[1], ast.declaraciones[3]
+    assert [s.expresion.valor for s in primero.cuerpo_if] == [1, 2]
+    assert [s.expresion.valor for s in primero.cuerpo_else] == [3]
+    assert [s.expresion.valor for s in segundo.cuerpo_if] == [4]
+    assert len(ast.declaraciones[2].cuerpo) == 2
+    assert [e.valor for e in ast.declaraciones[4].expresiones[1:]] == [2]
@@ -0,0 +1,59 @@
+# tests/test_pratt_parser.py
+"""El parser Pratt (experimental) da el mismo AST que PLY y el mismo primer diagnóstico.
+
+Después del primer error la recuperación es distinta de la de PLY, así que
+la lista completa de diagnósticos puede diferir.
+"""
+import random
+
+import pytest
+
+from SyntaxAnalyzer.Parser import BACKENDS_PARSER, BACKENDS_PARSER_EXPERIMENTALES, crear_parser
+from UI.CompilerController import CompilerController
+from benchmarks.Common import iguales
+from benchmarks.ParserComparison import CORPUS, LIMITE_PLY, analizar, comparar, mutar, programa_aleatorio, programas_profundos
+
+VALIDOS = CORPUS[:10]
+CON_ERRORES = CORPUS[10:]
+
+
+@pytest.mark.parametrize("codigo", VALIDOS)
+def test_mismo_ast_en_programas_validos(codigo):
+    ast_ply, errores_ply, _ = analizar("ply", codigo)
+    ast_pratt, errores_pratt, excepcion = analizar("pratt", codigo)
+    assert excepcion is None
+    assert errores_ply == errores_pratt == []
+    assert iguales(ast_pratt, ast_ply)
+
+
+@pytest.mark.parametrize("codigo", CON_ERRORES)
+def test_mismo_primer_diagnostico(codigo):
+    # La recuperación de PLY no termina en algunos programas: esos no se comparan
+    _, errores_ply, excepcion_ply = analizar("ply", codigo, LIMITE_PLY)
+    _, errores_pratt, excepcion_pratt = analizar("pratt", codigo)
+    assert excepcion_pratt is None
+    if excepcion_ply is None:
+        assert errores_pratt[:1] == errores_ply[:1] != []
+
+
+def test_programas_aleatorios_y_mutados():
+    azar = random.Random(11)
+    for _ in range(60):
+        programa = programa_aleatorio(azar)
+        for codigo in (programa, mutar(azar, programa)):
+            assert comparar(codigo) is None, codigo
+
+
+@pytest.mark.parametrize("codigo", programas_profundos(3_000), ids=[
+    "parentesis", "not", "sumas", "bloques", "si_sino", "parentesis_sin_cerrar", "si_sin_entonces"])
+def test_anidamiento_profundo_sin_recursion(codigo):
+    assert comparar(codigo) is None
+
+
+def test_es_experimental():
+    assert "pratt" not in BACKENDS_PARSER and "pratt" in BACKENDS_PARSER_EXPERIMENTALES
+    assert crear_parser("pratt") is not None
+    with pytest.raises(ValueError):
+        crear_parser("otro")
+    with pytest.raises(ValueError):
+        CompilerController(None, None, None, parser_backend="pratt")
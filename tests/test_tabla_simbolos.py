@@ -0,0 +1,142 @@
+# tests/test_tabla_simbolos.py
+"""TablaSimbolos: un slot entero por símbolo, y los slots que anota el analizador semántico."""
+import pytest
+
+from GlobalErrors.ErrorsManager import global_errors
+from SemanticAnalyzer.SemanticAnalyzer import SemanticAnalyzer
+from SemanticAnalyzer.SymbolTable import Simbolo, TablaSimbolos
+from SyntaxAnalyzer import AST
+from SyntaxAnalyzer.Parser import parse_buffer
+
+
+def _analizar(codigo):
+    ast = parse_buffer(codigo)
+    analizador = SemanticAnalyzer()
+    analizador.analyze(ast)
+    return ast, analizador
+
+
+def _identificadores(ast):
+    return [nodo for nodo in AST.preorden(ast) if isinstance(nodo, AST.NodoIdentificador)]
+
+
+def test_slots_densos_en_orden_de_declaracion():
+    tabla = TablaSimbolos()
+    a = tabla.declarar("a", "entero", 2)
+    b = tabla.declarar("b", "cadena", 3)
+    c = tabla.declarar("C", "decimal", 4, constante=True)
+    assert [a.slot, b.slot, c.slot] == [0, 1, 2]
+    assert len(tabla) == 3
+    assert tabla.simbolos == [a, b, c]
+    assert tabla.buscar("b") is b and tabla.simbolos[b.slot] is b
+    assert c.constante and not a.constante
+    assert tabla.buscar("z") is None
+
+
+def test_redeclarar_da_slot_nuevo_sin_reutilizar():
+    tabla = TablaSimbolos()
+    viejo = tabla.declarar("x", "entero", 1)
+    nuevo = tabla.declarar("x", "cadena", 5)
+    assert nuevo.slot == 1
+    assert tabla.buscar("x") is nuevo
+    assert tabla.simbolos[viejo.slot] is viejo
+
+
+def test_limpiar():
+    tabla = TablaSimbolos()
+    tabla.declarar("x", "entero", 1)
+    tabla.limpiar()
+    assert len(tabla) == 0 and tabla.buscar("x") is None
+    assert tabla.declarar("y", "entero", 1).slot == 0
+
+
+def test_simbolo_sin_dict():
+    simbolo = Simbolo("x", "entero", 1, 0)
+    with pytest.raises(AttributeError):
+        simbolo.otro = 1
+    assert repr(simbolo) == "Simbolo(variable entero 'x', slot=0, linea=1)"
+
+
+def test_cada_identificador_resuelto_lleva_el_slot_de_su_declaracion(capsys):
+    ast, analizador = _analizar(
+        "inicio\n"
+        "entero a = 1;\n"
+        "cadena b = \"x\";\n"
+        "a = a + 1;\n"
+        "mostrar b, a;\n"
+        "para i desde 1 hasta 3 hacer\n"
+        "mostrar i * a;\n"
+        "fin_para\n"
+        "fin\n")
+    assert not global_errors
+    tabla = analizador.tabla
+    assert [(s.nombre, s.tipo, s.slot, s.constante) for s in tabla.simbolos] == [
+        ("a", "entero", 0, False), ("b", "cadena", 1, False),
+        ("i", "entero", 2, False)]
+    identificadores = _identificadores(ast)
+    assert {id(nodo) for nodo in identificadores} == set(analizador.slots)
+    for nodo in identificadores:
+        assert tabla.simbolos[analizador.slots[id(nodo)]].nombre == nodo.nombre
+
+
+def test_no_declarados_y_redeclarados_no_toman_slot(capsys):
+    ast, analizador = _analizar(
+        "inicio\n"
+        "entero a = 1;\n"
+        "entero a = 2;\n"
+        "mostrar y;\n"
+        "z = 3;\n"
+        "fin\n")
+    assert len(analizador.tabla) == 1
+    sin_slot = {nodo.nombre for nodo in _identificadores(ast) if id(nodo) not in analizador.slots}
+    assert sin_slot == {"a", "y", "z"}  # La segunda `a`, la referencia y la asignación
+    mensajes = [error["mensaje"] for error in global_errors]
+    for mensaje in ("❌ Variable 'a' ya declarada", "❌ Identificador 'y' no declarado",
+                    "❌ Variable 'z' no declarada"):
+        assert mensaje in mensajes
+
+
+def _constante(nombre, valor, linea):
+    # El lexer da "constante" como TIPO, así que el parser no arma estas declaraciones
+    tipo = "cadena" if isinstance(valor, str) else "decimal"
+    return AST.NodoDeclaracion("constante", AST.NodoIdentificador(nombre, linea),
+                               AST.NodoLiteral(tipo, valor, linea), linea, es_constante=True)
+
+
+def test_constante_toma_el_tipo_de_su_expresion(capsys):
+    declaracion = _constante("K", 2.5, 1)
+    referencia = AST.NodoIdentificador("K", 2)
+    analizador = SemanticAnalyzer()
+    analizador.analyze(AST.NodoPrograma([declaracion, AST.NodoMostrar([referencia], 2)], 1))
+    assert not global_errors
+    [simbolo] = analizador.tabla.simbolos
+    assert (simbolo.tipo, simbolo.constante, simbolo.slot) == ("decimal", True, 0)
+    assert analizador.slots == {id(declaracion.identificador): 0, id(referencia): 0}
+
+
+def test_una_constante_no_se_asigna(capsys):
+    asignacion = AST.NodoAsignacion(AST.NodoIdentificador("K", 2), AST.NodoLiteral("decimal", 1.0, 2), 2)
+    analizador = SemanticAnalyzer()
+    analizador.analyze(AST.NodoPrograma([_constante("K", 2.5, 1), asignacion], 1))
+    assert [error["mensaje"] for error in global_errors] == ["❌ Variable 'K' no declarada"]
+    assert id(asignacion.identificador) not in analizador.slots
+
+
+def test_para_sobre_una_constante_la_vuelve_variable_entera(capsys):
+    variable = AST.NodoIdentificador("n", 2)
+    para = AST.NodoPara(variable, AST.NodoLiteral("entero", 1, 2), AST.NodoLiteral("entero", 2, 2), None,
+                        [AST.NodoMostrar([AST.NodoIdentificador("n", 3)], 3)], 2)
+    analizador = SemanticAnalyzer()
+    analizador.analyze(AST.NodoPrograma([_constante("n", "hola", 1), para], 1))
+    assert not global_errors
+    [simbolo] = analizador.tabla.simbolos
+    assert (simbolo.tipo, simbolo.constante, simbolo.slot) == ("entero", False, 0)
+    assert analizador.slots[id(variable)] == 0
+
+
+def test_analyze_empieza_con_la_tabla_vacia(capsys):
+    analizador = SemanticAnalyzer()
+    analizador.analyze(parse_buffer("inicio\nentero a;\nentero b;\nfin\n"))
+    analizador.analyze(parse_buffer("inicio\nentero b;\nfin\n"))
+    assert [(s.nombre, s.slot) for s in analizador.tabla.simbolos] == [("b", 0)]
+    assert list(analizador.slots.values()) == [0]